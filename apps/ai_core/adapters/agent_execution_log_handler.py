@@ -0,0 +1,95 @@
+"""
+Callback que registra los nodos de un workflow en ``AgentExecutionLog``.
+"""
+
+import time
+from uuid import UUID
+
+from django.utils import timezone
+from langchain_core.callbacks import BaseCallbackHandler
+
+from apps.ai_core.models import AgentExecutionLog
+
+from ..workflows.run_config import WORKFLOW_NAME_METADATA_KEY
+from .agent_execution_log_writer import (
+    AgentExecutionLogWriter,
+    get_agent_log_writer,
+)
+from .token_usage_handler import TokenUsageHandler
+
+
+class AgentExecutionLogHandler(BaseCallbackHandler):
+    """
+    Envía el inicio y fin de cada nodo de LangGraph al writer en lote.
+
+    Solo registra las ejecuciones de nodo (el runnable cuyo nombre es
+    ``metadata["langgraph_node"]``), no el grafo completo ni los
+    runnables internos de cada nodo. Únicamente encola, por lo que
+    corre en línea también en ``ainvoke`` (``run_inline``).
+
+    Con ``usage`` cada paso guarda los tokens y el costo de las llamadas
+    al LLM hechas dentro del nodo.
+    """
+
+    run_inline = True
+
+    def __init__(
+        self,
+        tenant_id: str,
+        writer: AgentExecutionLogWriter | None = None,
+        usage: TokenUsageHandler | None = None,
+    ):
+        self.tenant_id = str(tenant_id)
+        self.writer = writer or get_agent_log_writer()
+        self.usage = usage
+        self._started: dict[UUID, float] = {}
+
+    def on_chain_start(
+        self,
+        serialized: dict,
+        inputs: dict,
+        *,
+        run_id: UUID,
+        metadata: dict | None = None,
+        **kwargs,
+    ) -> None:
+        metadata = metadata or {}
+        node_name = metadata.get("langgraph_node")
+        if node_name is None or kwargs.get("name") != node_name:
+            return
+        self._started[run_id] = time.monotonic()
+        self.writer.start(
+            run_id,
+            tenant_id=self.tenant_id,
+            workflow_name=metadata.get(WORKFLOW_NAME_METADATA_KEY) or "workflow",
+            node_name=node_name,
+            input_data=inputs,
+            start_time=timezone.now(),
+        )
+
+    def on_chain_end(self, outputs: dict, *, run_id: UUID, **kwargs) -> None:
+        self._finish(run_id, AgentExecutionLog.STATUS_SUCCESS, outputs)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs) -> None:
+        self._finish(
+            run_id,
+            AgentExecutionLog.STATUS_FAILED,
+            {"error": f"{type(error).__name__}: {error}"},
+        )
+
+    def _finish(self, run_id: UUID, status: str, output_data) -> None:
+        started = self._started.pop(run_id, None)
+        if started is None:
+            return
+        fields = {}
+        usage = self.usage.pop_node_usage(run_id) if self.usage else None
+        if usage is not None:
+            fields["tokens_input"], fields["tokens_output"], fields["cost_usd"] = usage
+        self.writer.end(
+            run_id,
+            output_data=output_data,
+            end_time=timezone.now(),
+            duration_seconds=time.monotonic() - started,
+            status=status,
+            **fields,
+        )
@@ -0,0 +1,425 @@
+"""
+Escritura en lote de ``AgentExecutionLog``.
+
+Guardar cada paso de un agente con ``.save()`` agrega un viaje a la
+base de datos (y la serialización de JSON grandes) a cada nodo de cada
+workflow. El writer acumula los eventos de inicio y fin de los nodos y
+los escribe desde un hilo en segundo plano con ``bulk_create`` y
+``bulk_update`` cada ``AI_AGENT_LOG_BATCH_SIZE`` eventos o
+``AI_AGENT_LOG_FLUSH_INTERVAL_MS`` milisegundos.
+
+Por el mismo hilo pasa el consumo de tokens de cada llamada al LLM
+(``add_usage``), que se suma por lote al rollup ``AIUsageDaily``.
+"""
+
+import asyncio
+import atexit
+import base64
+import json
+import logging
+import os
+import queue
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, connection
+
+from apps.ai_core.models import AgentExecutionLog, AIUsageDaily
+from apps.ai_core.repositories.ai_usage_daily_repository import (
+    COUNTER_FIELDS,
+    AIUsageDailyRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Campos que un evento de fin actualiza en una fila ya insertada
+END_FIELDS = [
+    "output_data",
+    "end_time",
+    "duration_seconds",
+    "tokens_input",
+    "tokens_output",
+    "cost_usd",
+    "status",
+]
+
+_START, _END, _ENTRY, _USAGE = "start", "end", "entry", "usage"
+_FLUSH, _STOP = "flush", "stop"
+
+# Clave de una fila de ``AIUsageDaily``
+USAGE_KEY_FIELDS = ("tenant_id", "date", "provider", "model")
+
+
+def compact_payload(value, max_bytes: int | None = None):
+    """
+    Reduce un payload de log que excede ``max_bytes`` serializado.
+
+    Si comprimido (zlib) cabe, se guarda como
+    ``{"_compressed": "zlib+base64", "data": ...}``; si no, como
+    ``{"_truncated": True, "size": ..., "preview": ...}`` con el inicio
+    del JSON. Los valores no serializables se guardan como texto.
+
+    Args:
+        value: Payload (``input_data`` u ``output_data``).
+        max_bytes: Default: ``AI_AGENT_LOG_MAX_PAYLOAD_BYTES``.
+
+    Returns:
+        Payload listo para el ``JSONField``.
+    """
+    max_bytes = max_bytes or settings.AI_AGENT_LOG_MAX_PAYLOAD_BYTES
+    text = json.dumps(value, cls=DjangoJSONEncoder, default=str, ensure_ascii=False)
+    raw = text.encode()
+    if len(raw) <= max_bytes:
+        return json.loads(text)
+
+    compressed = base64.b64encode(zlib.compress(raw, 6)).decode()
+    if len(compressed) <= max_bytes:
+        return {"_compressed": "zlib+base64", "size": len(raw), "data": compressed}
+    return {
+        "_truncated": True,
+        "size": len(raw),
+        "preview": raw[:max_bytes].decode(errors="ignore"),
+    }
+
+
+def expand_payload(value):
+    """Inverso de ``compact_payload`` para payloads comprimidos."""
+    if isinstance(value, dict) and value.get("_compressed") == "zlib+base64":
+        return json.loads(zlib.decompress(base64.b64decode(value["data"])))
+    return value
+
+
+class AgentExecutionLogWriter:
+    """
+    Buffer de eventos de ``AgentExecutionLog`` con escritura en lote.
+
+    ``start``/``end``/``add`` solo encolan (nunca bloquean al nodo; si la
+    cola está llena el evento se descarta y se cuenta en ``dropped``).
+    El hilo de escritura serializa y compacta los payloads
+    (``compact_payload``) y resuelve cada lote así:
+
+    - inicio y fin en el mismo lote: un solo INSERT con el estado final;
+    - inicio sin fin: INSERT en ``running`` y, cuando llegue el fin,
+      ``bulk_update`` por pk;
+    - consumo de tokens: se agrega por (tenant, día, proveedor, modelo)
+      y se suma a ``AIUsageDaily`` con un solo upsert, aparte de los
+      logs. Si falla, los incrementos se conservan y se reintentan en el
+      siguiente lote; un lote de logs que falla se descarta.
+
+    El hilo se crea al primer evento (y de nuevo tras un ``fork``, como
+    en los workers prefork de Celery). ``close`` vacía el buffer; se
+    registra con ``atexit`` y en el apagado de los workers.
+
+    Con ``background=False`` cada evento se escribe en el hilo que lo
+    genera (tests con SQLite en memoria, donde otro hilo no ve las
+    tablas); los emitidos dentro de un event loop esperan al siguiente
+    evento síncrono o a ``flush``.
+    """
+
+    def __init__(
+        self,
+        batch_size: int | None = None,
+        flush_interval_ms: int | None = None,
+        max_queue: int | None = None,
+        background: bool | None = None,
+    ):
+        """
+        Args:
+            batch_size: Default: ``AI_AGENT_LOG_BATCH_SIZE``.
+            flush_interval_ms: Default: ``AI_AGENT_LOG_FLUSH_INTERVAL_MS``.
+            max_queue: Default: ``AI_AGENT_LOG_MAX_QUEUE``.
+            background: Default: ``AI_AGENT_LOG_BACKGROUND``.
+        """
+        self.batch_size = batch_size or settings.AI_AGENT_LOG_BATCH_SIZE
+        self.flush_interval = (
+            flush_interval_ms or settings.AI_AGENT_LOG_FLUSH_INTERVAL_MS
+        ) / 1000
+        self.max_queue = max_queue or settings.AI_AGENT_LOG_MAX_QUEUE
+        self.background = (
+            settings.AI_AGENT_LOG_BACKGROUND if background is None else background
+        )
+        self.dropped = 0
+        self.written = 0
+
+        # Filas insertadas en ``running`` que esperan su evento de fin
+        self._open: OrderedDict[str, int] = OrderedDict()
+        # Modo en línea: eventos emitidos dentro de un event loop, donde
+        # el ORM síncrono no se puede usar; se escriben en el próximo flush
+        self._deferred: list[tuple] = []
+        # Incrementos de ``AIUsageDaily`` cuya escritura falló
+        self._usage: dict[tuple, AIUsageDaily] = {}
+        self._lock = threading.Lock()
+        self._queue: queue.Queue | None = None
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+
+    def start(self, run_id, **fields) -> None:
+        """
+        Registra el inicio de un paso.
+
+        Args:
+            run_id: ID de la ejecución del nodo (``run_id`` de LangChain).
+            **fields: Campos de ``AgentExecutionLog`` (``tenant_id``,
+                ``workflow_name``, ``node_name``, ``input_data``...).
+        """
+        self._put((_START, str(run_id), fields))
+
+    def end(self, run_id, **fields) -> None:
+        """
+        Registra el fin de un paso iniciado con ``start``.
+
+        Args:
+            run_id: El mismo ``run_id`` del inicio.
+            **fields: Campos de ``END_FIELDS``.
+        """
+        self._put((_END, str(run_id), fields))
+
+    def add(self, **fields) -> None:
+        """Registra un paso ya terminado (por ejemplo, un hit de cache)."""
+        self._put((_ENTRY, None, fields))
+
+    def add_usage(self, **fields) -> None:
+        """
+        Registra el consumo de una llamada al LLM.
+
+        Args:
+            **fields: ``tenant_id``, ``date``, ``provider``, ``model`` y
+                los incrementos de ``COUNTER_FIELDS`` (los omitidos son 0).
+        """
+        self._put((_USAGE, None, fields))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Espera a que se escriba todo lo encolado hasta ahora.
+
+        Returns:
+            bool: False si venció ``timeout`` antes.
+        """
+        if not self.background:
+            deferred, self._deferred = self._deferred, []
+            if deferred or self._usage:
+                self._write(deferred)
+            return True
+        if self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put((_FLUSH, None, done))
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = 10) -> None:
+        """Vacía el buffer y detiene el hilo de escritura."""
+        if not self.background:
+            self.flush()
+            return
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None or self._pid != os.getpid():
+                return
+            self._queue.put((_STOP, None, None))
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning("Agent log writer did not flush within %ss", timeout)
+
+    def _put(self, event: tuple) -> None:
+        if not self.background:
+            self._deferred.append(event)
+            if not _in_event_loop():
+                self.flush()
+            return
+        try:
+            self._ensure_thread().put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning("Agent log queue full: %s events dropped", self.dropped)
+
+    def _ensure_thread(self) -> queue.Queue:
+        if self._thread is not None and self._pid == os.getpid():
+            return self._queue
+        with self._lock:
+            if self._thread is None or self._pid != os.getpid():
+                # Tras un fork el hilo no existe en el hijo
+                self._pid = os.getpid()
+                self._open.clear()
+                self._usage.clear()
+                self._queue = queue.Queue(self.max_queue)
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self._queue,),
+                    name="agent-log-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+        return self._queue
+
+    def _run(self, events: queue.Queue) -> None:
+        """
+        Bucle del hilo: junta un lote por tamaño o tiempo y lo escribe.
+
+        La cola es FIFO, así que al llegar un flush o el stop ya se
+        leyó todo lo encolado antes.
+        """
+        stopping = False
+        try:
+            while not stopping:
+                batch, waiters, deadline = [], [], None
+                while len(batch) < self.batch_size:
+                    timeout = None if deadline is None else deadline - time.monotonic()
+                    if timeout is not None and timeout <= 0:
+                        break
+                    try:
+                        event = events.get(timeout=timeout)
+                    except queue.Empty:
+                        break
+                    if event[0] == _STOP:
+                        stopping = True
+                        break
+                    if event[0] == _FLUSH:
+                        waiters.append(event[2])
+                        break
+                    batch.append(event)
+                    if deadline is None:
+                        deadline = time.monotonic() + self.flush_interval
+
+                if batch or self._usage:
+                    close_old_connections()
+                    self._write(batch)
+                for waiter in waiters:
+                    waiter.set()
+        finally:
+            connection.close()
+
+    def _write(self, batch: list[tuple]) -> None:
+        """
+        Escribe un lote en dos sentencias independientes.
+
+        Si falla el upsert del consumo, los incrementos quedan para el
+        siguiente lote; si fallan los logs, el error se registra y los
+        eventos de log se descartan.
+        """
+        usage, self._usage = self._usage, {}
+        logs = []
+        for event in batch:
+            if event[0] == _USAGE:
+                self._add_usage(usage, event[2])
+            else:
+                logs.append(event)
+
+        if usage:
+            try:
+                AIUsageDailyRepository().increment(list(usage.values()))
+            except Exception:
+                self._usage = usage
+                logger.warning(
+                    "AI usage rollup of %s rows failed, retrying with the next batch",
+                    len(usage),
+                    exc_info=True,
+                )
+        if logs:
+            try:
+                self._write_logs(logs)
+            except Exception:
+                logger.warning(
+                    "Agent log batch of %s events failed", len(logs), exc_info=True
+                )
+
+    def _write_logs(self, batch: list[tuple]) -> None:
+        pending: dict[str, AgentExecutionLog] = {}
+        created: list[AgentExecutionLog] = []
+        updates: dict[int, AgentExecutionLog] = {}
+
+        for kind, run_id, fields in batch:
+            if kind == _START:
+                log = self._build(fields, run_id=run_id)
+                pending[run_id] = log
+                created.append(log)
+            elif kind == _ENTRY:
+                created.append(self._build(fields))
+            elif run_id in pending:
+                self._apply_end(pending.pop(run_id), fields)
+            else:
+                pk = self._open.pop(run_id, None)
+                if pk is None:
+                    continue  # El inicio se descartó o es de otro proceso
+                updates[pk] = AgentExecutionLog(pk=pk)
+                self._apply_end(updates[pk], fields)
+
+        if created:
+            AgentExecutionLog.objects.bulk_create(created)
+            self._remember_open(pending)
+        if updates:
+            AgentExecutionLog.objects.bulk_update(updates.values(), END_FIELDS)
+        self.written += len(created) + len(updates)
+
+    def _remember_open(self, pending: dict[str, AgentExecutionLog]) -> None:
+        """Guarda el pk de las filas que quedaron en ``running``."""
+        missing = [run_id for run_id, log in pending.items() if log.pk is None]
+        if missing:
+            # Backends sin RETURNING en bulk_create
+            found = {
+                str(run_id): pk
+                for run_id, pk in AgentExecutionLog.objects.filter(
+                    run_id__in=missing
+                ).values_list("run_id", "pk")
+            }
+            for run_id in missing:
+                pending[run_id].pk = found.get(run_id)
+        for run_id, log in pending.items():
+            if log.pk is not None:
+                self._open[run_id] = log.pk
+        while len(self._open) > self.max_queue:
+            self._open.popitem(last=False)
+
+    @staticmethod
+    def _add_usage(usage: dict[tuple, AIUsageDaily], fields: dict) -> None:
+        """Suma un evento de consumo a la fila de su clave en el lote."""
+        key = tuple(fields[name] for name in USAGE_KEY_FIELDS)
+        row = usage.get(key)
+        if row is None:
+            row = usage[key] = AIUsageDaily(
+                **{name: fields[name] for name in USAGE_KEY_FIELDS}
+            )
+        for name in COUNTER_FIELDS:
+            setattr(row, name, getattr(row, name) + fields.get(name, 0))
+
+    @staticmethod
+    def _build(fields: dict, run_id: str | None = None) -> AgentExecutionLog:
+        fields = dict(fields)
+        fields["input_data"] = compact_payload(fields.get("input_data"))
+        if "output_data" in fields:
+            fields["output_data"] = compact_payload(fields["output_data"])
+        return AgentExecutionLog(run_id=run_id, **fields)
+
+    @staticmethod
+    def _apply_end(log: AgentExecutionLog, fields: dict) -> None:
+        for name, value in fields.items():
+            if name == "output_data":
+                value = compact_payload(value)
+            setattr(log, name, value)
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+_writer: AgentExecutionLogWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_agent_log_writer() -> AgentExecutionLogWriter:
+    """Writer del proceso (se vacía al terminar el intérprete)."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = AgentExecutionLogWriter()
+                atexit.register(_writer.close)
+    return _writer
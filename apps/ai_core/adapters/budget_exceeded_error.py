@@ -0,0 +1,20 @@
+"""
+Error de presupuesto de IA excedido.
+"""
+
+
+class BudgetExceededError(ValueError):
+    """
+    El tenant superó su presupuesto mensual de IA.
+
+    Hereda de ``ValueError`` para que los servicios y las ejecuciones
+    encoladas lo traten como un error permanente (sin reintentos).
+    """
+
+    def __init__(self, tenant_id: str, spent, budget):
+        self.tenant_id = str(tenant_id)
+        self.spent = spent
+        self.budget = budget
+        super().__init__(
+            f"Presupuesto mensual de IA excedido ({spent:.2f} de {budget:.2f} USD)"
+        )
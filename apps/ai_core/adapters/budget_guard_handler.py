@@ -0,0 +1,43 @@
+"""
+Callback que controla el presupuesto de IA antes de cada llamada al LLM.
+"""
+
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from apps.tenants.models import TenantAIConfig
+
+from .tenant_budget_guard import TenantBudgetGuard
+
+
+class BudgetGuardHandler(BaseCallbackHandler):
+    """
+    Rechaza cada llamada al LLM de un tenant que excedió su tope.
+
+    El error se propaga a la ejecución (``raise_error``). Con
+    ``AIBudgetAction.DOWNGRADE`` las llamadas siguen: el modelo de
+    respaldo se elige al crear el chat model (``get_llm_for_tenant``),
+    así que una ejecución que cruza el tope a mitad de camino termina
+    con el modelo que tenía.
+    """
+
+    run_inline = True
+    raise_error = True
+
+    def __init__(self, config: TenantAIConfig, guard: TenantBudgetGuard | None = None):
+        self.config = config
+        self.guard = guard or TenantBudgetGuard()
+
+    def on_chat_model_start(
+        self, serialized: dict, messages: list, *, run_id: UUID, **kwargs
+    ) -> None:
+        self._check()
+
+    def on_llm_start(
+        self, serialized: dict, prompts: list, *, run_id: UUID, **kwargs
+    ) -> None:
+        self._check()
+
+    def _check(self) -> None:
+        self.guard.check(self.config)
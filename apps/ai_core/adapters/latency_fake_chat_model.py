@@ -0,0 +1,65 @@
+"""
+Chat model falso con latencia simulada.
+
+Sirve para probar y medir el motor asíncrono de workflows sin llamar a
+un proveedor: responde tras ``latency`` segundos (``asyncio.sleep`` en
+``ainvoke``) y cuenta las llamadas concurrentes.
+"""
+
+import asyncio
+import time
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from pydantic import Field
+
+
+class LatencyFakeChatModel(BaseChatModel):
+    """
+    Chat model que cicla ``responses`` con una latencia fija.
+
+    Attributes:
+        responses: Respuestas, en orden cíclico.
+        latency: Segundos de espera por llamada.
+        calls: Llamadas realizadas.
+        in_flight: Llamadas en curso.
+        peak_in_flight: Máximo de llamadas simultáneas observado.
+    """
+
+    responses: list[str] = Field(default_factory=lambda: ["ok"])
+    latency: float = 0.0
+    calls: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+
+    @property
+    def _llm_type(self) -> str:
+        return "latency-fake-chat-model"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        self._enter()
+        try:
+            time.sleep(self.latency)
+            return self._result()
+        finally:
+            self.in_flight -= 1
+
+    async def _agenerate(
+        self, messages, stop=None, run_manager=None, **kwargs
+    ) -> ChatResult:
+        self._enter()
+        try:
+            await asyncio.sleep(self.latency)
+            return self._result()
+        finally:
+            self.in_flight -= 1
+
+    def _enter(self) -> None:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def _result(self) -> ChatResult:
+        content = self.responses[self.calls % len(self.responses)]
+        self.calls += 1
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content))])
@@ -0,0 +1,21 @@
+"""
+Cache de respuestas de LLM por tenant.
+
+Aquí solo se exportan los backends (sin dependencias de LangChain, se
+usan desde servicios y comandos). ``TenantLLMCache`` se importa desde
+``tenant_llm_cache`` al construir los chat models.
+"""
+
+from .database_llm_cache_backend import DatabaseLLMCacheBackend
+from .llm_cache_backend import LLMCacheBackend
+from .llm_cache_backend_factory import get_llm_cache_backend
+from .memory_llm_cache_backend import MemoryLLMCacheBackend
+from .redis_llm_cache_backend import RedisLLMCacheBackend
+
+__all__ = [
+    "DatabaseLLMCacheBackend",
+    "LLMCacheBackend",
+    "MemoryLLMCacheBackend",
+    "RedisLLMCacheBackend",
+    "get_llm_cache_backend",
+]
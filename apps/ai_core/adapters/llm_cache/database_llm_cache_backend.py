@@ -0,0 +1,56 @@
+"""
+Backend en base de datos para el cache de respuestas de LLM.
+"""
+
+from datetime import timedelta
+
+from django.utils import timezone
+
+from apps.ai_core.models import LLMResponseCacheEntry
+
+
+class DatabaseLLMCacheBackend:
+    """
+    Tabla ``LLMResponseCacheEntry`` (PostgreSQL en producción, SQLite
+    en tests), compartida por todos los procesos.
+
+    Las entradas vencidas no se leen; ``purge_expired`` (comando
+    ``clear_llm_cache --expired``) las elimina.
+    """
+
+    def get(self, tenant_id: str, key: str) -> list | None:
+        return (
+            LLMResponseCacheEntry.objects.filter(
+                tenant_id=tenant_id, key=key, expires_at__gt=timezone.now()
+            )
+            .values_list("response", flat=True)
+            .first()
+        )
+
+    def set(self, tenant_id: str, key: str, value: list, ttl: int) -> None:
+        # Upsert: dos procesos pueden cachear el mismo prompt a la vez
+        LLMResponseCacheEntry.objects.bulk_create(
+            [
+                LLMResponseCacheEntry(
+                    tenant_id=tenant_id,
+                    key=key,
+                    response=value,
+                    expires_at=timezone.now() + timedelta(seconds=ttl),
+                )
+            ],
+            update_conflicts=True,
+            unique_fields=["tenant", "key"],
+            update_fields=["response", "expires_at"],
+        )
+
+    def clear(self, tenant_id: str | None = None) -> None:
+        entries = LLMResponseCacheEntry.objects.all()
+        if tenant_id is not None:
+            entries = entries.filter(tenant_id=tenant_id)
+        entries.delete()
+
+    def purge_expired(self) -> int:
+        deleted, _ = LLMResponseCacheEntry.objects.filter(
+            expires_at__lte=timezone.now()
+        ).delete()
+        return deleted
@@ -0,0 +1,31 @@
+"""
+Contrato de los backends del cache de respuestas de LLM.
+"""
+
+from typing import Protocol
+
+
+class LLMCacheBackend(Protocol):
+    """
+    Interface (Protocol) para los backends del cache de respuestas.
+
+    Las entradas se direccionan siempre por ``(tenant_id, key)``: un
+    tenant nunca lee respuestas de otro aunque el prompt coincida. Los
+    valores son listas JSON-serializables de generaciones.
+    """
+
+    def get(self, tenant_id: str, key: str) -> list | None:
+        """Obtiene una respuesta vigente o None."""
+        ...
+
+    def set(self, tenant_id: str, key: str, value: list, ttl: int) -> None:
+        """Guarda una respuesta por ``ttl`` segundos."""
+        ...
+
+    def clear(self, tenant_id: str | None = None) -> None:
+        """Descarta las respuestas de un tenant (o de todos)."""
+        ...
+
+    def purge_expired(self) -> int:
+        """Elimina las entradas vencidas y retorna cuántas eran."""
+        ...
@@ -0,0 +1,50 @@
+"""
+Selección del backend del cache de respuestas de LLM.
+"""
+
+import threading
+
+from django.conf import settings
+
+from .database_llm_cache_backend import DatabaseLLMCacheBackend
+from .llm_cache_backend import LLMCacheBackend
+from .memory_llm_cache_backend import MemoryLLMCacheBackend
+from .redis_llm_cache_backend import RedisLLMCacheBackend
+
+DISABLED = "none"
+
+_backends: dict[str, LLMCacheBackend] = {}
+_lock = threading.Lock()
+
+
+def get_llm_cache_backend(name: str | None = None) -> LLMCacheBackend | None:
+    """
+    Backend del cache (una instancia por proceso).
+
+    Args:
+        name: ``memory``, ``database``, ``redis`` o ``none``
+            (default: setting ``AI_LLM_CACHE_BACKEND``).
+
+    Returns:
+        LLMCacheBackend | None: None si el cache está apagado.
+
+    Raises:
+        ValueError: Si el backend no existe.
+    """
+    name = name or settings.AI_LLM_CACHE_BACKEND
+    if name == DISABLED:
+        return None
+    with _lock:
+        if name not in _backends:
+            _backends[name] = _build_backend(name)
+        return _backends[name]
+
+
+def _build_backend(name: str) -> LLMCacheBackend:
+    if name == "memory":
+        return MemoryLLMCacheBackend(settings.AI_LLM_CACHE_MAX_ENTRIES)
+    if name == "database":
+        return DatabaseLLMCacheBackend()
+    if name == "redis":
+        return RedisLLMCacheBackend(settings.AI_LLM_CACHE_ALIAS)
+    raise ValueError(f"Backend de cache de LLM no soportado: {name}")
@@ -0,0 +1,59 @@
+"""
+Backend en memoria del proceso para el cache de respuestas de LLM.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class MemoryLLMCacheBackend:
+    """
+    LRU acotado con TTL, local a cada proceso.
+
+    Sin dependencias externas; cada worker tiene su propio cache, así
+    que el hit rate baja con muchos procesos (ver backends ``database``
+    y ``redis``).
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[float, list]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, tenant_id: str, key: str) -> list | None:
+        entry_key = (str(tenant_id), key)
+        with self._lock:
+            entry = self._entries.get(entry_key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[entry_key]
+                return None
+            self._entries.move_to_end(entry_key)
+            return entry[1]
+
+    def set(self, tenant_id: str, key: str, value: list, ttl: int) -> None:
+        entry_key = (str(tenant_id), key)
+        with self._lock:
+            self._entries[entry_key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self, tenant_id: str | None = None) -> None:
+        with self._lock:
+            if tenant_id is None:
+                self._entries.clear()
+                return
+            tenant_id = str(tenant_id)
+            for entry_key in [k for k in self._entries if k[0] == tenant_id]:
+                del self._entries[entry_key]
+
+    def purge_expired(self) -> int:
+        now = time.monotonic()
+        with self._lock:
+            expired = [k for k, (expires, _) in self._entries.items() if expires <= now]
+            for entry_key in expired:
+                del self._entries[entry_key]
+        return len(expired)
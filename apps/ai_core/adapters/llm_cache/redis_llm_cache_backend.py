@@ -0,0 +1,48 @@
+"""
+Backend Redis para el cache de respuestas de LLM.
+"""
+
+import time
+
+from django.core.cache import caches
+
+
+class RedisLLMCacheBackend:
+    """
+    Cache de Django ``AI_LLM_CACHE_ALIAS`` (``RedisCache`` cuando está
+    configurado ``REDIS_CACHE_URL``), compartido por todos los procesos.
+
+    El TTL lo aplica Redis. Como el cache de Django no borra por
+    prefijo, las claves llevan una versión global y una por tenant
+    (``time_ns`` de la última invalidación): limpiar es cambiar la
+    versión y las entradas anteriores expiran solas.
+    """
+
+    def __init__(self, alias: str):
+        self.cache = caches[alias]
+
+    def get(self, tenant_id: str, key: str) -> list | None:
+        return self.cache.get(self._entry_key(tenant_id, key))
+
+    def set(self, tenant_id: str, key: str, value: list, ttl: int) -> None:
+        self.cache.set(self._entry_key(tenant_id, key), value, timeout=ttl)
+
+    def clear(self, tenant_id: str | None = None) -> None:
+        version_key = self._version_key(tenant_id)
+        version = max(time.time_ns(), (self.cache.get(version_key) or 0) + 1)
+        self.cache.set(version_key, version, timeout=None)
+
+    def purge_expired(self) -> int:
+        return 0
+
+    def _entry_key(self, tenant_id: str, key: str) -> str:
+        global_key, tenant_key = self._version_key(None), self._version_key(tenant_id)
+        versions = self.cache.get_many([global_key, tenant_key])
+        return (
+            f"llmcache:{tenant_id}:{versions.get(global_key, 0)}."
+            f"{versions.get(tenant_key, 0)}:{key}"
+        )
+
+    @staticmethod
+    def _version_key(tenant_id: str | None) -> str:
+        return f"llmcache:version:{tenant_id or '*'}"
@@ -0,0 +1,167 @@
+"""
+Cache de respuestas de LLM (match exacto) aislado por tenant.
+
+Se conecta a los chat models de ``get_llm_for_tenant`` mediante el
+parámetro ``cache`` de LangChain, que consulta ``lookup`` antes de
+llamar al proveedor y guarda con ``update`` después.
+"""
+
+import hashlib
+import json
+import logging
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+from langchain_core.runnables.config import var_child_runnable_config
+
+from apps.ai_core.models import AgentExecutionLog
+from apps.ai_core.workflows.run_config import WORKFLOW_NAME_METADATA_KEY
+
+from ..agent_execution_log_writer import get_agent_log_writer
+from .llm_cache_backend import LLMCacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Forma canónica del prompt serializado por LangChain.
+
+    Ordena las claves, descarta valores nulos y normaliza fines de
+    línea y espacios al final de cada línea, de modo que prompts que
+    solo difieren en eso comparten entrada.
+    """
+    try:
+        data = json.loads(prompt)
+    except ValueError:
+        return _normalize_text(prompt)
+    return json.dumps(
+        _normalize_value(data),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+def build_cache_key(prompt: str, llm_string: str) -> str:
+    """
+    Clave de una respuesta: hash de proveedor, modelo y parámetros
+    (``llm_string`` de LangChain) más el hash del prompt normalizado.
+    """
+    llm_hash = hashlib.sha256(llm_string.encode()).hexdigest()
+    prompt_hash = hashlib.sha256(normalize_prompt(prompt).encode()).hexdigest()
+    return hashlib.sha256(f"{llm_hash}:{prompt_hash}".encode()).hexdigest()
+
+
+def _normalize_text(text: str) -> str:
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip()
+
+
+def _normalize_value(value):
+    if isinstance(value, dict):
+        return {k: _normalize_value(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list):
+        return [_normalize_value(item) for item in value]
+    if isinstance(value, str):
+        return _normalize_text(value)
+    return value
+
+
+class TenantLLMCache(BaseCache):
+    """
+    ``BaseCache`` de LangChain sobre un ``LLMCacheBackend``.
+
+    Cada instancia pertenece a un tenant (el backend recibe el tenant
+    en cada operación). Un error del backend se trata como miss: el
+    cache nunca debe impedir la llamada al proveedor. Cada hit se
+    registra en ``AgentExecutionLog`` con ``cache_hit=True`` (vía el writer
+    en lote).
+    """
+
+    def __init__(
+        self, tenant_id: str, backend: LLMCacheBackend, ttl: int | None = None
+    ):
+        self.tenant_id = str(tenant_id)
+        self.backend = backend
+        self.ttl = ttl or settings.AI_LLM_CACHE_TTL_SECONDS
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        key = build_cache_key(prompt, llm_string)
+        try:
+            cached = self.backend.get(self.tenant_id, key)
+        except Exception:
+            logger.warning("LLM cache lookup failed", exc_info=True)
+            return None
+        if cached is None:
+            return None
+
+        generations = [self._load_generation(item) for item in cached]
+        self._record_hit(key, generations)
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = build_cache_key(prompt, llm_string)
+        value = [self._dump_generation(generation) for generation in return_val]
+        try:
+            self.backend.set(self.tenant_id, key, value, self.ttl)
+        except Exception:
+            logger.warning("LLM cache update failed", exc_info=True)
+
+    def clear(self, **kwargs) -> None:
+        """Descarta todas las respuestas cacheadas del tenant."""
+        self.backend.clear(self.tenant_id)
+
+    # Los backends y el log usan el ORM (síncrono): en ``ainvoke`` se
+    # ejecutan vía ``sync_to_async`` en lugar del executor por defecto.
+    async def alookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        return await sync_to_async(self.lookup)(prompt, llm_string)
+
+    async def aupdate(
+        self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE
+    ) -> None:
+        await sync_to_async(self.update)(prompt, llm_string, return_val)
+
+    async def aclear(self, **kwargs) -> None:
+        await sync_to_async(self.clear)(**kwargs)
+
+    def _record_hit(self, key: str, generations: list[Generation]) -> None:
+        """Registra el hit con el workflow y nodo de la ejecución en curso."""
+        metadata = (var_child_runnable_config.get() or {}).get("metadata") or {}
+        now = timezone.now()
+        get_agent_log_writer().add(
+            tenant_id=self.tenant_id,
+            workflow_name=metadata.get(WORKFLOW_NAME_METADATA_KEY) or "llm",
+            node_name=metadata.get("langgraph_node") or "llm",
+            input_data={"cache_key": key},
+            output_data={"generations": [g.text for g in generations]},
+            start_time=now,
+            end_time=now,
+            duration_seconds=0,
+            cache_hit=True,
+            status=AgentExecutionLog.STATUS_SUCCESS,
+        )
+
+    @staticmethod
+    def _dump_generation(generation: Generation) -> dict:
+        if isinstance(generation, ChatGeneration):
+            return {
+                "message": message_to_dict(generation.message),
+                "generation_info": generation.generation_info,
+            }
+        return {"text": generation.text, "generation_info": generation.generation_info}
+
+    @staticmethod
+    def _load_generation(data: dict) -> Generation:
+        # Marca para que ``TokenUsageHandler`` no lo cuente como consumo
+        generation_info = {**(data.get("generation_info") or {}), "cache_hit": True}
+        if "message" in data:
+            return ChatGeneration(
+                message=messages_from_dict([data["message"]])[0],
+                generation_info=generation_info,
+            )
+        return Generation(text=data["text"], generation_info=generation_info)
@@ -0,0 +1,108 @@
+"""
+Pool de clientes de chat models por tenant.
+
+Construir un ``ChatOpenAI``/``ChatAnthropic``/``ChatGoogleGenerativeAI``
+crea su propio cliente HTTP; reutilizar la instancia conserva las
+conexiones (y el handshake TLS) entre ejecuciones del mismo tenant.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import ClassVar
+
+from django.conf import settings
+
+
+class LLMClientPool:
+    """
+    LRU acotado de clientes por (tenant, proveedor, modelo, hash de la
+    API key, temperatura, max_tokens, cache de respuestas).
+
+    La clave incluye todo lo que se pasa al constructor, así que un
+    cambio de configuración nunca reutiliza un cliente viejo aunque la
+    invalidación no llegue (por ejemplo, en otro proceso): la entrada
+    anterior solo queda ociosa hasta expirar. Las entradas sin uso por
+    más de ``AI_LLM_POOL_IDLE_SECONDS`` se descartan.
+    """
+
+    _clients: ClassVar[OrderedDict[tuple, tuple[object, float]]] = OrderedDict()
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def get(
+        cls,
+        tenant_id: str,
+        provider: str,
+        model: str,
+        api_key: str,
+        temperature: float,
+        max_tokens: int | None,
+        factory: Callable[[], object],
+        response_cache: bool = False,
+    ):
+        """
+        Obtiene el cliente del pool o lo crea con ``factory``.
+
+        Returns:
+            El chat model (compartido entre hilos; los callbacks se pasan
+            por ejecución, no en el cliente).
+        """
+        key = (
+            str(tenant_id),
+            provider,
+            model,
+            hashlib.sha256(api_key.encode()).hexdigest(),
+            temperature,
+            max_tokens,
+            response_cache,
+        )
+        now = time.monotonic()
+        with cls._lock:
+            cls._evict_idle(now)
+            entry = cls._clients.get(key)
+            if entry is not None:
+                cls._clients[key] = (entry[0], now)
+                cls._clients.move_to_end(key)
+                return entry[0]
+
+        client = factory()
+        with cls._lock:
+            # Otro hilo pudo crearlo mientras tanto: se conserva el primero
+            entry = cls._clients.get(key)
+            if entry is not None:
+                client = entry[0]
+            cls._clients[key] = (client, now)
+            cls._clients.move_to_end(key)
+            while len(cls._clients) > settings.AI_LLM_POOL_MAX_CLIENTS:
+                cls._clients.popitem(last=False)
+        return client
+
+    @classmethod
+    def invalidate(cls, tenant_id: str) -> None:
+        """Descarta los clientes de un tenant."""
+        tenant_id = str(tenant_id)
+        with cls._lock:
+            for key in [key for key in cls._clients if key[0] == tenant_id]:
+                del cls._clients[key]
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._clients.clear()
+
+    @classmethod
+    def size(cls) -> int:
+        return len(cls._clients)
+
+    @classmethod
+    def _evict_idle(cls, now: float) -> None:
+        """Descarta desde el extremo menos usado los clientes ociosos."""
+        idle_seconds = settings.AI_LLM_POOL_IDLE_SECONDS
+        while cls._clients:
+            key, (_, last_used) = next(iter(cls._clients.items()))
+            if now - last_used <= idle_seconds:
+                return
+            del cls._clients[key]
@@ -1,20 +1,41 @@
+from functools import partial
+from importlib import import_module
+
 from django.conf import settings
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-from ..models.ai_config import TenantAIConfig
-from langchain_openai import ChatOpenAI
 
 from apps.tenants.models.choices import AIProvider
 
+from ..models.ai_config import TenantAIConfig
+from .llm_cache import get_llm_cache_backend
+from .llm_cache.tenant_llm_cache import TenantLLMCache
+from .llm_client_pool import LLMClientPool
+from .tenant_budget_guard import TenantBudgetGuard
 
-def get_llm_for_tenant(tenant_config: TenantAIConfig):
+# Los SDKs de proveedores se importan en el primer uso: cargarlos al
+# importar el módulo cuesta segundos en cada worker y comando.
+CHAT_MODEL_CLASSES = {
+    AIProvider.OPENAI: ("langchain_openai", "ChatOpenAI"),
+    AIProvider.CLAUDE: ("langchain_anthropic", "ChatAnthropic"),
+    AIProvider.GEMINI: ("langchain_google_genai", "ChatGoogleGenerativeAI"),
+}
+
+
+def get_chat_model_class(provider: str) -> type:
+    """Importa (una sola vez, vía ``sys.modules``) la clase del proveedor."""
+    module_name, class_name = CHAT_MODEL_CLASSES[provider]
+    return getattr(import_module(module_name), class_name)
+
+
+def resolve_provider_credentials(tenant_config: TenantAIConfig) -> tuple[str, str]:
     """
-    Devuelve una instancia de LangChain ChatModel configurada
-    según las preferencias del tenant.
+    Proveedor efectivo y API key de un tenant (la propia o la global
+    de la plataforma).
+
+    Raises:
+        ValueError: Si el proveedor no está soportado.
     """
     api_key = tenant_config.api_key
     provider = tenant_config.provider
-    model_name = tenant_config.model_name
 
     # Lógica de Fallback a las llaves globales de la plataforma
     if provider == AIProvider.PLATFORM_DEFAULT:
@@ -22,23 +43,59 @@ def get_llm_for_tenant(tenant_config: TenantAIConfig):
         provider = AIProvider.OPENAI
         api_key = settings.OPENAI_API_KEY_GLOBAL
 
-    # 1. OpenAI
     if provider == AIProvider.OPENAI:
-        final_key = api_key or settings.OPENAI_API_KEY_GLOBAL
-        return ChatOpenAI(api_key=final_key, model=model_name, temperature=0)
-
-    # 2. Claude
-    elif provider == AIProvider.CLAUDE:
-        final_key = api_key or settings.CLAUDE_API_KEY_GLOBAL
-        return ChatAnthropic(api_key=final_key, model=model_name, temperature=0)
-
-    # 3. Gemini
-    elif provider == AIProvider.GEMINI:
-        final_key = api_key or settings.GEMINI_API_KEY_GLOBAL
-        return ChatGoogleGenerativeAI(
-            google_api_key=final_key,
-            model=model_name,
-            temperature=0
-        )
-
+        return provider, api_key or settings.OPENAI_API_KEY_GLOBAL
+    if provider == AIProvider.CLAUDE:
+        return provider, api_key or settings.CLAUDE_API_KEY_GLOBAL
+    if provider == AIProvider.GEMINI:
+        return provider, api_key or settings.GEMINI_API_KEY_GLOBAL
     raise ValueError(f"Proveedor de IA no soportado: {provider}")
+
+
+def get_llm_for_tenant(tenant_config: TenantAIConfig):
+    """
+    Devuelve una instancia de LangChain ChatModel configurada
+    según las preferencias del tenant.
+
+    Las instancias se reutilizan desde ``LLMClientPool`` (conexiones
+    HTTP ya abiertas) mientras la configuración no cambie. Salvo que el
+    tenant lo desactive, llevan un ``TenantLLMCache`` que reutiliza
+    respuestas idénticas.
+
+    Si el tenant excedió su presupuesto mensual se usa el modelo de
+    respaldo (``AIBudgetAction.DOWNGRADE``) o se rechaza.
+
+    Raises:
+        ValueError: Si el proveedor no está soportado.
+        BudgetExceededError: Si el tenant excedió su presupuesto y no
+            tiene modelo de respaldo.
+    """
+    provider, final_key = resolve_provider_credentials(tenant_config)
+    model_name = tenant_config.model_name
+    if tenant_config.monthly_budget_usd is not None:
+        model_name = TenantBudgetGuard().check(tenant_config)
+
+    backend = get_llm_cache_backend() if tenant_config.response_cache_enabled else None
+    # False desactiva también el cache global de LangChain
+    cache = TenantLLMCache(tenant_config.tenant_id, backend) if backend else False
+
+    # Gemini recibe la key como ``google_api_key``
+    key_argument = "google_api_key" if provider == AIProvider.GEMINI else "api_key"
+    factory = partial(
+        get_chat_model_class(provider),
+        model=model_name,
+        temperature=0,
+        cache=cache,
+        **{key_argument: final_key},
+    )
+
+    return LLMClientPool.get(
+        tenant_id=str(tenant_config.tenant_id),
+        provider=provider,
+        model=model_name,
+        api_key=final_key,
+        temperature=0,
+        max_tokens=None,
+        response_cache=backend is not None,
+        factory=factory,
+    )
@@ -0,0 +1,59 @@
+"""
+Tabla de precios de modelos de LLM.
+"""
+
+import logging
+from decimal import Decimal
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+PER_MILLION = Decimal(1_000_000)
+
+
+class ModelPriceTable:
+    """
+    Precios por proveedor y modelo (USD por millón de tokens).
+
+    Los modelos se buscan por el prefijo más largo, de modo que
+    ``gpt-4o-2024-08-06`` usa el precio de ``gpt-4o`` y
+    ``gpt-4o-mini`` el suyo propio. Un modelo sin precio cuesta 0 y se
+    advierte una vez por proceso.
+
+    Example:
+        >>> ModelPriceTable().cost("openai", "gpt-4o-mini", 1000, 200)
+        Decimal('0.000270')
+    """
+
+    def __init__(self, prices: dict | None = None):
+        """
+        Args:
+            prices: ``{proveedor: {modelo: (entrada, salida)}}``
+                (default: ``AI_MODEL_PRICES``).
+        """
+        self.prices = prices if prices is not None else settings.AI_MODEL_PRICES
+        self._unknown: set[tuple[str, str]] = set()
+
+    def price(self, provider: str, model: str) -> tuple[Decimal, Decimal] | None:
+        """Precio (entrada, salida) por millón de tokens, o None."""
+        models = self.prices.get(provider) or {}
+        matches = [name for name in models if model.startswith(name)]
+        if not matches:
+            return None
+        input_price, output_price = models[max(matches, key=len)]
+        return Decimal(str(input_price)), Decimal(str(output_price))
+
+    def cost(
+        self, provider: str, model: str, tokens_input: int, tokens_output: int
+    ) -> Decimal:
+        """Costo en USD (6 decimales, como ``cost_usd``)."""
+        price = self.price(provider, model)
+        if price is None:
+            if (provider, model) not in self._unknown:
+                self._unknown.add((provider, model))
+                logger.warning("No price for model %s/%s", provider, model)
+            return Decimal("0.000000")
+        input_price, output_price = price
+        cost = (tokens_input * input_price + tokens_output * output_price) / PER_MILLION
+        return cost.quantize(Decimal("0.000001"))
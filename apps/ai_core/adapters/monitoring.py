@@ -2,22 +2,51 @@
 from django.conf import settings
 from langchain_core.callbacks import StdOutCallbackHandler
 
+from apps.tenants.models import TenantAIConfig
+
+from .agent_execution_log_handler import AgentExecutionLogHandler
+from .budget_guard_handler import BudgetGuardHandler
+from .tenant_budget_guard import TenantBudgetGuard
+from .token_usage_handler import TokenUsageHandler
+
 # from langfuse.callback import CallbackHandler as LangfuseCallbackHandler
 
 
 def get_workflow_monitor(
-    trace_name: str, tenant_id: str, session_id: str | None = None
+    trace_name: str,
+    tenant_id: str,
+    session_id: str | None = None,
+    ai_config: TenantAIConfig | None = None,
 ) -> list:
     """
     Devuelve una lista de Callbacks para monitorear la ejecución.
+
+    Con ``ai_config`` y un tope mensual configurado, además controla el
+    presupuesto del tenant antes de cada llamada al LLM.
     """
     callbacks = []
 
-    # 1. Logs de consola en desarrollo
+    # 1. Presupuesto mensual (primero: rechaza antes de registrar nada)
+    budget = None
+    if ai_config is not None and ai_config.monthly_budget_usd is not None:
+        budget = TenantBudgetGuard()
+        callbacks.append(BudgetGuardHandler(ai_config, budget))
+
+    # 2. Logs de consola en desarrollo
     if settings.DEBUG:
         callbacks.append(StdOutCallbackHandler())
 
-    # 2. Hook para Langfuse (Descomentar en producción)
+    # 3. Tokens y costo por tenant (rollup diario AIUsageDaily)
+    usage = None
+    if settings.AI_USAGE_TRACKING_ENABLED:
+        usage = TokenUsageHandler(tenant_id, budget=budget)
+        callbacks.append(usage)
+
+    # 4. Bitácora de nodos en AgentExecutionLog (escritura en lote)
+    if settings.AI_AGENT_LOG_ENABLED:
+        callbacks.append(AgentExecutionLogHandler(tenant_id, usage=usage))
+
+    # 5. Hook para Langfuse (Descomentar en producción)
     """
     if os.environ.get("LANGFUSE_PUBLIC_KEY"):
         langfuse_handler = LangfuseCallbackHandler(
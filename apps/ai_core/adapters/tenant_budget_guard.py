@@ -0,0 +1,153 @@
+"""
+Control del presupuesto mensual de IA por tenant.
+
+Sumar ``AIUsageDaily`` (o peor, ``AgentExecutionLog``) antes de cada
+llamada al LLM es una consulta por llamada. El guard lleva el gasto del
+mes en un contador del cache de Django ``AI_BUDGET_CACHE_ALIAS``
+(memoria del proceso o Redis si está configurado ``REDIS_CACHE_URL``):
+se siembra desde el rollup diario y cada llamada le suma su costo.
+"""
+
+import asyncio
+import contextlib
+import logging
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+
+from apps.ai_core.repositories import AIUsageDailyRepository
+from apps.tenants.models import AIBudgetAction, TenantAIConfig
+
+from .budget_exceeded_error import BudgetExceededError
+
+logger = logging.getLogger(__name__)
+
+# Los contadores son enteros (micro-USD) para poder usar ``incr``
+MICROS = Decimal(1_000_000)
+
+
+class TenantBudgetGuard:
+    """
+    Contadores de gasto mensual por tenant y la decisión de presupuesto.
+
+    El contador del mes vence a los ``AI_BUDGET_COUNTER_TTL_SECONDS`` y
+    se vuelve a sembrar desde ``AIUsageDaily``: así se corrige la
+    deriva entre procesos con el backend en memoria. El rollup va
+    detrás del gasto real solo lo que tarda el writer en lote en
+    escribir (``AI_AGENT_LOG_FLUSH_INTERVAL_MS``).
+
+    Dentro de un event loop no se consulta la base: si el contador no
+    está sembrado, la llamada pasa (el motor asíncrono los siembra con
+    ``warm`` antes de encolar).
+    """
+
+    def __init__(
+        self,
+        cache_alias: str | None = None,
+        ttl: int | None = None,
+        usage_repo: AIUsageDailyRepository | None = None,
+    ):
+        self.cache = caches[cache_alias or settings.AI_BUDGET_CACHE_ALIAS]
+        self.ttl = ttl or settings.AI_BUDGET_COUNTER_TTL_SECONDS
+        self.usage_repo = usage_repo or AIUsageDailyRepository()
+
+    def spent(self, tenant_id: str) -> Decimal | None:
+        """
+        Gasto del tenant en el mes en curso.
+
+        Returns:
+            Decimal | None: None si no se pudo sembrar el contador
+                (dentro de un event loop).
+        """
+        key = self._key(tenant_id)
+        micros = self.cache.get(key)
+        if micros is None:
+            if _in_event_loop():
+                return None
+            micros = self._seed(tenant_id, key)
+        return Decimal(micros) / MICROS
+
+    def warm(self, tenant_id: str) -> None:
+        """Siembra el contador del mes si no existe."""
+        self.spent(tenant_id)
+
+    def add_spend(self, tenant_id: str, cost: Decimal) -> None:
+        """
+        Suma el costo de una llamada al contador del mes.
+
+        Si el contador no existe (venció o nunca se sembró) no se hace
+        nada: la próxima siembra lee el costo desde el rollup.
+        """
+        micros = int(cost * MICROS)
+        if micros <= 0:
+            return
+        with contextlib.suppress(ValueError):
+            self.cache.incr(self._key(tenant_id), micros)
+
+    def is_exceeded(self, config: TenantAIConfig) -> bool:
+        """Si el tenant tiene tope y el gasto del mes lo alcanzó."""
+        if config.monthly_budget_usd is None:
+            return False
+        spent = self.spent(config.tenant_id)
+        return spent is not None and spent >= config.monthly_budget_usd
+
+    def check(self, config: TenantAIConfig) -> str:
+        """
+        Modelo a usar, o error si la llamada debe rechazarse.
+
+        Returns:
+            str: Ver ``resolve_model``.
+
+        Raises:
+            BudgetExceededError: Si el tope se alcanzó y la acción es
+                ``AIBudgetAction.REJECT`` (o no hay modelo de respaldo).
+        """
+        model_name = self.resolve_model(config)
+        if model_name is None:
+            raise BudgetExceededError(
+                config.tenant_id,
+                self.spent(config.tenant_id),
+                config.monthly_budget_usd,
+            )
+        return model_name
+
+    def resolve_model(self, config: TenantAIConfig) -> str | None:
+        """
+        Modelo a usar según el presupuesto.
+
+        Returns:
+            str | None: ``model_name`` dentro del tope, el modelo de
+                respaldo al excederlo con ``DOWNGRADE``, o None si la
+                llamada debe rechazarse.
+        """
+        if not self.is_exceeded(config):
+            return config.model_name
+        if (
+            config.budget_action == AIBudgetAction.DOWNGRADE
+            and config.budget_fallback_model
+        ):
+            return config.budget_fallback_model
+        return None
+
+    def _seed(self, tenant_id: str, key: str) -> int:
+        today = timezone.localdate()
+        totals = self.usage_repo.totals(tenant_id, today.replace(day=1), today)
+        micros = int((totals["cost_usd"] or 0) * MICROS)
+        # ``add`` no pisa el contador si otro proceso lo sembró primero
+        if not self.cache.add(key, micros, timeout=self.ttl):
+            micros = self.cache.get(key, micros)
+        return micros
+
+    @staticmethod
+    def _key(tenant_id: str) -> str:
+        return f"aibudget:{tenant_id}:{timezone.localdate():%Y-%m}"
+
+
+def _in_event_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
@@ -0,0 +1,70 @@
+"""
+Estimación local de tokens.
+
+Se usa cuando la respuesta del proveedor no informa el uso. Con
+``tiktoken`` (dependencia de ``langchain-openai``) cuenta con el
+encoding de OpenAI, que para Claude y Gemini es una aproximación
+razonable; sin él, estima ~4 caracteres por token.
+"""
+
+import functools
+import logging
+import math
+
+logger = logging.getLogger(__name__)
+
+# Tokens de formato por mensaje de chat (rol y separadores)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+@functools.cache
+def _encoding():
+    """
+    Encoding de ``tiktoken``, o None para estimar por caracteres.
+
+    ``get_encoding`` descarga el vocabulario la primera vez; si falla
+    (sin red, caché no escribible) se usa la estimación por caracteres
+    durante el resto del proceso en lugar de romper el registro de uso.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        logger.warning(
+            "tiktoken encoding unavailable, estimating tokens by length",
+            exc_info=True,
+        )
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """Tokens estimados de un texto."""
+    if not text:
+        return 0
+    encoding = _encoding()
+    if encoding is None:
+        return math.ceil(len(text) / 4)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def estimate_message_tokens(messages: list) -> int:
+    """
+    Tokens estimados de un prompt de chat (``BaseMessage``) o de texto.
+
+    Args:
+        messages: Mensajes de LangChain o strings.
+    """
+    total = 0
+    for message in messages:
+        content = getattr(message, "content", message)
+        if not isinstance(content, str):
+            # Contenido multimodal: solo los bloques de texto
+            content = " ".join(
+                block.get("text", "") if isinstance(block, dict) else str(block)
+                for block in content
+            )
+        total += estimate_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+    return total
@@ -0,0 +1,217 @@
+"""
+Callback de conteo de tokens y costo de las llamadas al LLM.
+"""
+
+from decimal import Decimal
+from uuid import UUID
+
+from django.utils import timezone
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from .agent_execution_log_writer import (
+    AgentExecutionLogWriter,
+    get_agent_log_writer,
+)
+from .model_price_table import ModelPriceTable
+from .tenant_budget_guard import TenantBudgetGuard
+from .token_estimator import estimate_message_tokens, estimate_tokens
+
+# ``ls_provider`` de las integraciones de LangChain -> ``AIProvider``
+LS_PROVIDERS = {
+    "openai": "openai",
+    "anthropic": "claude",
+    "google_genai": "gemini",
+}
+
+
+class TokenUsageHandler(BaseCallbackHandler):
+    """
+    Cuenta tokens y costo de cada llamada al LLM de un tenant.
+
+    El uso sale de la respuesta del proveedor (``usage_metadata`` del
+    mensaje o ``llm_output``); si no viene, se estima con
+    ``token_estimator`` a partir del prompt y la respuesta. El costo
+    usa ``ModelPriceTable``. Cada llamada se suma al rollup
+    ``AIUsageDaily`` vía el writer en lote; las respuestas del cache de
+    respuestas cuentan como ``cache_hits`` sin tokens ni costo.
+
+    También acumula el uso por nodo de LangGraph (sube por los
+    ``parent_run_id`` hasta el nodo), que ``AgentExecutionLogHandler``
+    guarda en el log del paso (``pop_node_usage``).
+
+    Con ``budget`` el costo se suma además al contador de gasto mensual
+    del tenant (``TenantBudgetGuard``).
+    """
+
+    run_inline = True
+
+    def __init__(
+        self,
+        tenant_id: str,
+        writer: AgentExecutionLogWriter | None = None,
+        price_table: ModelPriceTable | None = None,
+        budget: TenantBudgetGuard | None = None,
+    ):
+        self.tenant_id = str(tenant_id)
+        self.writer = writer or get_agent_log_writer()
+        self.price_table = price_table or ModelPriceTable()
+        self.budget = budget
+        self._calls: dict[UUID, dict] = {}
+        self._parents: dict[UUID, UUID | None] = {}
+        self._nodes: set[UUID] = set()
+        self._node_usage: dict[UUID, list] = {}
+
+    def on_chain_start(
+        self,
+        serialized: dict,
+        inputs: dict,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        metadata: dict | None = None,
+        **kwargs,
+    ) -> None:
+        self._parents[run_id] = parent_run_id
+        node_name = (metadata or {}).get("langgraph_node")
+        if node_name is not None and kwargs.get("name") == node_name:
+            self._nodes.add(run_id)
+
+    def on_chain_end(self, outputs, *, run_id: UUID, **kwargs) -> None:
+        self._parents.pop(run_id, None)
+        self._nodes.discard(run_id)
+
+    def on_chain_error(self, error, *, run_id: UUID, **kwargs) -> None:
+        self._parents.pop(run_id, None)
+        self._nodes.discard(run_id)
+
+    def on_chat_model_start(
+        self,
+        serialized: dict,
+        messages: list[list],
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        metadata: dict | None = None,
+        **kwargs,
+    ) -> None:
+        self._track_call(run_id, parent_run_id, metadata, messages)
+
+    def on_llm_start(
+        self,
+        serialized: dict,
+        prompts: list[str],
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        metadata: dict | None = None,
+        **kwargs,
+    ) -> None:
+        self._track_call(run_id, parent_run_id, metadata, [[p] for p in prompts])
+
+    def on_llm_error(self, error, *, run_id: UUID, **kwargs) -> None:
+        self._calls.pop(run_id, None)
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs) -> None:
+        call = self._calls.pop(run_id, None)
+        if call is None:
+            return
+        generations = [g for batch in response.generations for g in batch]
+        model = call["model"] or (response.llm_output or {}).get("model_name") or ""
+
+        if generations and all(
+            (g.generation_info or {}).get("cache_hit") for g in generations
+        ):
+            self.writer.add_usage(
+                tenant_id=self.tenant_id,
+                date=timezone.localdate(),
+                provider=call["provider"],
+                model=model,
+                cache_hits=1,
+            )
+            return
+
+        tokens_input, tokens_output, estimated = self._usage(
+            response, generations, call["prompts"]
+        )
+        cost = self.price_table.cost(
+            call["provider"], model, tokens_input, tokens_output
+        )
+        self.writer.add_usage(
+            tenant_id=self.tenant_id,
+            date=timezone.localdate(),
+            provider=call["provider"],
+            model=model,
+            requests=1,
+            estimated_requests=int(estimated),
+            tokens_input=tokens_input,
+            tokens_output=tokens_output,
+            cost_usd=cost,
+        )
+        if self.budget is not None:
+            self.budget.add_spend(self.tenant_id, cost)
+
+        node = self._node_of(call["parent_run_id"])
+        if node is not None:
+            usage = self._node_usage.setdefault(node, [0, 0, Decimal(0)])
+            usage[0] += tokens_input
+            usage[1] += tokens_output
+            usage[2] += cost
+
+    def pop_node_usage(self, run_id: UUID) -> tuple[int, int, Decimal] | None:
+        """Tokens de entrada, de salida y costo acumulados de un nodo."""
+        usage = self._node_usage.pop(run_id, None)
+        return tuple(usage) if usage else None
+
+    def _track_call(
+        self,
+        run_id: UUID,
+        parent_run_id: UUID | None,
+        metadata: dict | None,
+        prompts: list[list],
+    ) -> None:
+        metadata = metadata or {}
+        ls_provider = metadata.get("ls_provider") or ""
+        self._calls[run_id] = {
+            "provider": LS_PROVIDERS.get(ls_provider, ls_provider),
+            "model": metadata.get("ls_model_name") or "",
+            "parent_run_id": parent_run_id,
+            # Solo para estimar si el proveedor no informa el uso
+            "prompts": prompts,
+        }
+
+    def _node_of(self, run_id: UUID | None) -> UUID | None:
+        """Nodo de LangGraph que contiene la ejecución ``run_id``."""
+        while run_id is not None and run_id not in self._nodes:
+            run_id = self._parents.get(run_id)
+        return run_id
+
+    @staticmethod
+    def _usage(
+        response: LLMResult, generations: list, prompts: list[list]
+    ) -> tuple[int, int, bool]:
+        """(tokens de entrada, tokens de salida, si fue estimado)."""
+        usages = [
+            g.message.usage_metadata
+            for g in generations
+            if getattr(getattr(g, "message", None), "usage_metadata", None)
+        ]
+        if usages:
+            return (
+                sum(u.get("input_tokens", 0) for u in usages),
+                sum(u.get("output_tokens", 0) for u in usages),
+                False,
+            )
+
+        llm_output = response.llm_output or {}
+        reported = llm_output.get("token_usage") or llm_output.get("usage") or {}
+        tokens_input = reported.get("prompt_tokens", reported.get("input_tokens"))
+        tokens_output = reported.get("completion_tokens", reported.get("output_tokens"))
+        if tokens_input is not None and tokens_output is not None:
+            return tokens_input, tokens_output, False
+
+        return (
+            sum(estimate_message_tokens(prompt) for prompt in prompts),
+            sum(estimate_tokens(g.text) for g in generations),
+            True,
+        )
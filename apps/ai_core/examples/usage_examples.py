@@ -161,7 +161,7 @@ def ejemplo_5_listar_tools_disponibles():
     print("EJEMPLO 5: Tools disponibles en el sistema")
     print("=" * 60)
 
-    tools = ToolRegistry._registry.keys()
+    tools = ToolRegistry.list_tools()
 
     print(f"\nTotal de tools registradas: {len(tools)}\n")
 
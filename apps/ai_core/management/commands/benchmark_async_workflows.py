@@ -0,0 +1,154 @@
+"""
+Benchmark del motor asíncrono de workflows.
+
+Ejecuta un grafo de prueba (dos nodos que llaman al LLM con
+``ainvoke``, como analista y sourcer) con ``LatencyFakeChatModel``:
+mide el tiempo secuencial contra ``AsyncWorkflowEngine``, verifica que
+ninguna API key supere su límite de concurrencia, que los tenants
+chicos no esperen al lote de un tenant grande y que cancelar un
+tenant libere sus cupos.
+
+Uso:
+    python manage.py benchmark_async_workflows --bulk-runs 500 --latency 0.05
+"""
+
+import asyncio
+import time
+from typing import TypedDict
+
+from django.core.management.base import BaseCommand
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import END, StateGraph
+
+from apps.ai_core.adapters.latency_fake_chat_model import LatencyFakeChatModel
+from apps.ai_core.workflows.async_workflow_engine import AsyncWorkflowEngine
+from apps.ai_core.workflows.run_config import build_run_config, get_run_llm
+
+
+class ProbeState(TypedDict):
+    messages: list[str]
+
+
+async def call_llm(state: ProbeState, config: RunnableConfig) -> dict:
+    response = await get_run_llm(config).ainvoke("prompt")
+    return {"messages": [*state["messages"], response.content]}
+
+
+def build_probe_graph():
+    workflow = StateGraph(ProbeState)
+    workflow.add_node("analyst", call_llm)
+    workflow.add_node("sourcer", call_llm)
+    workflow.set_entry_point("analyst")
+    workflow.add_edge("analyst", "sourcer")
+    workflow.add_edge("sourcer", END)
+    return workflow.compile()
+
+
+class Command(BaseCommand):
+    help = "Mide concurrencia, límites, equidad y cancelación del motor asíncrono."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--bulk-runs", type=int, default=500)
+        parser.add_argument("--small-tenants", type=int, default=3)
+        parser.add_argument("--small-runs", type=int, default=5)
+        parser.add_argument("--latency", type=float, default=0.05)
+        parser.add_argument("--max-concurrency", type=int, default=64)
+        parser.add_argument("--tenant-limit", type=int, default=8)
+        parser.add_argument("--api-key-limit", type=int, default=16)
+
+    def handle(self, *args, **options):
+        asyncio.run(self._run(options))
+
+    async def _run(self, options):
+        graph = build_probe_graph()
+        state = {"messages": []}
+
+        # 1. Secuencial (muestra de 20 ejecuciones, extrapolada)
+        sample = min(20, options["bulk_runs"])
+        llm = LatencyFakeChatModel(latency=options["latency"])
+        started = time.perf_counter()
+        for _ in range(sample):
+            await graph.ainvoke(state, config=build_run_config(llm))
+        sequential = (time.perf_counter() - started) / sample * options["bulk_runs"]
+
+        # 2. Motor: un tenant con un lote grande y varios tenants chicos
+        engine = self._engine(graph, options)
+        bulk_llm = LatencyFakeChatModel(latency=options["latency"])
+        small_llms = [
+            LatencyFakeChatModel(latency=options["latency"])
+            for _ in range(options["small_tenants"])
+        ]
+        started = time.perf_counter()
+        bulk_runs = [
+            self._submit(engine, "bulk", bulk_llm, state)
+            for _ in range(options["bulk_runs"])
+        ]
+        small_runs = [
+            self._submit(engine, f"small-{i}", small_llm, state)
+            for i, small_llm in enumerate(small_llms)
+            for _ in range(options["small_runs"])
+        ]
+        small_done = await self._finished_at(small_runs, started)
+        bulk_done = await self._finished_at(bulk_runs, started)
+
+        peak = max([bulk_llm, *small_llms], key=lambda m: m.peak_in_flight)
+        self.stdout.write(
+            f"{options['bulk_runs']} ejecuciones del tenant grande + "
+            f"{options['small_tenants']}x{options['small_runs']} de tenants chicos "
+            f"(latencia {options['latency'] * 1000:.0f} ms por llamada)."
+        )
+        self.stdout.write(f"Secuencial (extrapolado):  {sequential:,.2f} s")
+        self.stdout.write(f"Motor asíncrono:           {bulk_done:,.2f} s")
+        self.stdout.write(f"Tenants chicos terminaron: {small_done:,.2f} s")
+        self.stdout.write(
+            f"Pico por API key:          {peak.peak_in_flight} "
+            f"(límite {options['api_key_limit']}, por tenant {options['tenant_limit']})"
+        )
+
+        # 3. Cancelación de un tenant a mitad del lote
+        cancel_llm = LatencyFakeChatModel(latency=options["latency"])
+        runs = [
+            self._submit(engine, "bulk", cancel_llm, state)
+            for _ in range(options["bulk_runs"])
+        ]
+        await asyncio.sleep(options["latency"] * 4)
+        cancelled = engine.cancel_tenant("bulk")
+        await engine.join()
+        self.stdout.write(
+            f"Cancelación: {cancelled} ejecuciones canceladas, "
+            f"{sum(run.status == run.SUCCEEDED for run in runs)} completadas, "
+            f"cupos en uso al final: {engine.stats()}"
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Speedup: {sequential / bulk_done:,.1f}x; los tenants chicos "
+                f"esperaron {small_done / bulk_done:.0%} del lote grande."
+            )
+        )
+
+    @staticmethod
+    def _engine(graph, options) -> AsyncWorkflowEngine:
+        return AsyncWorkflowEngine(
+            max_concurrency=options["max_concurrency"],
+            tenant_limit=options["tenant_limit"],
+            provider_limits={},
+            api_key_limit=options["api_key_limit"],
+            graph_resolver=lambda name: graph,
+        )
+
+    @staticmethod
+    def _submit(engine, tenant_id, llm, state):
+        return engine.submit(
+            "probe",
+            state,
+            tenant_id=tenant_id,
+            llm=llm,
+            provider="fake",
+            api_key=f"key-{tenant_id}",
+        )
+
+    @staticmethod
+    async def _finished_at(runs, started: float) -> float:
+        await asyncio.gather(*runs, return_exceptions=True)
+        return time.perf_counter() - started
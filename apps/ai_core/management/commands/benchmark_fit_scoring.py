@@ -0,0 +1,98 @@
+"""
+Benchmark del scoring de encaje candidato-vacante.
+
+Compara ``analyze_candidate_fit`` invocada por candidato contra
+``BatchFitScorer`` sobre perfiles sintéticos, y verifica que ambos
+produzcan el mismo top-K.
+
+Uso:
+    python manage.py benchmark_fit_scoring --candidates 50000 --top-k 20
+"""
+
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.ai_core.services.batch_fit_scorer import BatchFitScorer
+from apps.ai_core.tools.candidate_tools import analyze_candidate_fit
+
+
+class Command(BaseCommand):
+    help = "Mide el scoring por candidato vs. vectorizado (datos sintéticos)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--candidates", type=int, default=50_000)
+        parser.add_argument("--vocabulary", type=int, default=500)
+        parser.add_argument("--skills-per-candidate", type=int, default=8)
+        parser.add_argument("--required-skills", type=int, default=6)
+        parser.add_argument("--top-k", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        vocabulary = [f"Skill{i}" for i in range(options["vocabulary"])]
+        profiles = [
+            (
+                candidate_id,
+                {
+                    "skills": rng.sample(vocabulary, options["skills_per_candidate"]),
+                    "experience_years": rng.randint(0, 15),
+                },
+            )
+            for candidate_id in range(options["candidates"])
+        ]
+        requirements = {
+            "required_skills": rng.sample(vocabulary[:50], options["required_skills"]),
+            "min_experience_years": 3,
+        }
+        top_k = options["top_k"]
+
+        started = time.perf_counter()
+        results = [
+            (candidate_id, analyze_candidate_fit.func(profile, requirements))
+            for candidate_id, profile in profiles
+        ]
+        results.sort(
+            key=lambda item: (-item[1]["match_score"], not item[1]["experience_match"])
+        )
+        per_candidate = time.perf_counter() - started
+
+        started = time.perf_counter()
+        scorer = BatchFitScorer(profiles)
+        built = time.perf_counter() - started
+        started = time.perf_counter()
+        ranking = scorer.top_k(requirements, k=top_k)
+        scored = time.perf_counter() - started
+
+        expected = [
+            {"candidate_id": candidate_id, **result}
+            for candidate_id, result in results[:top_k]
+        ]
+        matches = [_comparable(a) for a in ranking] == [
+            _comparable(b) for b in expected
+        ]
+
+        self.stdout.write(
+            f"{len(profiles)} candidatos, {options['required_skills']} skills "
+            f"requeridas, top-{top_k}."
+        )
+        self.stdout.write(f"Por candidato:  {per_candidate * 1000:,.1f} ms")
+        self.stdout.write(
+            f"Vectorizado:    {(built + scored) * 1000:,.1f} ms "
+            f"(matriz {built * 1000:,.1f} ms + scoring {scored * 1000:,.1f} ms)"
+        )
+        self.stdout.write(
+            f"Speedup: {per_candidate / (built + scored):,.1f}x "
+            f"({per_candidate / scored:,.0f}x reutilizando la matriz)."
+        )
+        style = self.style.SUCCESS if matches else self.style.ERROR
+        self.stdout.write(style(f"Top-K idéntico: {'sí' if matches else 'no'}."))
+
+
+def _comparable(result: dict) -> dict:
+    """Normaliza las listas (derivadas de sets) para comparar resultados."""
+    return {
+        key: sorted(value) if isinstance(value, list) else value
+        for key, value in result.items()
+    }
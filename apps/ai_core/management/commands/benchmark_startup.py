@@ -0,0 +1,123 @@
+"""
+Benchmark del tiempo de arranque (``python -X importtime``).
+
+Mide, en subprocesos limpios, cuánto tardan ``manage.py check`` y la
+carga de la app WSGI (``core.wsgi`` más el URLconf, como un worker de
+gunicorn antes del primer request). Reporta los módulos de mayor costo
+acumulado y si se cargaron SDKs pesados (langchain, proveedores de
+LLM, numpy/scipy), que deben importarse solo en el primer uso.
+
+Uso:
+    python manage.py benchmark_startup --runs 5
+    python manage.py benchmark_startup --max-ms 800   # falla si se excede
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+WSGI_LOAD = (
+    "import importlib, core.wsgi; from django.conf import settings; "
+    "importlib.import_module(settings.ROOT_URLCONF)"
+)
+
+TARGETS = {
+    "check": ["manage.py", "check"],
+    "wsgi": ["-c", WSGI_LOAD],
+}
+
+HEAVY_MODULES = (
+    "langchain_core",
+    "langchain_openai",
+    "langchain_anthropic",
+    "langchain_google_genai",
+    "langgraph",
+    "numpy",
+    "scipy",
+)
+
+
+class Command(BaseCommand):
+    help = "Mide el costo de imports al arrancar manage.py check y la app WSGI."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument("--top", type=int, default=10)
+        parser.add_argument(
+            "--target", choices=sorted(TARGETS), action="append", dest="targets"
+        )
+        parser.add_argument(
+            "--max-ms",
+            type=float,
+            help="Falla si la mediana de tiempo de imports supera este valor.",
+        )
+
+    def handle(self, *args, **options):
+        exceeded = []
+        for target in options["targets"] or list(TARGETS):
+            samples = [self._measure(target) for _ in range(options["runs"])]
+            wall = statistics.median(sample["wall"] for sample in samples)
+            imports = statistics.median(sample["imports"] for sample in samples)
+            last = samples[-1]
+
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n{target}"))
+            self.stdout.write(f"Tiempo total (mediana): {wall:,.1f} ms")
+            self.stdout.write(f"Imports (mediana):      {imports:,.1f} ms")
+            self.stdout.write(f"Top {options['top']} por costo acumulado:")
+            ranked = sorted(last["top_level"].items(), key=lambda item: -item[1])
+            for name, cumulative in ranked[: options["top"]]:
+                self.stdout.write(f"  {cumulative / 1000:>9,.1f} ms  {name}")
+
+            heavy = [name for name in HEAVY_MODULES if name in last["modules"]]
+            if heavy:
+                self.stdout.write(
+                    self.style.WARNING(f"SDKs pesados cargados: {', '.join(heavy)}")
+                )
+            else:
+                self.stdout.write(self.style.SUCCESS("SDKs pesados cargados: ninguno"))
+
+            if options["max_ms"] is not None and imports > options["max_ms"]:
+                exceeded.append(f"{target}: {imports:,.1f} ms")
+
+        if exceeded:
+            raise CommandError(
+                f"Arranque por encima de {options['max_ms']:,.1f} ms: "
+                + "; ".join(exceeded)
+            )
+
+    def _measure(self, target: str) -> dict:
+        """Ejecuta un arranque con ``-X importtime`` y parsea su salida."""
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", *TARGETS[target]],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+        )
+        wall = (time.perf_counter() - started) * 1000
+        if result.returncode:
+            raise CommandError(f"'{target}' falló:\n{result.stderr[-2000:]}")
+
+        modules: set[str] = set()
+        top_level: dict[str, int] = {}
+        total = 0
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "self [us]" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:") :].split("|")
+            total += int(self_us)
+            module = name.strip()
+            modules.add(module)
+            # Los módulos de primer nivel no llevan sangría en el árbol
+            if name.startswith(" ") and not name.startswith("  "):
+                top_level[module] = int(cumulative_us)
+        return {
+            "wall": wall,
+            "imports": total / 1000,
+            "modules": modules,
+            "top_level": top_level,
+        }
@@ -0,0 +1,57 @@
+"""
+Benchmark del costo de compilar workflows por ejecución.
+
+Compara construir y compilar ``SourcingWorkflowBuilder`` en cada
+ejecución (comportamiento anterior) contra reutilizar el grafo de
+``CompiledWorkflowCache``. Usa un chat model falso: mide solo el
+overhead del grafo, no la latencia del proveedor.
+
+Uso:
+    python manage.py benchmark_workflow_compilation --runs 200
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from apps.ai_core.workflows.compiled_workflow_cache import CompiledWorkflowCache
+from apps.ai_core.workflows.run_config import build_run_config
+from apps.ai_core.workflows.sourcing_graph import SourcingWorkflowBuilder
+
+
+class Command(BaseCommand):
+    help = "Mide el overhead por ejecución con y sin cache de grafos compilados."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=200)
+
+    def handle(self, *args, **options):
+        runs = options["runs"]
+        llm = FakeListChatModel(responses=["ok"])
+        state = {"vacancy_id": 1, "context": {"title": "Backend"}, "messages": []}
+        config = build_run_config(llm)
+
+        started = time.perf_counter()
+        for _ in range(runs):
+            SourcingWorkflowBuilder().build().invoke(state, config=config)
+        uncached = (time.perf_counter() - started) / runs
+
+        CompiledWorkflowCache.clear()
+        CompiledWorkflowCache.get(SourcingWorkflowBuilder.NAME)  # calentamiento
+        started = time.perf_counter()
+        for _ in range(runs):
+            CompiledWorkflowCache.get(SourcingWorkflowBuilder.NAME).invoke(
+                state, config=config
+            )
+        cached = (time.perf_counter() - started) / runs
+
+        self.stdout.write(f"{runs} ejecuciones del workflow de sourcing.")
+        self.stdout.write(f"Compilando por ejecución: {uncached * 1000:,.2f} ms")
+        self.stdout.write(f"Grafo cacheado:           {cached * 1000:,.2f} ms")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Ahorro: {(uncached - cached) * 1000:,.2f} ms por ejecución "
+                f"({(uncached - cached) / uncached:.0%}, {uncached / cached:,.1f}x)."
+            )
+        )
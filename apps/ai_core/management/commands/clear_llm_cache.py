@@ -0,0 +1,50 @@
+"""
+Comando para limpiar el cache de respuestas de LLM.
+
+Uso:
+    python manage.py clear_llm_cache --expired
+    python manage.py clear_llm_cache --tenant <uuid>
+    python manage.py clear_llm_cache --all
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.ai_core.adapters.llm_cache import get_llm_cache_backend
+
+
+class Command(BaseCommand):
+    help = "Elimina respuestas vencidas o descarta el cache de un tenant."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--expired", action="store_true", help="Solo entradas con TTL vencido"
+        )
+        parser.add_argument("--tenant", help="ID del tenant a limpiar")
+        parser.add_argument("--all", action="store_true", help="Todos los tenants")
+        parser.add_argument(
+            "--backend", help="Backend (default: setting AI_LLM_CACHE_BACKEND)"
+        )
+
+    def handle(self, *args, **options):
+        try:
+            backend = get_llm_cache_backend(options["backend"])
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+        if backend is None:
+            raise CommandError("El cache de respuestas de LLM está desactivado.")
+
+        if options["expired"]:
+            deleted = backend.purge_expired()
+            self.stdout.write(
+                self.style.SUCCESS(f"{deleted} respuestas vencidas eliminadas.")
+            )
+        elif options["tenant"]:
+            backend.clear(options["tenant"])
+            self.stdout.write(
+                self.style.SUCCESS(f"Cache del tenant {options['tenant']} descartado.")
+            )
+        elif options["all"]:
+            backend.clear()
+            self.stdout.write(self.style.SUCCESS("Cache de respuestas descartado."))
+        else:
+            raise CommandError("Indique --expired, --tenant <id> o --all.")
@@ -0,0 +1,43 @@
+"""
+Comando para ver las estadísticas del cache de herramientas.
+
+Uso:
+    python manage.py tool_cache_stats
+    python manage.py tool_cache_stats --reset
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.ai_core.tools import ToolRegistry
+
+
+class Command(BaseCommand):
+    help = "Muestra hits, misses y hit rate del cache de resultados de tools."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="Pone los contadores en cero"
+        )
+
+    def handle(self, *args, **options):
+        caches = ToolRegistry.cached_tools()
+        stats = ToolRegistry.get_stats()
+        if options["reset"]:
+            stats.reset(list(caches))
+            self.stdout.write(self.style.SUCCESS("Contadores del cache reiniciados."))
+            return
+
+        totals = stats.read(list(caches))
+        self.stdout.write(
+            f"{'tool':<32} {'ttl':>7} {'hits':>9} {'misses':>9} "
+            f"{'hit rate':>9} {'bypass':>8} {'evict':>8}"
+        )
+        for name, result_cache in sorted(caches.items()):
+            counts = totals[name]
+            calls = counts["hits"] + counts["misses"]
+            hit_rate = f"{counts['hits'] / calls:.1%}" if calls else "-"
+            self.stdout.write(
+                f"{name:<32} {result_cache.policy.ttl:>6}s {counts['hits']:>9} "
+                f"{counts['misses']:>9} {hit_rate:>9} {counts['bypasses']:>8} "
+                f"{counts['evictions']:>8}"
+            )
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-19 08:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_core', '0001_initial'),
+        ('tenants', '0007_tenantaiconfig_response_cache_enabled'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='agentexecutionlog',
+            name='cache_hit',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.CreateModel(
+            name='LLMResponseCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64)),
+                ('response', models.JSONField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='tenants.tenant')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('tenant', 'key'), name='unique_llm_cache_tenant_key')],
+            },
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:13
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_core', '0003_workflow_execution'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='agentexecutionlog',
+            name='run_id',
+            field=models.UUIDField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='agentexecutionlog',
+            name='start_time',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
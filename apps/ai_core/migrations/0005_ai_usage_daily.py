@@ -0,0 +1,35 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:18
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ai_core', '0004_agent_log_run_id'),
+        ('tenants', '0007_tenantaiconfig_response_cache_enabled'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AIUsageDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('provider', models.CharField(max_length=50)),
+                ('model', models.CharField(max_length=100)),
+                ('requests', models.PositiveIntegerField(default=0)),
+                ('cache_hits', models.PositiveIntegerField(default=0)),
+                ('estimated_requests', models.PositiveIntegerField(default=0)),
+                ('tokens_input', models.BigIntegerField(default=0)),
+                ('tokens_output', models.BigIntegerField(default=0)),
+                ('cost_usd', models.DecimalField(decimal_places=6, default=0, max_digits=14)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='tenants.tenant')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('tenant', 'date', 'provider', 'model'), name='unique_ai_usage_daily')],
+            },
+        ),
+    ]
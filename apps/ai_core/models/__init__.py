@@ -1,4 +1,13 @@
 from .ai_config import TenantAIConfig
+from .ai_usage_daily import AIUsageDaily
+from .llm_response_cache_entry import LLMResponseCacheEntry
 from .logs import AgentExecutionLog
+from .workflow_execution import WorkflowExecution
 
-__all__ = ["AgentExecutionLog", "TenantAIConfig"]
+__all__ = [
+    "AIUsageDaily",
+    "AgentExecutionLog",
+    "LLMResponseCacheEntry",
+    "TenantAIConfig",
+    "WorkflowExecution",
+]
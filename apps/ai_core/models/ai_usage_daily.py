@@ -0,0 +1,45 @@
+from django.db import models
+
+from apps.tenants.models import Tenant
+
+
+class AIUsageDaily(models.Model):
+    """
+    Uso de LLM acumulado por tenant, día, proveedor y modelo.
+
+    Se actualiza con upserts que suman a la fila del día (ver
+    ``AIUsageDailyRepository.increment``), así que facturación y
+    dashboards leen una fila por día y modelo en lugar de recorrer
+    ``AgentExecutionLog``.
+    """
+
+    tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE)
+    date = models.DateField()
+
+    # Ej: "openai", "claude", "gemini"
+    provider = models.CharField(max_length=50)
+    # Ej: "gpt-4o-mini"
+    model = models.CharField(max_length=100)
+
+    # Llamadas facturables y respuestas servidas desde el cache (sin costo)
+    requests = models.PositiveIntegerField(default=0)
+    cache_hits = models.PositiveIntegerField(default=0)
+    # Llamadas cuyo uso se estimó localmente (el proveedor no lo informó)
+    estimated_requests = models.PositiveIntegerField(default=0)
+
+    tokens_input = models.BigIntegerField(default=0)
+    tokens_output = models.BigIntegerField(default=0)
+    cost_usd = models.DecimalField(max_digits=14, decimal_places=6, default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tenant", "date", "provider", "model"],
+                name="unique_ai_usage_daily",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.tenant_id} {self.date} {self.provider}/{self.model}"
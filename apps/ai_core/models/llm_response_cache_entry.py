@@ -0,0 +1,31 @@
+from django.db import models
+
+from apps.tenants.models import Tenant
+
+
+class LLMResponseCacheEntry(models.Model):
+    """
+    Respuesta de LLM cacheada (backend ``database`` del cache).
+
+    ``key`` es el hash de proveedor, modelo, parámetros y prompt
+    normalizado; siempre se consulta junto con el tenant.
+    """
+
+    tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE)
+    key = models.CharField(max_length=64)
+
+    # Generaciones serializadas (mensajes de LangChain como dict)
+    response = models.JSONField()
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tenant", "key"], name="unique_llm_cache_tenant_key"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.tenant_id}:{self.key}"
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 from apps.tenants.models import Tenant
 
@@ -26,12 +27,16 @@ class AgentExecutionLog(models.Model):
     # Ej: "screening_agent"
     node_name = models.CharField(max_length=100)
 
+    # run_id de LangChain del nodo (correlaciona inicio y fin del paso)
+    run_id = models.UUIDField(null=True, blank=True, db_index=True)
+
     # Inputs y Outputs (JSON grandes)
     input_data = models.JSONField()
     output_data = models.JSONField(null=True)
 
     # Métricas clave
-    start_time = models.DateTimeField(auto_now_add=True)
+    # Lo fija quien registra el paso (los logs se escriben en lote, después)
+    start_time = models.DateTimeField(default=timezone.now)
     end_time = models.DateTimeField(null=True)
     duration_seconds = models.FloatField(null=True)
 
@@ -40,6 +45,9 @@ class AgentExecutionLog(models.Model):
     tokens_output = models.IntegerField(default=0)
     cost_usd = models.DecimalField(max_digits=10, decimal_places=6, default=0)
 
+    # True si la respuesta salió del cache de respuestas (sin costo)
+    cache_hit = models.BooleanField(default=False)
+
     status = models.CharField(
         max_length=20, default=STATUS_RUNNING, choices=STATUS_CHOICES
     )
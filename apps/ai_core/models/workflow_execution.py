@@ -0,0 +1,71 @@
+import uuid
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from apps.tenants.models import Tenant
+
+
+class WorkflowExecution(models.Model):
+    """
+    Ejecución de un workflow encolada en Celery.
+
+    Es la fuente de verdad del estado: el worker la reclama antes de
+    ejecutar (una entrega duplicada de la tarea no vuelve a correr el
+    workflow) y guarda aquí el resultado, que se consulta por API sin
+    depender del result backend de Celery.
+    """
+
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_RETRYING = "retrying"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_RETRYING, "Retrying"),
+        (STATUS_SUCCEEDED, "Succeeded"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    FINISHED_STATUSES = (STATUS_SUCCEEDED, STATUS_FAILED)
+
+    # Nombres de los builders (``SourcingWorkflowBuilder.NAME``...)
+    WORKFLOW_SOURCING = "sourcing"
+    WORKFLOW_SCREENING = "screening"
+
+    # También es el task_id de Celery
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    tenant = models.ForeignKey(Tenant, on_delete=models.CASCADE)
+
+    # Ej: "sourcing", "screening"
+    workflow_name = models.CharField(max_length=100)
+
+    # Ej: {"vacancy_id": 12}
+    input_data = models.JSONField()
+
+    # Cola de Celery elegida según el plan del tenant
+    queue = models.CharField(max_length=50)
+
+    status = models.CharField(
+        max_length=20, default=STATUS_PENDING, choices=STATUS_CHOICES
+    )
+    attempts = models.PositiveIntegerField(default=0)
+
+    result = models.JSONField(null=True, encoder=DjangoJSONEncoder)
+    error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True)
+    finished_at = models.DateTimeField(null=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["tenant", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.workflow_name} {self.id} - {self.status}"
@@ -0,0 +1,17 @@
+"""Repositorios de la app ai_core."""
+
+from .ai_usage_daily_repository import (
+    AIUsageDailyRepository,
+    AIUsageDailyRepositoryProtocol,
+)
+from .workflow_execution_repository import (
+    WorkflowExecutionRepository,
+    WorkflowExecutionRepositoryProtocol,
+)
+
+__all__ = [
+    "AIUsageDailyRepository",
+    "AIUsageDailyRepositoryProtocol",
+    "WorkflowExecutionRepository",
+    "WorkflowExecutionRepositoryProtocol",
+]
@@ -0,0 +1,104 @@
+"""
+Repositorio para AIUsageDaily.
+
+Este módulo implementa el patrón Repository para el rollup diario de
+uso de LLM por tenant.
+"""
+
+from datetime import date
+from typing import Protocol
+
+from django.db import connection
+from django.db.models import QuerySet, Sum
+from django.utils import timezone
+
+from apps.ai_core.models import AIUsageDaily
+
+# Contadores que el upsert suma a la fila existente
+COUNTER_FIELDS = [
+    "requests",
+    "cache_hits",
+    "estimated_requests",
+    "tokens_input",
+    "tokens_output",
+    "cost_usd",
+]
+
+
+class AIUsageDailyRepositoryProtocol(Protocol):
+    """Interface para el repositorio del rollup diario de uso de IA."""
+
+    def increment(self, rows: list[AIUsageDaily]) -> None: ...
+
+    def get_by_tenant(
+        self, tenant_id: str, since: date, until: date
+    ) -> QuerySet[AIUsageDaily]: ...
+
+    def totals(self, tenant_id: str, since: date, until: date) -> dict: ...
+
+
+class AIUsageDailyRepository:
+    """Implementación del repositorio del rollup diario de uso de IA."""
+
+    def increment(self, rows: list[AIUsageDaily]) -> None:
+        """
+        Suma los contadores de ``rows`` a sus filas del día.
+
+        Un solo INSERT ... ON CONFLICT DO UPDATE de varias filas
+        (PostgreSQL y SQLite >= 3.35). Las filas deben venir ya
+        agregadas: una misma (tenant, fecha, proveedor, modelo) no
+        puede repetirse en la sentencia.
+
+        Args:
+            rows: Instancias sin guardar con los incrementos.
+        """
+        if not rows:
+            return
+        opts = AIUsageDaily._meta
+        qn = connection.ops.quote_name
+        table = qn(opts.db_table)
+
+        insert_fields = [f for f in opts.concrete_fields if not f.primary_key]
+        now = timezone.now()
+        params = []
+        for row in rows:
+            row.updated_at = now
+            params += [
+                f.get_db_prep_save(getattr(row, f.attname), connection)
+                for f in insert_fields
+            ]
+
+        columns = ", ".join(qn(f.column) for f in insert_fields)
+        placeholders = ", ".join(["%s"] * len(insert_fields))
+        values = ", ".join([f"({placeholders})"] * len(rows))
+        conflict = ", ".join(
+            qn(opts.get_field(name).column)
+            for name in ("tenant", "date", "provider", "model")
+        )
+        assignments = ", ".join(
+            [
+                f"{qn(name)} = {table}.{qn(name)} + EXCLUDED.{qn(name)}"
+                for name in COUNTER_FIELDS
+            ]
+            + [f"{qn('updated_at')} = EXCLUDED.{qn('updated_at')}"]
+        )
+        sql = (
+            f"INSERT INTO {table} ({columns}) VALUES {values} "
+            f"ON CONFLICT ({conflict}) DO UPDATE SET {assignments}"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+    def get_by_tenant(
+        self, tenant_id: str, since: date, until: date
+    ) -> QuerySet[AIUsageDaily]:
+        """Filas del tenant entre ``since`` y ``until`` (inclusive)."""
+        return AIUsageDaily.objects.filter(
+            tenant_id=tenant_id, date__gte=since, date__lte=until
+        ).order_by("date", "provider", "model")
+
+    def totals(self, tenant_id: str, since: date, until: date) -> dict:
+        """Suma de los contadores del tenant en el rango."""
+        return self.get_by_tenant(tenant_id, since, until).aggregate(
+            **{name: Sum(name) for name in COUNTER_FIELDS}
+        )
@@ -0,0 +1,88 @@
+"""
+Repositorio para WorkflowExecution.
+
+Este módulo implementa el patrón Repository para las ejecuciones de
+workflows encoladas en Celery.
+"""
+
+from datetime import timedelta
+from typing import Protocol
+
+from django.db.models import F, Q
+from django.utils import timezone
+
+from apps.ai_core.models import WorkflowExecution
+
+
+class WorkflowExecutionRepositoryProtocol(Protocol):
+    """Interface para el repositorio de ejecuciones de workflows."""
+
+    def get_by_id(self, execution_id: str) -> WorkflowExecution | None: ...
+
+    def get_for_tenant(
+        self, tenant_id: str, execution_id: str
+    ) -> WorkflowExecution | None: ...
+
+    def create(self, **kwargs) -> WorkflowExecution: ...
+
+    def claim(self, execution_id: str, lease_seconds: int) -> bool: ...
+
+    def save_outcome(self, execution: WorkflowExecution) -> None: ...
+
+
+class WorkflowExecutionRepository:
+    """Implementación del repositorio de ejecuciones de workflows."""
+
+    def get_by_id(self, execution_id: str) -> WorkflowExecution | None:
+        try:
+            return WorkflowExecution.objects.get(id=execution_id)
+        except (WorkflowExecution.DoesNotExist, ValueError):
+            return None
+
+    def get_for_tenant(
+        self, tenant_id: str, execution_id: str
+    ) -> WorkflowExecution | None:
+        try:
+            return WorkflowExecution.objects.get(id=execution_id, tenant_id=tenant_id)
+        except (WorkflowExecution.DoesNotExist, ValueError):
+            return None
+
+    def create(self, **kwargs) -> WorkflowExecution:
+        return WorkflowExecution.objects.create(**kwargs)
+
+    def claim(self, execution_id: str, lease_seconds: int) -> bool:
+        """
+        Marca la ejecución como ``running`` si nadie la está ejecutando.
+
+        Es un UPDATE condicional (atómico sin bloqueos explícitos): gana
+        una sola entrega de la tarea. Una ejecución ``running`` cuyo
+        ``started_at`` superó el lease se considera huérfana (worker
+        caído) y puede reclamarse de nuevo.
+
+        Args:
+            execution_id: ID de la ejecución.
+            lease_seconds: Duración máxima de un intento.
+
+        Returns:
+            bool: True si esta entrega reclamó la ejecución.
+        """
+        now = timezone.now()
+        claimable = Q(
+            status__in=[
+                WorkflowExecution.STATUS_PENDING,
+                WorkflowExecution.STATUS_RETRYING,
+            ]
+        ) | Q(
+            status=WorkflowExecution.STATUS_RUNNING,
+            started_at__lt=now - timedelta(seconds=lease_seconds),
+        )
+        return bool(
+            WorkflowExecution.objects.filter(claimable, id=execution_id).update(
+                status=WorkflowExecution.STATUS_RUNNING,
+                attempts=F("attempts") + 1,
+                started_at=now,
+            )
+        )
+
+    def save_outcome(self, execution: WorkflowExecution) -> None:
+        execution.save(update_fields=["status", "result", "error", "finished_at"])
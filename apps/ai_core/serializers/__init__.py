@@ -0,0 +1,11 @@
+"""Serializers de la app ai_core."""
+
+from .ai_usage_daily_serializer import AIUsageDailySerializer
+from .ai_usage_totals_serializer import AIUsageTotalsSerializer
+from .workflow_execution_serializer import WorkflowExecutionSerializer
+
+__all__ = [
+    "AIUsageDailySerializer",
+    "AIUsageTotalsSerializer",
+    "WorkflowExecutionSerializer",
+]
@@ -0,0 +1,29 @@
+"""
+Serializer para AIUsageDaily.
+
+Este módulo contiene el serializer de lectura del rollup diario de
+consumo de IA de un tenant.
+"""
+
+from rest_framework import serializers
+
+from apps.ai_core.models import AIUsageDaily
+
+
+class AIUsageDailySerializer(serializers.ModelSerializer):
+    """Serializer para lectura de una fila diaria de consumo."""
+
+    class Meta:
+        model = AIUsageDaily
+        fields = [
+            "date",
+            "provider",
+            "model",
+            "requests",
+            "cache_hits",
+            "estimated_requests",
+            "tokens_input",
+            "tokens_output",
+            "cost_usd",
+        ]
+        read_only_fields = fields
@@ -0,0 +1,19 @@
+"""
+Serializer para los totales de consumo de IA.
+
+Este módulo contiene el serializer de los contadores sumados de
+``AIUsageDaily`` en un rango de fechas.
+"""
+
+from rest_framework import serializers
+
+
+class AIUsageTotalsSerializer(serializers.Serializer):
+    """Serializer para los totales de consumo de un rango."""
+
+    requests = serializers.IntegerField(read_only=True)
+    cache_hits = serializers.IntegerField(read_only=True)
+    estimated_requests = serializers.IntegerField(read_only=True)
+    tokens_input = serializers.IntegerField(read_only=True)
+    tokens_output = serializers.IntegerField(read_only=True)
+    cost_usd = serializers.DecimalField(max_digits=14, decimal_places=6, read_only=True)
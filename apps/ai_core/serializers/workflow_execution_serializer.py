@@ -0,0 +1,31 @@
+"""
+Serializer para WorkflowExecution.
+
+Este módulo contiene el serializer para consultar el estado y el
+resultado de una ejecución de workflow encolada.
+"""
+
+from rest_framework import serializers
+
+from apps.ai_core.models import WorkflowExecution
+
+
+class WorkflowExecutionSerializer(serializers.ModelSerializer):
+    """Serializer para lectura del estado de una ejecución de workflow."""
+
+    class Meta:
+        model = WorkflowExecution
+        fields = [
+            "id",
+            "workflow_name",
+            "input_data",
+            "queue",
+            "status",
+            "attempts",
+            "result",
+            "error",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
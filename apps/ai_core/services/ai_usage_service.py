@@ -0,0 +1,71 @@
+"""
+Servicio de aplicación para el consumo de IA por tenant.
+
+Este módulo contiene los casos de uso de lectura del rollup diario
+``AIUsageDaily`` (tokens, costo y hits de cache por día y modelo).
+"""
+
+from datetime import date, timedelta
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from apps.ai_core.repositories import AIUsageDailyRepository
+
+# Rango por defecto y máximo de una consulta de consumo
+DEFAULT_USAGE_DAYS = 30
+MAX_USAGE_DAYS = 366
+
+
+class AIUsageService:
+    """Servicio de aplicación para consultar el consumo de IA."""
+
+    def __init__(self, usage_repo: AIUsageDailyRepository | None = None):
+        self.usage_repo = usage_repo or AIUsageDailyRepository()
+
+    def get_usage(
+        self, tenant_id: str, since: str | None = None, until: str | None = None
+    ) -> dict:
+        """
+        Consumo del tenant por día y modelo, con los totales del rango.
+
+        Args:
+            tenant_id: ID del tenant.
+            since: Fecha ISO inicial (default: 30 días antes de ``until``).
+            until: Fecha ISO final, inclusive (default: hoy).
+
+        Returns:
+            dict: ``since``, ``until``, ``rows`` y ``totals``.
+
+        Raises:
+            ValueError: Si las fechas son inválidas o el rango excede
+                ``MAX_USAGE_DAYS``.
+        """
+        until_date = self._parse(until, "until") or timezone.localdate()
+        since_date = self._parse(since, "since") or (
+            until_date - timedelta(days=DEFAULT_USAGE_DAYS - 1)
+        )
+        if since_date > until_date:
+            raise ValueError("since no puede ser posterior a until")
+        if (until_date - since_date).days >= MAX_USAGE_DAYS:
+            raise ValueError(f"El rango no puede exceder {MAX_USAGE_DAYS} días")
+
+        totals = self.usage_repo.totals(tenant_id, since_date, until_date)
+        return {
+            "since": since_date,
+            "until": until_date,
+            "rows": self.usage_repo.get_by_tenant(tenant_id, since_date, until_date),
+            "totals": {name: value or 0 for name, value in totals.items()},
+        }
+
+    @staticmethod
+    def _parse(value: str | None, field: str) -> date | None:
+        if not value:
+            return None
+        try:
+            parsed = parse_date(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValueError(f"{field} debe ser una fecha YYYY-MM-DD")
+        return parsed
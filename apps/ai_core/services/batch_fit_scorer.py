@@ -0,0 +1,177 @@
+"""
+Scoring vectorizado de encaje candidato-vacante.
+
+Este módulo evalúa muchos candidatos contra una vacante en una sola
+pasada matricial, con los mismos criterios que la tool
+``analyze_candidate_fit`` (que evalúa un candidato por llamada).
+"""
+
+from collections.abc import Hashable, Iterable
+
+import numpy as np
+from scipy import sparse
+
+
+def fit_recommendation(match_percentage: float) -> str:
+    """Recomendación según el porcentaje de skills requeridas cubiertas."""
+    if match_percentage >= 70:
+        return "Strong match"
+    if match_percentage >= 40:
+        return "Partial match"
+    return "Weak match"
+
+
+class BatchFitScorer:
+    """
+    Matriz dispersa candidato x skill para scoring por lotes.
+
+    Las skills (en minúsculas, como en ``analyze_candidate_fit``) se
+    codifican como IDs enteros. La matriz se construye una vez y puede
+    evaluarse contra varias vacantes: cada evaluación es un producto
+    matriz-vector sobre todos los candidatos.
+
+    Example:
+        >>> scorer = BatchFitScorer([(1, {"skills": ["Python"]})])
+        >>> scorer.top_k({"required_skills": ["python"]}, k=5)[0]["match_score"]
+        100.0
+    """
+
+    def __init__(self, candidates: Iterable[tuple[Hashable, dict]]):
+        """
+        Construye la matriz a partir de perfiles de candidatos.
+
+        Args:
+            candidates: Tuplas ``(candidate_id, perfil)``; el perfil tiene
+                el formato de ``analyze_candidate_fit`` (``skills`` y
+                ``experience_years``).
+        """
+        self.vocabulary: dict[str, int] = {}
+        self.candidate_ids: list[Hashable] = []
+        years: list[float] = []
+        indices: list[int] = []
+        indptr = [0]
+
+        for candidate_id, profile in candidates:
+            skill_ids = {
+                self.vocabulary.setdefault(skill.lower(), len(self.vocabulary))
+                for skill in profile.get("skills", [])
+            }
+            indices.extend(skill_ids)
+            indptr.append(len(indices))
+            self.candidate_ids.append(candidate_id)
+            years.append(profile.get("experience_years", 0))
+
+        self.experience_years = np.asarray(years, dtype=np.float64)
+        self._years = years
+        self.matrix = sparse.csr_matrix(
+            (
+                np.ones(len(indices), dtype=np.int32),
+                np.asarray(indices, dtype=np.int32),
+                np.asarray(indptr, dtype=np.int64),
+            ),
+            shape=(len(self.candidate_ids), len(self.vocabulary)),
+        )
+        self._skill_names = np.array(list(self.vocabulary), dtype=object)
+
+    def __len__(self) -> int:
+        return len(self.candidate_ids)
+
+    def evaluate(self, job_requirements: dict) -> dict[str, np.ndarray]:
+        """
+        Evalúa a todos los candidatos contra una vacante.
+
+        Args:
+            job_requirements: ``required_skills`` y ``min_experience_years``.
+
+        Returns:
+            dict[str, np.ndarray]: Por candidato: ``matching_count``,
+                ``missing_count``, ``match_score`` (0-100) y
+                ``experience_match``.
+        """
+        required = {
+            skill.lower() for skill in job_requirements.get("required_skills", [])
+        }
+        known = [
+            self.vocabulary[skill] for skill in required if skill in self.vocabulary
+        ]
+
+        if known:
+            required_vector = np.zeros(len(self.vocabulary), dtype=np.int32)
+            required_vector[known] = 1
+            matching = self.matrix @ required_vector
+        else:
+            matching = np.zeros(len(self), dtype=np.int32)
+
+        # Solo hay len(required) + 1 porcentajes posibles: se calculan con
+        # la misma aritmética (y redondeo) que la tool y se indexan.
+        percentages = np.array(
+            [
+                round(count / len(required) * 100, 2)
+                for count in range(len(required) + 1)
+            ]
+            if required
+            else [0.0]
+        )
+        match_score = percentages[matching]
+        return {
+            "matching_count": matching,
+            "missing_count": len(required) - matching,
+            "match_score": match_score,
+            "experience_match": self.experience_years
+            >= job_requirements.get("min_experience_years", 0),
+        }
+
+    def top_k(self, job_requirements: dict, k: int = 10) -> list[dict]:
+        """
+        Retorna los ``k`` candidatos con mejor encaje.
+
+        El orden es: más skills requeridas cubiertas, luego quienes
+        cumplen la experiencia mínima, luego el orden de entrada.
+
+        Returns:
+            list[dict]: Resultado de ``analyze_candidate_fit`` para cada
+                candidato, más ``candidate_id``.
+        """
+        if k <= 0 or not len(self):
+            return []
+        evaluation = self.evaluate(job_requirements)
+        matching = evaluation["matching_count"]
+        experience = evaluation["experience_match"]
+
+        # Clave única y descendente: matching, luego experiencia
+        rank_key = matching.astype(np.int64) * 2 + experience
+        if k < len(self):
+            threshold = np.partition(rank_key, len(self) - k)[len(self) - k]
+            candidates = np.flatnonzero(rank_key >= threshold)
+        else:
+            candidates = np.arange(len(self))
+        order = candidates[np.lexsort((candidates, -rank_key[candidates]))][:k]
+
+        return [self._result(int(row), job_requirements) for row in order]
+
+    def _result(self, row: int, job_requirements: dict) -> dict:
+        """Arma el detalle de ``analyze_candidate_fit`` para una fila."""
+        start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+        candidate_skills = set(self._skill_names[self.matrix.indices[start:end]])
+        required_skills = {
+            skill.lower() for skill in job_requirements.get("required_skills", [])
+        }
+
+        matching_skills = candidate_skills & required_skills
+        match_percentage = (
+            len(matching_skills) / len(required_skills) * 100 if required_skills else 0
+        )
+        candidate_years = self._years[row]
+        required_years = job_requirements.get("min_experience_years", 0)
+
+        return {
+            "candidate_id": self.candidate_ids[row],
+            "match_score": round(match_percentage, 2),
+            "matching_skills": list(matching_skills),
+            "missing_skills": list(required_skills - candidate_skills),
+            "extra_skills": list(candidate_skills - required_skills),
+            "experience_match": candidate_years >= required_years,
+            "candidate_years": candidate_years,
+            "required_years": required_years,
+            "recommendation": fit_recommendation(match_percentage),
+        }
@@ -0,0 +1,229 @@
+"""
+Servicio de aplicación para ejecuciones de workflows en Celery.
+
+Este módulo contiene los casos de uso para registrar ejecuciones de
+sourcing y screening, elegir su cola según el plan del tenant y
+ejecutarlas desde los workers de forma idempotente.
+"""
+
+import logging
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.ai_core.models import WorkflowExecution
+from apps.ai_core.repositories import WorkflowExecutionRepository
+from apps.recruitment.adapters.skill_normalizer import split_skill_list
+from apps.recruitment.repositories import (
+    ApplicationRepository,
+    JobVacancyRepository,
+)
+from apps.tenants.repositories import TenantRepository
+
+logger = logging.getLogger(__name__)
+
+
+class WorkflowExecutionService:
+    """
+    Servicio de aplicación para ejecuciones de workflows encoladas.
+
+    El registro ``WorkflowExecution`` se crea en la request y la tarea
+    solo recibe su ID; el worker lee las entidades al ejecutar, de modo
+    que un reintento usa datos actuales y nunca duplica el registro.
+    """
+
+    def __init__(
+        self,
+        execution_repo: WorkflowExecutionRepository | None = None,
+        tenant_repo: TenantRepository | None = None,
+        vacancy_repo: JobVacancyRepository | None = None,
+        application_repo: ApplicationRepository | None = None,
+    ):
+        self.execution_repo = execution_repo or WorkflowExecutionRepository()
+        self.tenant_repo = tenant_repo or TenantRepository()
+        self.vacancy_repo = vacancy_repo or JobVacancyRepository()
+        self.application_repo = application_repo or ApplicationRepository()
+        self.runners = {
+            WorkflowExecution.WORKFLOW_SOURCING: self._run_sourcing,
+            WorkflowExecution.WORKFLOW_SCREENING: self._run_screening,
+        }
+
+    def create_sourcing(self, tenant_id: str, vacancy_id: int) -> WorkflowExecution:
+        """
+        Registra un sourcing pendiente para una vacante del tenant.
+
+        Raises:
+            ValueError: Si la vacante no existe o es de otro tenant.
+        """
+        vacancy = self.vacancy_repo.get_by_id(vacancy_id)
+        if vacancy is None or str(vacancy.tenant_id) != str(tenant_id):
+            raise ValueError("Vacante no encontrada")
+        return self._create(
+            tenant_id, WorkflowExecution.WORKFLOW_SOURCING, {"vacancy_id": vacancy.id}
+        )
+
+    def create_screening(
+        self, tenant_id: str, application_id: int
+    ) -> WorkflowExecution:
+        """
+        Registra un screening pendiente para una postulación del tenant.
+
+        Raises:
+            ValueError: Si la postulación no existe o es de otro tenant.
+        """
+        application = self.application_repo.get_by_id(application_id)
+        if application is None or str(application.tenant_id) != str(tenant_id):
+            raise ValueError("Postulación no encontrada")
+        return self._create(
+            tenant_id,
+            WorkflowExecution.WORKFLOW_SCREENING,
+            {"application_id": application.id},
+        )
+
+    def get_execution(
+        self, tenant_id: str, execution_id: str
+    ) -> WorkflowExecution | None:
+        """Obtiene una ejecución del tenant por su ID."""
+        return self.execution_repo.get_for_tenant(tenant_id, execution_id)
+
+    def queue_for_plan(self, plan: str) -> str:
+        """Cola de Celery para un plan (``AI_WORKFLOW_PLAN_QUEUES``)."""
+        return settings.AI_WORKFLOW_PLAN_QUEUES.get(
+            plan, settings.AI_WORKFLOW_DEFAULT_QUEUE
+        )
+
+    def run(self, execution_id: str) -> WorkflowExecution | None:
+        """
+        Ejecuta el workflow si esta entrega logra reclamarlo.
+
+        Una entrega duplicada (``acks_late``) o la reentrega de una
+        ejecución terminada no vuelve a correr el workflow: retorna el
+        registro tal como está. Un ``ValueError`` (datos inválidos,
+        tenant sin configuración de IA) falla la ejecución sin
+        reintentos; cualquier otro error la deja en ``retrying`` hasta
+        agotar ``AI_WORKFLOW_MAX_RETRIES``.
+
+        Args:
+            execution_id: ID de la ejecución.
+
+        Returns:
+            WorkflowExecution | None: Registro con el estado final del
+                intento, o None si no existe.
+        """
+        if not self.execution_repo.claim(execution_id, settings.CELERY_TASK_TIME_LIMIT):
+            return self.execution_repo.get_by_id(execution_id)
+
+        execution = self.execution_repo.get_by_id(execution_id)
+        try:
+            state = self.runners[execution.workflow_name](execution)
+        except ValueError as e:
+            self._finish(execution, WorkflowExecution.STATUS_FAILED, error=str(e))
+        except Exception as e:
+            logger.warning(
+                "Workflow execution %s failed (attempt %s)",
+                execution.id,
+                execution.attempts,
+                exc_info=True,
+            )
+            retryable = execution.attempts <= settings.AI_WORKFLOW_MAX_RETRIES
+            self._finish(
+                execution,
+                (
+                    WorkflowExecution.STATUS_RETRYING
+                    if retryable
+                    else WorkflowExecution.STATUS_FAILED
+                ),
+                error=f"{type(e).__name__}: {e}",
+            )
+        else:
+            self._finish(
+                execution,
+                WorkflowExecution.STATUS_SUCCEEDED,
+                result={
+                    "final_output": state.get("final_output") or {},
+                    "messages": [
+                        getattr(message, "content", message)
+                        for message in state.get("messages", [])
+                    ],
+                },
+            )
+        return execution
+
+    def retry_countdown(self, execution: WorkflowExecution) -> int:
+        """
+        Segundos hasta el próximo intento de una ejecución no terminada.
+
+        ``retrying``: backoff exponencial desde
+        ``AI_WORKFLOW_RETRY_BACKOFF_SECONDS``. ``running`` (otra entrega
+        la tiene): lo que le queda del lease, tras lo cual se puede
+        reclamar si el worker murió.
+        """
+        if execution.status == WorkflowExecution.STATUS_RUNNING:
+            elapsed = (timezone.now() - execution.started_at).total_seconds()
+            return max(int(settings.CELERY_TASK_TIME_LIMIT - elapsed) + 1, 1)
+        return settings.AI_WORKFLOW_RETRY_BACKOFF_SECONDS * 2 ** max(
+            execution.attempts - 1, 0
+        )
+
+    def _create(
+        self, tenant_id: str, workflow_name: str, input_data: dict
+    ) -> WorkflowExecution:
+        tenant = self.tenant_repo.get_by_id(tenant_id)
+        if tenant is None:
+            raise ValueError("Tenant no encontrado")
+        return self.execution_repo.create(
+            tenant=tenant,
+            workflow_name=workflow_name,
+            input_data=input_data,
+            queue=self.queue_for_plan(tenant.plan),
+        )
+
+    def _finish(
+        self,
+        execution: WorkflowExecution,
+        status: str,
+        result: dict | None = None,
+        error: str = "",
+    ) -> None:
+        execution.status = status
+        execution.result = result
+        execution.error = error
+        if status in WorkflowExecution.FINISHED_STATUSES:
+            execution.finished_at = timezone.now()
+        self.execution_repo.save_outcome(execution)
+
+    def _run_sourcing(self, execution: WorkflowExecution) -> dict:
+        # LangGraph se carga al ejecutar, no al importar las views
+        from .workflow_service import start_sourcing_workflow
+
+        vacancy = self.vacancy_repo.get_by_id(execution.input_data["vacancy_id"])
+        if vacancy is None or vacancy.tenant_id != execution.tenant_id:
+            raise ValueError("Vacante no encontrada")
+        return start_sourcing_workflow(
+            tenant_id=execution.tenant_id,
+            vacancy_id=vacancy.id,
+            job_data={
+                "title": vacancy.title,
+                "description": vacancy.description,
+                "requirements": vacancy.requirements,
+                "location": vacancy.location,
+                "is_remote": vacancy.is_remote,
+            },
+        )
+
+    def _run_screening(self, execution: WorkflowExecution) -> dict:
+        from .workflow_service import start_screening_workflow
+
+        application = self.application_repo.get_by_id(
+            execution.input_data["application_id"]
+        )
+        if application is None or application.tenant_id != execution.tenant_id:
+            raise ValueError("Postulación no encontrada")
+        return start_screening_workflow(
+            tenant_id=execution.tenant_id,
+            application_id=application.id,
+            candidate_profile={"skills": application.candidate.skills or []},
+            job_requirements={
+                "required_skills": split_skill_list(application.vacancy.requirements)
+            },
+        )
@@ -1,8 +1,18 @@
+import asyncio
+
+from asgiref.sync import async_to_sync, sync_to_async
+
 from apps.tenants.models import TenantAIConfig
 
-from ..adapters.llm_factory import get_llm_for_tenant
+from ..adapters.llm_factory import get_llm_for_tenant, resolve_provider_credentials
 from ..adapters.monitoring import get_workflow_monitor
+from ..adapters.tenant_budget_guard import TenantBudgetGuard
+from ..workflows.async_workflow_engine import AsyncWorkflowEngine
+from ..workflows.compiled_workflow_cache import CompiledWorkflowCache
+from ..workflows.run_config import build_run_config
+from ..workflows.screening_graph import ScreeningWorkflowBuilder
 from ..workflows.sourcing_graph import SourcingWorkflowBuilder
+from ..workflows.workflow_run import WorkflowRun
 
 
 def start_sourcing_workflow(tenant_id: str, vacancy_id: int, job_data: dict):
@@ -19,19 +29,167 @@ def start_sourcing_workflow(tenant_id: str, vacancy_id: int, job_data: dict):
     # 2. Instanciar el LLM correcto (Factory)
     llm = get_llm_for_tenant(config)
 
-    # 3. Construir el Grafo
-    builder = SourcingWorkflowBuilder(llm=llm)
-    app = builder.build()
+    # 3. Obtener el Grafo (compilado una vez por proceso y versión)
+    app = CompiledWorkflowCache.get(SourcingWorkflowBuilder.NAME)
 
     # 4. Configurar Monitoreo
     monitor = get_workflow_monitor(
-        trace_name=f"Sourcing Vacancy {vacancy_id}", tenant_id=str(tenant_id)
+        trace_name=f"Sourcing Vacancy {vacancy_id}",
+        tenant_id=str(tenant_id),
+        ai_config=config,
     )
 
     # 5. Estado Inicial
-    initial_state = {"vacancy_id": vacancy_id, "context": job_data, "messages": []}
+    initial_state = {
+        "tenant_id": str(tenant_id),
+        "vacancy_id": vacancy_id,
+        "context": job_data,
+        "messages": [],
+    }
 
-    # 6. Ejecutar
-    result = app.invoke(initial_state, config={"callbacks": monitor})
+    # 6. Ejecutar (LLM y callbacks viajan en el config de la ejecución)
+    result = app.invoke(
+        initial_state,
+        config=build_run_config(
+            llm, monitor, workflow_name=SourcingWorkflowBuilder.NAME
+        ),
+    )
 
     return result
+
+
+def start_screening_workflow(
+    tenant_id: str,
+    application_id: int,
+    candidate_profile: dict,
+    job_requirements: dict,
+):
+    """
+    Ejecuta el screening de una postulación.
+
+    Raises:
+        ValueError: Si el tenant no tiene configuración de IA.
+    """
+    try:
+        config = TenantAIConfig.objects.get(tenant_id=tenant_id)
+    except TenantAIConfig.DoesNotExist:
+        raise ValueError("Tenant no tiene configuración de IA") from None
+
+    app = CompiledWorkflowCache.get(ScreeningWorkflowBuilder.NAME)
+    monitor = get_workflow_monitor(
+        trace_name=f"Screening Application {application_id}",
+        tenant_id=str(tenant_id),
+        ai_config=config,
+    )
+    initial_state = {
+        "tenant_id": str(tenant_id),
+        "application_id": application_id,
+        "candidate_profile": candidate_profile,
+        "job_requirements": job_requirements,
+        "messages": [],
+    }
+    return app.invoke(
+        initial_state,
+        config=build_run_config(
+            get_llm_for_tenant(config),
+            monitor,
+            workflow_name=ScreeningWorkflowBuilder.NAME,
+        ),
+    )
+
+
+def submit_sourcing_workflow(
+    engine: AsyncWorkflowEngine,
+    config: TenantAIConfig,
+    vacancy_id: int,
+    job_data: dict,
+) -> WorkflowRun:
+    """
+    Encola un workflow de sourcing en el motor asíncrono.
+
+    Debe llamarse desde el event loop del motor.
+
+    Returns:
+        WorkflowRun: Handle para esperar (``await``) o cancelar.
+
+    Raises:
+        ValueError: Si el proveedor del tenant no está soportado.
+    """
+    provider, api_key = resolve_provider_credentials(config)
+    return engine.submit(
+        SourcingWorkflowBuilder.NAME,
+        {
+            "tenant_id": str(config.tenant_id),
+            "vacancy_id": vacancy_id,
+            "context": job_data,
+            "messages": [],
+        },
+        tenant_id=str(config.tenant_id),
+        llm=get_llm_for_tenant(config),
+        provider=provider,
+        api_key=api_key,
+        callbacks=get_workflow_monitor(
+            trace_name=f"Sourcing Vacancy {vacancy_id}",
+            tenant_id=str(config.tenant_id),
+            ai_config=config,
+        ),
+    )
+
+
+async def arun_sourcing_workflows(
+    requests: list[dict], engine: AsyncWorkflowEngine | None = None
+) -> list:
+    """
+    Ejecuta varios workflows de sourcing a la vez (``ainvoke``).
+
+    Args:
+        requests: Dicts con ``tenant_id``, ``vacancy_id`` y ``job_data``.
+        engine: Motor a usar (default: uno nuevo con los límites de
+            settings).
+
+    Returns:
+        list: Por request y en el mismo orden, el estado final o la
+            excepción con la que terminó (``ValueError`` si el tenant no
+            tiene configuración de IA, ``CancelledError`` si se canceló).
+    """
+    engine = engine or AsyncWorkflowEngine()
+    configs = await sync_to_async(_get_ai_configs)(
+        {str(request["tenant_id"]) for request in requests}
+    )
+
+    results: list = [None] * len(requests)
+    runs: dict[int, WorkflowRun] = {}
+    for index, request in enumerate(requests):
+        config = configs.get(str(request["tenant_id"]))
+        if config is None:
+            results[index] = ValueError("Tenant no tiene configuración de IA")
+            continue
+        try:
+            runs[index] = submit_sourcing_workflow(
+                engine, config, request["vacancy_id"], request["job_data"]
+            )
+        except ValueError as e:
+            results[index] = e
+
+    outcomes = await asyncio.gather(*runs.values(), return_exceptions=True)
+    for index, outcome in zip(runs, outcomes, strict=True):
+        results[index] = outcome
+    return results
+
+
+def run_sourcing_workflows(requests: list[dict]) -> list:
+    """Versión síncrona (workers, comandos) de ``arun_sourcing_workflows``."""
+    return async_to_sync(arun_sourcing_workflows)(requests)
+
+
+def _get_ai_configs(tenant_ids: set[str]) -> dict[str, TenantAIConfig]:
+    configs = {
+        str(config.tenant_id): config
+        for config in TenantAIConfig.objects.filter(tenant_id__in=tenant_ids)
+    }
+    # Dentro del event loop el guard no consulta la base: se siembran aquí
+    budget = TenantBudgetGuard()
+    for tenant_id, config in configs.items():
+        if config.monthly_budget_usd is not None:
+            budget.warm(tenant_id)
+    return configs
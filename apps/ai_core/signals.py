@@ -0,0 +1,43 @@
+"""
+Señales de la app ai_core.
+
+Cuando cambia la configuración de IA de un tenant descartan sus
+clientes de LLM reutilizables y, si el tenant desactivó el cache de
+respuestas, las respuestas ya cacheadas. La app tenants no depende de
+ai_core: la invalidación se engancha aquí.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.ai_core.adapters.llm_cache import get_llm_cache_backend
+from apps.ai_core.adapters.llm_client_pool import LLMClientPool
+from apps.tenants.models import TenantAIConfig
+
+
+@receiver(post_save, sender=TenantAIConfig)
+@receiver(post_delete, sender=TenantAIConfig)
+def invalidate_llm_clients(sender, instance: TenantAIConfig, **kwargs) -> None:
+    """Descarta los clientes del tenant al confirmar la transacción."""
+    tenant_id = str(instance.tenant_id)
+    transaction.on_commit(lambda: LLMClientPool.invalidate(tenant_id))
+
+
+@receiver(post_save, sender=TenantAIConfig)
+def clear_response_cache(
+    sender, instance: TenantAIConfig, update_fields=None, **kwargs
+) -> None:
+    """Descarta las respuestas cacheadas al desactivar el cache (opt-out)."""
+    if instance.response_cache_enabled:
+        return
+    if update_fields is not None and "response_cache_enabled" not in update_fields:
+        return
+    tenant_id = str(instance.tenant_id)
+
+    def clear() -> None:
+        backend = get_llm_cache_backend()
+        if backend is not None:
+            backend.clear(tenant_id)
+
+    transaction.on_commit(clear)
@@ -0,0 +1,75 @@
+"""
+Tareas asíncronas (Celery) de la app ai_core.
+"""
+
+from celery import shared_task
+from celery.signals import worker_process_shutdown
+
+from apps.ai_core.adapters.agent_execution_log_writer import get_agent_log_writer
+from apps.ai_core.models import WorkflowExecution
+from apps.ai_core.services.workflow_execution_service import (
+    WorkflowExecutionService,
+)
+from apps.ai_core.tools import ToolRegistry
+
+
+@shared_task(
+    name="ai_core.run_workflow_execution",
+    acks_late=True,
+    reject_on_worker_lost=True,
+    ignore_result=True,
+)
+def run_workflow_execution(execution_id: str) -> str | None:
+    """
+    Ejecuta un ``WorkflowExecution`` (sourcing, screening).
+
+    Se confirma al terminar (``acks_late``) y se reencola si el worker
+    muere, así que puede entregarse más de una vez: el servicio reclama
+    la ejecución antes de correrla y una entrega duplicada no repite el
+    workflow. Los reintentos los decide el registro
+    (``AI_WORKFLOW_MAX_RETRIES``) y el resultado se consulta ahí, no en
+    el result backend.
+    """
+    service = WorkflowExecutionService()
+    execution = service.run(execution_id)
+    if execution is None:
+        return None
+    if execution.status in (
+        WorkflowExecution.STATUS_RETRYING,
+        WorkflowExecution.STATUS_RUNNING,
+    ):
+        # Reintento o, si otra entrega la tiene, nueva revisión al vencer
+        # su lease (si terminó, esa entrega no hace nada)
+        enqueue_workflow_execution(
+            execution, countdown=service.retry_countdown(execution)
+        )
+    return execution.status
+
+
+def enqueue_workflow_execution(
+    execution: WorkflowExecution, countdown: int | None = None
+) -> None:
+    """
+    Envía la ejecución a la cola de su plan.
+
+    El task_id es el ID de la ejecución, así que todas las entregas de
+    un mismo registro se rastrean como una sola tarea.
+    """
+    run_workflow_execution.apply_async(
+        args=[str(execution.id)],
+        queue=execution.queue,
+        task_id=str(execution.id),
+        countdown=countdown,
+    )
+
+
+@worker_process_shutdown.connect
+def flush_agent_logs(**kwargs) -> None:
+    """Escribe los logs de agentes en buffer antes de que termine el proceso."""
+    get_agent_log_writer().close()
+
+
+@worker_process_shutdown.connect
+def publish_tool_cache_stats(**kwargs) -> None:
+    """Publica los contadores del cache de tools pendientes del proceso."""
+    ToolRegistry.get_stats().publish()
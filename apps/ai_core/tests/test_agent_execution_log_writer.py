@@ -0,0 +1,65 @@
+import asyncio
+from datetime import date
+from unittest import mock
+
+import pytest
+from django.db import DatabaseError
+
+from apps.ai_core.adapters.agent_execution_log_writer import AgentExecutionLogWriter
+from apps.ai_core.models import AgentExecutionLog, AIUsageDaily
+from apps.ai_core.repositories.ai_usage_daily_repository import (
+    AIUsageDailyRepository,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def writer():
+    return AgentExecutionLogWriter(background=False)
+
+
+def usage(tenant, **counters):
+    return {
+        "tenant_id": tenant.id,
+        "date": date(2026, 10, 19),
+        "provider": "openai",
+        "model": "gpt-4o-mini",
+        **counters,
+    }
+
+
+def test_usage_is_written_when_log_batch_fails(writer, tenant):
+    async def emit():
+        # Dentro de un event loop ambos eventos esperan al mismo flush
+        writer.add(
+            tenant_id=tenant.id,
+            workflow_name="screening",
+            node_name="fit",
+            input_data={},
+        )
+        writer.add_usage(**usage(tenant, requests=1, tokens_input=120))
+
+    asyncio.run(emit())
+    with mock.patch.object(
+        AgentExecutionLog.objects, "bulk_create", side_effect=DatabaseError("down")
+    ):
+        writer.flush()
+
+    row = AIUsageDaily.objects.get(tenant=tenant)
+    assert (row.requests, row.tokens_input) == (1, 120)
+    assert not AgentExecutionLog.objects.exists()
+
+
+def test_failed_usage_increment_is_retried_on_next_flush(writer, tenant):
+    with mock.patch.object(
+        AIUsageDailyRepository, "increment", side_effect=DatabaseError("down")
+    ):
+        writer.add_usage(**usage(tenant, requests=1, tokens_input=100))
+
+    assert not AIUsageDaily.objects.exists()
+
+    writer.add_usage(**usage(tenant, requests=1, tokens_input=50))
+
+    row = AIUsageDaily.objects.get(tenant=tenant)
+    assert (row.requests, row.tokens_input) == (2, 150)
@@ -0,0 +1,55 @@
+from unittest import mock
+
+import pytest
+
+from apps.ai_core import signals
+from apps.ai_core.adapters.llm_client_pool import LLMClientPool
+from apps.tenants.models import AIProvider, TenantAIConfig
+from apps.tenants.services import TenantAIConfigService
+
+
+@pytest.fixture
+def ai_config(tenant):
+    return TenantAIConfig.objects.create(
+        tenant=tenant, provider=AIProvider.OPENAI, api_key="sk-old"
+    )
+
+
+@pytest.fixture
+def backend():
+    backend = mock.Mock()
+    with mock.patch.object(signals, "get_llm_cache_backend", return_value=backend):
+        yield backend
+
+
+def test_change_provider_invalidates_clients_on_commit(
+    ai_config, tenant, django_capture_on_commit_callbacks
+):
+    with (
+        mock.patch.object(LLMClientPool, "invalidate") as invalidate,
+        django_capture_on_commit_callbacks(execute=True),
+    ):
+        TenantAIConfigService().change_provider(
+            str(tenant.id), AIProvider.CLAUDE, "sk-new", "claude-sonnet"
+        )
+
+    invalidate.assert_called_with(str(tenant.id))
+
+
+def test_disabling_response_cache_clears_tenant_entries(
+    ai_config, tenant, backend, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        TenantAIConfigService().set_response_cache(str(tenant.id), enabled=False)
+
+    backend.clear.assert_called_once_with(str(tenant.id))
+
+
+def test_other_updates_keep_response_cache(
+    ai_config, tenant, backend, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        TenantAIConfigService().set_response_cache(str(tenant.id), enabled=True)
+        TenantAIConfigService().update_api_key(str(tenant.id), "sk-new")
+
+    backend.clear.assert_not_called()
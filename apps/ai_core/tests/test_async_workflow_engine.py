@@ -0,0 +1,211 @@
+import asyncio
+from typing import TypedDict
+
+import pytest
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import END, StateGraph
+
+from apps.ai_core.adapters.latency_fake_chat_model import LatencyFakeChatModel
+from apps.ai_core.workflows.async_workflow_engine import AsyncWorkflowEngine
+from apps.ai_core.workflows.run_config import get_run_llm
+from apps.ai_core.workflows.workflow_run import WorkflowRun
+
+
+class ProbeState(TypedDict):
+    messages: list[str]
+
+
+class InFlight:
+    """Ejecuciones en curso en todo el motor (todas las keys y tenants)."""
+
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+
+
+def _probe_graph(in_flight: InFlight):
+    async def call_llm(state: ProbeState, config: RunnableConfig) -> dict:
+        in_flight.current += 1
+        in_flight.peak = max(in_flight.peak, in_flight.current)
+        try:
+            response = await get_run_llm(config).ainvoke("prompt")
+        finally:
+            in_flight.current -= 1
+        return {"messages": [*state["messages"], response.content]}
+
+    workflow = StateGraph(ProbeState)
+    workflow.add_node("analyst", call_llm)
+    workflow.set_entry_point("analyst")
+    workflow.add_edge("analyst", END)
+    return workflow.compile()
+
+
+def _failing_graph():
+    async def fail(state: ProbeState, config: RunnableConfig) -> dict:
+        raise RuntimeError("falla del proveedor")
+
+    workflow = StateGraph(ProbeState)
+    workflow.add_node("analyst", fail)
+    workflow.set_entry_point("analyst")
+    workflow.add_edge("analyst", END)
+    return workflow.compile()
+
+
+def _engine(graph, **limits) -> AsyncWorkflowEngine:
+    return AsyncWorkflowEngine(
+        provider_limits=limits.pop("provider_limits", {}),
+        graph_resolver=lambda name: graph,
+        **limits,
+    )
+
+
+def _submit(engine, tenant_id, llm, workflow_name="probe"):
+    return engine.submit(
+        workflow_name,
+        {"messages": []},
+        tenant_id=tenant_id,
+        llm=llm,
+        provider="openai",
+        api_key=f"key-{tenant_id}",
+    )
+
+
+def test_global_and_tenant_limits():
+    in_flight = InFlight()
+    engine = _engine(
+        _probe_graph(in_flight), max_concurrency=4, tenant_limit=2, api_key_limit=10
+    )
+    llms = {tenant: LatencyFakeChatModel(latency=0.01) for tenant in "ABC"}
+
+    async def main():
+        runs = [_submit(engine, tenant, llms[tenant]) for tenant in "ABC" * 6]
+        return await asyncio.gather(*runs)
+
+    results = asyncio.run(main())
+
+    assert results == [{"messages": ["ok"]}] * 18
+    assert in_flight.peak == 4
+    assert all(llm.peak_in_flight == 2 for llm in llms.values())
+    assert engine.stats() == {"queued": 0, "running": 0}
+
+
+def test_provider_and_api_key_limits():
+    in_flight = InFlight()
+    graph = _probe_graph(in_flight)
+    llm = LatencyFakeChatModel(latency=0.01)
+
+    async def main(engine, api_key):
+        runs = [
+            engine.submit(
+                "probe",
+                {"messages": []},
+                tenant_id=f"t{n % 4}",
+                llm=llm,
+                provider="openai",
+                api_key=api_key(n),
+            )
+            for n in range(12)
+        ]
+        await asyncio.gather(*runs)
+
+    # Key compartida (plataforma): el cupo por key aplica a todos los tenants
+    engine = _engine(graph, max_concurrency=10, tenant_limit=10, api_key_limit=3)
+    asyncio.run(main(engine, lambda n: "shared"))
+    assert in_flight.peak == 3
+
+    in_flight.peak = 0
+    engine = _engine(
+        graph,
+        max_concurrency=10,
+        tenant_limit=10,
+        api_key_limit=10,
+        provider_limits={"openai": 2},
+    )
+    asyncio.run(main(engine, lambda n: f"key-{n}"))
+    assert in_flight.peak == 2
+
+
+def test_round_robin_across_tenants():
+    engine = _engine(
+        _probe_graph(InFlight()), max_concurrency=1, tenant_limit=1, api_key_limit=1
+    )
+    llm = LatencyFakeChatModel(latency=0.001)
+    order = []
+
+    async def main():
+        runs = [_submit(engine, tenant, llm) for tenant in "AAAABBC"]
+        for run in runs:
+            run.future.add_done_callback(lambda _, run=run: order.append(run.tenant_id))
+        await asyncio.gather(*runs)
+
+    asyncio.run(main())
+
+    # La primera de A arranca al encolarse; luego una por tenant por
+    # vuelta, así el lote de A no hace esperar a B y C
+    assert "".join(order) == "AABCABA"
+
+
+def test_failed_run_does_not_affect_others():
+    graphs = {"probe": _probe_graph(InFlight()), "broken": _failing_graph()}
+    engine = AsyncWorkflowEngine(
+        max_concurrency=1,
+        tenant_limit=1,
+        api_key_limit=1,
+        provider_limits={},
+        graph_resolver=graphs.__getitem__,
+    )
+    llm = LatencyFakeChatModel()
+
+    async def main():
+        broken = _submit(engine, "A", llm, workflow_name="broken")
+        runs = [_submit(engine, "A", llm), _submit(engine, "B", llm)]
+        with pytest.raises(RuntimeError, match="falla del proveedor"):
+            await broken
+        return broken, await asyncio.gather(*runs)
+
+    broken, results = asyncio.run(main())
+
+    assert broken.status == WorkflowRun.FAILED
+    assert results == [{"messages": ["ok"]}] * 2
+    assert engine.stats() == {"queued": 0, "running": 0}
+
+
+def test_cancel_tenant_releases_its_slots():
+    engine = _engine(
+        _probe_graph(InFlight()), max_concurrency=2, tenant_limit=1, api_key_limit=2
+    )
+    slow = LatencyFakeChatModel(latency=10)
+    fast = LatencyFakeChatModel(latency=0.001)
+
+    async def main():
+        running = _submit(engine, "A", slow)
+        queued = _submit(engine, "A", slow)
+        await asyncio.sleep(0)
+        assert engine.stats() == {"queued": 1, "running": 1}
+
+        assert engine.cancel_tenant("A") == 2
+        other = _submit(engine, "B", fast)
+        await engine.join()
+        return running, queued, other
+
+    running, queued, other = asyncio.run(asyncio.wait_for(main(), timeout=5))
+
+    assert running.status == queued.status == WorkflowRun.CANCELLED
+    assert other.status == WorkflowRun.SUCCEEDED
+    assert other.future.result() == {"messages": ["ok"]}
+    assert engine.stats() == {"queued": 0, "running": 0}
+
+
+def test_submit_unknown_workflow_raises():
+    async def main():
+        AsyncWorkflowEngine().submit(
+            "missing",
+            {"messages": []},
+            tenant_id="A",
+            llm=LatencyFakeChatModel(),
+            provider="openai",
+            api_key="key",
+        )
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
@@ -0,0 +1,60 @@
+import pytest
+
+from apps.ai_core.services.batch_fit_scorer import BatchFitScorer
+from apps.ai_core.tools.candidate_tools import analyze_candidate_fit
+
+PROFILES = [
+    (1, {"skills": ["Python", "Django", "PostgreSQL"], "experience_years": 6}),
+    (2, {"skills": ["python", "React"], "experience_years": 2}),
+    (3, {"skills": [], "experience_years": 10}),
+    (4, {"skills": ["Go", "Rust"]}),
+    (5, {"skills": ["DJANGO", "Django", "fastapi"], "experience_years": 3}),
+]
+
+REQUIREMENTS = [
+    {"required_skills": ["Python", "Django", "FastAPI"], "min_experience_years": 3},
+    {"required_skills": ["Kotlin"]},
+    {"required_skills": []},
+    {"required_skills": ["python", "PYTHON"], "min_experience_years": 5},
+]
+
+
+def _normalized(result: dict) -> dict:
+    """Las listas de skills salen de sets: se comparan sin orden."""
+    return {
+        key: sorted(value) if key.endswith("_skills") else value
+        for key, value in result.items()
+    }
+
+
+@pytest.mark.parametrize("requirements", REQUIREMENTS)
+def test_batch_matches_per_candidate_tool(requirements):
+    scorer = BatchFitScorer(PROFILES)
+    ranking = scorer.top_k(requirements, k=len(PROFILES))
+    evaluation = scorer.evaluate(requirements)
+
+    assert len(ranking) == len(PROFILES)
+    for result in ranking:
+        candidate_id = result.pop("candidate_id")
+        profile = dict(PROFILES)[candidate_id]
+        expected = analyze_candidate_fit.invoke(
+            {"candidate_profile": profile, "job_requirements": requirements}
+        )
+        assert _normalized(result) == _normalized(expected)
+
+        row = scorer.candidate_ids.index(candidate_id)
+        assert evaluation["match_score"][row] == expected["match_score"]
+        assert bool(evaluation["experience_match"][row]) is expected["experience_match"]
+
+
+def test_top_k_orders_by_coverage_then_experience():
+    scorer = BatchFitScorer(PROFILES)
+
+    ranking = scorer.top_k(REQUIREMENTS[0], k=3)
+
+    assert [result["candidate_id"] for result in ranking] == [1, 5, 2]
+
+
+def test_empty_inputs():
+    assert BatchFitScorer([]).top_k(REQUIREMENTS[0]) == []
+    assert BatchFitScorer(PROFILES).top_k(REQUIREMENTS[0], k=0) == []
@@ -0,0 +1,65 @@
+from unittest import mock
+
+import pytest
+
+from apps.ai_core.workflows.compiled_workflow_cache import CompiledWorkflowCache
+from apps.ai_core.workflows.run_config import build_run_config, get_run_llm
+from apps.ai_core.workflows.screening_graph import ScreeningWorkflowBuilder
+from apps.ai_core.workflows.sourcing_graph import SourcingWorkflowBuilder
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    CompiledWorkflowCache.clear()
+    yield
+    CompiledWorkflowCache.clear()
+
+
+def test_graph_is_compiled_once_per_name():
+    with mock.patch.object(
+        SourcingWorkflowBuilder,
+        "build",
+        autospec=True,
+        side_effect=lambda self: object(),
+    ) as build:
+        first = CompiledWorkflowCache.get(SourcingWorkflowBuilder.NAME)
+        again = CompiledWorkflowCache.get(SourcingWorkflowBuilder.NAME)
+
+    assert again is first
+    assert build.call_count == 1
+    assert CompiledWorkflowCache.get(ScreeningWorkflowBuilder.NAME) is not first
+
+
+def test_version_bump_recompiles():
+    first = CompiledWorkflowCache.get(SourcingWorkflowBuilder.NAME)
+
+    with mock.patch.object(
+        SourcingWorkflowBuilder, "VERSION", SourcingWorkflowBuilder.VERSION + 1
+    ):
+        bumped = CompiledWorkflowCache.get(SourcingWorkflowBuilder.NAME)
+
+    assert bumped is not first
+
+
+def test_unknown_workflow_raises_value_error():
+    with pytest.raises(ValueError, match="no registrado"):
+        CompiledWorkflowCache.get("desconocido")
+
+
+def test_run_config_carries_llm_and_workflow_name():
+    llm = mock.Mock()
+
+    config = build_run_config(llm, workflow_name="sourcing", vacancy_id=1)
+
+    assert get_run_llm(config) is llm
+    assert config["configurable"]["vacancy_id"] == 1
+    assert config["metadata"] == {"workflow_name": "sourcing"}
+    assert config["callbacks"] == []
+
+
+def test_run_without_llm_raises_value_error():
+    graph = CompiledWorkflowCache.get(SourcingWorkflowBuilder.NAME)
+    state = {"vacancy_id": 1, "context": {}, "messages": []}
+
+    with pytest.raises(ValueError, match="no recibió un LLM"):
+        graph.invoke(state, config={"configurable": {}})
@@ -0,0 +1,59 @@
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from apps.ai_core.adapters import llm_factory
+from apps.ai_core.tools import ToolRegistry
+from apps.tenants.models.choices import AIProvider
+
+
+def test_wsgi_startup_loads_no_heavy_sdks():
+    out = StringIO()
+
+    call_command("benchmark_startup", "--runs", "1", "--target", "wsgi", stdout=out)
+
+    assert "SDKs pesados cargados: ninguno" in out.getvalue()
+
+
+def test_benchmark_startup_fails_over_budget():
+    with pytest.raises(CommandError, match="por encima de"):
+        call_command(
+            "benchmark_startup",
+            "--runs",
+            "1",
+            "--target",
+            "wsgi",
+            "--max-ms",
+            "0.001",
+            stdout=StringIO(),
+        )
+
+
+def test_tool_modules_are_imported_once_on_first_use():
+    with (
+        mock.patch.object(ToolRegistry, "_loaded", False),
+        mock.patch("apps.ai_core.tools.registry.import_module") as import_module,
+    ):
+        ToolRegistry.list_tools()
+        ToolRegistry.list_tools()
+
+    assert [c.args[0] for c in import_module.call_args_list] == list(
+        ToolRegistry._modules
+    )
+
+
+def test_unknown_tool_raises_value_error():
+    with pytest.raises(ValueError, match="no registrada"):
+        ToolRegistry.get_tool("desconocida")
+
+    assert "linkedin_search_tool" in ToolRegistry.list_tools()
+
+
+def test_chat_model_class_is_imported_on_first_use():
+    with mock.patch.object(llm_factory, "import_module") as import_module:
+        chat_class = llm_factory.get_chat_model_class(AIProvider.CLAUDE)
+
+    import_module.assert_called_once_with("langchain_anthropic")
+    assert chat_class is import_module.return_value.ChatAnthropic
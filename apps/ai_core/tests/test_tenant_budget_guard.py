@@ -0,0 +1,109 @@
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from django.core.cache import caches
+from django.utils import timezone
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from apps.ai_core.adapters import llm_factory
+from apps.ai_core.adapters.budget_exceeded_error import BudgetExceededError
+from apps.ai_core.adapters.budget_guard_handler import BudgetGuardHandler
+from apps.ai_core.adapters.llm_client_pool import LLMClientPool
+from apps.ai_core.adapters.tenant_budget_guard import TenantBudgetGuard
+from apps.ai_core.models import AIUsageDaily
+from apps.tenants.models import AIBudgetAction, AIProvider, TenantAIConfig
+from apps.tenants.services import TenantAIConfigService
+
+
+@pytest.fixture(autouse=True)
+def empty_counters():
+    caches["default"].clear()
+
+
+@pytest.fixture
+def ai_config(tenant):
+    AIUsageDaily.objects.create(
+        tenant=tenant,
+        date=timezone.localdate(),
+        provider=AIProvider.OPENAI,
+        model="gpt-4o",
+        cost_usd=Decimal("8"),
+    )
+    return TenantAIConfig.objects.create(
+        tenant=tenant,
+        provider=AIProvider.OPENAI,
+        api_key="sk-test",
+        model_name="gpt-4o",
+        monthly_budget_usd=Decimal("10"),
+    )
+
+
+def test_counter_is_seeded_once_and_incremented(ai_config, django_assert_num_queries):
+    guard = TenantBudgetGuard()
+
+    assert guard.spent(ai_config.tenant_id) == Decimal("8")
+    with django_assert_num_queries(0):
+        guard.add_spend(ai_config.tenant_id, Decimal("1.5"))
+        assert guard.spent(ai_config.tenant_id) == Decimal("9.5")
+        assert guard.check(ai_config) == "gpt-4o"
+
+
+def test_overrun_raises_budget_exceeded_error(ai_config):
+    guard = TenantBudgetGuard()
+    guard.warm(ai_config.tenant_id)
+    guard.add_spend(ai_config.tenant_id, Decimal("2"))
+
+    with pytest.raises(BudgetExceededError) as error:
+        guard.check(ai_config)
+
+    assert error.value.spent == Decimal("10")
+    assert error.value.budget == Decimal("10")
+
+
+def test_overrun_downgrades_to_fallback_model(ai_config):
+    ai_config.monthly_budget_usd = Decimal("5")
+    ai_config.budget_action = AIBudgetAction.DOWNGRADE
+    ai_config.budget_fallback_model = "gpt-4o-mini"
+
+    with (
+        mock.patch.object(llm_factory, "get_chat_model_class"),
+        mock.patch.object(LLMClientPool, "get") as pool_get,
+    ):
+        llm_factory.get_llm_for_tenant(ai_config)
+
+    assert pool_get.call_args.kwargs["model"] == "gpt-4o-mini"
+
+
+def test_handler_stops_llm_call_over_budget(ai_config):
+    ai_config.monthly_budget_usd = Decimal("5")
+    model = FakeListChatModel(responses=["respuesta"])
+
+    with pytest.raises(BudgetExceededError):
+        model.invoke("Hola", config={"callbacks": [BudgetGuardHandler(ai_config)]})
+
+
+def test_handler_lets_calls_through_under_budget(ai_config):
+    model = FakeListChatModel(responses=["respuesta"])
+
+    response = model.invoke(
+        "Hola", config={"callbacks": [BudgetGuardHandler(ai_config)]}
+    )
+
+    assert response.content == "respuesta"
+
+
+@pytest.mark.parametrize(
+    "budget, action, fallback, message",
+    [
+        (Decimal("-1"), AIBudgetAction.REJECT, "", "negativo"),
+        (Decimal("10"), AIBudgetAction.DOWNGRADE, "", "modelo de respaldo"),
+    ],
+)
+def test_set_budget_rejects_invalid_values(
+    ai_config, budget, action, fallback, message
+):
+    with pytest.raises(ValueError, match=message):
+        TenantAIConfigService().set_budget(
+            str(ai_config.tenant_id), budget, action, fallback
+        )
@@ -0,0 +1,124 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from apps.ai_core.adapters.llm_cache import (
+    DatabaseLLMCacheBackend,
+    MemoryLLMCacheBackend,
+    get_llm_cache_backend,
+    tenant_llm_cache,
+)
+from apps.ai_core.adapters.llm_cache.tenant_llm_cache import (
+    TenantLLMCache,
+    build_cache_key,
+)
+from apps.ai_core.models import LLMResponseCacheEntry
+from apps.tenants.models import Tenant
+
+
+@pytest.fixture
+def log_writer():
+    writer = mock.Mock()
+    with mock.patch.object(
+        tenant_llm_cache, "get_agent_log_writer", return_value=writer
+    ):
+        yield writer
+
+
+@pytest.fixture
+def other_tenant(db):
+    return Tenant.objects.create(name="Globex", slug="globex")
+
+
+def _chat_model(tenant_id, backend):
+    return FakeListChatModel(
+        responses=["primera", "segunda"], cache=TenantLLMCache(tenant_id, backend)
+    )
+
+
+@pytest.mark.parametrize(
+    "backend", [MemoryLLMCacheBackend(max_entries=10), DatabaseLLMCacheBackend()]
+)
+def test_repeated_prompt_is_served_from_tenant_cache(
+    backend, tenant, other_tenant, log_writer
+):
+    model = _chat_model(tenant.id, backend)
+
+    assert model.invoke("Hola").content == "primera"
+    assert model.invoke("Hola").content == "primera"
+    assert model.invoke("Otra cosa").content == "segunda"
+    # Mismo prompt, otro tenant: no lee la respuesta del primero
+    assert _chat_model(other_tenant.id, backend).invoke("Hola").content == "primera"
+    assert log_writer.add.call_count == 1
+    assert log_writer.add.call_args.kwargs["cache_hit"] is True
+    assert log_writer.add.call_args.kwargs["tenant_id"] == str(tenant.id)
+    backend.clear()
+
+
+def test_backend_error_is_treated_as_miss(log_writer):
+    backend = mock.Mock()
+    backend.get.side_effect = RuntimeError("redis caído")
+    model = _chat_model("t1", backend)
+
+    assert model.invoke("Hola").content == "primera"
+    assert model.invoke("Hola").content == "segunda"
+    log_writer.add.assert_not_called()
+
+
+def test_prompt_normalization_shares_key():
+    assert build_cache_key("Hola  \r\nmundo\n", "llm") == build_cache_key(
+        "Hola\nmundo", "llm"
+    )
+    assert build_cache_key("Hola", "llm") != build_cache_key("Hola", "otro-llm")
+
+
+def test_expired_database_entries_are_not_read(tenant):
+    backend = DatabaseLLMCacheBackend()
+    backend.set(str(tenant.id), "k", [{"text": "vieja"}], ttl=60)
+    LLMResponseCacheEntry.objects.update(
+        expires_at=timezone.now() - timedelta(seconds=1)
+    )
+
+    assert backend.get(str(tenant.id), "k") is None
+    assert backend.purge_expired() == 1
+
+
+def test_clear_command_only_clears_given_tenant(tenant, other_tenant):
+    backend = DatabaseLLMCacheBackend()
+    backend.set(str(tenant.id), "k", [{"text": "a"}], ttl=60)
+    backend.set(str(other_tenant.id), "k", [{"text": "b"}], ttl=60)
+
+    call_command(
+        "clear_llm_cache",
+        "--backend",
+        "database",
+        "--tenant",
+        str(tenant.id),
+        stdout=StringIO(),
+    )
+
+    assert backend.get(str(tenant.id), "k") is None
+    assert backend.get(str(other_tenant.id), "k") == [{"text": "b"}]
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        (["--backend", "database"], "Indique"),
+        (["--backend", "desconocido", "--all"], "no soportado"),
+        (["--backend", "none", "--all"], "desactivado"),
+    ],
+)
+def test_clear_command_rejects_invalid_options(db, args, message):
+    with pytest.raises(CommandError, match=message):
+        call_command("clear_llm_cache", *args)
+
+
+def test_unknown_backend_raises_value_error():
+    with pytest.raises(ValueError, match="no soportado"):
+        get_llm_cache_backend("desconocido")
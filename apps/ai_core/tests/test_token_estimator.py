@@ -0,0 +1,40 @@
+import sys
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from apps.ai_core.adapters import token_estimator
+from apps.ai_core.adapters.token_estimator import estimate_tokens
+
+
+@pytest.fixture(autouse=True)
+def clear_encoding_cache():
+    token_estimator._encoding.cache_clear()
+    yield
+    token_estimator._encoding.cache_clear()
+
+
+def fake_tiktoken(get_encoding):
+    return mock.patch.dict(
+        sys.modules, {"tiktoken": SimpleNamespace(get_encoding=get_encoding)}
+    )
+
+
+def test_estimate_tokens_uses_tiktoken_encoding():
+    encoding = mock.Mock()
+    encoding.encode.return_value = [1, 2, 3]
+
+    with fake_tiktoken(lambda name: encoding):
+        assert estimate_tokens("hola mundo") == 3
+
+    encoding.encode.assert_called_once_with("hola mundo", disallowed_special=())
+
+
+def test_estimate_tokens_falls_back_when_encoding_fails_to_load():
+    def offline(name):
+        raise OSError("Network is unreachable")
+
+    with fake_tiktoken(offline):
+        assert estimate_tokens("a" * 10) == 3
+        assert estimate_tokens("") == 0
@@ -0,0 +1,125 @@
+from unittest import mock
+
+import pytest
+from langchain_core.tools import tool
+
+from apps.ai_core.tools import ToolRegistry
+from apps.ai_core.tools.tool_cache_policy import ToolCachePolicy
+from apps.ai_core.tools.tool_result_cache import ToolResultCache
+from apps.ai_core.workflows.compiled_workflow_cache import CompiledWorkflowCache
+from apps.ai_core.workflows.run_config import build_run_config
+from apps.ai_core.workflows.sourcing_graph import SourcingWorkflowBuilder
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+@pytest.fixture
+def search(calls):
+    @tool
+    def search_profiles(query: str, max_results: int = 10) -> list[str]:
+        """Busca perfiles."""
+        calls.append((query, max_results))
+        return [f"{query}-{n}" for n in range(max_results)]
+
+    return search_profiles
+
+
+def _cache(**policy) -> ToolResultCache:
+    return ToolResultCache("search", ToolCachePolicy(ttl=60, **policy), mock.Mock())
+
+
+def test_string_and_dict_inputs_share_entry(search, calls):
+    cached = _cache().wrap(search, tenant_id="t1")
+
+    first = cached.invoke("python")
+    assert cached.invoke({"query": "python"}) == first
+    assert cached.invoke({"query": "python", "max_results": 10}) == first
+    assert calls == [("python", 10)]
+
+    cached.invoke({"query": "python", "max_results": 2})
+    assert len(calls) == 2
+
+
+def test_entries_are_scoped_by_tenant(search, calls):
+    result_cache = _cache()
+
+    result_cache.wrap(search, tenant_id="t1").invoke("python")
+    result_cache.wrap(search, tenant_id="t2").invoke("python")
+
+    assert len(calls) == 2
+    result_cache.stats.record.assert_has_calls(
+        [mock.call("search", "misses"), mock.call("search", "misses")]
+    )
+
+
+def test_custom_key_receives_named_arguments(search, calls):
+    cached = _cache(key=lambda arguments: arguments["query"].lower()).wrap(
+        search, tenant_id="t1"
+    )
+
+    cached.invoke("Python")
+    cached.invoke({"query": "PYTHON"})
+
+    assert calls == [("Python", 10)]
+
+
+def test_result_copies_are_isolated(search):
+    cached = _cache().wrap(search, tenant_id="t1")
+
+    cached.invoke("python").append("modificado")
+
+    assert "modificado" not in cached.invoke("python")
+
+
+def test_missing_tenant_bypasses_cache(search, calls):
+    result_cache = _cache()
+    cached = result_cache.wrap(search)
+
+    cached.invoke("python")
+    cached.invoke("python")
+
+    assert len(calls) == 2
+    assert len(result_cache) == 0
+
+
+def test_registry_profile_tool_accepts_string_and_dict_input():
+    ToolRegistry.clear_cache("get_linkedin_profile_details")
+    profile_tool = ToolRegistry.get_tool("get_linkedin_profile_details")
+
+    by_string = profile_tool.invoke("https://linkedin.com/in/x")
+    by_dict = profile_tool.invoke({"linkedin_url": "https://LinkedIn.com/in/x/"})
+
+    assert by_string == by_dict
+    assert by_string["url"] == "https://linkedin.com/in/x"
+    assert len(ToolRegistry.cached_tools()["get_linkedin_profile_details"]) == 1
+
+
+def test_sourcing_workflow_hits_tenant_scoped_cache():
+    ToolRegistry.clear_cache("linkedin_search_tool")
+    graph = CompiledWorkflowCache.get(SourcingWorkflowBuilder.NAME)
+    config = build_run_config(llm=mock.Mock())
+
+    def run(tenant_id):
+        state = {
+            "tenant_id": tenant_id,
+            "vacancy_id": 1,
+            "context": {"title": "Python Dev", "location": "Caracas"},
+            "messages": [],
+        }
+        return graph.invoke(state, config=config)["final_output"]
+
+    with mock.patch.object(ToolRegistry.get_stats(), "record") as record:
+        first = run("t1")
+        again = run("t1")
+        run("t2")
+
+    assert again == first
+    assert first["query"] == "Python Dev"
+    assert record.call_args_list == [
+        mock.call("linkedin_search_tool", "misses"),
+        mock.call("linkedin_search_tool", "hits"),
+        mock.call("linkedin_search_tool", "misses"),
+    ]
@@ -0,0 +1,143 @@
+from unittest import mock
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from apps.ai_core.models import WorkflowExecution
+from apps.ai_core.services import workflow_service
+from apps.ai_core.services.workflow_execution_service import (
+    WorkflowExecutionService,
+)
+from apps.ai_core.tasks import run_workflow_execution
+from apps.recruitment.models import JobVacancy
+from apps.tenants.models import Tenant
+
+SOURCING_STATE = {
+    "final_output": {"candidates": ["ana@example.com"]},
+    "messages": [AIMessage("Perfil buscado"), AIMessage("1 candidato")],
+}
+
+
+@pytest.fixture
+def sourcing():
+    """Reemplaza el workflow de sourcing (sin LLM) durante el test."""
+    with mock.patch.object(
+        workflow_service, "start_sourcing_workflow", return_value=SOURCING_STATE
+    ) as start:
+        yield start
+
+
+@pytest.fixture
+def execution(tenant, vacancy):
+    return WorkflowExecutionService().create_sourcing(str(tenant.id), vacancy.id)
+
+
+def _run(execution):
+    run_workflow_execution.apply(args=[str(execution.id)])
+    execution.refresh_from_db()
+    return execution
+
+
+def test_execution_runs_once(execution, sourcing):
+    assert _run(execution).status == WorkflowExecution.STATUS_SUCCEEDED
+    assert execution.result == {
+        "final_output": SOURCING_STATE["final_output"],
+        "messages": ["Perfil buscado", "1 candidato"],
+    }
+
+    # Reentrega de una ejecución terminada: no vuelve a correr
+    assert _run(execution).attempts == 1
+    assert sourcing.call_count == 1
+
+
+def test_duplicate_delivery_while_running_is_a_noop(execution, sourcing):
+    service = WorkflowExecutionService()
+    assert service.execution_repo.claim(str(execution.id), lease_seconds=1800)
+
+    running = service.run(str(execution.id))
+
+    assert running.status == WorkflowExecution.STATUS_RUNNING
+    assert running.attempts == 1
+    assert service.retry_countdown(running) > 0
+    sourcing.assert_not_called()
+
+
+def test_transient_errors_are_retried(execution, sourcing, settings):
+    settings.AI_WORKFLOW_MAX_RETRIES = 3
+    sourcing.side_effect = [
+        ConnectionError("503"),
+        ConnectionError("503"),
+        SOURCING_STATE,
+    ]
+
+    execution = _run(execution)
+
+    assert execution.status == WorkflowExecution.STATUS_SUCCEEDED
+    assert execution.attempts == 3
+    assert execution.error == ""
+
+
+def test_fails_after_max_retries(execution, sourcing, settings):
+    settings.AI_WORKFLOW_MAX_RETRIES = 2
+    sourcing.side_effect = ConnectionError("proveedor caído")
+
+    execution = _run(execution)
+
+    assert execution.status == WorkflowExecution.STATUS_FAILED
+    assert execution.attempts == 3
+    assert execution.error == "ConnectionError: proveedor caído"
+    assert execution.finished_at is not None
+    assert sourcing.call_count == 3
+
+
+def test_tenant_without_ai_config_fails_without_retry(execution):
+    execution = _run(execution)
+
+    assert execution.status == WorkflowExecution.STATUS_FAILED
+    assert execution.attempts == 1
+    assert execution.error == "Tenant no tiene configuración de IA"
+
+
+def test_status_endpoint(
+    tenant,
+    vacancy,
+    api_client,
+    tenant_client,
+    sourcing,
+    django_capture_on_commit_callbacks,
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(
+            "/api/ai/workflows/sourcing/", {"vacancy_id": vacancy.id}, format="json"
+        )
+    assert response.status_code == 202
+    assert response.data["status"] == WorkflowExecution.STATUS_PENDING
+    url = f"/api/ai/workflows/{response.data['id']}/"
+
+    response = api_client.get(url)
+    assert response.status_code == 200
+    assert response.data["status"] == WorkflowExecution.STATUS_SUCCEEDED
+    assert response.data["attempts"] == 1
+    assert response.data["result"]["messages"] == ["Perfil buscado", "1 candidato"]
+
+    other = Tenant.objects.create(name="Otro", slug="otro")
+    assert tenant_client(other).get(url).status_code == 404
+
+
+def test_enqueue_validates_input(tenant, api_client):
+    other = Tenant.objects.create(name="Otro", slug="otro")
+    foreign = JobVacancy.objects.create(
+        tenant=other, title="Go Dev", description="d", requirements="Go"
+    )
+
+    response = api_client.post(
+        "/api/ai/workflows/sourcing/", {"vacancy_id": "x"}, format="json"
+    )
+    assert response.status_code == 400
+
+    response = api_client.post(
+        "/api/ai/workflows/sourcing/", {"vacancy_id": foreign.id}, format="json"
+    )
+    assert response.status_code == 400
+    assert response.data == {"error": "Vacante no encontrada"}
+    assert not WorkflowExecution.objects.exists()
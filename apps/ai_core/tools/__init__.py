@@ -1,18 +1,12 @@
 """
 Tools para AI Core.
 
-Este módulo importa automáticamente todas las tools para que se
-registren en el ToolRegistry al importar el paquete.
+Los módulos de tools no se importan aquí: ``ToolRegistry`` los carga
+(y se auto-registran) en el primer ``get_tool``, para que importar el
+paquete no arrastre ``langchain_core`` al arranque.
 """
 
-# Importar todos los módulos de tools para que se auto-registren
-from . import (
-    candidate_tools,
-    email_tools,
-    linkedin_tools,
-)
 from .registry import ToolRegistry
+from .tool_cache_policy import ToolCachePolicy
 
-__all__ = [
-    "ToolRegistry",
-]
+__all__ = ["ToolCachePolicy", "ToolRegistry"]
@@ -7,7 +7,9 @@ análisis de CVs, matching con vacantes, etc.
 
 from langchain_core.tools import tool
 
+from ..services.batch_fit_scorer import BatchFitScorer, fit_recommendation
 from .registry import ToolRegistry
+from .tool_cache_policy import ToolCachePolicy
 
 
 @ToolRegistry.register("analyze_candidate_fit")
@@ -54,17 +56,47 @@ def analyze_candidate_fit(candidate_profile: dict, job_requirements: dict) -> di
         "experience_match": experience_match,
         "candidate_years": candidate_years,
         "required_years": required_years,
-        "recommendation": (
-            "Strong match"
-            if match_percentage >= 70
-            else "Partial match"
-            if match_percentage >= 40
-            else "Weak match"
-        ),
+        "recommendation": fit_recommendation(match_percentage),
     }
 
 
-@ToolRegistry.register("extract_cv_information")
+@ToolRegistry.register("rank_candidates_fit")
+@tool
+def rank_candidates_fit(
+    candidate_profiles: list[dict], job_requirements: dict, top_k: int = 10
+) -> list[dict]:
+    """
+    Rankea muchos candidatos contra una vacante en una sola pasada.
+
+    Aplica los criterios de ``analyze_candidate_fit`` a todos los
+    perfiles de forma vectorizada y retorna los mejores.
+
+    Args:
+        candidate_profiles: Perfiles con ``id``, skills y experiencia
+        job_requirements: Requisitos de la vacante
+        top_k: Número de candidatos a retornar
+
+    Returns:
+        Lista con el análisis de cada candidato (incluye ``candidate_id``)
+
+    Example:
+        >>> ranking = rank_candidates_fit(
+        ...     candidate_profiles=[{"id": 1, "skills": ["Python"]}],
+        ...     job_requirements={"required_skills": ["Python", "FastAPI"]},
+        ... )
+        >>> print(ranking[0]["match_score"])
+    """
+    scorer = BatchFitScorer(
+        (profile.get("id", index), profile)
+        for index, profile in enumerate(candidate_profiles)
+    )
+    return scorer.top_k(job_requirements, k=top_k)
+
+
+@ToolRegistry.register(
+    "extract_cv_information",
+    cache=ToolCachePolicy(ttl=24 * 60 * 60, max_entries=256),
+)
 @tool
 def extract_cv_information(cv_text: str) -> dict:
     """
@@ -7,10 +7,18 @@ ser utilizadas por los agentes de IA.
 
 from langchain_core.tools import tool
 
+from apps.recruitment.adapters.skill_normalizer import normalize_skills
+
 from .registry import ToolRegistry
+from .tool_cache_policy import ToolCachePolicy
+
 
+def _profile_url_key(arguments: dict) -> str:
+    """Misma entrada para variantes de la URL del perfil."""
+    return arguments["linkedin_url"].strip().rstrip("/").lower()
 
-@ToolRegistry.register("linkedin_search_tool")
+
+@ToolRegistry.register("linkedin_search_tool", cache=ToolCachePolicy(ttl=60 * 60))
 @tool
 def search_linkedin_profiles(
     query: str, location: str | None = None, max_results: int = 10
@@ -60,7 +68,11 @@ def search_linkedin_profiles(
     }
 
 
-@ToolRegistry.register("get_linkedin_profile_details")
+# Perfiles públicos: la misma entrada sirve a todos los tenants
+@ToolRegistry.register(
+    "get_linkedin_profile_details",
+    cache=ToolCachePolicy(ttl=24 * 60 * 60, tenant_scoped=False, key=_profile_url_key),
+)
 @tool
 def get_linkedin_profile_details(linkedin_url: str) -> dict:
     """
@@ -128,6 +140,4 @@ def extract_skills_from_profile(profile_data: dict) -> list[str]:
     skills = profile_data.get("skills", [])
 
     # Normalizar (convertir a lowercase, eliminar duplicados)
-    normalized_skills = list({skill.lower() for skill in skills})
-
-    return sorted(normalized_skills)
+    return normalize_skills(skills)
@@ -1,16 +1,55 @@
+import threading
 from collections.abc import Callable
+from importlib import import_module
 from typing import ClassVar
 
+from .tool_cache_policy import ToolCachePolicy
+from .tool_cache_stats import ToolCacheStats
+from .tool_result_cache import ToolResultCache
+
 
 class ToolRegistry:
+    """
+    Registro de herramientas de ai_core.
+
+    Los módulos de tools (que importan ``langchain_core``) se cargan en
+    el primer ``get_tool``, no al importar el paquete: los comandos y
+    workers que no usan IA no pagan ese costo de arranque.
+
+    Las tools registradas con una ``ToolCachePolicy`` se entregan
+    memoizadas: llamadas con los mismos argumentos (y tenant, si la
+    política es por tenant) reutilizan el resultado durante su TTL.
+    """
+
     _registry: ClassVar[dict[str, Callable]] = {}
+    _caches: ClassVar[dict[str, ToolResultCache]] = {}
+    _stats: ClassVar[ToolCacheStats | None] = None
+    _modules: ClassVar[tuple[str, ...]] = (
+        "apps.ai_core.tools.candidate_tools",
+        "apps.ai_core.tools.email_tools",
+        "apps.ai_core.tools.linkedin_tools",
+    )
+    _loaded: ClassVar[bool] = False
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+    # Aparte de ``_lock``: ``register`` corre dentro de ``load_tools``
+    _stats_lock: ClassVar[threading.Lock] = threading.Lock()
 
     @classmethod
-    def register(cls, name: str):
-        """Decorador para registrar una herramienta."""
+    def register(cls, name: str, cache: ToolCachePolicy | None = None):
+        """
+        Decorador para registrar una herramienta.
+
+        Args:
+            name: Nombre de la herramienta.
+            cache: Política de cache de resultados (default: sin cache).
+        """
 
         def decorator(func):
             cls._registry[name] = func
+            if cache is None:
+                cls._caches.pop(name, None)
+            else:
+                cls._caches[name] = ToolResultCache(name, cache, cls.get_stats())
             return func
 
         return decorator
@@ -21,6 +60,7 @@ class ToolRegistry:
         Obtiene la herramienta y (opcionalmente) inyecta el tenant_id
         si la herramienta lo requiere (Currying/Partial).
         """
+        cls.load_tools()
         func = cls._registry.get(name)
         if not func:
             raise ValueError(f"Herramienta '{name}' no registrada en ai_core.")
@@ -28,4 +68,47 @@ class ToolRegistry:
         # Aquí podrías aplicar lógica para inyectar tenant_id
         # automáticamente si la función lo espera. Por ahora devolvemos
         # la función cruda envuelta en una StructuredTool de LangChain.
-        return func
+        result_cache = cls._caches.get(name)
+        if result_cache is None:
+            return func
+        return result_cache.wrap(func, tenant_id)
+
+    @classmethod
+    def cached_tools(cls) -> dict[str, ToolResultCache]:
+        """Caches de resultados por herramienta (las que tienen política)."""
+        cls.load_tools()
+        return dict(cls._caches)
+
+    @classmethod
+    def clear_cache(cls, name: str | None = None) -> None:
+        """Descarta los resultados cacheados de una herramienta (o de todas)."""
+        for tool_name, result_cache in cls.cached_tools().items():
+            if name is None or tool_name == name:
+                result_cache.clear()
+
+    @classmethod
+    def get_stats(cls) -> ToolCacheStats:
+        """Contadores de hit/miss del proceso."""
+        if cls._stats is None:
+            with cls._stats_lock:
+                if cls._stats is None:
+                    cls._stats = ToolCacheStats()
+        return cls._stats
+
+    @classmethod
+    def list_tools(cls) -> list[str]:
+        """Nombres de las herramientas registradas."""
+        cls.load_tools()
+        return sorted(cls._registry)
+
+    @classmethod
+    def load_tools(cls) -> None:
+        """Importa una sola vez los módulos que registran las tools."""
+        if cls._loaded:
+            return
+        with cls._lock:
+            if cls._loaded:
+                return
+            for module_name in cls._modules:
+                import_module(module_name)
+            cls._loaded = True
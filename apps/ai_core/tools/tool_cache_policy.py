@@ -0,0 +1,30 @@
+"""
+Política de cache de resultados de una herramienta.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ToolCachePolicy:
+    """
+    Cómo ``ToolRegistry`` memoiza los resultados de una herramienta.
+
+    Solo para tools sin efectos secundarios (deterministas o de
+    consulta a servicios externos): una llamada cacheada no se ejecuta.
+
+    Attributes:
+        ttl: Segundos que un resultado sigue vigente.
+        max_entries: Resultados por herramienta en cada proceso (LRU).
+        tenant_scoped: Si cada tenant tiene sus propias entradas. Sin
+            ``tenant_id`` en ``get_tool`` la herramienta no se cachea.
+        key: Función ``(argumentos) -> str`` para la clave. Recibe
+            todos los argumentos por nombre, con sus defaults (default:
+            hash del JSON de todos los argumentos).
+    """
+
+    ttl: int
+    max_entries: int = 1024
+    tenant_scoped: bool = True
+    key: Callable[[dict], str] | None = None
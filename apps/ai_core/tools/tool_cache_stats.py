@@ -0,0 +1,79 @@
+"""
+Estadísticas de hit/miss del cache de herramientas.
+
+Cada proceso cuenta en memoria y publica los incrementos en el cache de
+Django ``AI_TOOL_CACHE_STATS_ALIAS`` cada
+``AI_TOOL_CACHE_STATS_FLUSH_SECONDS``, de modo que el comando
+``tool_cache_stats`` ve los totales de todos los workers cuando ese
+cache es Redis.
+"""
+
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+
+# Contadores por herramienta
+STAT_FIELDS = ("hits", "misses", "bypasses", "evictions")
+
+
+class ToolCacheStats:
+    """Contadores locales del proceso con publicación periódica."""
+
+    def __init__(
+        self, cache_alias: str | None = None, flush_seconds: float | None = None
+    ):
+        self.cache_alias = cache_alias or settings.AI_TOOL_CACHE_STATS_ALIAS
+        self.flush_seconds = (
+            settings.AI_TOOL_CACHE_STATS_FLUSH_SECONDS
+            if flush_seconds is None
+            else flush_seconds
+        )
+        self._pending: Counter[tuple[str, str]] = Counter()
+        self._published_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, tool_name: str, field: str) -> None:
+        """Suma 1 a un contador y publica si toca."""
+        with self._lock:
+            self._pending[(tool_name, field)] += 1
+            due = time.monotonic() - self._published_at >= self.flush_seconds
+        if due:
+            self.publish()
+
+    def publish(self) -> None:
+        """Suma los contadores pendientes a los compartidos."""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            self._published_at = time.monotonic()
+        cache = caches[self.cache_alias]
+        for (tool_name, field), count in pending.items():
+            key = self._key(tool_name, field)
+            cache.add(key, 0, timeout=None)
+            cache.incr(key, count)
+
+    def read(self, tool_names: list[str]) -> dict[str, dict[str, int]]:
+        """Totales publicados por herramienta."""
+        keys = {
+            self._key(name, field): (name, field)
+            for name in tool_names
+            for field in STAT_FIELDS
+        }
+        values = caches[self.cache_alias].get_many(list(keys))
+        stats = {name: dict.fromkeys(STAT_FIELDS, 0) for name in tool_names}
+        for key, value in values.items():
+            name, field = keys[key]
+            stats[name][field] = value
+        return stats
+
+    def reset(self, tool_names: list[str]) -> None:
+        """Pone en cero los totales publicados."""
+        caches[self.cache_alias].delete_many(
+            [self._key(name, field) for name in tool_names for field in STAT_FIELDS]
+        )
+
+    @staticmethod
+    def _key(tool_name: str, field: str) -> str:
+        return f"toolcache:stats:{tool_name}:{field}"
@@ -0,0 +1,125 @@
+"""
+Cache en memoria de los resultados de una herramienta.
+"""
+
+import copy
+import hashlib
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from .tool_cache_policy import ToolCachePolicy
+from .tool_cache_stats import ToolCacheStats
+
+
+class ToolResultCache:
+    """
+    LRU con TTL de los resultados de una herramienta, local al proceso.
+
+    Las entradas se direccionan por ``(tenant_id, clave)`` cuando la
+    política es por tenant. Los resultados se copian al guardar y al
+    leer: un nodo que modifica lo que recibe no altera el cache.
+    Dos llamadas idénticas simultáneas pueden ejecutar ambas la
+    herramienta (no hay bloqueo por clave).
+    """
+
+    def __init__(self, name: str, policy: ToolCachePolicy, stats: ToolCacheStats):
+        self.name = name
+        self.policy = policy
+        self.stats = stats
+        self._entries: OrderedDict[tuple[str, str], tuple[float, object]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def wrap(self, tool, tenant_id: str | None = None):
+        """
+        Versión memoizada de ``tool``.
+
+        Args:
+            tool: ``StructuredTool`` de LangChain o función.
+            tenant_id: Tenant de la ejecución.
+
+        Returns:
+            Copia de la tool cuyo ``func`` consulta el cache. Si la
+            política es por tenant y falta el tenant, la copia solo
+            cuenta la llamada como ``bypasses``.
+        """
+        func = getattr(tool, "func", tool)
+        signature = inspect.signature(func)
+
+        if self.policy.tenant_scoped and tenant_id is None:
+
+            def wrapped(*args, **kwargs):
+                self.stats.record(self.name, "bypasses")
+                return func(*args, **kwargs)
+
+        else:
+            scope = str(tenant_id) if self.policy.tenant_scoped else ""
+
+            def wrapped(*args, **kwargs):
+                try:
+                    bound = signature.bind(*args, **kwargs)
+                except TypeError:
+                    # Argumentos inválidos: que la herramienta informe el error
+                    return func(*args, **kwargs)
+                bound.apply_defaults()
+                key = (scope, self._key(bound.arguments))
+                found, value = self.get(key)
+                if found:
+                    self.stats.record(self.name, "hits")
+                    return value
+                self.stats.record(self.name, "misses")
+                value = func(*args, **kwargs)
+                self.set(key, value)
+                return value
+
+        if func is tool:
+            return wrapped
+        # ``coroutine=None``: ``ainvoke`` usa ``func`` en un executor
+        return tool.model_copy(update={"func": wrapped, "coroutine": None})
+
+    def get(self, key: tuple[str, str]) -> tuple[bool, object]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, copy.deepcopy(entry[1])
+
+    def set(self, key: tuple[str, str], value) -> None:
+        entry = (time.monotonic() + self.policy.ttl, copy.deepcopy(value))
+        evicted = 0
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.policy.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        for _ in range(evicted):
+            self.stats.record(self.name, "evictions")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key(self, arguments: dict) -> str:
+        """
+        Clave de una llamada a partir de sus argumentos por nombre.
+
+        ``invoke`` con un string llama a la función con un argumento
+        posicional y con un dict, por nombre; ambos se normalizan con
+        la firma de la función antes de llegar aquí.
+        """
+        if self.policy.key is not None:
+            return self.policy.key(arguments)
+        raw = json.dumps(arguments, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode()).hexdigest()
@@ -0,0 +1,14 @@
+"""URLs de la app ai_core."""
+
+from django.urls import include, path
+from rest_framework.routers import DefaultRouter
+
+from apps.ai_core.views import AIUsageViewSet, WorkflowExecutionViewSet
+
+router = DefaultRouter()
+router.register(r"workflows", WorkflowExecutionViewSet, basename="workflow")
+router.register(r"usage", AIUsageViewSet, basename="ai-usage")
+
+urlpatterns = [
+    path("", include(router.urls)),
+]
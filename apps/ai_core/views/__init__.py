@@ -0,0 +1,6 @@
+"""Views de la app ai_core."""
+
+from .ai_usage_views import AIUsageViewSet
+from .workflow_execution_views import WorkflowExecutionViewSet
+
+__all__ = ["AIUsageViewSet", "WorkflowExecutionViewSet"]
@@ -0,0 +1,49 @@
+"""
+ViewSet para el consumo de IA.
+
+Este módulo contiene el ViewSet de lectura del consumo diario de tokens
+y costo del tenant.
+"""
+
+from rest_framework import status, viewsets
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from apps.ai_core.serializers import (
+    AIUsageDailySerializer,
+    AIUsageTotalsSerializer,
+)
+from apps.ai_core.services.ai_usage_service import AIUsageService
+
+
+class AIUsageViewSet(viewsets.ViewSet):
+    """
+    ViewSet para el consumo de IA del tenant.
+
+    ``GET /usage/?since=YYYY-MM-DD&until=YYYY-MM-DD`` devuelve una fila
+    por día, proveedor y modelo y los totales del rango.
+    """
+
+    permission_classes = [IsAuthenticated]
+    service = AIUsageService()
+
+    def list(self, request: Request) -> Response:
+        """Consumo diario y totales del tenant en el rango."""
+        try:
+            usage = self.service.get_usage(
+                request.tenant_id,
+                since=request.query_params.get("since"),
+                until=request.query_params.get("until"),
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            {
+                "since": usage["since"],
+                "until": usage["until"],
+                "totals": AIUsageTotalsSerializer(usage["totals"]).data,
+                "results": AIUsageDailySerializer(usage["rows"], many=True).data,
+            }
+        )
@@ -0,0 +1,67 @@
+"""
+ViewSet para WorkflowExecution.
+
+Este módulo contiene el ViewSet para encolar workflows de IA y
+consultar su estado.
+"""
+
+from django.db import transaction
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from apps.ai_core.serializers import WorkflowExecutionSerializer
+from apps.ai_core.services.workflow_execution_service import (
+    WorkflowExecutionService,
+)
+from apps.ai_core.tasks import enqueue_workflow_execution
+
+
+class WorkflowExecutionViewSet(viewsets.ViewSet):
+    """
+    ViewSet para ejecuciones de workflows de IA.
+
+    Encolar responde 202 con el ID de la ejecución; el estado y el
+    resultado se consultan en ``GET /workflows/{id}/``.
+    """
+
+    permission_classes = [IsAuthenticated]
+    service = WorkflowExecutionService()
+
+    def retrieve(self, request: Request, pk=None) -> Response:
+        """Estado y resultado de una ejecución del tenant."""
+        execution = self.service.get_execution(request.tenant_id, pk)
+        if not execution:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        return Response(WorkflowExecutionSerializer(execution).data)
+
+    @action(detail=False, methods=["post"])
+    def sourcing(self, request: Request) -> Response:
+        """Encola el sourcing de una vacante (``vacancy_id``)."""
+        return self._enqueue(request, "vacancy_id", self.service.create_sourcing)
+
+    @action(detail=False, methods=["post"])
+    def screening(self, request: Request) -> Response:
+        """Encola el screening de una postulación (``application_id``)."""
+        return self._enqueue(request, "application_id", self.service.create_screening)
+
+    def _enqueue(self, request: Request, field: str, create) -> Response:
+        """Registra la ejecución y la encola al confirmar la transacción."""
+        object_id = str(request.data.get(field, ""))
+        if not object_id.isdigit():
+            return Response(
+                {"error": f"{field} debe ser un ID numérico"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            execution = create(request.tenant_id, int(object_id))
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        transaction.on_commit(lambda: enqueue_workflow_execution(execution))
+        return Response(
+            WorkflowExecutionSerializer(execution).data,
+            status=status.HTTP_202_ACCEPTED,
+        )
@@ -0,0 +1,261 @@
+"""
+Motor asíncrono de ejecución de workflows.
+
+Ejecuta muchos workflows a la vez en un solo proceso con ``ainvoke``,
+respetando límites de concurrencia por proveedor, por API key y por
+tenant, y repartiendo los cupos entre tenants en round-robin.
+"""
+
+import asyncio
+import hashlib
+from collections import Counter, OrderedDict, deque
+from collections.abc import Callable
+
+from django.conf import settings
+
+from .compiled_workflow_cache import CompiledWorkflowCache
+from .run_config import build_run_config
+from .workflow_run import WorkflowRun
+
+
+class AsyncWorkflowEngine:
+    """
+    Planificador de ejecuciones de workflows sobre un event loop.
+
+    Cada tenant tiene su cola FIFO; el despacho recorre los tenants en
+    round-robin y arranca la primera ejecución de cada uno que quepa en
+    los límites:
+
+    - ``max_concurrency``: ejecuciones simultáneas en el proceso.
+    - ``tenant_limit``: por tenant (un lote de 500 vacantes no acapara
+      los cupos: los demás tenants entran en la siguiente vuelta).
+    - ``provider_limits``: por proveedor (``{"openai": 48, ...}``; un
+      proveedor ausente solo tiene el límite global).
+    - ``api_key_limit``: por API key; los tenants que usan la key de
+      la plataforma comparten este cupo.
+
+    Los límites funcionan como semáforos contados al despachar (y no
+    con ``acquire`` dentro de la ejecución), así una ejecución que no
+    puede arrancar no ocupa un cupo global ni bloquea a otros tenants.
+    Las llamadas al LLM de un workflow son secuenciales, por lo que
+    acotar ejecuciones por key acota las requests en vuelo por key.
+
+    Todas las operaciones deben hacerse desde el event loop del motor.
+
+    Example:
+        >>> engine = AsyncWorkflowEngine()
+        >>> run = engine.submit("sourcing", state, tenant_id=t, llm=llm,
+        ...                     provider="openai", api_key=key)
+        >>> result = await run
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        tenant_limit: int | None = None,
+        provider_limits: dict[str, int] | None = None,
+        api_key_limit: int | None = None,
+        graph_resolver: Callable[[str], object] | None = None,
+    ):
+        """
+        Args:
+            max_concurrency: Default: ``AI_WORKFLOW_MAX_CONCURRENCY``.
+            tenant_limit: Default: ``AI_WORKFLOW_TENANT_CONCURRENCY``.
+            provider_limits: Default: ``AI_WORKFLOW_PROVIDER_CONCURRENCY``.
+            api_key_limit: Default: ``AI_WORKFLOW_API_KEY_CONCURRENCY``.
+            graph_resolver: Obtiene el grafo compilado por nombre
+                (default: ``CompiledWorkflowCache.get``).
+        """
+        self.max_concurrency = max_concurrency or settings.AI_WORKFLOW_MAX_CONCURRENCY
+        self.tenant_limit = tenant_limit or settings.AI_WORKFLOW_TENANT_CONCURRENCY
+        self.provider_limits = (
+            provider_limits
+            if provider_limits is not None
+            else settings.AI_WORKFLOW_PROVIDER_CONCURRENCY
+        )
+        self.api_key_limit = api_key_limit or settings.AI_WORKFLOW_API_KEY_CONCURRENCY
+        self.graph_resolver = graph_resolver or CompiledWorkflowCache.get
+
+        self._queues: OrderedDict[str, deque[WorkflowRun]] = OrderedDict()
+        self._running: set[WorkflowRun] = set()
+        self._by_tenant: Counter[str] = Counter()
+        self._by_provider: Counter[str] = Counter()
+        self._by_key: Counter[str] = Counter()
+
+    def submit(
+        self,
+        workflow_name: str,
+        state: dict,
+        *,
+        tenant_id: str,
+        llm,
+        provider: str,
+        api_key: str,
+        callbacks: list | None = None,
+    ) -> WorkflowRun:
+        """
+        Encola una ejecución y la arranca si hay cupo.
+
+        Args:
+            workflow_name: Nombre del workflow.
+            state: Estado inicial del grafo.
+            tenant_id: Tenant dueño de la ejecución.
+            llm: Chat model del tenant.
+            provider: Proveedor efectivo del chat model.
+            api_key: API key efectiva (solo se guarda su hash).
+            callbacks: Callbacks de monitoreo.
+
+        Returns:
+            WorkflowRun: Handle de la ejecución (``await run``).
+
+        Raises:
+            ValueError: Si el workflow no está registrado.
+        """
+        run = WorkflowRun(
+            workflow_name=workflow_name,
+            tenant_id=str(tenant_id),
+            provider=str(provider),
+            key_hash=hashlib.sha256(api_key.encode()).hexdigest(),
+            graph=self.graph_resolver(workflow_name),
+            state=state,
+            llm=llm,
+            callbacks=callbacks or [],
+            future=asyncio.get_running_loop().create_future(),
+        )
+        run.future.add_done_callback(lambda _: self._on_future_done(run))
+        self._queues.setdefault(run.tenant_id, deque()).append(run)
+        self._dispatch()
+        return run
+
+    def cancel(self, run: WorkflowRun) -> bool:
+        """
+        Cancela una ejecución en cola (sale de la cola) o en curso.
+
+        Returns:
+            bool: False si la ejecución ya había terminado.
+        """
+        cancelled = run.future.cancel()
+        self._on_future_done(run)
+        return cancelled
+
+    def cancel_tenant(self, tenant_id: str) -> int:
+        """
+        Cancela las ejecuciones en cola y en curso de un tenant.
+
+        Returns:
+            int: Ejecuciones canceladas.
+        """
+        tenant_id = str(tenant_id)
+        runs = list(self._queues.get(tenant_id, ()))
+        runs += [run for run in self._running if run.tenant_id == tenant_id]
+        return sum(self.cancel(run) for run in runs)
+
+    def cancel_all(self) -> int:
+        """Cancela todas las ejecuciones en cola y en curso."""
+        runs = [run for queue in self._queues.values() for run in queue]
+        runs += list(self._running)
+        return sum(self.cancel(run) for run in runs)
+
+    async def join(self) -> None:
+        """
+        Espera a que terminen todas las ejecuciones (incluidas las que
+        se encolen mientras tanto). Cancelar ``join`` no las cancela.
+        """
+        while self._running or self._queues:
+            # Las tareas en curso (no sus futures): una cancelada resuelve
+            # el future antes de terminar de liberar su cupo.
+            pending = [run.future for queue in self._queues.values() for run in queue]
+            pending += [run.task for run in self._running]
+            await asyncio.wait(pending)
+
+    def stats(self) -> dict[str, int]:
+        """Ejecuciones en cola y en curso."""
+        return {
+            "queued": sum(len(queue) for queue in self._queues.values()),
+            "running": len(self._running),
+        }
+
+    def _dispatch(self) -> None:
+        """Arranca ejecuciones en round-robin por tenant mientras haya cupo."""
+        started = True
+        while started and len(self._running) < self.max_concurrency:
+            started = False
+            for tenant_id in list(self._queues):
+                if len(self._running) >= self.max_concurrency:
+                    return
+                queue = self._queues[tenant_id]
+                if not self._has_capacity(queue[0]):
+                    continue
+                run = queue.popleft()
+                if queue:
+                    # El tenant pasa al final de la vuelta
+                    self._queues.move_to_end(tenant_id)
+                else:
+                    del self._queues[tenant_id]
+                self._start(run)
+                started = True
+
+    def _has_capacity(self, run: WorkflowRun) -> bool:
+        provider_limit = self.provider_limits.get(run.provider)
+        return (
+            self._by_tenant[run.tenant_id] < self.tenant_limit
+            and self._by_key[run.key_hash] < self.api_key_limit
+            and (
+                provider_limit is None
+                or self._by_provider[run.provider] < provider_limit
+            )
+        )
+
+    def _start(self, run: WorkflowRun) -> None:
+        self._running.add(run)
+        self._by_tenant[run.tenant_id] += 1
+        self._by_provider[run.provider] += 1
+        self._by_key[run.key_hash] += 1
+        run.status = WorkflowRun.RUNNING
+        run.task = asyncio.create_task(self._execute(run))
+        run.task.add_done_callback(lambda task: self._on_task_done(run, task))
+
+    async def _execute(self, run: WorkflowRun):
+        config = build_run_config(
+            run.llm, run.callbacks, workflow_name=run.workflow_name
+        )
+        return await run.graph.ainvoke(run.state, config=config)
+
+    def _on_task_done(self, run: WorkflowRun, task: asyncio.Task) -> None:
+        """Libera los cupos, resuelve el future y despacha la siguiente."""
+        self._running.discard(run)
+        self._by_tenant[run.tenant_id] -= 1
+        self._by_provider[run.provider] -= 1
+        self._by_key[run.key_hash] -= 1
+
+        if task.cancelled():
+            run.status = WorkflowRun.CANCELLED
+            run.future.cancel()
+        elif task.exception() is not None:
+            run.status = WorkflowRun.FAILED
+            if not run.future.done():
+                run.future.set_exception(task.exception())
+        else:
+            run.status = WorkflowRun.SUCCEEDED
+            if not run.future.done():
+                run.future.set_result(task.result())
+        self._dispatch()
+
+    def _on_future_done(self, run: WorkflowRun) -> None:
+        """
+        Propaga la cancelación del future a la cola o a la tarea.
+
+        También corre como callback del future, así que cancelar el
+        future (o la tarea que lo espera) cancela la ejecución.
+        """
+        if not run.future.cancelled():
+            return
+        if run.status == WorkflowRun.QUEUED:
+            queue = self._queues.get(run.tenant_id)
+            if queue and run in queue:
+                queue.remove(run)
+                if not queue:
+                    del self._queues[run.tenant_id]
+            run.status = WorkflowRun.CANCELLED
+        elif run.status == WorkflowRun.RUNNING:
+            run.task.cancel()
@@ -0,0 +1,60 @@
+"""
+Cache de workflows compilados.
+
+Construir un ``StateGraph`` y compilarlo cuesta lo mismo en cada
+ejecución aunque la topología no cambie; este módulo compila cada
+workflow una vez por proceso y versión.
+"""
+
+import threading
+from typing import ClassVar
+
+from .screening_graph import ScreeningWorkflowBuilder
+from .sourcing_graph import SourcingWorkflowBuilder
+
+WORKFLOW_BUILDERS = {
+    ScreeningWorkflowBuilder.NAME: ScreeningWorkflowBuilder,
+    SourcingWorkflowBuilder.NAME: SourcingWorkflowBuilder,
+}
+
+
+class CompiledWorkflowCache:
+    """
+    Grafos compilados indexados por (nombre, versión).
+
+    Un grafo compilado sin checkpointer no guarda estado entre
+    ejecuciones, así que puede invocarse de forma concurrente desde
+    varios hilos. La versión la declara el builder (``VERSION``): al
+    cambiarla, la entrada anterior deja de usarse.
+    """
+
+    _compiled: ClassVar[dict[tuple[str, int], object]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def get(cls, name: str):
+        """
+        Obtiene el grafo compilado de un workflow (compilándolo si hace falta).
+
+        Raises:
+            ValueError: Si el workflow no está registrado.
+        """
+        builder_class = WORKFLOW_BUILDERS.get(name)
+        if builder_class is None:
+            raise ValueError(f"Workflow '{name}' no registrado en ai_core.")
+
+        key = (name, builder_class.VERSION)
+        graph = cls._compiled.get(key)
+        if graph is None:
+            with cls._lock:
+                graph = cls._compiled.get(key)
+                if graph is None:
+                    graph = builder_class().build()
+                    cls._compiled[key] = graph
+        return graph
+
+    @classmethod
+    def clear(cls) -> None:
+        """Descarta todos los grafos compilados."""
+        with cls._lock:
+            cls._compiled.clear()
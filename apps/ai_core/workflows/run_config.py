@@ -0,0 +1,53 @@
+"""
+Configuración por ejecución de los workflows compilados.
+
+Los grafos compilados se comparten entre ejecuciones; lo que varía por
+ejecución (LLM del tenant, callbacks de monitoreo) viaja en el
+``RunnableConfig`` que recibe ``invoke``.
+"""
+
+from langchain_core.runnables import RunnableConfig
+
+LLM_CONFIG_KEY = "llm"
+# Nombre del workflow en ``config["metadata"]`` (lo leen los logs)
+WORKFLOW_NAME_METADATA_KEY = "workflow_name"
+
+
+def build_run_config(
+    llm,
+    callbacks: list | None = None,
+    workflow_name: str | None = None,
+    **configurable,
+) -> RunnableConfig:
+    """
+    Arma el ``config`` de una ejecución.
+
+    Args:
+        llm: Chat model del tenant (lo leen los nodos con ``get_run_llm``).
+        callbacks: Callbacks de monitoreo de la ejecución.
+        workflow_name: Nombre del workflow para ``config["metadata"]``.
+        **configurable: Valores adicionales para ``config["configurable"]``.
+
+    Returns:
+        RunnableConfig: Config para ``graph.invoke(state, config=...)``.
+    """
+    config: RunnableConfig = {
+        "callbacks": callbacks or [],
+        "configurable": {**configurable, LLM_CONFIG_KEY: llm},
+    }
+    if workflow_name:
+        config["metadata"] = {WORKFLOW_NAME_METADATA_KEY: workflow_name}
+    return config
+
+
+def get_run_llm(config: RunnableConfig):
+    """
+    LLM de la ejecución en curso (dentro de un nodo).
+
+    Raises:
+        ValueError: Si la ejecución no recibió un LLM.
+    """
+    llm = config.get("configurable", {}).get(LLM_CONFIG_KEY)
+    if llm is None:
+        raise ValueError("La ejecución del workflow no recibió un LLM.")
+    return llm
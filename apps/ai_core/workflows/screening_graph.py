@@ -0,0 +1,62 @@
+from typing import TypedDict
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph import END, StateGraph
+
+from ..tools.registry import ToolRegistry
+from .run_config import get_run_llm
+
+
+# Schema del Estado
+class ScreeningState(TypedDict):
+    messages: list[str]
+    tenant_id: str
+    application_id: int
+    candidate_profile: dict
+    job_requirements: dict
+    final_output: dict
+
+
+class ScreeningWorkflowBuilder:
+    """
+    Construye el grafo de screening de una postulación.
+
+    El nodo ``screener`` evalúa el encaje del candidato con la vacante
+    (tool ``analyze_candidate_fit``) y deja el análisis en
+    ``final_output``. Igual que en sourcing, el LLM llega en el
+    ``config`` de cada ejecución y las tools se piden con el
+    ``tenant_id`` del estado; cambiar la topología o los nodos requiere
+    incrementar ``VERSION``.
+    """
+
+    NAME = "screening"
+    VERSION = 2
+
+    def build(self):
+        workflow = StateGraph(ScreeningState)
+
+        workflow.add_node("screener", self._screener)
+
+        workflow.set_entry_point("screener")
+        workflow.add_edge("screener", END)
+
+        return workflow.compile()
+
+    @staticmethod
+    def _screener(state, config: RunnableConfig):
+        # El LLM del tenant llega con la ejecución, no con el grafo
+        llm = get_run_llm(config)  # noqa: F841
+
+        fit = ToolRegistry.get_tool(
+            "analyze_candidate_fit", state.get("tenant_id")
+        ).invoke(
+            {
+                "candidate_profile": state["candidate_profile"],
+                "job_requirements": state["job_requirements"],
+            },
+            config=config,
+        )
+        return {
+            "messages": [*state["messages"], "Agente screener ejecutado"],
+            "final_output": fit,
+        }
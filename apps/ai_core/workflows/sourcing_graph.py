@@ -1,22 +1,38 @@
 from typing import TypedDict
 
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import END, StateGraph
 
+from ..tools.registry import ToolRegistry
+from .run_config import get_run_llm
+
 # from langchain_core.messages import SystemMessage, HumanMessage
-# from ..tools.registry import ToolRegistry
 
 
 # Schema del Estado
 class AgentState(TypedDict):
     messages: list[str]  # Simplificado para el ejemplo
+    tenant_id: str
     vacancy_id: int
     context: dict
     final_output: dict
 
 
 class SourcingWorkflowBuilder:
-    def __init__(self, llm):
-        self.llm = llm
+    """
+    Construye el grafo de sourcing.
+
+    La topología es estática: el LLM y los callbacks no se capturan en
+    los nodos sino que llegan en el ``config`` de cada ejecución (ver
+    ``build_run_config``), de modo que el grafo compilado se reutiliza
+    entre tenants y ejecuciones. Las tools se obtienen en cada ejecución
+    con el ``tenant_id`` del estado, para que las que cachean por tenant
+    reutilicen resultados. Cambiar la topología o los nodos requiere
+    incrementar ``VERSION``.
+    """
+
+    NAME = "sourcing"
+    VERSION = 2
 
     def build(self):
         # Configuración: Qué herramientas puede usar cada agente
@@ -40,23 +56,37 @@ class SourcingWorkflowBuilder:
         return workflow.compile()
 
     def _create_node(self, agent_name, configs):
-        # 1. Obtener herramientas reales del registro
-        # tool_names = configs.get(agent_name, [])
+        tool_names = configs.get(agent_name, [])
+
+        def node_func(state, config: RunnableConfig):
+            # El LLM del tenant llega con la ejecución, no con el grafo
+            llm = get_run_llm(config)  # noqa: F841
 
-        # Nota: Aquí deberíamos convertir las funciones de python
-        # a LangChain Tools
-        # tools = [ToolRegistry.get_tool(name) for name in tool_names]
+            # 1. Herramientas del registro, con el cache del tenant
+            tools = {
+                name: ToolRegistry.get_tool(name, state.get("tenant_id"))
+                for name in tool_names
+            }
 
-        # 2. Bind tools al LLM (si hay herramientas)
-        # if tool_names:
-        #     llm_bound = self.llm.bind_tools(tools)
-        # else:
-        #     llm_bound = self.llm
+            # 2. Bind tools al LLM (si hay herramientas)
+            # if tools:
+            #     llm_bound = llm.bind_tools(list(tools.values()))
+            # else:
+            #     llm_bound = llm
 
-        def node_func(state):
             # Lógica simple de invocación
             # prompt = f"Eres un {agent_name}... contexto: {state['context']}"
-            # response = self.llm.invoke(...)
-            return {"messages": [f"Agente {agent_name} ejecutado"]}
+            # response = llm.invoke(..., config=config)
+            update = {"messages": [f"Agente {agent_name} ejecutado"]}
+            if "linkedin_search_tool" in tools:
+                context = state["context"]
+                update["final_output"] = tools["linkedin_search_tool"].invoke(
+                    {
+                        "query": context.get("title", ""),
+                        "location": context.get("location") or None,
+                    },
+                    config=config,
+                )
+            return update
 
         return node_func
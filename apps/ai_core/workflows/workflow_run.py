@@ -0,0 +1,55 @@
+"""
+Ejecución de un workflow dentro de ``AsyncWorkflowEngine``.
+"""
+
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+
+
+@dataclass(eq=False)
+class WorkflowRun:
+    """
+    Handle de una ejecución encolada o en curso.
+
+    Se puede esperar (``await run``) para obtener el estado final del
+    grafo; si la ejecución falló, ``await`` relanza la excepción.
+    Cancelar el ``future`` (o la tarea que lo espera) o llamar a
+    ``AsyncWorkflowEngine.cancel`` cancela la ejecución, esté en cola o
+    corriendo.
+
+    Attributes:
+        workflow_name: Nombre del workflow.
+        tenant_id: Tenant dueño de la ejecución.
+        provider: Proveedor de IA (límite de concurrencia por proveedor).
+        key_hash: Hash de la API key (límite por key).
+        graph: Grafo compilado.
+        state: Estado inicial.
+        llm: Chat model del tenant.
+        callbacks: Callbacks de monitoreo.
+        id: Identificador de la ejecución.
+        status: ``queued``, ``running``, ``succeeded``, ``failed`` o
+            ``cancelled``.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    workflow_name: str
+    tenant_id: str
+    provider: str
+    key_hash: str
+    graph: object = field(repr=False)
+    state: dict = field(repr=False)
+    llm: object = field(repr=False)
+    callbacks: list = field(default_factory=list, repr=False)
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    status: str = QUEUED
+    future: asyncio.Future | None = field(default=None, repr=False)
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    def __await__(self):
+        return self.future.__await__()
@@ -0,0 +1,47 @@
+import pytest
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.recruitment.models import JobVacancy
+from apps.tenants.models import Tenant, TenantMembership, TenantRole
+from apps.users.models import User
+
+
+@pytest.fixture
+def tenant(db):
+    return Tenant.objects.create(name="Acme", slug="acme")
+
+
+@pytest.fixture
+def vacancy(tenant):
+    return JobVacancy.objects.create(
+        tenant=tenant,
+        title="Python Dev",
+        description="Backend con Django",
+        requirements="Python, Django, PostgreSQL",
+    )
+
+
+@pytest.fixture
+def tenant_client(db):
+    """Crea clientes autenticados como owner de un tenant (JWT con ``tenant_id``)."""
+
+    def make(tenant: Tenant) -> APIClient:
+        user = User.objects.create_user(
+            username=f"owner-{tenant.slug}",
+            email=f"owner@{tenant.slug}.example.com",
+            password="secret",
+        )
+        TenantMembership.objects.create(tenant=tenant, user=user, role=TenantRole.OWNER)
+        token = AccessToken.for_user(user)
+        token["tenant_id"] = str(tenant.id)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        return client
+
+    return make
+
+
+@pytest.fixture
+def api_client(tenant, tenant_client):
+    return tenant_client(tenant)
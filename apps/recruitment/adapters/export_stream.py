@@ -0,0 +1,111 @@
+"""
+Serialización en streaming para exportaciones masivas.
+
+Este módulo convierte iteradores de tuplas (``values_list``) en
+fragmentos de bytes CSV o NDJSON, opcionalmente comprimidos con gzip,
+para usarlos con ``StreamingHttpResponse`` sin materializar el
+resultado completo en memoria.
+"""
+
+import csv
+import io
+import json
+import zlib
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+# Tamaño aproximado de cada fragmento enviado al cliente
+BUFFER_SIZE = 64 * 1024
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime | date):
+        return value.isoformat()
+    if isinstance(value, list | dict):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def iter_csv(header: list[str], rows: Iterable[tuple]) -> Iterator[bytes]:
+    """
+    Serializa filas a CSV en fragmentos de ~``BUFFER_SIZE`` bytes.
+
+    Args:
+        header: Nombres de columna.
+        rows: Tuplas con los valores de cada fila.
+
+    Yields:
+        bytes: Fragmentos codificados en UTF-8.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(header)
+    for row in rows:
+        writer.writerow([_csv_value(value) for value in row])
+        if buffer.tell() >= BUFFER_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def iter_ndjson(header: list[str], rows: Iterable[tuple]) -> Iterator[bytes]:
+    """
+    Serializa filas a NDJSON (un objeto por línea) en fragmentos.
+
+    Args:
+        header: Claves de cada objeto.
+        rows: Tuplas con los valores de cada fila.
+
+    Yields:
+        bytes: Fragmentos codificados en UTF-8.
+    """
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    lines: list[str] = []
+    size = 0
+    for row in rows:
+        line = encoder.encode(dict(zip(header, row, strict=True)))
+        lines.append(line)
+        size += len(line) + 1
+        if size >= BUFFER_SIZE:
+            yield ("\n".join(lines) + "\n").encode()
+            lines, size = [], 0
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def iter_gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Comprime un flujo de bytes como gzip, fragmento a fragmento."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def iter_export(
+    header: list[str], rows: Iterable[tuple], file_format: str, compress: bool = False
+) -> Iterator[bytes]:
+    """
+    Serializa filas en el formato pedido.
+
+    Raises:
+        ValueError: Si el formato no está soportado.
+    """
+    if file_format == "csv":
+        chunks = iter_csv(header, rows)
+    elif file_format == "ndjson":
+        chunks = iter_ndjson(header, rows)
+    else:
+        raise ValueError(f"Formato de exportación no soportado: {file_format}")
+    return iter_gzip(chunks) if compress else chunks
@@ -0,0 +1,93 @@
+"""
+Lectores en streaming para importación masiva de postulaciones.
+
+Este módulo convierte archivos CSV o NDJSON en un iterador de filas
+sin cargar el archivo completo en memoria.
+"""
+
+import csv
+import io
+import json
+from collections.abc import Iterator
+from typing import BinaryIO
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+ImportRow = tuple[int, dict | None]
+
+
+def detect_import_format(filename: str) -> str | None:
+    """
+    Infiere el formato a partir de la extensión del archivo.
+
+    Args:
+        filename: Nombre del archivo.
+
+    Returns:
+        str | None: ``csv``, ``ndjson`` o None si no se reconoce.
+    """
+    name = filename.lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    return None
+
+
+def iter_csv_rows(stream: BinaryIO) -> Iterator[ImportRow]:
+    """
+    Itera un CSV con cabecera, una fila a la vez.
+
+    Las celdas vacías se omiten para que los campos opcionales no
+    se validen como cadenas vacías.
+
+    Yields:
+        ImportRow: Número de línea y diccionario de la fila.
+    """
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    reader = csv.DictReader(text)
+    for row in reader:
+        yield (
+            reader.line_num,
+            {
+                key.strip(): value.strip()
+                for key, value in row.items()
+                if key and value and value.strip()
+            },
+        )
+
+
+def iter_ndjson_rows(stream: BinaryIO) -> Iterator[ImportRow]:
+    """
+    Itera un archivo NDJSON (un objeto JSON por línea).
+
+    Yields:
+        ImportRow: Número de línea y diccionario de la fila, o None
+            si la línea no es un objeto JSON válido.
+    """
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            row = None
+        yield line_number, row if isinstance(row, dict) else None
+
+
+def iter_import_rows(stream: BinaryIO, file_format: str) -> Iterator[ImportRow]:
+    """
+    Itera las filas de un archivo de importación según su formato.
+
+    Args:
+        stream: Archivo binario abierto.
+        file_format: ``csv`` o ``ndjson``.
+
+    Raises:
+        ValueError: Si el formato no está soportado.
+    """
+    if file_format == "csv":
+        return iter_csv_rows(stream)
+    if file_format == "ndjson":
+        return iter_ndjson_rows(stream)
+    raise ValueError(f"Formato de importación no soportado: {file_format}")
@@ -0,0 +1,49 @@
+"""
+Normalización de nombres de habilidades.
+
+Este módulo contiene la forma canónica de texto de una habilidad
+(minúsculas, espacios colapsados) compartida por las tools de IA y el
+índice de habilidades de candidatos. No depende de Django.
+"""
+
+import re
+from collections.abc import Iterable
+
+SKILL_SEPARATORS = re.compile(r"[,;\n\r•|]+")
+
+
+def normalize_skill(skill: str) -> str:
+    """
+    Normaliza el texto de una habilidad.
+
+    Example:
+        >>> normalize_skill("  Machine   Learning ")
+        'machine learning'
+    """
+    return " ".join(skill.split()).lower()
+
+
+def normalize_skills(skills: Iterable) -> list[str]:
+    """
+    Normaliza una lista de habilidades (sin vacíos ni duplicados).
+
+    Los elementos que no son texto se ignoran, ya que ``skills`` es un
+    JSON libre.
+
+    Returns:
+        list[str]: Habilidades normalizadas, ordenadas.
+    """
+    normalized = {normalize_skill(skill) for skill in skills if isinstance(skill, str)}
+    normalized.discard("")
+    return sorted(normalized)
+
+
+def split_skill_list(text: str) -> list[str]:
+    """
+    Separa un texto de requisitos en habilidades normalizadas.
+
+    Example:
+        >>> split_skill_list("Python, Django;\\nPostgreSQL")
+        ['django', 'postgresql', 'python']
+    """
+    return normalize_skills(SKILL_SEPARATORS.split(text or ""))
@@ -5,3 +5,6 @@ class RecruitmentConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.recruitment"
     verbose_name = "Reclutamiento"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,37 @@
+"""
+Comando para archivar postulaciones de vacantes cerradas.
+
+Uso:
+    python manage.py archive_applications [--days <n>] [--chunk-size <n>]
+
+Mueve a ``ArchivedApplication`` las postulaciones de vacantes cerradas
+o archivadas hace más de ``--days`` días (default: setting
+``RECRUITMENT_ARCHIVE_AFTER_DAYS``). Se revierte con
+``restore_applications``.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.recruitment.services import ApplicationArchiveService
+
+
+class Command(BaseCommand):
+    help = "Archiva postulaciones de vacantes cerradas hace más de N días."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, help="Antigüedad mínima del cierre")
+        parser.add_argument("--chunk-size", type=int, help="Filas por transacción")
+
+    def handle(self, *args, **options):
+        try:
+            totals = ApplicationArchiveService().archive_closed_vacancies(
+                older_than_days=options["days"], chunk_size=options["chunk_size"]
+            )
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{totals['applications']} postulaciones archivadas "
+                f"de {totals['vacancies']} vacantes."
+            )
+        )
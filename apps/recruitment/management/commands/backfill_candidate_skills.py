@@ -0,0 +1,24 @@
+"""
+Comando para reconstruir el índice de habilidades de candidatos.
+
+Uso:
+    python manage.py backfill_candidate_skills [--tenant <id>] [--chunk-size 1000]
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.recruitment.services import CandidateSkillIndexService
+
+
+class Command(BaseCommand):
+    help = "Pobla CandidateSkill a partir de Candidate.skills."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tenant", help="ID del tenant (default: todos)")
+        parser.add_argument("--chunk-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        total = CandidateSkillIndexService().backfill(
+            tenant_id=options["tenant"], chunk_size=options["chunk_size"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"{total} candidatos indexados."))
@@ -0,0 +1,93 @@
+"""
+Benchmark de la importación masiva de postulaciones.
+
+Genera filas sintéticas en streaming, las importa a una vacante
+temporal y reporta el throughput. Todo se revierte al terminar.
+
+Uso:
+    python manage.py benchmark_application_import --rows 10000
+"""
+
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.recruitment.models import JobVacancy
+from apps.recruitment.services import ApplicationImportService
+from apps.tenants.models import Tenant
+
+TARGET_ROWS_PER_MINUTE = 10_000
+
+
+class Command(BaseCommand):
+    help = "Mide filas/minuto de la importación masiva (datos sintéticos)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=10_000)
+        parser.add_argument("--chunk-size", type=int)
+        parser.add_argument(
+            "--existing-ratio",
+            type=float,
+            default=0.2,
+            help="Fracción de filas cuyo candidato ya existe en el tenant.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            self._run(options)
+            transaction.set_rollback(True)
+
+    def _run(self, options):
+        rows = options["rows"]
+        slug = f"bench-{uuid.uuid4().hex[:8]}"
+        tenant = Tenant.objects.create(name=slug, slug=slug)
+        vacancy = JobVacancy.objects.create(
+            tenant=tenant, title="Benchmark", description="-", requirements="-"
+        )
+
+        existing = int(rows * options["existing_ratio"])
+        if existing:
+            ApplicationImportService().import_rows(
+                vacancy_id=JobVacancy.objects.create(
+                    tenant=tenant, title="Seed", description="-", requirements="-"
+                ).id,
+                rows=self._synthetic_rows(existing),
+            )
+
+        started = time.perf_counter()
+        report = ApplicationImportService().import_rows(
+            vacancy_id=vacancy.id,
+            rows=self._synthetic_rows(rows),
+            chunk_size=options["chunk_size"],
+        )
+        elapsed = time.perf_counter() - started
+
+        rate = report.processed / elapsed * 60 if elapsed else float("inf")
+        style = (
+            self.style.SUCCESS if rate >= TARGET_ROWS_PER_MINUTE else self.style.ERROR
+        )
+        self.stdout.write(
+            f"{report.processed} filas ({existing} candidatos existentes) en "
+            f"{elapsed:.2f}s; {report.created} creadas, {report.failed} errores."
+        )
+        self.stdout.write(
+            style(
+                f"Throughput: {rate:,.0f} filas/minuto "
+                f"(objetivo: {TARGET_ROWS_PER_MINUTE:,})."
+            )
+        )
+
+    @staticmethod
+    def _synthetic_rows(count: int):
+        for i in range(count):
+            yield (
+                i + 2,
+                {
+                    "first_name": f"Nombre{i}",
+                    "last_name": f"Apellido{i}",
+                    "email": f"candidato{i}@example.com",
+                    "phone": f"+58412{i:07d}",
+                },
+            )
@@ -0,0 +1,45 @@
+"""
+Comando para crear particiones futuras de postulaciones.
+
+Uso:
+    python manage.py create_application_partitions [--months <n>] [--list]
+
+Crea las particiones mensuales del mes actual y los ``--months``
+siguientes (default: setting ``RECRUITMENT_PARTITION_MONTHS_AHEAD``).
+Es idempotente; programarlo (cron o la tarea
+``recruitment.create_application_partitions``) evita que las
+postulaciones caigan en la partición por defecto.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.recruitment.services import ApplicationPartitionService
+
+
+class Command(BaseCommand):
+    help = "Crea las particiones mensuales futuras de postulaciones."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--months", type=int, help="Meses por adelantado")
+        parser.add_argument(
+            "--list", action="store_true", help="Lista las particiones existentes"
+        )
+
+    def handle(self, *args, **options):
+        service = ApplicationPartitionService()
+        if not service.is_partitioned():
+            self.stdout.write(
+                self.style.WARNING("La tabla de postulaciones no está particionada.")
+            )
+            return
+
+        created = service.ensure_future_partitions(options["months"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(created)} particiones creadas"
+                + (f": {', '.join(created)}." if created else ".")
+            )
+        )
+        if options["list"]:
+            for name, bounds in service.get_partitions():
+                self.stdout.write(f"{name}  {bounds}")
@@ -0,0 +1,72 @@
+"""
+Comando para importar postulaciones masivamente a una vacante.
+
+Uso:
+    python manage.py import_applications <vacancy_id> candidatos.csv
+    cat candidatos.ndjson | python manage.py import_applications 12 - \\
+        --format ndjson
+"""
+
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.recruitment.adapters.import_row_reader import (
+    IMPORT_FORMATS,
+    detect_import_format,
+    iter_import_rows,
+)
+from apps.recruitment.models import ApplicationSource
+from apps.recruitment.services import ApplicationImportService
+
+
+class Command(BaseCommand):
+    help = "Importa postulaciones desde un archivo CSV o NDJSON (en streaming)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("vacancy_id", type=int)
+        parser.add_argument("path", help="Ruta del archivo o '-' para stdin.")
+        parser.add_argument("--format", choices=IMPORT_FORMATS)
+        parser.add_argument("--chunk-size", type=int)
+        parser.add_argument(
+            "--source",
+            choices=ApplicationSource.values,
+            default=ApplicationSource.AGENCY,
+        )
+        parser.add_argument(
+            "--errors-file",
+            help="Guarda los errores por fila en este archivo (NDJSON).",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        file_format = options["format"] or detect_import_format(path)
+        if not file_format:
+            raise CommandError("No se pudo inferir el formato; usa --format.")
+
+        stream = sys.stdin.buffer if path == "-" else open(path, "rb")  # noqa: SIM115
+        try:
+            report = ApplicationImportService().import_rows(
+                vacancy_id=options["vacancy_id"],
+                rows=iter_import_rows(stream, file_format),
+                source=options["source"],
+                chunk_size=options["chunk_size"],
+            )
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+
+        if options["errors_file"]:
+            with open(options["errors_file"], "w") as errors_file:
+                for error in report.errors:
+                    errors_file.write(json.dumps(error, ensure_ascii=False) + "\n")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{report.processed} filas procesadas: {report.created} "
+                f"postulaciones creadas, {report.failed} con errores."
+            )
+        )
@@ -0,0 +1,36 @@
+"""
+Comando para convertir Application en una tabla particionada.
+
+Uso:
+    python manage.py partition_applications prepare
+    python manage.py partition_applications copy [--chunk-size <n>]
+    python manage.py partition_applications swap
+    python manage.py partition_applications drop-legacy
+
+Convierte la tabla de postulaciones (PostgreSQL >= 13) en una tabla
+particionada por mes de ``applied_at``. ``copy`` puede repetirse (por
+ejemplo, en cron) hasta ejecutar ``swap`` en una ventana tranquila:
+``swap`` bloquea la tabla solo mientras copia los últimos cambios.
+``drop-legacy`` elimina la tabla original una vez verificada la nueva.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.recruitment.services import ApplicationPartitionService
+
+
+class Command(BaseCommand):
+    help = "Convierte la tabla de postulaciones en particionada por mes."
+
+    def add_arguments(self, parser):
+        parser.add_argument("step", choices=ApplicationPartitionService.STEPS)
+        parser.add_argument("--chunk-size", type=int, help="Filas por lote (copy)")
+
+    def handle(self, *args, **options):
+        try:
+            summary = ApplicationPartitionService().run_step(
+                options["step"], chunk_size=options["chunk_size"]
+            )
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+        self.stdout.write(self.style.SUCCESS(summary))
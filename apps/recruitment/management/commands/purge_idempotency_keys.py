@@ -0,0 +1,20 @@
+"""
+Comando para eliminar Idempotency Keys expiradas.
+
+Uso:
+    python manage.py purge_idempotency_keys
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.recruitment.services import ApplicationIdempotencyService
+
+
+class Command(BaseCommand):
+    help = "Elimina las respuestas de Idempotency-Key cuyo TTL ya venció."
+
+    def handle(self, *args, **options):
+        deleted = ApplicationIdempotencyService().purge_expired()
+        self.stdout.write(
+            self.style.SUCCESS(f"{deleted} Idempotency Keys expiradas eliminadas.")
+        )
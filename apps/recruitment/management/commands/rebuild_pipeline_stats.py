@@ -0,0 +1,26 @@
+"""
+Comando para reconstruir el embudo de postulaciones por vacante.
+
+Uso:
+    python manage.py rebuild_pipeline_stats [--vacancy <id> ...]
+
+Corrige desvíos de ``VacancyPipelineStats`` (por ejemplo, tras borrados
+en cascada de candidatos o cargas directas en la base de datos).
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.recruitment.services import VacancyPipelineStatsService
+
+
+class Command(BaseCommand):
+    help = "Recalcula VacancyPipelineStats a partir de las postulaciones."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--vacancy", type=int, action="append", help="ID de vacante (repetible)"
+        )
+
+    def handle(self, *args, **options):
+        rebuilt = VacancyPipelineStatsService().rebuild(options["vacancy"])
+        self.stdout.write(self.style.SUCCESS(f"{rebuilt} vacantes reconstruidas."))
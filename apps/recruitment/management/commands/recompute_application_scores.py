@@ -0,0 +1,44 @@
+"""
+Comando para recalcular los puntajes de postulaciones.
+
+Uso:
+    python manage.py recompute_application_scores [--vacancy <id> ...] [--bump]
+
+Con ``--bump`` incrementa ``score_version`` de las vacantes (por
+ejemplo, tras cambiar el algoritmo de scoring) y recalcula todo.
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.recruitment.repositories import JobVacancyRepository
+from apps.recruitment.services import ApplicationScoringService
+
+
+class Command(BaseCommand):
+    help = "Recalcula los puntajes obsoletos de las postulaciones."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--vacancy", type=int, action="append", help="ID de vacante (repetible)"
+        )
+        parser.add_argument(
+            "--bump",
+            action="store_true",
+            help="Marca todos los puntajes como obsoletos antes de recalcular.",
+        )
+
+    def handle(self, *args, **options):
+        vacancy_repo = JobVacancyRepository()
+        vacancy_ids = options["vacancy"]
+        if options["bump"]:
+            vacancy_ids = vacancy_repo.bump_score_version(vacancy_ids)
+        elif vacancy_ids is None:
+            vacancy_ids = vacancy_repo.get_ids()
+
+        service = ApplicationScoringService()
+        total = sum(service.recompute_vacancy(vacancy_id) for vacancy_id in vacancy_ids)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{total} postulaciones recalculadas en {len(vacancy_ids)} vacantes."
+            )
+        )
@@ -0,0 +1,47 @@
+"""
+Comando para restaurar postulaciones archivadas.
+
+Uso:
+    python manage.py restore_applications --vacancy <id> [--vacancy <id> ...]
+    python manage.py restore_applications --all
+
+Devuelve a la tabla de postulaciones lo movido por
+``archive_applications``. Si la vacante sigue cerrada, el siguiente
+archivado volverá a moverlas.
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.recruitment.services import ApplicationArchiveService
+
+
+class Command(BaseCommand):
+    help = "Restaura postulaciones archivadas de una o más vacantes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--vacancy", type=int, action="append", help="ID de vacante (repetible)"
+        )
+        parser.add_argument(
+            "--all", action="store_true", help="Todas las vacantes archivadas"
+        )
+        parser.add_argument("--chunk-size", type=int, help="Filas por transacción")
+
+    def handle(self, *args, **options):
+        service = ApplicationArchiveService()
+        if options["all"]:
+            vacancy_ids = service.get_archived_vacancy_ids()
+        elif options["vacancy"]:
+            vacancy_ids = options["vacancy"]
+        else:
+            raise CommandError("Indique --vacancy <id> o --all.")
+
+        restored = sum(
+            service.restore_vacancy(vacancy_id, chunk_size=options["chunk_size"])
+            for vacancy_id in vacancy_ids
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{restored} postulaciones restauradas de {len(vacancy_ids)} vacantes."
+            )
+        )
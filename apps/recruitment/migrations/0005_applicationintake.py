@@ -0,0 +1,35 @@
+# Generated by Django 5.2.8 on 2026-10-19 08:21
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0004_jobvacancy_interview_mode_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationIntake',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False, verbose_name='ID')),
+                ('vacancy_id', models.BigIntegerField(verbose_name='ID de Vacante')),
+                ('payload', models.JSONField(verbose_name='Datos del Candidato')),
+                ('source', models.CharField(choices=[('linkedin', 'LinkedIn'), ('website', 'Sitio Web'), ('referral', 'Referido'), ('agency', 'Agencia'), ('other', 'Otro')], default='website', max_length=20, verbose_name='Fuente')),
+                ('status', models.CharField(choices=[('pending', 'Pendiente'), ('accepted', 'Aceptada'), ('rejected', 'Rechazada')], default='pending', max_length=20, verbose_name='Estado')),
+                ('error', models.TextField(blank=True, verbose_name='Error')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de Recepción')),
+                ('processed_at', models.DateTimeField(blank=True, null=True, verbose_name='Fecha de Procesamiento')),
+                ('application', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='recruitment.application', verbose_name='Postulación')),
+            ],
+            options={
+                'verbose_name': 'Postulación Recibida',
+                'verbose_name_plural': 'Postulaciones Recibidas',
+                'ordering': ['created_at'],
+                'indexes': [models.Index(fields=['status', 'created_at'], name='recruitment_status_603f9d_idx')],
+            },
+        ),
+    ]
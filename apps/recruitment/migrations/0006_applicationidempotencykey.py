@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-19 08:22
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0005_applicationintake'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationIdempotencyKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('vacancy_id', models.BigIntegerField(verbose_name='ID de Vacante')),
+                ('key', models.CharField(max_length=255, verbose_name='Idempotency Key')),
+                ('status_code', models.PositiveSmallIntegerField(verbose_name='Código HTTP')),
+                ('response_body', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder, verbose_name='Cuerpo de la Respuesta')),
+                ('created_at', models.DateTimeField(verbose_name='Fecha de Creación')),
+            ],
+            options={
+                'verbose_name': 'Idempotency Key de Postulación',
+                'verbose_name_plural': 'Idempotency Keys de Postulación',
+                'indexes': [models.Index(fields=['created_at'], name='recruitment_created_7ae2a3_idx')],
+                'constraints': [models.UniqueConstraint(fields=('vacancy_id', 'key'), name='unique_application_idempotency_key')],
+            },
+        ),
+    ]
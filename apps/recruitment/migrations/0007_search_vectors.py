@@ -0,0 +1,63 @@
+"""
+Columnas tsvector generadas (STORED) con índices GIN para búsqueda
+de texto completo en candidatos y vacantes.
+
+Solo aplica en PostgreSQL; en otros motores (SQLite de tests) la
+búsqueda usa el fallback con icontains.
+"""
+
+from django.db import migrations
+
+CANDIDATE_VECTOR = """
+    setweight(to_tsvector('simple'::regconfig,
+        coalesce(first_name, '') || ' ' || coalesce(last_name, '')), 'A')
+    || setweight(to_tsvector('simple'::regconfig, coalesce(email, '')), 'A')
+    || setweight(jsonb_to_tsvector('simple'::regconfig, skills, '["string"]'), 'B')
+"""
+
+VACANCY_VECTOR = """
+    setweight(to_tsvector('spanish'::regconfig, coalesce(title, '')), 'A')
+    || setweight(to_tsvector('english'::regconfig, coalesce(title, '')), 'A')
+    || setweight(to_tsvector('spanish'::regconfig, coalesce(requirements, '')), 'B')
+    || setweight(to_tsvector('english'::regconfig, coalesce(requirements, '')), 'B')
+    || setweight(to_tsvector('spanish'::regconfig, coalesce(description, '')), 'C')
+    || setweight(to_tsvector('english'::regconfig, coalesce(description, '')), 'C')
+"""
+
+SEARCH_COLUMNS = [
+    ("recruitment_candidate", CANDIDATE_VECTOR),
+    ("recruitment_jobvacancy", VACANCY_VECTOR),
+]
+
+
+def add_search_vectors(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, expression in SEARCH_COLUMNS:
+        schema_editor.execute(
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ({expression}) STORED"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {table}_search_gin "
+            f"ON {table} USING GIN (search_vector)"
+        )
+
+
+def remove_search_vectors(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, _ in SEARCH_COLUMNS:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {table}_search_gin")
+        schema_editor.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0006_applicationidempotencykey'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_vectors, remove_search_vectors),
+    ]
@@ -0,0 +1,43 @@
+"""
+Índice trigram (pg_trgm) por tenant para autocompletado de candidatos.
+
+Un único GIN multicolumna (btree_gin para ``tenant_id``) cubre el
+nombre completo y el email, de modo que las búsquedas ILIKE y de
+similitud por palabra quedan acotadas al tenant dentro del índice.
+Solo aplica en PostgreSQL.
+"""
+
+from django.db import migrations
+
+INDEX_NAME = "recruitment_candidate_autocomplete_trgm"
+
+# Debe coincidir con la expresión usada en CandidateRepository.autocomplete
+FULL_NAME = "(first_name || ' ' || last_name)"
+
+
+def add_autocomplete_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    schema_editor.execute(
+        f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON recruitment_candidate "
+        f"USING GIN (tenant_id, {FULL_NAME} gin_trgm_ops, email gin_trgm_ops)"
+    )
+
+
+def remove_autocomplete_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0007_search_vectors'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_autocomplete_index, remove_autocomplete_index),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.8 on 2026-10-19 08:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Alias frecuentes -> habilidad canónica (ya normalizados)
+SKILL_ALIASES = {
+    "javascript": ["js", "ecmascript"],
+    "typescript": ["ts"],
+    "postgresql": ["postgres", "psql"],
+    "kubernetes": ["k8s"],
+    "go": ["golang"],
+    "react": ["reactjs", "react.js"],
+    "node.js": ["node", "nodejs"],
+    "vue": ["vuejs", "vue.js"],
+    "c#": ["csharp"],
+    "machine learning": ["ml"],
+    "amazon web services": ["aws"],
+    "google cloud platform": ["gcp", "google cloud"],
+}
+
+
+def seed_skill_aliases(apps, schema_editor):
+    Skill = apps.get_model("recruitment", "Skill")
+    for name, aliases in SKILL_ALIASES.items():
+        canonical, _ = Skill.objects.get_or_create(name=name)
+        for alias in aliases:
+            Skill.objects.update_or_create(name=alias, defaults={"canonical": canonical})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0008_candidate_autocomplete_trgm'),
+        ('tenants', '0006_tenantmembership_permissions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Nombre')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de Creación')),
+                ('canonical', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='recruitment.skill', verbose_name='Habilidad Canónica')),
+            ],
+            options={
+                'verbose_name': 'Habilidad',
+                'verbose_name_plural': 'Habilidades',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CandidateSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_index', to='recruitment.candidate', verbose_name='Candidato')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='tenants.tenant', verbose_name='Tenant')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='candidates', to='recruitment.skill', verbose_name='Habilidad')),
+            ],
+            options={
+                'verbose_name': 'Habilidad de Candidato',
+                'verbose_name_plural': 'Habilidades de Candidatos',
+                'indexes': [models.Index(fields=['tenant', 'skill', 'candidate'], name='recruitment_tenant__e3a8fd_idx')],
+                'constraints': [models.UniqueConstraint(fields=('candidate', 'skill'), name='unique_candidate_skill')],
+            },
+        ),
+        migrations.RunPython(seed_skill_aliases, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.8 on 2026-10-19 08:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0009_candidate_skill_index'),
+        ('tenants', '0006_tenantmembership_permissions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='score_version',
+            field=models.PositiveIntegerField(default=0, verbose_name='Versión del Puntaje'),
+        ),
+        migrations.AddField(
+            model_name='jobvacancy',
+            name='score_version',
+            field=models.PositiveIntegerField(default=1, verbose_name='Versión de Scoring'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['vacancy', '-score'], name='recruitment_app_top_score'),
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['vacancy', 'score_version'], name='recruitment_app_score_ver'),
+        ),
+    ]
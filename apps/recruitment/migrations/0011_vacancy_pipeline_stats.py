@@ -0,0 +1,55 @@
+# Generated by Django 5.2.8 on 2026-10-19 08:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_pipeline_stats(apps, schema_editor):
+    Application = apps.get_model("recruitment", "Application")
+    VacancyPipelineStats = apps.get_model("recruitment", "VacancyPipelineStats")
+    rows = (
+        Application.objects.order_by()
+        .values("tenant_id", "vacancy_id", "status")
+        .annotate(total=Count("id"))
+    )
+    VacancyPipelineStats.objects.bulk_create(
+        (
+            VacancyPipelineStats(
+                tenant_id=row["tenant_id"],
+                vacancy_id=row["vacancy_id"],
+                status=row["status"],
+                count=row["total"],
+            )
+            for row in rows.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0010_application_scores'),
+        ('tenants', '0006_tenantmembership_permissions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VacancyPipelineStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('new', 'Nuevo'), ('screening', 'En Screening'), ('interview', 'En Entrevista'), ('offer', 'Oferta Enviada'), ('hired', 'Contratado'), ('rejected', 'Rechazado'), ('withdrawn', 'Retirado')], max_length=20, verbose_name='Estado')),
+                ('count', models.IntegerField(default=0, verbose_name='Postulaciones')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Fecha de Actualización')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='tenants.tenant', verbose_name='Tenant')),
+                ('vacancy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pipeline_stats', to='recruitment.jobvacancy', verbose_name='Vacante')),
+            ],
+            options={
+                'verbose_name': 'Estadística de Pipeline',
+                'verbose_name_plural': 'Estadísticas de Pipeline',
+                'constraints': [models.UniqueConstraint(fields=('vacancy', 'status'), name='unique_vacancy_pipeline_status')],
+            },
+        ),
+        migrations.RunPython(populate_pipeline_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 08:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0011_vacancy_pipeline_stats'),
+        ('tenants', '0006_tenantmembership_permissions'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['vacancy', 'status', '-score', 'applied_at'], name='recruitment_app_board'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2.8 on 2026-10-19 08:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0012_application_board_index'),
+        ('tenants', '0006_tenantmembership_permissions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedApplication',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('new', 'Nuevo'), ('screening', 'En Screening'), ('interview', 'En Entrevista'), ('offer', 'Oferta Enviada'), ('hired', 'Contratado'), ('rejected', 'Rechazado'), ('withdrawn', 'Retirado')], max_length=20, verbose_name='Estado')),
+                ('source', models.CharField(choices=[('linkedin', 'LinkedIn'), ('website', 'Sitio Web'), ('referral', 'Referido'), ('agency', 'Agencia'), ('other', 'Otro')], max_length=20, verbose_name='Fuente')),
+                ('score', models.FloatField(default=0.0, verbose_name='Puntaje')),
+                ('score_version', models.PositiveIntegerField(default=0, verbose_name='Versión del Puntaje')),
+                ('notes', models.TextField(blank=True, verbose_name='Notas Internas')),
+                ('applied_at', models.DateTimeField(verbose_name='Fecha de Postulación')),
+                ('updated_at', models.DateTimeField(verbose_name='Fecha de Actualización')),
+                ('archived_at', models.DateTimeField(auto_now_add=True, verbose_name='Fecha de Archivo')),
+                ('candidate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_applications', to='recruitment.candidate', verbose_name='Candidato')),
+                ('tenant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='tenants.tenant', verbose_name='Tenant')),
+                ('vacancy', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_applications', to='recruitment.jobvacancy', verbose_name='Vacante')),
+            ],
+            options={
+                'verbose_name': 'Postulación Archivada',
+                'verbose_name_plural': 'Postulaciones Archivadas',
+                'indexes': [models.Index(fields=['tenant', 'id'], name='recruitment_tenant__fc7cdb_idx'), models.Index(fields=['vacancy', 'id'], name='recruitment_vacancy_ce6b0f_idx')],
+            },
+        ),
+    ]
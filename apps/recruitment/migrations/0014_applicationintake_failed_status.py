@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recruitment', '0013_archived_application'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='applicationintake',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pendiente'), ('accepted', 'Aceptada'), ('rejected', 'Rechazada'), ('failed', 'Fallida')], default='pending', max_length=20, verbose_name='Estado'),
+        ),
+    ]
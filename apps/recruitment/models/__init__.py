@@ -1,15 +1,28 @@
 """Modelos de la app recruitment."""
 
 from .application import Application
+from .application_idempotency_key import ApplicationIdempotencyKey
+from .application_intake import ApplicationIntake
+from .archived_application import ArchivedApplication
 from .candidate import Candidate
-from .choices import ApplicationSource, CandidateStatus, JobStatus
+from .candidate_skill import CandidateSkill
+from .choices import ApplicationSource, CandidateStatus, IntakeStatus, JobStatus
 from .job_vacancy import JobVacancy
+from .skill import Skill
+from .vacancy_pipeline_stats import VacancyPipelineStats
 
 __all__ = [
     "Application",
+    "ApplicationIdempotencyKey",
+    "ApplicationIntake",
     "ApplicationSource",
+    "ArchivedApplication",
     "Candidate",
+    "CandidateSkill",
     "CandidateStatus",
+    "IntakeStatus",
     "JobStatus",
     "JobVacancy",
+    "Skill",
+    "VacancyPipelineStats",
 ]
@@ -28,6 +28,8 @@ class Application(models.Model):
         status (str): Estado actual en el proceso.
         source (str): Fuente de la postulación.
         score (float): Puntaje de evaluación (0-100).
+        score_version (int): ``score_version`` de la vacante con la que se
+            calculó el puntaje (0 = sin calcular).
         notes (str): Notas internas.
         applied_at (datetime): Fecha de postulación.
         updated_at (datetime): Fecha de actualización.
@@ -72,6 +74,10 @@ class Application(models.Model):
         default=0.0, verbose_name="Puntaje", help_text="Puntaje de evaluación (0-100)"
     )
 
+    score_version = models.PositiveIntegerField(
+        default=0, verbose_name="Versión del Puntaje"
+    )
+
     notes = models.TextField(blank=True, verbose_name="Notas Internas")
 
     applied_at = models.DateTimeField(
@@ -90,6 +96,16 @@ class Application(models.Model):
         indexes = [
             models.Index(fields=["tenant", "status"]),
             models.Index(fields=["vacancy", "status"]),
+            models.Index(
+                fields=["vacancy", "-score"], name="recruitment_app_top_score"
+            ),
+            models.Index(
+                fields=["vacancy", "score_version"], name="recruitment_app_score_ver"
+            ),
+            models.Index(
+                fields=["vacancy", "status", "-score", "applied_at"],
+                name="recruitment_app_board",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -0,0 +1,53 @@
+"""
+Modelo ApplicationIdempotencyKey.
+
+Este módulo contiene el registro de respuestas de postulaciones
+públicas indexado por el header ``Idempotency-Key``.
+"""
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+
+class ApplicationIdempotencyKey(models.Model):
+    """
+    Respuesta almacenada de una postulación pública.
+
+    Permite que los clientes reintenten ``POST /applications/`` con el
+    mismo ``Idempotency-Key`` y reciban la respuesta original con una
+    sola búsqueda por índice, sin repetir el trabajo de postulación.
+
+    Attributes:
+        vacancy_id (int): ID de la vacante de la postulación.
+        key (str): Valor del header ``Idempotency-Key``.
+        status_code (int): Código HTTP de la respuesta original.
+        response_body (JSON): Cuerpo de la respuesta original.
+        created_at (datetime): Fecha de almacenamiento (base del TTL).
+    """
+
+    vacancy_id = models.BigIntegerField(verbose_name="ID de Vacante")
+
+    key = models.CharField(max_length=255, verbose_name="Idempotency Key")
+
+    status_code = models.PositiveSmallIntegerField(verbose_name="Código HTTP")
+
+    response_body = models.JSONField(
+        encoder=DjangoJSONEncoder, verbose_name="Cuerpo de la Respuesta"
+    )
+
+    created_at = models.DateTimeField(verbose_name="Fecha de Creación")
+
+    class Meta:
+        verbose_name = "Idempotency Key de Postulación"
+        verbose_name_plural = "Idempotency Keys de Postulación"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["vacancy_id", "key"], name="unique_application_idempotency_key"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["created_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.vacancy_id}:{self.key} ({self.status_code})"
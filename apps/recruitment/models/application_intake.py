@@ -0,0 +1,87 @@
+"""
+Modelo ApplicationIntake.
+
+Este módulo contiene la cola de entrada de postulaciones públicas
+procesadas de forma asíncrona.
+"""
+
+import uuid
+
+from django.db import models
+
+from .application import Application
+from .choices import ApplicationSource, IntakeStatus
+
+
+class ApplicationIntake(models.Model):
+    """
+    Postulación pública pendiente de procesamiento.
+
+    Se guarda tal como llegó (ya validada) para responder 202 de
+    inmediato; los workers de Celery la procesan en lotes y registran
+    el resultado para que el postulante pueda consultarlo.
+
+    Attributes:
+        id (UUID): Tracking ID entregado al cliente.
+        vacancy_id (int): ID de la vacante (sin FK para no tocar la
+            tabla de vacantes en la ruta de entrada).
+        payload (JSON): Datos validados del candidato.
+        source (str): Fuente de la postulación.
+        status (str): Estado del procesamiento.
+        error (str): Motivo del rechazo, si aplica.
+        application (FK): Postulación creada, si fue aceptada.
+        created_at (datetime): Fecha de recepción.
+        processed_at (datetime): Fecha de procesamiento.
+    """
+
+    id = models.UUIDField(
+        primary_key=True, default=uuid.uuid4, editable=False, verbose_name="ID"
+    )
+
+    vacancy_id = models.BigIntegerField(verbose_name="ID de Vacante")
+
+    payload = models.JSONField(verbose_name="Datos del Candidato")
+
+    source = models.CharField(
+        max_length=20,
+        choices=ApplicationSource.choices,
+        default=ApplicationSource.WEBSITE,
+        verbose_name="Fuente",
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=IntakeStatus.choices,
+        default=IntakeStatus.PENDING,
+        verbose_name="Estado",
+    )
+
+    error = models.TextField(blank=True, verbose_name="Error")
+
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+        verbose_name="Postulación",
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True, verbose_name="Fecha de Recepción"
+    )
+
+    processed_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="Fecha de Procesamiento"
+    )
+
+    class Meta:
+        verbose_name = "Postulación Recibida"
+        verbose_name_plural = "Postulaciones Recibidas"
+        ordering = ["created_at"]
+        indexes = [
+            models.Index(fields=["status", "created_at"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.id} ({self.get_status_display()})"
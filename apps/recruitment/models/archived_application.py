@@ -0,0 +1,97 @@
+"""
+Modelo ArchivedApplication.
+
+Este módulo contiene el almacenamiento frío de postulaciones de
+vacantes cerradas hace tiempo.
+"""
+
+from django.db import models
+
+from apps.tenants.models import Tenant
+
+from .candidate import Candidate
+from .choices import ApplicationSource, CandidateStatus
+from .job_vacancy import JobVacancy
+
+
+class ArchivedApplication(models.Model):
+    """
+    Postulación archivada.
+
+    Copia columna a columna de ``Application`` (con el mismo ``id``)
+    fuera de la tabla caliente, cuyos índices usan los dashboards. Las
+    filas se mueven por lotes con ``archive_applications`` y vuelven
+    con ``restore_applications``.
+
+    Attributes:
+        id (int): ID original de la postulación.
+        tenant (FK): Tenant.
+        vacancy (FK): Vacante.
+        candidate (FK): Candidato.
+        status (str): Estado al archivar.
+        source (str): Fuente de la postulación.
+        score (float): Puntaje de evaluación (0-100).
+        score_version (int): Versión del puntaje.
+        notes (str): Notas internas.
+        applied_at (datetime): Fecha de postulación.
+        updated_at (datetime): Última actualización antes de archivar.
+        archived_at (datetime): Fecha de archivo.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+
+    tenant = models.ForeignKey(
+        Tenant,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="Tenant",
+    )
+
+    vacancy = models.ForeignKey(
+        JobVacancy,
+        on_delete=models.CASCADE,
+        related_name="archived_applications",
+        verbose_name="Vacante",
+    )
+
+    candidate = models.ForeignKey(
+        Candidate,
+        on_delete=models.CASCADE,
+        related_name="archived_applications",
+        verbose_name="Candidato",
+    )
+
+    status = models.CharField(
+        max_length=20, choices=CandidateStatus.choices, verbose_name="Estado"
+    )
+
+    source = models.CharField(
+        max_length=20, choices=ApplicationSource.choices, verbose_name="Fuente"
+    )
+
+    score = models.FloatField(default=0.0, verbose_name="Puntaje")
+
+    score_version = models.PositiveIntegerField(
+        default=0, verbose_name="Versión del Puntaje"
+    )
+
+    notes = models.TextField(blank=True, verbose_name="Notas Internas")
+
+    applied_at = models.DateTimeField(verbose_name="Fecha de Postulación")
+
+    updated_at = models.DateTimeField(verbose_name="Fecha de Actualización")
+
+    archived_at = models.DateTimeField(
+        auto_now_add=True, verbose_name="Fecha de Archivo"
+    )
+
+    class Meta:
+        verbose_name = "Postulación Archivada"
+        verbose_name_plural = "Postulaciones Archivadas"
+        indexes = [
+            models.Index(fields=["tenant", "id"]),
+            models.Index(fields=["vacancy", "id"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.candidate_id} - {self.vacancy_id} (archivada)"
@@ -0,0 +1,64 @@
+"""
+Modelo CandidateSkill.
+
+Este módulo contiene la tabla intermedia del índice de habilidades
+de candidatos.
+"""
+
+from django.db import models
+
+from apps.tenants.models import Tenant
+
+from .candidate import Candidate
+from .skill import Skill
+
+
+class CandidateSkill(models.Model):
+    """
+    Habilidad canónica de un candidato.
+
+    Índice derivado de ``Candidate.skills`` (se sincroniza al guardar
+    el candidato) que permite filtrar por habilidades con búsquedas por
+    índice en lugar de decodificar el JSON de cada fila.
+
+    Attributes:
+        tenant (FK): Tenant del candidato (acota el índice).
+        candidate (FK): Candidato.
+        skill (FK): Habilidad canónica.
+    """
+
+    tenant = models.ForeignKey(
+        Tenant,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="Tenant",
+    )
+
+    candidate = models.ForeignKey(
+        Candidate,
+        on_delete=models.CASCADE,
+        related_name="skill_index",
+        verbose_name="Candidato",
+    )
+
+    skill = models.ForeignKey(
+        Skill,
+        on_delete=models.CASCADE,
+        related_name="candidates",
+        verbose_name="Habilidad",
+    )
+
+    class Meta:
+        verbose_name = "Habilidad de Candidato"
+        verbose_name_plural = "Habilidades de Candidatos"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["candidate", "skill"], name="unique_candidate_skill"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["tenant", "skill", "candidate"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.candidate_id}:{self.skill_id}"
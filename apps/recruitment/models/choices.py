@@ -37,3 +37,12 @@ class ApplicationSource(models.TextChoices):
     REFERRAL = "referral", "Referido"
     AGENCY = "agency", "Agencia"
     OTHER = "other", "Otro"
+
+
+class IntakeStatus(models.TextChoices):
+    """Estado de una postulación recibida en modo asíncrono."""
+
+    PENDING = "pending", "Pendiente"
+    ACCEPTED = "accepted", "Aceptada"
+    REJECTED = "rejected", "Rechazada"
+    FAILED = "failed", "Fallida"
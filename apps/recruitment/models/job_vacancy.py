@@ -34,6 +34,8 @@ class JobVacancy(models.Model):
         created_at (datetime): Fecha de creación.
         updated_at (datetime): Fecha de actualización.
         closed_at (datetime): Fecha de cierre.
+        score_version (int): Versión de los requisitos para scoring; se
+            incrementa cuando cambian y vuelve obsoletos los puntajes.
     """
 
     class InterviewMode(models.TextChoices):
@@ -113,6 +115,10 @@ class JobVacancy(models.Model):
 
     manual_interview_guide = models.TextField(blank=True, null=True)
 
+    score_version = models.PositiveIntegerField(
+        default=1, verbose_name="Versión de Scoring"
+    )
+
     class Meta:
         verbose_name = "Vacante"
         verbose_name_plural = "Vacantes"
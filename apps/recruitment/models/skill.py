@@ -0,0 +1,45 @@
+"""
+Modelo Skill.
+
+Este módulo contiene el diccionario de habilidades normalizadas.
+"""
+
+from django.db import models
+
+
+class Skill(models.Model):
+    """
+    Habilidad del diccionario normalizado.
+
+    Cada nombre normalizado (minúsculas) es una fila. Las filas con
+    ``canonical`` son alias de otra habilidad (``js`` -> ``javascript``);
+    el índice de candidatos siempre referencia la habilidad canónica.
+
+    Attributes:
+        name (str): Nombre normalizado (único).
+        canonical (FK): Habilidad canónica si esta fila es un alias.
+        created_at (datetime): Fecha de creación.
+    """
+
+    name = models.CharField(max_length=100, unique=True, verbose_name="Nombre")
+
+    canonical = models.ForeignKey(
+        "self",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="aliases",
+        verbose_name="Habilidad Canónica",
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True, verbose_name="Fecha de Creación"
+    )
+
+    class Meta:
+        verbose_name = "Habilidad"
+        verbose_name_plural = "Habilidades"
+        ordering = ["name"]
+
+    def __str__(self) -> str:
+        return self.name
@@ -0,0 +1,67 @@
+"""
+Modelo VacancyPipelineStats.
+
+Este módulo contiene el agregado de postulaciones por estado de cada
+vacante (embudo del pipeline).
+"""
+
+from django.db import models
+
+from apps.tenants.models import Tenant
+
+from .choices import CandidateStatus
+from .job_vacancy import JobVacancy
+
+
+class VacancyPipelineStats(models.Model):
+    """
+    Conteo de postulaciones de una vacante en un estado.
+
+    Se mantiene de forma incremental (en la misma transacción que crea
+    postulaciones o cambia su estado), de modo que el embudo se lee sin
+    agrupar la tabla de postulaciones. ``rebuild_pipeline_stats``
+    corrige desvíos.
+
+    Attributes:
+        tenant (FK): Tenant de la vacante.
+        vacancy (FK): Vacante.
+        status (str): Estado del pipeline.
+        count (int): Postulaciones en ese estado.
+        updated_at (datetime): Última modificación.
+    """
+
+    tenant = models.ForeignKey(
+        Tenant,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="Tenant",
+    )
+
+    vacancy = models.ForeignKey(
+        JobVacancy,
+        on_delete=models.CASCADE,
+        related_name="pipeline_stats",
+        verbose_name="Vacante",
+    )
+
+    status = models.CharField(
+        max_length=20, choices=CandidateStatus.choices, verbose_name="Estado"
+    )
+
+    count = models.IntegerField(default=0, verbose_name="Postulaciones")
+
+    updated_at = models.DateTimeField(
+        auto_now=True, verbose_name="Fecha de Actualización"
+    )
+
+    class Meta:
+        verbose_name = "Estadística de Pipeline"
+        verbose_name_plural = "Estadísticas de Pipeline"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["vacancy", "status"], name="unique_vacancy_pipeline_status"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.vacancy_id}:{self.status}={self.count}"
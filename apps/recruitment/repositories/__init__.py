@@ -1,23 +1,62 @@
 """Repositorios de la app recruitment."""
 
+from .application_idempotency_key_repository import (
+    ApplicationIdempotencyKeyRepository,
+    ApplicationIdempotencyKeyRepositoryProtocol,
+)
+from .application_intake_repository import (
+    ApplicationIntakeRepository,
+    ApplicationIntakeRepositoryProtocol,
+)
+from .application_partition_repository import (
+    ApplicationPartitionRepository,
+    ApplicationPartitionRepositoryProtocol,
+)
 from .application_repository import (
     ApplicationRepository,
     ApplicationRepositoryProtocol,
 )
+from .archived_application_repository import (
+    ArchivedApplicationRepository,
+    ArchivedApplicationRepositoryProtocol,
+)
 from .candidate_repository import (
     CandidateRepository,
     CandidateRepositoryProtocol,
 )
+from .candidate_skill_repository import (
+    CandidateSkillRepository,
+    CandidateSkillRepositoryProtocol,
+)
 from .job_vacancy_repository import (
     JobVacancyRepository,
     JobVacancyRepositoryProtocol,
 )
+from .skill_repository import SkillRepository, SkillRepositoryProtocol
+from .vacancy_pipeline_stats_repository import (
+    VacancyPipelineStatsRepository,
+    VacancyPipelineStatsRepositoryProtocol,
+)
 
 __all__ = [
+    "ApplicationIdempotencyKeyRepository",
+    "ApplicationIdempotencyKeyRepositoryProtocol",
+    "ApplicationIntakeRepository",
+    "ApplicationIntakeRepositoryProtocol",
+    "ApplicationPartitionRepository",
+    "ApplicationPartitionRepositoryProtocol",
     "ApplicationRepository",
     "ApplicationRepositoryProtocol",
+    "ArchivedApplicationRepository",
+    "ArchivedApplicationRepositoryProtocol",
     "CandidateRepository",
     "CandidateRepositoryProtocol",
+    "CandidateSkillRepository",
+    "CandidateSkillRepositoryProtocol",
     "JobVacancyRepository",
     "JobVacancyRepositoryProtocol",
+    "SkillRepository",
+    "SkillRepositoryProtocol",
+    "VacancyPipelineStatsRepository",
+    "VacancyPipelineStatsRepositoryProtocol",
 ]
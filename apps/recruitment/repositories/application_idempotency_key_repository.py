@@ -0,0 +1,54 @@
+"""
+Repositorio para ApplicationIdempotencyKey.
+
+Este módulo implementa el patrón Repository para las respuestas
+almacenadas por Idempotency-Key.
+"""
+
+from datetime import datetime
+from typing import Protocol
+
+from apps.recruitment.models import ApplicationIdempotencyKey
+
+
+class ApplicationIdempotencyKeyRepositoryProtocol(Protocol):
+    """Interface para el repositorio de Idempotency Keys."""
+
+    def get(self, vacancy_id: int, key: str) -> ApplicationIdempotencyKey | None: ...
+
+    def create_if_absent(self, **kwargs) -> None: ...
+
+    def replace_if_created_before(
+        self, vacancy_id: int, key: str, threshold: datetime, **kwargs
+    ) -> bool: ...
+
+
+class ApplicationIdempotencyKeyRepository:
+    """Implementación del repositorio de Idempotency Keys."""
+
+    def get(self, vacancy_id: int, key: str) -> ApplicationIdempotencyKey | None:
+        return ApplicationIdempotencyKey.objects.filter(
+            vacancy_id=vacancy_id, key=key
+        ).first()
+
+    def create_if_absent(self, **kwargs) -> None:
+        """Guarda la respuesta salvo que otra petición concurrente ganara."""
+        ApplicationIdempotencyKey.objects.bulk_create(
+            [ApplicationIdempotencyKey(**kwargs)], ignore_conflicts=True
+        )
+
+    def replace_if_created_before(
+        self, vacancy_id: int, key: str, threshold: datetime, **kwargs
+    ) -> bool:
+        """Reemplaza el registro solo si se creó antes de ``threshold``."""
+        return bool(
+            ApplicationIdempotencyKey.objects.filter(
+                vacancy_id=vacancy_id, key=key, created_at__lt=threshold
+            ).update(**kwargs)
+        )
+
+    def delete_created_before(self, threshold: datetime) -> int:
+        deleted, _ = ApplicationIdempotencyKey.objects.filter(
+            created_at__lt=threshold
+        ).delete()
+        return deleted
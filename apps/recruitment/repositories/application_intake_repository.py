@@ -0,0 +1,64 @@
+"""
+Repositorio para ApplicationIntake.
+
+Este módulo implementa el patrón Repository para la cola de
+postulaciones asíncronas.
+"""
+
+from typing import Protocol
+
+from django.db.models import QuerySet
+
+from apps.recruitment.models import ApplicationIntake, IntakeStatus
+
+
+class ApplicationIntakeRepositoryProtocol(Protocol):
+    """Interface para el repositorio de postulaciones recibidas."""
+
+    def get_by_id(self, intake_id: str) -> ApplicationIntake | None: ...
+
+    def create(self, **kwargs) -> ApplicationIntake: ...
+
+    def claim_pending(self, limit: int) -> list[ApplicationIntake]: ...
+
+    def save_outcomes(self, intakes: list[ApplicationIntake]) -> None: ...
+
+
+class ApplicationIntakeRepository:
+    """Implementación del repositorio de postulaciones recibidas."""
+
+    def get_by_id(self, intake_id: str) -> ApplicationIntake | None:
+        try:
+            return ApplicationIntake.objects.get(id=intake_id)
+        except (ApplicationIntake.DoesNotExist, ValueError):
+            return None
+
+    def create(self, **kwargs) -> ApplicationIntake:
+        return ApplicationIntake.objects.create(**kwargs)
+
+    def get_pending(self) -> QuerySet[ApplicationIntake]:
+        return ApplicationIntake.objects.filter(status=IntakeStatus.PENDING)
+
+    def claim_pending(self, limit: int) -> list[ApplicationIntake]:
+        """
+        Bloquea el siguiente lote de postulaciones pendientes.
+
+        Debe llamarse dentro de una transacción. Usa SKIP LOCKED para
+        que varios workers drenen la cola en paralelo sin pisarse.
+
+        Args:
+            limit: Tamaño máximo del lote.
+
+        Returns:
+            list[ApplicationIntake]: Postulaciones reclamadas.
+        """
+        return list(
+            self.get_pending()
+            .select_for_update(skip_locked=True)
+            .order_by("created_at")[:limit]
+        )
+
+    def save_outcomes(self, intakes: list[ApplicationIntake]) -> None:
+        ApplicationIntake.objects.bulk_update(
+            intakes, ["status", "error", "application", "processed_at"]
+        )
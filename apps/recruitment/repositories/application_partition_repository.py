@@ -0,0 +1,456 @@
+"""
+Repositorio para el particionado de Application.
+
+Este módulo contiene el SQL (solo PostgreSQL >= 13) para convertir la
+tabla de postulaciones en una tabla particionada por rango mensual de
+``applied_at`` y para administrar sus particiones.
+"""
+
+import hashlib
+import re
+from datetime import date, datetime
+from typing import Protocol
+
+from django.db import connection
+
+from apps.recruitment.models import Application
+
+TABLE = Application._meta.db_table
+SHADOW_TABLE = f"{TABLE}_partitioned"
+LEGACY_TABLE = f"{TABLE}_legacy"
+KEY_TABLE = f"{TABLE}_key"
+DELTA_TABLE = f"{TABLE}_delta"
+SEQUENCE = f"{TABLE}_pid_seq"
+DEFAULT_PARTITION = f"{TABLE}_pdefault"
+
+# Unicidad (vacante, candidato): una tabla particionada solo admite
+# índices únicos que incluyan la clave de partición, así que el par se
+# reserva en KEY_TABLE. Un duplicado falla con unique_violation, como
+# con un índice único (la reinserción de la misma fila se permite para
+# poder mover filas entre particiones). KEY_TABLE también es el destino
+# de las FKs hacia la postulación, con una fila por ``application_id``.
+KEY_TRIGGERS_SQL = f"""
+CREATE TABLE IF NOT EXISTS {KEY_TABLE} (
+    vacancy_id bigint NOT NULL,
+    candidate_id bigint NOT NULL,
+    application_id bigint NOT NULL UNIQUE,
+    PRIMARY KEY (vacancy_id, candidate_id)
+);
+
+CREATE OR REPLACE FUNCTION {TABLE}_key_insert() RETURNS trigger AS $$
+BEGIN
+    INSERT INTO {KEY_TABLE} (vacancy_id, candidate_id, application_id)
+    VALUES (NEW.vacancy_id, NEW.candidate_id, NEW.id)
+    ON CONFLICT DO NOTHING;
+    IF FOUND OR EXISTS (
+        SELECT 1 FROM {KEY_TABLE}
+        WHERE vacancy_id = NEW.vacancy_id
+          AND candidate_id = NEW.candidate_id
+          AND application_id = NEW.id
+    ) THEN
+        RETURN NEW;
+    END IF;
+    RAISE unique_violation USING
+        MESSAGE = 'duplicate key value violates unique constraint "{KEY_TABLE}_pkey"',
+        DETAIL = format('Key (vacancy_id, candidate_id)=(%s, %s) already exists.',
+                        NEW.vacancy_id, NEW.candidate_id),
+        CONSTRAINT = '{KEY_TABLE}_pkey';
+END $$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION {TABLE}_key_update() RETURNS trigger AS $$
+BEGIN
+    UPDATE {KEY_TABLE}
+    SET vacancy_id = NEW.vacancy_id, candidate_id = NEW.candidate_id
+    WHERE vacancy_id = OLD.vacancy_id
+      AND candidate_id = OLD.candidate_id
+      AND application_id = OLD.id;
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION {TABLE}_key_delete() RETURNS trigger AS $$
+BEGIN
+    DELETE FROM {KEY_TABLE}
+    WHERE vacancy_id = OLD.vacancy_id
+      AND candidate_id = OLD.candidate_id
+      AND application_id = OLD.id;
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+CREATE TRIGGER {TABLE}_key_insert BEFORE INSERT ON {SHADOW_TABLE}
+    FOR EACH ROW EXECUTE FUNCTION {TABLE}_key_insert();
+CREATE TRIGGER {TABLE}_key_update AFTER UPDATE OF vacancy_id, candidate_id
+    ON {SHADOW_TABLE} FOR EACH ROW
+    WHEN (OLD.vacancy_id <> NEW.vacancy_id OR OLD.candidate_id <> NEW.candidate_id)
+    EXECUTE FUNCTION {TABLE}_key_update();
+CREATE TRIGGER {TABLE}_key_delete AFTER DELETE ON {SHADOW_TABLE}
+    FOR EACH ROW EXECUTE FUNCTION {TABLE}_key_delete();
+"""
+
+# Registro de filas modificadas en la tabla original mientras se copia
+CAPTURE_SQL = f"""
+CREATE TABLE IF NOT EXISTS {DELTA_TABLE} (id bigint NOT NULL);
+
+CREATE OR REPLACE FUNCTION {TABLE}_capture() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        INSERT INTO {DELTA_TABLE} (id) VALUES (OLD.id);
+    ELSE
+        INSERT INTO {DELTA_TABLE} (id) VALUES (NEW.id);
+    END IF;
+    RETURN NULL;
+END $$ LANGUAGE plpgsql;
+
+CREATE TRIGGER {TABLE}_capture AFTER INSERT OR UPDATE OR DELETE ON {TABLE}
+    FOR EACH ROW EXECUTE FUNCTION {TABLE}_capture();
+"""
+
+
+def partition_name(month: date) -> str:
+    """Nombre de la partición de un mes (``<tabla>_p2026_01``)."""
+    return f"{TABLE}_p{month.year:04d}_{month.month:02d}"
+
+
+class ApplicationPartitionRepositoryProtocol(Protocol):
+    """Interface para el repositorio de particiones de postulaciones."""
+
+    def is_supported(self) -> bool: ...
+
+    def is_partitioned(self) -> bool: ...
+
+    def get_partitions(self) -> list[tuple[str, str]]: ...
+
+    def create_partition(self, start: date, end: date) -> bool: ...
+
+
+class ApplicationPartitionRepository:
+    """
+    Implementación del repositorio de particiones de postulaciones.
+
+    La conversión usa una tabla sombra (``SHADOW_TABLE``): se crea vacía
+    y particionada, se llena por lotes mientras la tabla original sigue
+    en uso (un trigger registra las filas que cambian) y al final se
+    intercambian los nombres en una transacción corta. La tabla original
+    queda como ``LEGACY_TABLE`` hasta ``drop_legacy``.
+    """
+
+    def is_supported(self) -> bool:
+        """PostgreSQL >= 13 (triggers BEFORE en tablas particionadas)."""
+        return (
+            connection.vendor == "postgresql" and connection.pg_version >= 130000  # type: ignore[attr-defined]
+        )
+
+    def is_partitioned(self, table: str = TABLE) -> bool:
+        return bool(
+            self._fetch_value(
+                "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(%s))",
+                [table],
+            )
+        )
+
+    def table_exists(self, table: str) -> bool:
+        return self._fetch_value("SELECT to_regclass(%s) IS NOT NULL", [table])
+
+    def get_partitions(self, table: str = TABLE) -> list[tuple[str, str]]:
+        """Particiones de la tabla y su rango, en orden."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid) "
+                "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = to_regclass(%s) ORDER BY c.relname",
+                [table],
+            )
+            return cursor.fetchall()
+
+    def get_applied_at_range(self) -> tuple[datetime | None, datetime | None]:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT MIN(applied_at), MAX(applied_at) FROM {self._qn(TABLE)}"
+            )
+            return cursor.fetchone()
+
+    def get_max_id(self, table: str) -> int:
+        return self._fetch_value(f"SELECT COALESCE(MAX(id), 0) FROM {self._qn(table)}")
+
+    def create_partition(self, start: date, end: date, table: str = TABLE) -> bool:
+        """
+        Crea la partición ``[start, end)`` (límites en UTC) si no existe.
+
+        Si la partición por defecto ya tiene filas del rango, se separa,
+        se crea la partición y las filas se mueven a ella. Debe
+        ejecutarse dentro de una transacción.
+
+        Returns:
+            bool: True si la partición se creó.
+        """
+        name = partition_name(start)
+        if self.table_exists(name):
+            return False
+        qn = self._qn
+        bounds = (
+            f"FROM ('{start.isoformat()} 00:00+00') TO ('{end.isoformat()} 00:00+00')"
+        )
+        in_range = (
+            f"applied_at >= '{start.isoformat()} 00:00+00' "
+            f"AND applied_at < '{end.isoformat()} 00:00+00'"
+        )
+        default_rows = self.table_exists(DEFAULT_PARTITION) and self._fetch_value(
+            f"SELECT EXISTS (SELECT 1 FROM {qn(DEFAULT_PARTITION)} WHERE {in_range})"
+        )
+        with connection.cursor() as cursor:
+            if not default_rows:
+                cursor.execute(
+                    f"CREATE TABLE {qn(name)} PARTITION OF {qn(table)} "
+                    f"FOR VALUES {bounds}"
+                )
+                return True
+            columns = self._columns()
+            cursor.execute(
+                f"ALTER TABLE {qn(table)} DETACH PARTITION {qn(DEFAULT_PARTITION)}"
+            )
+            cursor.execute(
+                f"CREATE TABLE {qn(name)} PARTITION OF {qn(table)} FOR VALUES {bounds}"
+            )
+            cursor.execute(
+                f"WITH moved AS (DELETE FROM {qn(DEFAULT_PARTITION)} "
+                f"WHERE {in_range} RETURNING {columns}) "
+                f"INSERT INTO {qn(table)} ({columns}) SELECT {columns} FROM moved"
+            )
+            cursor.execute(
+                f"ALTER TABLE {qn(table)} ATTACH PARTITION "
+                f"{qn(DEFAULT_PARTITION)} DEFAULT"
+            )
+        return True
+
+    def create_shadow(self) -> None:
+        """
+        Crea la tabla sombra particionada (sin particiones mensuales).
+
+        Copia columnas, CHECKs, FKs salientes e índices no únicos de la
+        tabla original (con nombres temporales), crea la tabla de
+        unicidad con sus triggers y empieza a registrar cambios en la
+        tabla original. Debe ejecutarse dentro de una transacción.
+        """
+        qn = self._qn
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE {qn(SHADOW_TABLE)} (LIKE {qn(TABLE)} "
+                f"INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+                f"PARTITION BY RANGE (applied_at)"
+            )
+            cursor.execute(
+                f"ALTER TABLE {qn(SHADOW_TABLE)} ADD CONSTRAINT "
+                f"{qn(SHADOW_TABLE + '_pkey')} PRIMARY KEY (id, applied_at)"
+            )
+            cursor.execute(f"CREATE SEQUENCE {qn(SEQUENCE)} AS bigint")
+            cursor.execute(
+                f"ALTER TABLE {qn(SHADOW_TABLE)} ALTER COLUMN id "
+                f"SET DEFAULT nextval('{SEQUENCE}')"
+            )
+            cursor.execute(
+                f"ALTER SEQUENCE {qn(SEQUENCE)} OWNED BY {qn(SHADOW_TABLE)}.id"
+            )
+
+            cursor.execute(
+                "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+                "WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+                [TABLE],
+            )
+            for name, definition in cursor.fetchall():
+                cursor.execute(
+                    f"ALTER TABLE {qn(SHADOW_TABLE)} ADD CONSTRAINT {qn(name)} "
+                    f"{definition}"
+                )
+
+            for name, definition in self._plain_indexes(TABLE):
+                method_and_columns = definition.split(" USING ", 1)[1]
+                cursor.execute(
+                    f"CREATE INDEX {qn(self._temp_name(name))} "
+                    f"ON {qn(SHADOW_TABLE)} USING {method_and_columns}"
+                )
+
+            cursor.execute(
+                f"CREATE TABLE {qn(DEFAULT_PARTITION)} "
+                f"PARTITION OF {qn(SHADOW_TABLE)} DEFAULT"
+            )
+            cursor.execute(KEY_TRIGGERS_SQL)
+            cursor.execute(CAPTURE_SQL)
+
+    def copy_chunk(self, after_id: int, until_id: int, chunk_size: int) -> int | None:
+        """
+        Copia a la tabla sombra un lote de filas ``(after_id, until_id]``.
+
+        Omite las filas cuyo par (vacante, candidato) ya está reservado
+        por otra fila copiada antes y borrada después en la tabla
+        original: ambas quedan registradas y ``swap`` las vuelve a copiar.
+
+        Returns:
+            int | None: Último ID del lote (None si no quedaban filas).
+        """
+        qn = self._qn
+        columns = self._columns()
+        return self._fetch_value(
+            f"WITH batch AS (SELECT {columns} FROM {qn(TABLE)} "
+            f"WHERE id > %s AND id <= %s ORDER BY id LIMIT %s), "
+            f"copied AS (INSERT INTO {qn(SHADOW_TABLE)} ({columns}) "
+            f"SELECT {columns} FROM batch WHERE NOT EXISTS ("
+            f"SELECT 1 FROM {qn(KEY_TABLE)} k WHERE k.vacancy_id = batch.vacancy_id "
+            f"AND k.candidate_id = batch.candidate_id)) "
+            f"SELECT MAX(id) FROM batch",
+            [after_id, until_id, chunk_size],
+        )
+
+    def swap(self) -> int:
+        """
+        Completa la copia e intercambia la tabla original por la sombra.
+
+        Bloquea la tabla original, copia las filas nuevas y vuelve a
+        copiar las registradas por el trigger de cambios, verifica el
+        conteo y renombra tablas, índices y la clave primaria. Una tabla
+        particionada no puede ser referenciada solo por ``id``, así que
+        las FKs que apuntaban a la tabla original se recrean (mismo
+        nombre y opciones) contra ``KEY_TABLE.application_id``, que tiene
+        una fila por postulación. Debe ejecutarse dentro de una
+        transacción.
+
+        Returns:
+            int: Filas de la tabla particionada.
+
+        Raises:
+            ValueError: Si los conteos no coinciden o alguna FK hacia la
+                tabla original no referencia solo ``id``.
+        """
+        qn = self._qn
+        columns = self._columns()
+        copied_until = self.get_max_id(SHADOW_TABLE)
+        with connection.cursor() as cursor:
+            cursor.execute(f"LOCK TABLE {qn(TABLE)} IN ACCESS EXCLUSIVE MODE")
+            cursor.execute(
+                f"DELETE FROM {qn(SHADOW_TABLE)} "
+                f"WHERE id IN (SELECT id FROM {qn(DELTA_TABLE)})"
+            )
+            cursor.execute(
+                f"INSERT INTO {qn(SHADOW_TABLE)} ({columns}) "
+                f"SELECT {columns} FROM {qn(TABLE)} WHERE id > %s "
+                f"OR id IN (SELECT id FROM {qn(DELTA_TABLE)})",
+                [copied_until],
+            )
+            cursor.execute(f"SELECT COUNT(*) FROM {qn(TABLE)}")
+            (expected,) = cursor.fetchone()
+            cursor.execute(f"SELECT COUNT(*) FROM {qn(SHADOW_TABLE)}")
+            (copied,) = cursor.fetchone()
+            if copied != expected:
+                raise ValueError(
+                    f"La copia no coincide ({copied} de {expected} filas)."
+                )
+
+            cursor.execute(f"DROP TRIGGER {qn(TABLE + '_capture')} ON {qn(TABLE)}")
+            cursor.execute(f"DROP FUNCTION {qn(TABLE + '_capture')}()")
+            cursor.execute(f"DROP TABLE {qn(DELTA_TABLE)}")
+
+            cursor.execute(
+                "SELECT conname, conrelid::regclass::text, "
+                "pg_get_constraintdef(oid) FROM pg_constraint "
+                "WHERE confrelid = to_regclass(%s) AND contype = 'f' "
+                "ORDER BY conname",
+                [TABLE],
+            )
+            foreign_keys = []
+            unsupported = []
+            for name, referencing_table, definition in cursor.fetchall():
+                definition, replaced = re.subn(
+                    rf'REFERENCES "?{re.escape(TABLE)}"?\(id\)',
+                    f"REFERENCES {qn(KEY_TABLE)}(application_id)",
+                    definition,
+                )
+                if replaced != 1:
+                    unsupported.append(f"{referencing_table}.{name}")
+                foreign_keys.append((name, referencing_table, definition))
+            if unsupported:
+                raise ValueError(
+                    "FKs hacia la tabla de postulaciones que no se pueden "
+                    f"recrear: {', '.join(unsupported)}."
+                )
+            for name, referencing_table, definition in foreign_keys:
+                cursor.execute(
+                    f"ALTER TABLE {qn(referencing_table)} DROP CONSTRAINT {qn(name)}"
+                )
+                cursor.execute(
+                    f"ALTER TABLE {qn(referencing_table)} ADD CONSTRAINT {qn(name)} "
+                    f"{definition}"
+                )
+
+            for name, _ in self._plain_indexes(TABLE):
+                cursor.execute(
+                    f"ALTER INDEX {qn(name)} RENAME TO {qn(self._legacy_name(name))}"
+                )
+                cursor.execute(
+                    f"ALTER INDEX {qn(self._temp_name(name))} RENAME TO {qn(name)}"
+                )
+            cursor.execute(
+                f"ALTER TABLE {qn(TABLE)} RENAME CONSTRAINT {qn(TABLE + '_pkey')} "
+                f"TO {qn(LEGACY_TABLE + '_pkey')}"
+            )
+            cursor.execute(
+                f"ALTER TABLE {qn(SHADOW_TABLE)} RENAME CONSTRAINT "
+                f"{qn(SHADOW_TABLE + '_pkey')} TO {qn(TABLE + '_pkey')}"
+            )
+
+            cursor.execute(
+                f"SELECT setval('{SEQUENCE}', "
+                f"GREATEST(nextval(pg_get_serial_sequence('{TABLE}', 'id')), %s))",
+                [self.get_max_id(TABLE)],
+            )
+            cursor.execute(f"ALTER TABLE {qn(TABLE)} RENAME TO {qn(LEGACY_TABLE)}")
+            cursor.execute(f"ALTER TABLE {qn(SHADOW_TABLE)} RENAME TO {qn(TABLE)}")
+        return copied
+
+    def drop_legacy(self) -> None:
+        """Elimina la tabla original conservada tras ``swap``."""
+        qn = self._qn
+        with connection.cursor() as cursor:
+            cursor.execute(f"DROP TABLE {qn(LEGACY_TABLE)}")
+            cursor.execute(
+                f"ALTER SEQUENCE {qn(SEQUENCE)} RENAME TO {qn(TABLE + '_id_seq')}"
+            )
+
+    def _plain_indexes(self, table: str) -> list[tuple[str, str]]:
+        """Índices no únicos de la tabla (nombre y definición)."""
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT c.relname, pg_get_indexdef(i.indexrelid) "
+                "FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE i.indrelid = to_regclass(%s) AND NOT i.indisunique "
+                "ORDER BY c.relname",
+                [table],
+            )
+            return cursor.fetchall()
+
+    @staticmethod
+    def _temp_name(index_name: str) -> str:
+        return (
+            "rap_"
+            + hashlib.md5(index_name.encode(), usedforsecurity=False).hexdigest()[:24]
+        )
+
+    @staticmethod
+    def _legacy_name(index_name: str) -> str:
+        return (
+            "ral_"
+            + hashlib.md5(index_name.encode(), usedforsecurity=False).hexdigest()[:24]
+        )
+
+    @staticmethod
+    def _columns() -> str:
+        qn = connection.ops.quote_name
+        return ", ".join(qn(f.column) for f in Application._meta.concrete_fields)
+
+    @staticmethod
+    def _qn(name: str) -> str:
+        return connection.ops.quote_name(name)
+
+    @staticmethod
+    def _fetch_value(sql: str, params: list | None = None):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params or [])
+            return cursor.fetchone()[0]
@@ -4,12 +4,17 @@ Repositorio para Application.
 Este módulo implementa el patrón Repository para Application.
 """
 
+from collections.abc import Iterator
 from typing import Protocol
 
-from django.db.models import QuerySet
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, QuerySet, Window
+from django.db.models.functions import RowNumber
 
 from apps.recruitment.models import Application, CandidateStatus
 
+from .upsert_statement import build_insert_ignore, build_upsert
+
 
 class ApplicationRepositoryProtocol(Protocol):
     """Interface para el repositorio de postulaciones."""
@@ -20,6 +25,8 @@ class ApplicationRepositoryProtocol(Protocol):
 
     def create(self, **kwargs) -> Application: ...
 
+    def create_if_absent(self, **kwargs) -> Application | None: ...
+
 
 class ApplicationRepository:
     """Implementación del repositorio de postulaciones."""
@@ -30,6 +37,10 @@ class ApplicationRepository:
         except Application.DoesNotExist:
             return None
 
+    def get_by_id_for_update(self, application_id: int) -> Application | None:
+        """Obtiene la postulación bloqueando la fila hasta el fin de la transacción."""
+        return Application.objects.select_for_update().filter(id=application_id).first()
+
     def get_by_vacancy(self, vacancy_id: int) -> QuerySet[Application]:
         return Application.objects.filter(vacancy_id=vacancy_id)
 
@@ -46,18 +57,209 @@ class ApplicationRepository:
         except Application.DoesNotExist:
             return None
 
+    def get_applied_candidate_ids(
+        self, vacancy_id: int, candidate_ids: list[int]
+    ) -> set[int]:
+        """Obtiene cuáles de los candidatos ya postularon a la vacante."""
+        return set(
+            Application.objects.filter(
+                vacancy_id=vacancy_id, candidate_id__in=candidate_ids
+            ).values_list("candidate_id", flat=True)
+        )
+
     def create(self, **kwargs) -> Application:
         return Application.objects.create(**kwargs)
 
+    def iter_values(
+        self,
+        tenant_id: str,
+        fields: list[str],
+        vacancy_id: int | None = None,
+        chunk_size: int = 2000,
+    ) -> Iterator[tuple]:
+        """
+        Itera las postulaciones de un tenant como tuplas planas.
+
+        Los campos pueden cruzar relaciones (``candidate__email``); el
+        JOIN se resuelve en la misma consulta y se usa un cursor del
+        servidor para mantener la memoria constante.
+        """
+        queryset = Application.objects.filter(tenant_id=tenant_id)
+        if vacancy_id is not None:
+            queryset = queryset.filter(vacancy_id=vacancy_id)
+        return (
+            queryset.order_by("id").values_list(*fields).iterator(chunk_size=chunk_size)
+        )
+
+    def bulk_create_if_absent(
+        self, applications: list[Application]
+    ) -> list[Application]:
+        """
+        Inserta postulaciones en lote ignorando duplicados concurrentes.
+
+        Como ``create_if_absent``, sin columnas de conflicto para que
+        también funcione con la tabla particionada. Ahí un duplicado
+        aborta el lote, que se reintenta sin los pares ya existentes.
+
+        Returns:
+            list[Application]: Solo las postulaciones insertadas.
+        """
+        if not applications:
+            return []
+        sql, params = build_insert_ignore(applications)
+        try:
+            with transaction.atomic():
+                return list(Application.objects.raw(sql, params))
+        except IntegrityError:
+            pending = self._without_existing(applications)
+            if len(pending) == len(applications):
+                raise
+            return self.bulk_create_if_absent(pending)
+
+    def create_if_absent(self, **kwargs) -> Application | None:
+        """
+        Crea una postulación salvo que ya exista para (vacante, candidato).
+
+        Usa INSERT ... ON CONFLICT DO NOTHING, así la verificación de
+        duplicados y la inserción son una sola sentencia sin ventana de
+        carrera. Sin columnas de conflicto para que también funcione con
+        la tabla particionada, donde la unicidad (vacante, candidato) la
+        resuelve un trigger (ver ``ApplicationPartitionRepository``) que
+        rechaza el duplicado con IntegrityError en lugar de omitirlo.
+
+        Args:
+            **kwargs: Campos de la postulación.
+
+        Returns:
+            Application | None: Postulación creada o None si ya existía.
+        """
+        application = Application(**kwargs)
+        sql, params = build_upsert(application, conflict_fields=[])
+        try:
+            with transaction.atomic():
+                created = list(Application.objects.raw(sql, params))
+        except IntegrityError:
+            if not self._without_existing([application]):
+                return None
+            raise
+        return created[0] if created else None
+
+    def get_stale_scores(
+        self,
+        vacancy_id: int,
+        score_version: int,
+        limit: int,
+        after_id: int = 0,
+        candidate_ids: list[int] | None = None,
+    ) -> list[tuple[int, list]]:
+        """
+        Obtiene postulaciones con puntaje obsoleto, paginando por ID.
+
+        Returns:
+            list[tuple[int, list]]: ``(id, candidate__skills)``.
+        """
+        queryset = Application.objects.filter(
+            vacancy_id=vacancy_id, score_version__lt=score_version, id__gt=after_id
+        )
+        if candidate_ids is not None:
+            queryset = queryset.filter(candidate_id__in=candidate_ids)
+        return list(
+            queryset.order_by("id").values_list("id", "candidate__skills")[:limit]
+        )
+
+    def has_stale_scores(self, vacancy_id: int, score_version: int) -> bool:
+        return Application.objects.filter(
+            vacancy_id=vacancy_id, score_version__lt=score_version
+        ).exists()
+
+    def bulk_update_scores(self, scores: dict[int, float], score_version: int) -> None:
+        """Guarda puntajes calculados sin tocar ``updated_at``."""
+        Application.objects.bulk_update(
+            [
+                Application(id=application_id, score=score, score_version=score_version)
+                for application_id, score in scores.items()
+            ],
+            ["score", "score_version"],
+        )
+
+    def get_top_by_score(self, vacancy_id: int, limit: int) -> QuerySet[Application]:
+        """Mejores postulaciones de una vacante (índice ``(vacancy, -score)``)."""
+        return (
+            self.get_by_vacancy(vacancy_id)
+            .select_related("candidate", "vacancy")
+            .order_by("-score", "applied_at")[:limit]
+        )
+
+    def get_board(
+        self,
+        vacancy_id: int,
+        limit: int,
+        status: str | None = None,
+        offset: int = 0,
+    ) -> list[Application]:
+        """
+        Primeras postulaciones de cada columna (estado) de una vacante.
+
+        Una sola consulta con funciones de ventana:
+        ``ROW_NUMBER() OVER (PARTITION BY status ORDER BY score DESC,
+        applied_at)`` para la posición y ``COUNT(*) OVER (PARTITION BY
+        status)`` para el total de la columna, con el candidato por JOIN.
+
+        Args:
+            vacancy_id: ID de la vacante.
+            limit: Tarjetas por columna.
+            status: Restringe a una columna (paginación dentro de ella).
+            offset: Tarjetas a saltar en cada columna.
+
+        Returns:
+            list[Application]: Anotadas con ``column_rank`` (desde 1) y
+                ``column_total``, ordenadas por estado y posición.
+        """
+        queryset = self.get_by_vacancy(vacancy_id)
+        if status is not None:
+            queryset = queryset.filter(status=status)
+        return list(
+            queryset.select_related("candidate")
+            .annotate(
+                column_rank=Window(
+                    RowNumber(),
+                    partition_by=[F("status")],
+                    order_by=[F("score").desc(), F("applied_at").asc(), F("id").asc()],
+                ),
+                column_total=Window(Count("id"), partition_by=[F("status")]),
+            )
+            .filter(column_rank__gt=offset, column_rank__lte=offset + limit)
+            .order_by("status", "column_rank")
+        )
+
     def update(self, application: Application, **kwargs) -> Application:
         for key, value in kwargs.items():
             setattr(application, key, value)
         application.save()
         return application
 
+    def delete(self, application: Application) -> None:
+        application.delete()
+
     def update_status(
         self, application: Application, status: CandidateStatus
     ) -> Application:
         application.status = status
         application.save(update_fields=["status", "updated_at"])
         return application
+
+    def _without_existing(self, applications: list[Application]) -> list[Application]:
+        """Descarta pares (vacante, candidato) repetidos o ya existentes."""
+        existing = set(
+            Application.objects.filter(
+                vacancy_id__in={a.vacancy_id for a in applications},
+                candidate_id__in={a.candidate_id for a in applications},
+            ).values_list("vacancy_id", "candidate_id")
+        )
+        pending = []
+        for application in applications:
+            pair = (application.vacancy_id, application.candidate_id)
+            if pair not in existing:
+                existing.add(pair)
+                pending.append(application)
+        return pending
@@ -0,0 +1,146 @@
+"""
+Repositorio para ArchivedApplication.
+
+Este módulo implementa el patrón Repository para el archivo frío de
+postulaciones y el movimiento de filas entre ambas tablas.
+"""
+
+from typing import Protocol
+
+from django.db import connection
+from django.db.models import Model
+from django.utils import timezone
+
+from apps.recruitment.models import Application, ArchivedApplication
+
+
+class ArchivedApplicationRepositoryProtocol(Protocol):
+    """Interface para el repositorio de postulaciones archivadas."""
+
+    def get_by_id(
+        self, tenant_id: str, application_id: int
+    ) -> ArchivedApplication | None: ...
+
+    def archive_chunk(
+        self, vacancy_id: int, chunk_size: int, after_id: int
+    ) -> tuple[list[int], int]: ...
+
+    def restore_chunk(
+        self, vacancy_id: int, chunk_size: int, after_id: int
+    ) -> tuple[list[int], int]: ...
+
+
+class ArchivedApplicationRepository:
+    """Implementación del repositorio de postulaciones archivadas."""
+
+    def get_by_id(
+        self, tenant_id: str, application_id: int
+    ) -> ArchivedApplication | None:
+        return (
+            ArchivedApplication.objects.select_related("candidate", "vacancy")
+            .filter(tenant_id=tenant_id, id=application_id)
+            .first()
+        )
+
+    def get_vacancy_ids(self) -> list[int]:
+        """Vacantes con postulaciones archivadas."""
+        return list(
+            ArchivedApplication.objects.order_by("vacancy_id")
+            .values_list("vacancy_id", flat=True)
+            .distinct()
+        )
+
+    def archive_chunk(
+        self, vacancy_id: int, chunk_size: int, after_id: int = 0
+    ) -> tuple[list[int], int]:
+        """
+        Mueve un lote de postulaciones de una vacante al archivo.
+
+        Bloquea las filas, las copia con un INSERT ... SELECT (conserva
+        ``id`` y fechas) y las borra de la tabla caliente. Debe
+        ejecutarse dentro de una transacción.
+
+        Returns:
+            tuple[list[int], int]: IDs leídos del lote (vacío al
+                terminar) y filas movidas.
+        """
+        ids = list(
+            Application.objects.select_for_update()
+            .filter(vacancy_id=vacancy_id, id__gt=after_id)
+            .order_by("id")
+            .values_list("id", flat=True)[:chunk_size]
+        )
+        if not ids:
+            return ids, 0
+        moved = self._copy(Application, ArchivedApplication, ids, archive=True)
+        Application.objects.filter(id__in=ids).delete()
+        return ids, moved
+
+    def restore_chunk(
+        self, vacancy_id: int, chunk_size: int, after_id: int = 0
+    ) -> tuple[list[int], int]:
+        """
+        Devuelve un lote de postulaciones archivadas a la tabla caliente.
+
+        Una fila archivada cuyo (vacante, candidato) ya volvió a postular
+        se deja en el archivo. Debe ejecutarse dentro de una transacción.
+
+        Returns:
+            tuple[list[int], int]: IDs leídos del lote (vacío al
+                terminar) y filas movidas.
+        """
+        ids = list(
+            ArchivedApplication.objects.select_for_update()
+            .filter(vacancy_id=vacancy_id, id__gt=after_id)
+            .order_by("id")
+            .values_list("id", flat=True)[:chunk_size]
+        )
+        if not ids:
+            return ids, 0
+        moved = self._copy(ArchivedApplication, Application, ids)
+        ArchivedApplication.objects.filter(
+            id__in=Application.objects.filter(id__in=ids).values("id")
+        ).delete()
+        return ids, moved
+
+    @staticmethod
+    def _copy(
+        source: type[Model],
+        target: type[Model],
+        ids: list[int],
+        archive: bool = False,
+    ) -> int:
+        """
+        INSERT ... SELECT de las columnas de ``Application``.
+
+        Al archivar se agrega ``archived_at``; al restaurar se omiten las
+        filas que violarían la unicidad (vacante, candidato).
+        """
+        qn = connection.ops.quote_name
+        source_table = qn(source._meta.db_table)
+        target_table = qn(target._meta.db_table)
+        columns = [qn(f.column) for f in Application._meta.concrete_fields]
+        insert_columns = ", ".join(columns)
+        select_columns = ", ".join(f"src.{col}" for col in columns)
+        params: list = []
+        if archive:
+            insert_columns += ", " + qn("archived_at")
+            select_columns += ", %s"
+            params.append(timezone.now())
+        placeholders = ", ".join(["%s"] * len(ids))
+        params.extend(ids)
+
+        sql = (
+            f"INSERT INTO {target_table} ({insert_columns}) "
+            f"SELECT {select_columns} FROM {source_table} src "
+            f"WHERE src.{qn('id')} IN ({placeholders})"
+        )
+        if not archive:
+            sql += (
+                f" AND NOT EXISTS (SELECT 1 FROM {target_table} dst "
+                f"WHERE dst.{qn('vacancy_id')} = src.{qn('vacancy_id')} "
+                f"AND dst.{qn('candidate_id')} = src.{qn('candidate_id')})"
+            )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.rowcount
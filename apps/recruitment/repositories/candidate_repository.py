@@ -4,12 +4,17 @@ Repositorio para Candidate.
 Este módulo implementa el patrón Repository para Candidate.
 """
 
+from collections.abc import Iterator
 from typing import Protocol
 
-from django.db.models import QuerySet
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
 
 from apps.recruitment.models import Candidate
 
+from .upsert_statement import build_upsert
+
 
 class CandidateRepositoryProtocol(Protocol):
     """Interface para el repositorio de candidatos."""
@@ -22,6 +27,8 @@ class CandidateRepositoryProtocol(Protocol):
 
     def create(self, **kwargs) -> Candidate: ...
 
+    def upsert_by_email(self, tenant_id: str, email: str, **fields) -> Candidate: ...
+
 
 class CandidateRepository:
     """Implementación del repositorio de candidatos."""
@@ -41,11 +48,142 @@ class CandidateRepository:
     def get_by_tenant(self, tenant_id: str) -> QuerySet[Candidate]:
         return Candidate.objects.filter(tenant_id=tenant_id)
 
+    def get_by_emails(self, tenant_id: str, emails: list[str]) -> dict[str, Candidate]:
+        """Obtiene los candidatos existentes de un tenant en un solo IN."""
+        return {
+            candidate.email: candidate
+            for candidate in Candidate.objects.filter(
+                tenant_id=tenant_id, email__in=emails
+            )
+        }
+
     def create(self, **kwargs) -> Candidate:
         return Candidate.objects.create(**kwargs)
 
+    def count_by_tenant(self, tenant_id: str, up_to: int | None = None) -> int:
+        """Cuenta candidatos del tenant, deteniéndose en ``up_to`` si se indica."""
+        queryset = Candidate.objects.filter(tenant_id=tenant_id)
+        if up_to is not None:
+            queryset = queryset[:up_to]
+        return queryset.count()
+
+    def autocomplete(self, tenant_id: str, query: str, limit: int) -> list[dict]:
+        """
+        Sugiere candidatos de un tenant por nombre o email.
+
+        En PostgreSQL combina coincidencia parcial (ILIKE) y similitud
+        por palabra de pg_trgm (tolera errores de tipeo), ambas servidas
+        por el índice trigram del tenant, y ordena por similitud. En
+        otros motores usa coincidencia por prefijo.
+
+        Args:
+            tenant_id: ID del tenant.
+            query: Texto escrito por el usuario.
+            limit: Máximo de sugerencias.
+
+        Returns:
+            list[dict]: ``id``, ``first_name``, ``last_name``, ``email``
+                y ``score`` (0-1) de cada sugerencia.
+        """
+        queryset = Candidate.objects.filter(tenant_id=tenant_id)
+        fields = ["id", "first_name", "last_name", "email", "score"]
+
+        if connection.vendor != "postgresql":
+            queryset = queryset.filter(
+                Q(first_name__istartswith=query)
+                | Q(last_name__istartswith=query)
+                | Q(email__istartswith=query)
+            ).annotate(score=Value(1.0, output_field=FloatField()))
+            return list(
+                queryset.order_by("last_name", "first_name").values(*fields)[:limit]
+            )
+
+        # Misma expresión que el índice de la migración 0008
+        full_name = "(first_name || ' ' || last_name)"
+        pattern = "%{}%".format(
+            query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        )
+        matches = RawSQL(
+            f"({full_name} ILIKE %s OR email ILIKE %s OR %s <%% {full_name})",
+            [pattern, pattern, query],
+            output_field=BooleanField(),
+        )
+        score = RawSQL(
+            f"GREATEST(word_similarity(%s, {full_name}), word_similarity(%s, email))",
+            [query, query],
+            output_field=FloatField(),
+        )
+        queryset = queryset.filter(matches).annotate(score=score)
+        return list(queryset.order_by("-score", "last_name").values(*fields)[:limit])
+
+    def iter_values(
+        self, tenant_id: str | None, fields: list[str], chunk_size: int = 2000
+    ) -> Iterator[tuple]:
+        """
+        Itera los candidatos de un tenant como tuplas, sin instanciar modelos.
+
+        Usa un cursor del servidor (``iterator``) para que la memoria no
+        crezca con el número de filas. Con ``tenant_id=None`` recorre
+        todos los tenants.
+        """
+        queryset = Candidate.objects.all()
+        if tenant_id is not None:
+            queryset = queryset.filter(tenant_id=tenant_id)
+        return (
+            queryset.order_by("id").values_list(*fields).iterator(chunk_size=chunk_size)
+        )
+
+    def bulk_create_or_touch(self, candidates: list[Candidate]) -> list[Candidate]:
+        """
+        Inserta candidatos en lote tolerando conflictos por (tenant, email).
+
+        Si otro proceso insertó el mismo email entre la lectura y la
+        escritura, solo se actualiza ``updated_at`` y se recupera su ID.
+
+        Args:
+            candidates: Candidatos sin guardar.
+
+        Returns:
+            list[Candidate]: Candidatos con su ID asignado.
+        """
+        return Candidate.objects.bulk_create(
+            candidates,
+            update_conflicts=True,
+            unique_fields=["tenant", "email"],
+            update_fields=["updated_at"],
+        )
+
+    def bulk_update(self, candidates: list[Candidate], fields: list[str]) -> None:
+        Candidate.objects.bulk_update(candidates, fields)
+
     def update(self, candidate: Candidate, **kwargs) -> Candidate:
         for key, value in kwargs.items():
             setattr(candidate, key, value)
         candidate.save()
         return candidate
+
+    def upsert_by_email(self, tenant_id: str, email: str, **fields) -> Candidate:
+        """
+        Crea o actualiza un candidato por (tenant, email) en un statement.
+
+        Usa INSERT ... ON CONFLICT (tenant, email) DO UPDATE, por lo que
+        envíos concurrentes del mismo email no compiten entre sí. Si los
+        datos recibidos son idénticos a los guardados, la fila no se
+        reescribe y se lee la existente.
+
+        Args:
+            tenant_id: ID del tenant.
+            email: Email del candidato.
+            **fields: Campos del candidato a insertar o actualizar.
+
+        Returns:
+            Candidate: Candidato creado, actualizado o sin cambios.
+        """
+        sql, params = build_upsert(
+            Candidate(tenant_id=tenant_id, email=email, **fields),
+            conflict_fields=["tenant", "email"],
+            update_fields=list(fields),
+        )
+        for candidate in Candidate.objects.raw(sql, params):
+            return candidate
+        return Candidate.objects.get(tenant_id=tenant_id, email=email)
@@ -0,0 +1,87 @@
+"""
+Repositorio para CandidateSkill.
+
+Este módulo implementa el patrón Repository para el índice de
+habilidades de candidatos.
+"""
+
+from typing import Protocol
+
+from django.db.models import Count, QuerySet
+
+from apps.recruitment.models import CandidateSkill
+
+
+class CandidateSkillRepositoryProtocol(Protocol):
+    """Interface para el repositorio del índice de habilidades."""
+
+    def replace(
+        self, tenant_id: str, skills_by_candidate: dict[int, set[int]]
+    ) -> None: ...
+
+    def candidate_ids_with_skills(
+        self, tenant_id: str, skill_ids: list[int], match_all: bool
+    ) -> QuerySet: ...
+
+
+class CandidateSkillRepository:
+    """Implementación del repositorio del índice de habilidades."""
+
+    def replace(self, tenant_id: str, skills_by_candidate: dict[int, set[int]]) -> None:
+        """
+        Deja el índice de cada candidato igual al conjunto indicado.
+
+        Solo escribe las diferencias: borra las habilidades que ya no
+        están e inserta las nuevas.
+
+        Args:
+            tenant_id: ID del tenant de los candidatos.
+            skills_by_candidate: Candidato -> IDs de habilidades canónicas.
+        """
+        current: dict[int, set[int]] = {pk: set() for pk in skills_by_candidate}
+        for candidate_id, skill_id in CandidateSkill.objects.filter(
+            candidate_id__in=skills_by_candidate
+        ).values_list("candidate_id", "skill_id"):
+            current[candidate_id].add(skill_id)
+
+        to_create = []
+        for candidate_id, skill_ids in skills_by_candidate.items():
+            stale = current[candidate_id] - skill_ids
+            if stale:
+                CandidateSkill.objects.filter(
+                    candidate_id=candidate_id, skill_id__in=stale
+                ).delete()
+            to_create.extend(
+                CandidateSkill(
+                    tenant_id=tenant_id, candidate_id=candidate_id, skill_id=skill_id
+                )
+                for skill_id in skill_ids - current[candidate_id]
+            )
+
+        if to_create:
+            CandidateSkill.objects.bulk_create(to_create, ignore_conflicts=True)
+
+    def candidate_ids_with_skills(
+        self, tenant_id: str, skill_ids: list[int], match_all: bool
+    ) -> QuerySet:
+        """
+        Subconsulta de IDs de candidatos con las habilidades indicadas.
+
+        Args:
+            tenant_id: ID del tenant.
+            skill_ids: IDs de habilidades canónicas (sin repetir).
+            match_all: True exige todas las habilidades; False, alguna.
+
+        Returns:
+            QuerySet: ``candidate_id`` para usar en ``__in``.
+        """
+        queryset = CandidateSkill.objects.filter(
+            tenant_id=tenant_id, skill_id__in=skill_ids
+        ).values("candidate_id")
+        if match_all and len(skill_ids) > 1:
+            queryset = queryset.annotate(matched=Count("skill_id")).filter(
+                matched=len(skill_ids)
+            )
+        else:
+            queryset = queryset.distinct()
+        return queryset.values("candidate_id")
@@ -0,0 +1,74 @@
+"""
+Búsqueda de texto completo sobre columnas ``search_vector``.
+
+En PostgreSQL usa las columnas tsvector generadas (migración
+``0007_search_vectors``) con su índice GIN y ordena por relevancia.
+En otros motores (SQLite de tests) cae a ``icontains`` por término.
+"""
+
+from functools import reduce
+from operator import and_, or_
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField
+from django.db import connection
+from django.db.models import FloatField, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+
+
+def full_text_search(
+    queryset: QuerySet,
+    terms: str,
+    configs: list[str],
+    fallback_fields: list[str],
+) -> QuerySet:
+    """
+    Filtra y ordena un queryset por relevancia textual.
+
+    Args:
+        queryset: Queryset base (ya filtrado por tenant).
+        terms: Texto de búsqueda (sintaxis websearch: comillas, ``-``, ``or``).
+        configs: Configuraciones de texto de PostgreSQL a combinar
+            (ej: ``["spanish", "english"]``); coincide cualquiera.
+        fallback_fields: Campos para ``icontains`` fuera de PostgreSQL.
+
+    Returns:
+        QuerySet: Resultados anotados con ``search_rank``.
+    """
+    if connection.vendor != "postgresql":
+        return _fallback_search(queryset, terms, fallback_fields)
+
+    qn = connection.ops.quote_name
+    vector = RawSQL(
+        f"{qn(queryset.model._meta.db_table)}.{qn('search_vector')}",
+        [],
+        output_field=SearchVectorField(),
+    )
+    query = reduce(
+        or_,
+        (
+            SearchQuery(terms, config=config, search_type="websearch")
+            for config in configs
+        ),
+    )
+    return (
+        queryset.alias(search_vector=vector)
+        .filter(search_vector=query)
+        .annotate(search_rank=SearchRank(vector, query))
+        .order_by("-search_rank", "-pk")
+    )
+
+
+def _fallback_search(queryset: QuerySet, terms: str, fields: list[str]) -> QuerySet:
+    words = terms.split()
+    if not words:
+        return queryset
+    condition = reduce(
+        and_,
+        (
+            reduce(or_, (Q(**{f"{field}__icontains": word}) for field in fields))
+            for word in words
+        ),
+    )
+    return queryset.filter(condition).annotate(
+        search_rank=Value(0.0, output_field=FloatField())
+    )
@@ -4,11 +4,12 @@ Repositorio para JobVacancy.
 Este módulo implementa el patrón Repository para JobVacancy.
 """
 
+from datetime import datetime
 from typing import Protocol
 
-from django.db.models import QuerySet
+from django.db.models import Exists, F, OuterRef, Q, QuerySet
 
-from apps.recruitment.models import JobStatus, JobVacancy
+from apps.recruitment.models import Application, JobStatus, JobVacancy
 
 
 class JobVacancyRepositoryProtocol(Protocol):
@@ -32,6 +33,10 @@ class JobVacancyRepository:
         except JobVacancy.DoesNotExist:
             return None
 
+    def get_by_id_for_update(self, vacancy_id: int) -> JobVacancy | None:
+        """Obtiene la vacante bloqueando la fila hasta el fin de la transacción."""
+        return JobVacancy.objects.select_for_update().filter(id=vacancy_id).first()
+
     def get_by_tenant(self, tenant_id: str) -> QuerySet[JobVacancy]:
         return JobVacancy.objects.filter(tenant_id=tenant_id)
 
@@ -49,5 +54,42 @@ class JobVacancyRepository:
         vacancy.save()
         return vacancy
 
+    def get_ids(self) -> list[int]:
+        return list(JobVacancy.objects.order_by("id").values_list("id", flat=True))
+
+    def get_archivable_ids(self, closed_before: datetime) -> list[int]:
+        """
+        Vacantes cerradas o archivadas antes de una fecha que aún tienen
+        postulaciones en la tabla caliente.
+
+        Las vacantes archivadas sin ``closed_at`` usan ``updated_at``.
+        """
+        return list(
+            JobVacancy.objects.filter(
+                Q(closed_at__lt=closed_before)
+                | Q(closed_at__isnull=True, updated_at__lt=closed_before),
+                Exists(Application.objects.filter(vacancy_id=OuterRef("id"))),
+                status__in=[JobStatus.CLOSED, JobStatus.ARCHIVED],
+            )
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+
+    def bump_score_version(self, vacancy_ids: list[int] | None = None) -> list[int]:
+        """
+        Incrementa ``score_version`` (todas las vacantes si no se indican).
+
+        Returns:
+            list[int]: IDs de las vacantes afectadas.
+        """
+        queryset = JobVacancy.objects.all()
+        if vacancy_ids is not None:
+            queryset = queryset.filter(id__in=vacancy_ids)
+        ids = list(queryset.values_list("id", flat=True))
+        JobVacancy.objects.filter(id__in=ids).update(
+            score_version=F("score_version") + 1
+        )
+        return ids
+
     def delete(self, vacancy: JobVacancy) -> None:
         vacancy.delete()
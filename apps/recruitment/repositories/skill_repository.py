@@ -0,0 +1,70 @@
+"""
+Repositorio para Skill.
+
+Este módulo implementa el patrón Repository para el diccionario de
+habilidades normalizadas.
+"""
+
+from typing import Protocol
+
+from apps.recruitment.models import Skill
+
+MAX_SKILL_NAME_LENGTH = Skill._meta.get_field("name").max_length
+
+
+class SkillRepositoryProtocol(Protocol):
+    """Interface para el repositorio de habilidades."""
+
+    def resolve(self, names: list[str], create: bool = False) -> dict[str, int]: ...
+
+    def canonical_names(self, names: list[str]) -> dict[str, str]: ...
+
+
+class SkillRepository:
+    """Implementación del repositorio de habilidades."""
+
+    def resolve(self, names: list[str], create: bool = False) -> dict[str, int]:
+        """
+        Resuelve nombres normalizados a IDs de habilidades canónicas.
+
+        Args:
+            names: Nombres ya normalizados.
+            create: Si se crean las habilidades que no existen.
+
+        Returns:
+            dict[str, int]: Nombre -> ID de la habilidad canónica. Los
+                nombres desconocidos (con ``create=False``) se omiten.
+        """
+        names = {name for name in names if len(name) <= MAX_SKILL_NAME_LENGTH}
+        if not names:
+            return {}
+
+        resolved = self._lookup(names)
+        missing = names - resolved.keys()
+        if create and missing:
+            Skill.objects.bulk_create(
+                [Skill(name=name) for name in missing], ignore_conflicts=True
+            )
+            resolved.update(self._lookup(missing))
+        return resolved
+
+    def canonical_names(self, names: list[str]) -> dict[str, str]:
+        """
+        Mapea nombres normalizados a su nombre canónico.
+
+        Returns:
+            dict[str, str]: Solo los nombres que son alias conocidos.
+        """
+        return dict(
+            Skill.objects.filter(name__in=names, canonical__isnull=False).values_list(
+                "name", "canonical__name"
+            )
+        )
+
+    def _lookup(self, names: set[str]) -> dict[str, int]:
+        return {
+            name: canonical_id or skill_id
+            for name, skill_id, canonical_id in Skill.objects.filter(
+                name__in=names
+            ).values_list("name", "id", "canonical_id")
+        }
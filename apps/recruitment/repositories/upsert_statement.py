@@ -0,0 +1,113 @@
+"""
+Construcción de sentencias INSERT ... ON CONFLICT.
+
+Este módulo genera upserts de una sola fila a partir de una instancia
+de modelo no guardada, e inserciones en lote que omiten conflictos.
+La sintaxis es compartida por PostgreSQL y SQLite (>= 3.35), por lo
+que funciona tanto en producción como en la configuración de tests.
+"""
+
+from django.db import connection
+from django.db.models import Model
+
+
+def build_upsert(
+    instance: Model,
+    conflict_fields: list[str],
+    update_fields: list[str] | None = None,
+) -> tuple[str, list]:
+    """
+    Construye un INSERT ... ON CONFLICT para una instancia.
+
+    Si ``update_fields`` está vacío la sentencia usa ``DO NOTHING``.
+    En caso contrario usa ``DO UPDATE`` con una cláusula WHERE que
+    omite la escritura cuando los valores no cambiaron, evitando
+    reescribir la fila (y sus índices) en reenvíos idénticos.
+
+    Args:
+        instance: Instancia del modelo (sin guardar) con los valores.
+        conflict_fields: Campos de la restricción única en conflicto. Vacío
+            (solo con ``DO NOTHING``) omite cualquier conflicto.
+        update_fields: Campos a actualizar si la fila ya existe.
+
+    Returns:
+        tuple[str, list]: SQL con ``RETURNING`` de todas las columnas
+            y sus parámetros. No retorna filas si no hubo escritura.
+    """
+    opts = instance._meta
+    qn = connection.ops.quote_name
+    table = qn(opts.db_table)
+
+    insert_fields = [f for f in opts.concrete_fields if not f.primary_key]
+    params = [
+        f.get_db_prep_save(f.pre_save(instance, add=True), connection)
+        for f in insert_fields
+    ]
+
+    columns = ", ".join(qn(f.column) for f in insert_fields)
+    placeholders = ", ".join(["%s"] * len(insert_fields))
+    conflict = ", ".join(qn(opts.get_field(name).column) for name in conflict_fields)
+    conflict_target = f"({conflict}) " if conflict_fields else ""
+    returning = ", ".join(qn(f.column) for f in opts.concrete_fields)
+
+    sql = (
+        f"INSERT INTO {table} ({columns}) VALUES ({placeholders}) "
+        f"ON CONFLICT {conflict_target}"
+    )
+
+    if not update_fields:
+        return f"{sql}DO NOTHING RETURNING {returning}", params
+
+    changed = [qn(opts.get_field(name).column) for name in update_fields]
+    touched = changed + [
+        qn(f.column)
+        for f in insert_fields
+        if getattr(f, "auto_now", False) and qn(f.column) not in changed
+    ]
+    assignments = ", ".join(f"{col} = EXCLUDED.{col}" for col in touched)
+    current = ", ".join(f"{table}.{col}" for col in changed)
+    incoming = ", ".join(f"EXCLUDED.{col}" for col in changed)
+
+    sql += (
+        f"DO UPDATE SET {assignments} "
+        f"WHERE ({current}) IS DISTINCT FROM ({incoming}) "
+        f"RETURNING {returning}"
+    )
+    return sql, params
+
+
+def build_insert_ignore(instances: list[Model]) -> tuple[str, list]:
+    """
+    Construye un INSERT de varias filas con ``ON CONFLICT DO NOTHING``.
+
+    A diferencia de ``bulk_create(ignore_conflicts=True)``, retorna las
+    filas efectivamente insertadas, de modo que los duplicados
+    descartados no se cuentan como creados.
+
+    Args:
+        instances: Instancias del mismo modelo (sin guardar).
+
+    Returns:
+        tuple[str, list]: SQL con ``RETURNING`` de todas las columnas
+            y sus parámetros. Solo retorna las filas insertadas.
+    """
+    opts = instances[0]._meta
+    qn = connection.ops.quote_name
+
+    insert_fields = [f for f in opts.concrete_fields if not f.primary_key]
+    params = [
+        f.get_db_prep_save(f.pre_save(instance, add=True), connection)
+        for instance in instances
+        for f in insert_fields
+    ]
+
+    columns = ", ".join(qn(f.column) for f in insert_fields)
+    row = "(" + ", ".join(["%s"] * len(insert_fields)) + ")"
+    values = ", ".join([row] * len(instances))
+    returning = ", ".join(qn(f.column) for f in opts.concrete_fields)
+
+    sql = (
+        f"INSERT INTO {qn(opts.db_table)} ({columns}) VALUES {values} "
+        f"ON CONFLICT DO NOTHING RETURNING {returning}"
+    )
+    return sql, params
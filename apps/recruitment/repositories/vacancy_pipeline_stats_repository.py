@@ -0,0 +1,134 @@
+"""
+Repositorio para VacancyPipelineStats.
+
+Este módulo implementa el patrón Repository para el agregado del
+embudo por vacante.
+"""
+
+from typing import Protocol
+
+from django.db import connection
+from django.db.models import Count
+from django.utils import timezone
+
+from apps.recruitment.models import (
+    Application,
+    ArchivedApplication,
+    VacancyPipelineStats,
+)
+
+
+class VacancyPipelineStatsRepositoryProtocol(Protocol):
+    """Interface para el repositorio de estadísticas del pipeline."""
+
+    def apply_deltas(
+        self, tenant_id: str, vacancy_id: int, deltas: dict[str, int]
+    ) -> None: ...
+
+    def get_counts(self, vacancy_ids: list[int]) -> dict[int, dict[str, int]]: ...
+
+
+class VacancyPipelineStatsRepository:
+    """Implementación del repositorio de estadísticas del pipeline."""
+
+    def apply_deltas(
+        self, tenant_id: str, vacancy_id: int, deltas: dict[str, int]
+    ) -> None:
+        """
+        Suma variaciones a los contadores de una vacante.
+
+        Un único INSERT ... ON CONFLICT DO UPDATE SET count = count + n:
+        el incremento es atómico a nivel de fila y crea el contador si
+        aún no existe. Debe ejecutarse en la transacción del cambio.
+
+        Args:
+            tenant_id: ID del tenant de la vacante.
+            vacancy_id: ID de la vacante.
+            deltas: Estado -> variación (p. ej. ``{"new": -1, "screening": 1}``).
+        """
+        deltas = {status: delta for status, delta in sorted(deltas.items()) if delta}
+        if not deltas:
+            return
+
+        opts = VacancyPipelineStats._meta
+        qn = connection.ops.quote_name
+        table = qn(opts.db_table)
+        tenant = opts.get_field("tenant").get_db_prep_save(tenant_id, connection)
+        now = opts.get_field("updated_at").get_db_prep_save(timezone.now(), connection)
+
+        values = ", ".join(["(%s, %s, %s, %s, %s)"] * len(deltas))
+        params = []
+        for status, delta in deltas.items():
+            params.extend([tenant, vacancy_id, status, delta, now])
+
+        tenant_col, vacancy_col, status_col, count_col, updated_col = (
+            qn(opts.get_field(name).column)
+            for name in ("tenant", "vacancy", "status", "count", "updated_at")
+        )
+        sql = (
+            f"INSERT INTO {table} "
+            f"({tenant_col}, {vacancy_col}, {status_col}, {count_col}, {updated_col}) "
+            f"VALUES {values} "
+            f"ON CONFLICT ({vacancy_col}, {status_col}) DO UPDATE SET "
+            f"{count_col} = {table}.{count_col} + EXCLUDED.{count_col}, "
+            f"{updated_col} = EXCLUDED.{updated_col}"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+    def get_counts(self, vacancy_ids: list[int]) -> dict[int, dict[str, int]]:
+        """Contadores por vacante y estado (una consulta por índice único)."""
+        counts: dict[int, dict[str, int]] = {pk: {} for pk in vacancy_ids}
+        for vacancy_id, status, count in VacancyPipelineStats.objects.filter(
+            vacancy_id__in=vacancy_ids
+        ).values_list("vacancy_id", "status", "count"):
+            counts[vacancy_id][status] = count
+        return counts
+
+    def rebuild(self, tenant_id: str, vacancy_id: int) -> dict[str, int]:
+        """
+        Recalcula los contadores de una vacante desde ``Application`` y
+        ``ArchivedApplication`` (el embudo conserva lo archivado).
+
+        Bloquea los contadores existentes mientras los reemplaza para
+        no intercalarse con incrementos concurrentes. Los contadores se
+        escriben con un upsert (no DELETE + INSERT), así un incremento
+        concurrente que crea la fila de un estado nuevo no hace fallar
+        el recálculo por la restricción única.
+
+        Returns:
+            dict[str, int]: Conteos recalculados por estado.
+        """
+        list(
+            VacancyPipelineStats.objects.select_for_update().filter(
+                vacancy_id=vacancy_id
+            )
+        )
+        counts: dict[str, int] = {}
+        for model in (Application, ArchivedApplication):
+            for status, total in (
+                model.objects.filter(vacancy_id=vacancy_id)
+                .order_by()
+                .values("status")
+                .annotate(total=Count("id"))
+                .values_list("status", "total")
+            ):
+                counts[status] = counts.get(status, 0) + total
+        VacancyPipelineStats.objects.filter(vacancy_id=vacancy_id).exclude(
+            status__in=list(counts)
+        ).delete()
+        VacancyPipelineStats.objects.bulk_create(
+            [
+                VacancyPipelineStats(
+                    tenant_id=tenant_id,
+                    vacancy_id=vacancy_id,
+                    status=status,
+                    count=count,
+                )
+                for status, count in counts.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["vacancy", "status"],
+            update_fields=["count", "updated_at"],
+        )
+        return counts
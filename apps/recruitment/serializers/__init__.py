@@ -1,15 +1,23 @@
 """Serializers de la app recruitment."""
 
+from .application_board_serializer import ApplicationBoardSerializer
 from .application_create_serializer import ApplicationCreateSerializer
+from .application_import_row_serializer import ApplicationImportRowSerializer
+from .application_intake_serializer import ApplicationIntakeSerializer
 from .application_serializer import ApplicationSerializer
 from .candidate_serializer import CandidateSerializer
 from .job_vacancy_create_serializer import JobVacancyCreateSerializer
 from .job_vacancy_serializer import JobVacancySerializer
+from .public_job_vacancy_serializer import PublicJobVacancySerializer
 
 __all__ = [
+    "ApplicationBoardSerializer",
     "ApplicationCreateSerializer",
+    "ApplicationImportRowSerializer",
+    "ApplicationIntakeSerializer",
     "ApplicationSerializer",
     "CandidateSerializer",
     "JobVacancyCreateSerializer",
     "JobVacancySerializer",
+    "PublicJobVacancySerializer",
 ]
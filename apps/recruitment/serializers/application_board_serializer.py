@@ -0,0 +1,34 @@
+"""
+Serializer para el tablero (kanban) de postulaciones.
+
+Este módulo contiene el serializer de las tarjetas del tablero: la
+postulación con un resumen del candidato.
+"""
+
+from rest_framework import serializers
+
+from apps.recruitment.models import Application
+
+
+class ApplicationBoardSerializer(serializers.ModelSerializer):
+    """Serializer de lectura de una tarjeta del tablero."""
+
+    candidate_id = serializers.IntegerField(read_only=True)
+    candidate_name = serializers.CharField(source="candidate.full_name", read_only=True)
+    candidate_email = serializers.EmailField(source="candidate.email", read_only=True)
+    position = serializers.IntegerField(source="column_rank", read_only=True)
+
+    class Meta:
+        model = Application
+        fields = [
+            "id",
+            "position",
+            "status",
+            "score",
+            "source",
+            "applied_at",
+            "candidate_id",
+            "candidate_name",
+            "candidate_email",
+        ]
+        read_only_fields = fields
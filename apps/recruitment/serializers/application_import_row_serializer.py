@@ -0,0 +1,38 @@
+"""
+Serializer para filas de importación masiva de postulaciones.
+
+Este módulo valida cada fila de un archivo CSV/NDJSON antes de
+crear candidatos y postulaciones.
+"""
+
+from rest_framework import serializers
+
+
+class ApplicationImportRowSerializer(serializers.Serializer):
+    """
+    Serializer para validar una fila de importación.
+
+    ``skills`` acepta una lista (NDJSON) o un texto separado por comas
+    (CSV).
+    """
+
+    first_name = serializers.CharField(max_length=100)
+    last_name = serializers.CharField(max_length=100)
+    email = serializers.EmailField()
+    phone = serializers.CharField(max_length=20, required=False)
+    linkedin_url = serializers.URLField(required=False)
+    resume_url = serializers.URLField(required=False)
+    skills = serializers.ListField(
+        child=serializers.CharField(max_length=100), required=False
+    )
+
+    def to_internal_value(self, data):
+        skills = data.get("skills")
+        if isinstance(skills, str):
+            data = {
+                **data,
+                "skills": [
+                    skill.strip() for skill in skills.split(",") if skill.strip()
+                ],
+            }
+        return super().to_internal_value(data)
@@ -0,0 +1,31 @@
+"""
+Serializer para ApplicationIntake.
+
+Este módulo contiene el serializer para consultar el estado de una
+postulación recibida en modo asíncrono.
+"""
+
+from rest_framework import serializers
+
+from apps.recruitment.models import ApplicationIntake
+
+
+class ApplicationIntakeSerializer(serializers.ModelSerializer):
+    """Serializer para lectura del estado de una postulación encolada."""
+
+    tracking_id = serializers.UUIDField(source="id", read_only=True)
+    status_display = serializers.CharField(source="get_status_display", read_only=True)
+
+    class Meta:
+        model = ApplicationIntake
+        fields = [
+            "tracking_id",
+            "vacancy_id",
+            "status",
+            "status_display",
+            "error",
+            "application",
+            "created_at",
+            "processed_at",
+        ]
+        read_only_fields = fields
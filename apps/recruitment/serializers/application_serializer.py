@@ -30,6 +30,7 @@ class ApplicationSerializer(serializers.ModelSerializer):
             "status_display",
             "source",
             "score",
+            "score_version",
             "notes",
             "applied_at",
             "updated_at",
@@ -37,6 +38,7 @@ class ApplicationSerializer(serializers.ModelSerializer):
         read_only_fields = [
             "id",
             "tenant",
+            "score_version",
             "applied_at",
             "updated_at",
         ]
@@ -37,6 +37,7 @@ class JobVacancySerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
             "closed_at",
+            "score_version",
         ]
         read_only_fields = [
             "id",
@@ -45,4 +46,5 @@ class JobVacancySerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
             "closed_at",
+            "score_version",
         ]
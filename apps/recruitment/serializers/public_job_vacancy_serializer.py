@@ -0,0 +1,31 @@
+"""
+Serializer público para JobVacancy.
+
+Este módulo contiene el serializer de las vacantes publicadas que se
+exponen en el job board (sin datos internos del tenant).
+"""
+
+from rest_framework import serializers
+
+from apps.recruitment.models import JobVacancy
+
+
+class PublicJobVacancySerializer(serializers.ModelSerializer):
+    """Serializer de lectura de una vacante publicada."""
+
+    class Meta:
+        model = JobVacancy
+        fields = [
+            "id",
+            "title",
+            "description",
+            "requirements",
+            "location",
+            "salary_min",
+            "salary_max",
+            "currency",
+            "is_remote",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = fields
@@ -1,9 +1,37 @@
 """Servicios de la app recruitment."""
 
+from .application_archive_service import ApplicationArchiveService
+from .application_idempotency_service import ApplicationIdempotencyService
+from .application_import_report import ApplicationImportReport
+from .application_import_service import ApplicationImportService
+from .application_intake_service import ApplicationIntakeService
+from .application_partition_service import ApplicationPartitionService
+from .application_scoring_service import ApplicationScoringService
 from .application_service import ApplicationService
+from .candidate_autocomplete_service import CandidateAutocompleteService
+from .candidate_prefix_index import CandidatePrefixIndex
+from .candidate_skill_index_service import CandidateSkillIndexService
+from .job_board_page import JobBoardPage
+from .job_board_service import JobBoardService
 from .job_vacancy_service import JobVacancyService
+from .recruitment_export_service import RecruitmentExportService
+from .vacancy_pipeline_stats_service import VacancyPipelineStatsService
 
 __all__ = [
+    "ApplicationArchiveService",
+    "ApplicationIdempotencyService",
+    "ApplicationImportReport",
+    "ApplicationImportService",
+    "ApplicationIntakeService",
+    "ApplicationPartitionService",
+    "ApplicationScoringService",
     "ApplicationService",
+    "CandidateAutocompleteService",
+    "CandidatePrefixIndex",
+    "CandidateSkillIndexService",
+    "JobBoardPage",
+    "JobBoardService",
     "JobVacancyService",
+    "RecruitmentExportService",
+    "VacancyPipelineStatsService",
 ]
@@ -0,0 +1,115 @@
+"""
+Servicio de aplicación para el archivo de postulaciones.
+
+Este módulo mueve las postulaciones de vacantes cerradas hace tiempo a
+``ArchivedApplication`` (y de vuelta), y resuelve las lecturas de
+detalle de postulaciones archivadas.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.recruitment.models import Application
+from apps.recruitment.repositories import (
+    ArchivedApplicationRepository,
+    JobVacancyRepository,
+)
+
+
+class ApplicationArchiveService:
+    """
+    Servicio de aplicación para el archivo frío de postulaciones.
+
+    Cada lote se mueve en su propia transacción: un archivado largo no
+    mantiene bloqueos prolongados y puede interrumpirse y repetirse sin
+    duplicar filas. El embudo (``VacancyPipelineStats``) no cambia al
+    archivar, de modo que las vacantes conservan su histórico.
+    """
+
+    def __init__(
+        self,
+        archive_repo: ArchivedApplicationRepository | None = None,
+        vacancy_repo: JobVacancyRepository | None = None,
+    ):
+        self.archive_repo = archive_repo or ArchivedApplicationRepository()
+        self.vacancy_repo = vacancy_repo or JobVacancyRepository()
+
+    def archive_closed_vacancies(
+        self, older_than_days: int | None = None, chunk_size: int | None = None
+    ) -> dict[str, int]:
+        """
+        Archiva las postulaciones de vacantes cerradas hace más de N días.
+
+        Args:
+            older_than_days: Antigüedad mínima del cierre (default:
+                setting ``RECRUITMENT_ARCHIVE_AFTER_DAYS``).
+            chunk_size: Filas por transacción (default: setting
+                ``RECRUITMENT_ARCHIVE_CHUNK_SIZE``).
+
+        Returns:
+            dict[str, int]: Vacantes y postulaciones archivadas.
+        """
+        if older_than_days is None:
+            older_than_days = settings.RECRUITMENT_ARCHIVE_AFTER_DAYS
+        if older_than_days < 0:
+            raise ValueError("older_than_days no puede ser negativo.")
+        cutoff = timezone.now() - timedelta(days=older_than_days)
+
+        totals = {"vacancies": 0, "applications": 0}
+        for vacancy_id in self.vacancy_repo.get_archivable_ids(cutoff):
+            totals["applications"] += self._move(
+                self.archive_repo.archive_chunk, vacancy_id, chunk_size
+            )
+            totals["vacancies"] += 1
+        return totals
+
+    def restore_vacancy(self, vacancy_id: int, chunk_size: int | None = None) -> int:
+        """
+        Devuelve las postulaciones archivadas de una vacante.
+
+        Returns:
+            int: Postulaciones restauradas (las que ya tenían una
+                postulación activa del mismo candidato quedan archivadas).
+        """
+        return self._move(self.archive_repo.restore_chunk, vacancy_id, chunk_size)
+
+    def get_archived_vacancy_ids(self) -> list[int]:
+        return self.archive_repo.get_vacancy_ids()
+
+    def get_archived_application(
+        self, tenant_id: str, application_id: int
+    ) -> Application | None:
+        """
+        Postulación archivada como instancia de ``Application``.
+
+        La instancia no está guardada (no debe modificarse); permite
+        reutilizar los serializers de lectura de postulaciones.
+        """
+        archived = self.archive_repo.get_by_id(tenant_id, application_id)
+        if archived is None:
+            return None
+        application = Application(
+            **{
+                field.attname: getattr(archived, field.attname)
+                for field in Application._meta.concrete_fields
+            }
+        )
+        application.candidate = archived.candidate
+        application.vacancy = archived.vacancy
+        return application
+
+    @staticmethod
+    def _move(move_chunk, vacancy_id: int, chunk_size: int | None) -> int:
+        chunk_size = chunk_size or settings.RECRUITMENT_ARCHIVE_CHUNK_SIZE
+        moved = 0
+        last_id = 0
+        while True:
+            with transaction.atomic():
+                ids, chunk_moved = move_chunk(vacancy_id, chunk_size, after_id=last_id)
+            if not ids:
+                return moved
+            moved += chunk_moved
+            last_id = ids[-1]
@@ -0,0 +1,78 @@
+"""
+Servicio de aplicación para Idempotency-Key en postulaciones.
+
+Este módulo contiene los casos de uso para reproducir respuestas de
+postulaciones públicas reintentadas por los clientes.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from apps.recruitment.repositories import ApplicationIdempotencyKeyRepository
+
+
+class ApplicationIdempotencyService:
+    """
+    Servicio de aplicación para respuestas idempotentes.
+
+    Guarda el código y el cuerpo de la primera respuesta para cada
+    (vacante, Idempotency-Key) y los devuelve en los reintentos que
+    llegan dentro del TTL (``RECRUITMENT_IDEMPOTENCY_TTL_SECONDS``).
+    """
+
+    def __init__(self, repository: ApplicationIdempotencyKeyRepository | None = None):
+        self.repository = repository or ApplicationIdempotencyKeyRepository()
+
+    @property
+    def ttl(self) -> timedelta:
+        return timedelta(seconds=settings.RECRUITMENT_IDEMPOTENCY_TTL_SECONDS)
+
+    def get_stored_response(self, vacancy_id: int, key: str) -> tuple[int, dict] | None:
+        """
+        Obtiene la respuesta almacenada para un reintento.
+
+        Args:
+            vacancy_id: ID de la vacante.
+            key: Valor del header Idempotency-Key.
+
+        Returns:
+            tuple[int, dict] | None: Código HTTP y cuerpo, o None si no
+                existe o expiró.
+        """
+        record = self.repository.get(vacancy_id, key)
+        if not record or record.created_at < timezone.now() - self.ttl:
+            return None
+        return record.status_code, record.response_body
+
+    def store_response(
+        self, vacancy_id: int, key: str, status_code: int, body: dict
+    ) -> None:
+        """
+        Almacena la respuesta de la primera ejecución.
+
+        Si ya existe un registro expirado se reemplaza; si existe uno
+        vigente (otra petición concurrente guardó primero) se conserva,
+        de modo que la primera respuesta almacenada gana.
+
+        Args:
+            vacancy_id: ID de la vacante.
+            key: Valor del header Idempotency-Key.
+            status_code: Código HTTP de la respuesta.
+            body: Cuerpo de la respuesta.
+        """
+        now = timezone.now()
+        values = {
+            "status_code": status_code,
+            "response_body": body,
+            "created_at": now,
+        }
+        if not self.repository.replace_if_created_before(
+            vacancy_id, key, now - self.ttl, **values
+        ):
+            self.repository.create_if_absent(vacancy_id=vacancy_id, key=key, **values)
+
+    def purge_expired(self) -> int:
+        """Elimina los registros cuyo TTL ya venció."""
+        return self.repository.delete_created_before(timezone.now() - self.ttl)
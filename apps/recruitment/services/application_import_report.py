@@ -0,0 +1,36 @@
+"""
+Resultado de una importación masiva de postulaciones.
+"""
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class ApplicationImportReport:
+    """
+    Acumula el resultado de una importación fila a fila.
+
+    Attributes:
+        processed: Filas leídas del archivo.
+        created: Postulaciones creadas.
+        errors: Errores por fila (número de línea y detalle).
+    """
+
+    processed: int = 0
+    created: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    @property
+    def failed(self) -> int:
+        return len(self.errors)
+
+    def add_error(self, row: int, detail) -> None:
+        self.errors.append({"row": row, "errors": detail})
+
+    def as_dict(self) -> dict:
+        return {
+            "processed": self.processed,
+            "created": self.created,
+            "failed": self.failed,
+            "errors": self.errors,
+        }
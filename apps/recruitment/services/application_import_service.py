@@ -0,0 +1,237 @@
+"""
+Servicio de aplicación para importación masiva de postulaciones.
+
+Este módulo contiene el caso de uso para cargar archivos de agencias
+(miles de candidatos por vacante) en lotes, sin pasar fila a fila
+por ``ApplicationService.apply_to_vacancy``.
+"""
+
+from collections.abc import Iterable, Iterator
+from itertools import islice
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.recruitment.adapters.import_row_reader import ImportRow
+from apps.recruitment.models import (
+    Application,
+    ApplicationSource,
+    Candidate,
+    CandidateStatus,
+    JobVacancy,
+)
+from apps.recruitment.repositories import (
+    ApplicationRepository,
+    CandidateRepository,
+    JobVacancyRepository,
+    VacancyPipelineStatsRepository,
+)
+from apps.recruitment.serializers import ApplicationImportRowSerializer
+
+from .application_import_report import ApplicationImportReport
+from .application_scoring_service import ApplicationScoringService
+from .candidate_autocomplete_service import CandidateAutocompleteService
+from .candidate_skill_index_service import CandidateSkillIndexService
+
+
+def _chunked(rows: Iterable[ImportRow], size: int) -> Iterator[list[ImportRow]]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class ApplicationImportService:
+    """
+    Servicio de aplicación para importación masiva.
+
+    Procesa las filas en lotes de tamaño fijo: una consulta ``IN`` para
+    resolver candidatos existentes, ``bulk_create`` con manejo de
+    conflictos para candidatos y postulaciones nuevas, y una
+    transacción por lote. La memoria queda acotada por el tamaño del
+    lote, no por el del archivo.
+    """
+
+    def __init__(
+        self,
+        application_repo: ApplicationRepository | None = None,
+        candidate_repo: CandidateRepository | None = None,
+        vacancy_repo: JobVacancyRepository | None = None,
+        scoring_service: ApplicationScoringService | None = None,
+        stats_repo: VacancyPipelineStatsRepository | None = None,
+        skill_index_service: CandidateSkillIndexService | None = None,
+    ):
+        self.application_repo = application_repo or ApplicationRepository()
+        self.candidate_repo = candidate_repo or CandidateRepository()
+        self.vacancy_repo = vacancy_repo or JobVacancyRepository()
+        self.scoring_service = scoring_service or ApplicationScoringService()
+        self.stats_repo = stats_repo or VacancyPipelineStatsRepository()
+        self.skill_index_service = skill_index_service or CandidateSkillIndexService()
+
+    def import_rows(
+        self,
+        vacancy_id: int,
+        rows: Iterable[ImportRow],
+        source: str = ApplicationSource.AGENCY,
+        chunk_size: int | None = None,
+        tenant_id: str | None = None,
+    ) -> ApplicationImportReport:
+        """
+        Importa postulaciones a una vacante desde un iterador de filas.
+
+        Args:
+            vacancy_id: ID de la vacante.
+            rows: Filas ``(número de línea, datos)`` de un lector.
+            source: Fuente de las postulaciones.
+            chunk_size: Filas por lote (default: setting
+                ``RECRUITMENT_IMPORT_CHUNK_SIZE``).
+            tenant_id: Si se indica, la vacante debe pertenecer a él.
+
+        Returns:
+            ApplicationImportReport: Conteos y errores por fila.
+
+        Raises:
+            ValueError: Si la fuente no es válida o si la vacante no
+                existe o es de otro tenant.
+        """
+        if source not in ApplicationSource.values:
+            raise ValueError("Fuente no válida.")
+
+        vacancy = self.vacancy_repo.get_by_id(vacancy_id)
+        if not vacancy or (tenant_id and str(vacancy.tenant_id) != str(tenant_id)):
+            raise ValueError("La vacante no existe.")
+
+        chunk_size = chunk_size or settings.RECRUITMENT_IMPORT_CHUNK_SIZE
+        report = ApplicationImportReport()
+        for chunk in _chunked(rows, chunk_size):
+            self._import_chunk(vacancy, chunk, source, report)
+        return report
+
+    def _import_chunk(
+        self,
+        vacancy: JobVacancy,
+        chunk: list[ImportRow],
+        source: str,
+        report: ApplicationImportReport,
+    ) -> None:
+        # 1. Validar filas (sin tocar la BD)
+        valid: dict[str, tuple[int, dict]] = {}
+        for row_number, row in chunk:
+            report.processed += 1
+            if row is None:
+                report.add_error(row_number, "La línea no es un objeto válido.")
+                continue
+            serializer = ApplicationImportRowSerializer(data=row)
+            if not serializer.is_valid():
+                report.add_error(row_number, serializer.errors)
+                continue
+            data = dict(serializer.validated_data)
+            email = data.pop("email")
+            if email in valid:
+                report.add_error(row_number, "Email duplicado en el archivo.")
+                continue
+            valid[email] = (row_number, data)
+
+        if not valid:
+            return
+
+        with transaction.atomic():
+            candidates = self._resolve_candidates(vacancy, valid)
+
+            # 2. Descartar candidatos que ya postularon
+            applied = self.application_repo.get_applied_candidate_ids(
+                vacancy.id, [candidate.id for candidate in candidates.values()]
+            )
+            applications = []
+            for email, (row_number, _) in valid.items():
+                candidate = candidates[email]
+                if candidate.id in applied:
+                    report.add_error(
+                        row_number, "El candidato ya postuló a esta vacante."
+                    )
+                    continue
+                applications.append(
+                    Application(
+                        tenant_id=vacancy.tenant_id,
+                        vacancy=vacancy,
+                        candidate=candidate,
+                        source=source,
+                        status=CandidateStatus.NEW,
+                    )
+                )
+
+            # 3. Crear postulaciones y calcular sus puntajes. Solo cuentan
+            # las insertadas: las que otro proceso creó entre la lectura
+            # y la escritura se descartan y se reportan como duplicadas.
+            created = self.application_repo.bulk_create_if_absent(applications)
+            created_ids = {application.candidate_id for application in created}
+            for application in applications:
+                if application.candidate_id not in created_ids:
+                    report.add_error(
+                        valid[application.candidate.email][0],
+                        "El candidato ya postuló a esta vacante.",
+                    )
+            if created:
+                report.created += len(created)
+                self.stats_repo.apply_deltas(
+                    str(vacancy.tenant_id),
+                    vacancy.id,
+                    {CandidateStatus.NEW: len(created)},
+                )
+                self.scoring_service.refresh_stale(
+                    vacancy, candidate_ids=sorted(created_ids)
+                )
+
+    def _resolve_candidates(
+        self, vacancy: JobVacancy, valid: dict[str, tuple[int, dict]]
+    ) -> dict[str, Candidate]:
+        """Crea o actualiza los candidatos de un lote y los indexa por email."""
+        tenant_id = str(vacancy.tenant_id)
+        candidates = self.candidate_repo.get_by_emails(tenant_id, list(valid))
+
+        to_create = []
+        to_update = []
+        changed_fields: set[str] = set()
+        reindex: list[str] = []
+        now = timezone.now()
+        for email, (_, data) in valid.items():
+            candidate = candidates.get(email)
+            if candidate is None:
+                to_create.append(
+                    Candidate(tenant_id=vacancy.tenant_id, email=email, **data)
+                )
+                if "skills" in data:
+                    reindex.append(email)
+                continue
+            changed = [
+                key for key, value in data.items() if getattr(candidate, key) != value
+            ]
+            if changed:
+                for key in changed:
+                    setattr(candidate, key, data[key])
+                candidate.updated_at = now
+                changed_fields.update(changed)
+                to_update.append(candidate)
+                if "skills" in changed:
+                    reindex.append(email)
+
+        if to_create:
+            for candidate in self.candidate_repo.bulk_create_or_touch(to_create):
+                candidates[candidate.email] = candidate
+        if to_update:
+            self.candidate_repo.bulk_update(
+                to_update, [*sorted(changed_fields), "updated_at"]
+            )
+        if to_create or to_update:
+            # bulk_create/bulk_update no emiten post_save: se actualizan
+            # los índices derivados
+            transaction.on_commit(
+                lambda: CandidateAutocompleteService.invalidate(tenant_id)
+            )
+        if reindex:
+            self.skill_index_service.sync_rows(
+                (candidates[email].pk, tenant_id, candidates[email].skills)
+                for email in reindex
+            )
+
+        return candidates
@@ -0,0 +1,129 @@
+"""
+Servicio de aplicación para la recepción asíncrona de postulaciones.
+
+Este módulo contiene los casos de uso para encolar postulaciones
+públicas y procesarlas en lotes desde los workers.
+"""
+
+import logging
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.recruitment.models import ApplicationIntake, IntakeStatus
+from apps.recruitment.repositories import ApplicationIntakeRepository
+
+from .application_service import ApplicationService
+
+logger = logging.getLogger(__name__)
+
+FAILED_ERROR = "No se pudo procesar la postulación."
+
+_OUTCOMES = (
+    IntakeStatus.ACCEPTED.value,
+    IntakeStatus.REJECTED.value,
+    IntakeStatus.FAILED.value,
+)
+
+
+class ApplicationIntakeService:
+    """
+    Servicio de aplicación para la cola de postulaciones.
+
+    Separa la recepción (un INSERT y respuesta 202) del trabajo
+    transaccional de ``ApplicationService.apply_to_vacancy``, que se
+    ejecuta después en lotes.
+    """
+
+    def __init__(
+        self,
+        intake_repo: ApplicationIntakeRepository | None = None,
+        application_service: ApplicationService | None = None,
+    ):
+        self.intake_repo = intake_repo or ApplicationIntakeRepository()
+        self.application_service = application_service or ApplicationService()
+
+    def submit(
+        self, vacancy_id: int, candidate_data: dict, source: str = "website"
+    ) -> ApplicationIntake:
+        """
+        Encola una postulación ya validada.
+
+        Args:
+            vacancy_id: ID de la vacante.
+            candidate_data: Datos del candidato.
+            source: Fuente de la postulación.
+
+        Returns:
+            ApplicationIntake: Registro con el tracking ID.
+        """
+        return self.intake_repo.create(
+            vacancy_id=vacancy_id, payload=candidate_data, source=source
+        )
+
+    def get_intake(self, tracking_id: str) -> ApplicationIntake | None:
+        """Obtiene una postulación encolada por su tracking ID."""
+        return self.intake_repo.get_by_id(tracking_id)
+
+    @transaction.atomic
+    def process_batch(self, batch_size: int | None = None) -> dict[str, int]:
+        """
+        Procesa un lote de postulaciones pendientes.
+
+        Cada postulación se aplica en su propio savepoint, de modo que
+        un rechazo (vacante inexistente, postulación duplicada) o un
+        error inesperado no revierte el resto del lote ni el reclamo:
+        la postulación queda ``REJECTED`` o ``FAILED`` y no vuelve a la
+        cola.
+
+        Args:
+            batch_size: Tamaño del lote (default: setting
+                ``RECRUITMENT_INTAKE_BATCH_SIZE``).
+
+        Returns:
+            dict[str, int]: Conteo de aceptadas, rechazadas y fallidas.
+        """
+        batch_size = batch_size or settings.RECRUITMENT_INTAKE_BATCH_SIZE
+        intakes = self.intake_repo.claim_pending(batch_size)
+
+        counts = dict.fromkeys(_OUTCOMES, 0)
+        for intake in intakes:
+            try:
+                with transaction.atomic():
+                    application = self.application_service.apply_to_vacancy(
+                        vacancy_id=intake.vacancy_id,
+                        candidate_data=dict(intake.payload),
+                        source=intake.source,
+                    )
+                intake.status = IntakeStatus.ACCEPTED
+                intake.application = application
+            except ValueError as e:
+                intake.status = IntakeStatus.REJECTED
+                intake.error = str(e)
+            except Exception:
+                logger.exception("Error al procesar la postulación %s", intake.id)
+                intake.status = IntakeStatus.FAILED
+                intake.error = FAILED_ERROR
+            intake.processed_at = timezone.now()
+            counts[intake.status] += 1
+
+        if intakes:
+            self.intake_repo.save_outcomes(intakes)
+
+        return counts
+
+    def process_pending(self, batch_size: int | None = None) -> dict[str, int]:
+        """
+        Drena la cola lote a lote hasta vaciarla.
+
+        Returns:
+            dict[str, int]: Conteo total de aceptadas, rechazadas y fallidas.
+        """
+        totals = dict.fromkeys(_OUTCOMES, 0)
+        while True:
+            counts = self.process_batch(batch_size)
+            if not any(counts.values()):
+                return totals
+            for key, value in counts.items():
+                totals[key] += value
@@ -0,0 +1,162 @@
+"""
+Servicio de aplicación para el particionado de postulaciones.
+
+Este módulo orquesta la conversión de ``Application`` a una tabla
+particionada por mes de ``applied_at`` (PostgreSQL) y la creación
+anticipada de particiones futuras.
+"""
+
+from datetime import date
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.recruitment.repositories import ApplicationPartitionRepository
+from apps.recruitment.repositories.application_partition_repository import (
+    LEGACY_TABLE,
+    SHADOW_TABLE,
+    TABLE,
+)
+
+
+def add_months(month: date, months: int) -> date:
+    """Primer día del mes desplazado ``months`` meses."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class ApplicationPartitionService:
+    """
+    Servicio de aplicación para el particionado de ``Application``.
+
+    La conversión se hace en pasos que pueden ejecutarse en momentos
+    distintos: ``prepare`` (tabla sombra y particiones), ``copy`` (por
+    lotes, reanudable, con la tabla en uso), ``swap`` (bloqueo breve e
+    intercambio) y ``drop_legacy``. Las particiones mensuales usan
+    límites en UTC; una partición por defecto recibe filas fuera de
+    rango hasta que se cree su mes.
+    """
+
+    STEPS = ("prepare", "copy", "swap", "drop-legacy")
+
+    def __init__(self, partition_repo: ApplicationPartitionRepository | None = None):
+        self.partition_repo = partition_repo or ApplicationPartitionRepository()
+
+    def is_partitioned(self) -> bool:
+        return (
+            self.partition_repo.is_supported() and self.partition_repo.is_partitioned()
+        )
+
+    def get_partitions(self) -> list[tuple[str, str]]:
+        if not self.is_partitioned():
+            return []
+        return self.partition_repo.get_partitions()
+
+    def ensure_future_partitions(self, months_ahead: int | None = None) -> list[str]:
+        """
+        Crea las particiones del mes actual y los ``months_ahead`` siguientes.
+
+        Sin efecto si la tabla no está particionada.
+
+        Returns:
+            list[str]: Nombres de las particiones creadas.
+        """
+        if not self.is_partitioned():
+            return []
+        if months_ahead is None:
+            months_ahead = settings.RECRUITMENT_PARTITION_MONTHS_AHEAD
+        current = timezone.now().date().replace(day=1)
+        return self._create_months(current, add_months(current, months_ahead))
+
+    def run_step(self, step: str, chunk_size: int | None = None) -> str:
+        """
+        Ejecuta un paso de la conversión.
+
+        Returns:
+            str: Resumen del resultado.
+
+        Raises:
+            ValueError: Si el motor no lo soporta, el paso no existe o no
+                corresponde al estado actual.
+        """
+        if not self.partition_repo.is_supported():
+            raise ValueError("El particionado requiere PostgreSQL 13 o superior.")
+        if step == "prepare":
+            return self.prepare()
+        if step == "copy":
+            return self.copy(chunk_size)
+        if step == "swap":
+            return self.swap()
+        if step == "drop-legacy":
+            return self.drop_legacy()
+        raise ValueError(f"Paso inválido. Opciones: {', '.join(self.STEPS)}.")
+
+    @transaction.atomic
+    def prepare(self) -> str:
+        """Crea la tabla sombra con las particiones de los datos existentes."""
+        if self.partition_repo.is_partitioned():
+            raise ValueError("La tabla de postulaciones ya está particionada.")
+        if self.partition_repo.table_exists(SHADOW_TABLE):
+            raise ValueError("La conversión ya fue preparada.")
+        self.partition_repo.create_shadow()
+
+        current = timezone.now().date().replace(day=1)
+        oldest, _ = self.partition_repo.get_applied_at_range()
+        first = oldest.date().replace(day=1) if oldest else current
+        created = self._create_months(
+            first,
+            add_months(current, settings.RECRUITMENT_PARTITION_MONTHS_AHEAD),
+            table=SHADOW_TABLE,
+        )
+        return f"{len(created)} particiones creadas."
+
+    def copy(self, chunk_size: int | None = None) -> str:
+        """
+        Copia las filas existentes a la tabla sombra, un lote por transacción.
+
+        Puede interrumpirse y repetirse: continúa desde el último ID
+        copiado. Los cambios posteriores quedan registrados para ``swap``.
+        """
+        if not self.partition_repo.table_exists(SHADOW_TABLE):
+            raise ValueError("Ejecute primero el paso prepare.")
+        chunk_size = chunk_size or settings.RECRUITMENT_PARTITION_COPY_CHUNK_SIZE
+        last_id = self.partition_repo.get_max_id(SHADOW_TABLE)
+        until_id = self.partition_repo.get_max_id(TABLE)
+        copied = 0
+        while True:
+            with transaction.atomic():
+                next_id = self.partition_repo.copy_chunk(last_id, until_id, chunk_size)
+            if next_id is None:
+                return f"Copia al día (hasta ID {last_id}, {copied} lotes)."
+            last_id = next_id
+            copied += 1
+
+    @transaction.atomic
+    def swap(self) -> str:
+        """Reemplaza la tabla de postulaciones por la particionada."""
+        if not self.partition_repo.table_exists(SHADOW_TABLE):
+            raise ValueError("Ejecute primero los pasos prepare y copy.")
+        rows = self.partition_repo.swap()
+        return f"Tabla particionada activa ({rows} filas)."
+
+    @transaction.atomic
+    def drop_legacy(self) -> str:
+        """Elimina la tabla original conservada por ``swap``."""
+        if not self.partition_repo.table_exists(LEGACY_TABLE):
+            raise ValueError("No hay tabla original que eliminar.")
+        self.partition_repo.drop_legacy()
+        return "Tabla original eliminada."
+
+    def _create_months(self, first: date, last: date, **kwargs) -> list[str]:
+        """Crea las particiones mensuales de ``first`` a ``last`` (inclusive)."""
+        created = []
+        month = first
+        while month <= last:
+            with transaction.atomic():
+                if self.partition_repo.create_partition(
+                    month, add_months(month, 1), **kwargs
+                ):
+                    created.append(month.strftime("%Y-%m"))
+            month = add_months(month, 1)
+        return created
@@ -0,0 +1,158 @@
+"""
+Servicio de aplicación para el puntaje persistido de postulaciones.
+
+Este módulo calcula ``Application.score`` (encaje de skills del
+candidato con los requisitos de la vacante) y lo mantiene al día
+cuando cambian los requisitos.
+"""
+
+from django.conf import settings
+from django.db import transaction
+
+from apps.recruitment.adapters.skill_normalizer import (
+    normalize_skills,
+    split_skill_list,
+)
+from apps.recruitment.models import Application, JobVacancy
+from apps.recruitment.repositories import (
+    ApplicationRepository,
+    JobVacancyRepository,
+    SkillRepository,
+)
+
+
+class ApplicationScoringService:
+    """
+    Servicio de aplicación para scoring de postulaciones.
+
+    Cada puntaje guarda el ``score_version`` de la vacante con el que
+    se calculó; las filas con una versión menor están obsoletas y se
+    recalculan por lotes (en background o al leer el ranking). El
+    cálculo usa ``BatchFitScorer`` con skills canónicas (alias
+    resueltos con el diccionario ``Skill``).
+    """
+
+    def __init__(
+        self,
+        application_repo: ApplicationRepository | None = None,
+        vacancy_repo: JobVacancyRepository | None = None,
+        skill_repo: SkillRepository | None = None,
+    ):
+        self.application_repo = application_repo or ApplicationRepository()
+        self.vacancy_repo = vacancy_repo or JobVacancyRepository()
+        self.skill_repo = skill_repo or SkillRepository()
+
+    def score_application(self, application: Application) -> Application:
+        """
+        Calcula y guarda el puntaje de una postulación recién creada.
+
+        Args:
+            application: Postulación con ``vacancy`` y ``candidate``.
+
+        Returns:
+            Application: La misma postulación con ``score`` actualizado.
+        """
+        vacancy = application.vacancy
+        scores = self._score_rows(
+            self.required_skills(vacancy),
+            [(application.id, application.candidate.skills)],
+        )
+        self.application_repo.bulk_update_scores(scores, vacancy.score_version)
+        application.score = scores[application.id]
+        application.score_version = vacancy.score_version
+        return application
+
+    def refresh_stale(
+        self,
+        vacancy: JobVacancy,
+        limit: int | None = None,
+        candidate_ids: list[int] | None = None,
+    ) -> int:
+        """
+        Recalcula postulaciones obsoletas de una vacante por lotes.
+
+        Cada lote se guarda en su propia transacción, de modo que un
+        recálculo largo no bloquea la tabla ni pierde lo ya procesado.
+
+        Args:
+            vacancy: Vacante.
+            limit: Máximo de postulaciones a procesar (default: todas).
+            candidate_ids: Restringe a estos candidatos.
+
+        Returns:
+            int: Postulaciones recalculadas.
+        """
+        chunk_size = settings.RECRUITMENT_SCORING_CHUNK_SIZE
+        required = self.required_skills(vacancy)
+        processed = 0
+        last_id = 0
+        while limit is None or processed < limit:
+            batch = min(chunk_size, limit - processed) if limit else chunk_size
+            rows = self.application_repo.get_stale_scores(
+                vacancy.id,
+                vacancy.score_version,
+                batch,
+                after_id=last_id,
+                candidate_ids=candidate_ids,
+            )
+            if not rows:
+                break
+            with transaction.atomic():
+                self.application_repo.bulk_update_scores(
+                    self._score_rows(required, rows), vacancy.score_version
+                )
+            processed += len(rows)
+            last_id = rows[-1][0]
+        return processed
+
+    def recompute_vacancy(self, vacancy_id: int) -> int:
+        """Recalcula todas las postulaciones obsoletas de una vacante."""
+        vacancy = self.vacancy_repo.get_by_id(vacancy_id)
+        if not vacancy:
+            return 0
+        return self.refresh_stale(vacancy)
+
+    def top_applications(self, vacancy: JobVacancy, limit: int) -> tuple[list, bool]:
+        """
+        Mejores postulaciones de una vacante según el puntaje guardado.
+
+        Antes de leer refresca hasta
+        ``RECRUITMENT_SCORING_LAZY_REFRESH_LIMIT`` filas obsoletas.
+
+        Returns:
+            tuple[list, bool]: Postulaciones y si aún quedan puntajes
+                obsoletos (el llamador puede encolar el recálculo).
+        """
+        self.refresh_stale(
+            vacancy, limit=settings.RECRUITMENT_SCORING_LAZY_REFRESH_LIMIT
+        )
+        stale = self.application_repo.has_stale_scores(
+            vacancy.id, vacancy.score_version
+        )
+        return list(self.application_repo.get_top_by_score(vacancy.id, limit)), stale
+
+    def required_skills(self, vacancy: JobVacancy) -> list[str]:
+        """Skills canónicas de los requisitos de la vacante."""
+        return self._canonicalize(split_skill_list(vacancy.requirements))
+
+    def _score_rows(
+        self, required: list[str], rows: list[tuple[int, list]]
+    ) -> dict[int, float]:
+        """Puntaje (0-100) de filas ``(application_id, skills)``."""
+        # numpy/scipy se cargan al puntuar, no al arrancar cada proceso
+        from apps.ai_core.services.batch_fit_scorer import BatchFitScorer
+
+        normalized = [(pk, normalize_skills(skills or [])) for pk, skills in rows]
+        aliases = self.skill_repo.canonical_names(
+            sorted({name for _, names in normalized for name in names})
+        )
+        scorer = BatchFitScorer(
+            (pk, {"skills": [aliases.get(name, name) for name in names]})
+            for pk, names in normalized
+        )
+        scores = scorer.evaluate({"required_skills": required})["match_score"]
+        return dict(zip(scorer.candidate_ids, scores.tolist(), strict=True))
+
+    def _canonicalize(self, names: list[str]) -> list[str]:
+        aliases = self.skill_repo.canonical_names(names)
+        return sorted({aliases.get(name, name) for name in names})
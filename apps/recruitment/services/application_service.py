@@ -15,9 +15,14 @@ from apps.recruitment.repositories import (
     ApplicationRepository,
     CandidateRepository,
     JobVacancyRepository,
+    VacancyPipelineStatsRepository,
 )
 from apps.tenants.repositories import TenantRepository
 
+from .application_scoring_service import ApplicationScoringService
+from .candidate_autocomplete_service import CandidateAutocompleteService
+from .candidate_skill_index_service import CandidateSkillIndexService
+
 
 class ApplicationService:
     """
@@ -33,11 +38,17 @@ class ApplicationService:
         candidate_repo: CandidateRepository | None = None,
         vacancy_repo: JobVacancyRepository | None = None,
         tenant_repo: TenantRepository | None = None,
+        scoring_service: ApplicationScoringService | None = None,
+        stats_repo: VacancyPipelineStatsRepository | None = None,
+        skill_index_service: CandidateSkillIndexService | None = None,
     ):
         self.application_repo = application_repo or ApplicationRepository()
         self.candidate_repo = candidate_repo or CandidateRepository()
         self.vacancy_repo = vacancy_repo or JobVacancyRepository()
         self.tenant_repo = tenant_repo or TenantRepository()
+        self.scoring_service = scoring_service or ApplicationScoringService()
+        self.stats_repo = stats_repo or VacancyPipelineStatsRepository()
+        self.skill_index_service = skill_index_service or CandidateSkillIndexService()
 
     @transaction.atomic
     def apply_to_vacancy(
@@ -61,36 +72,38 @@ class ApplicationService:
         if not vacancy:
             raise ValueError("La vacante no existe.")
 
-        tenant_id = str(vacancy.tenant.id)
-        email = candidate_data.get("email")
-
-        # Buscar o crear candidato
-        candidate = self.candidate_repo.get_by_email(tenant_id, email)
-        if not candidate:
-            candidate = self.candidate_repo.create(
-                tenant=vacancy.tenant, **candidate_data
-            )
-        else:
-            # Actualizar datos si es necesario
-            self.candidate_repo.update(candidate, **candidate_data)
+        candidate_fields = dict(candidate_data)
+        email = candidate_fields.pop("email")
 
-        # Verificar si ya postuló
-        existing_app = self.application_repo.get_by_candidate_and_vacancy(
-            candidate.id, vacancy.id
+        # Crear o actualizar candidato (upsert por tenant + email)
+        tenant_id = str(vacancy.tenant_id)
+        candidate = self.candidate_repo.upsert_by_email(
+            tenant_id, email, **candidate_fields
         )
-        if existing_app:
-            raise ValueError("El candidato ya postuló a esta vacante.")
+        # El upsert no emite post_save: se actualizan los índices derivados
+        transaction.on_commit(
+            lambda: CandidateAutocompleteService.invalidate(tenant_id)
+        )
+        if "skills" in candidate_fields:
+            self.skill_index_service.sync_candidate(candidate)
 
-        # Crear postulación
-        application = self.application_repo.create(
-            tenant=vacancy.tenant,
+        # Crear postulación (ignorada si ya postuló)
+        application = self.application_repo.create_if_absent(
+            tenant_id=vacancy.tenant_id,
             vacancy=vacancy,
             candidate=candidate,
             source=source,
             status=CandidateStatus.NEW,
         )
+        if application is None:
+            raise ValueError("El candidato ya postuló a esta vacante.")
+        self.stats_repo.apply_deltas(
+            str(vacancy.tenant_id), vacancy.id, {CandidateStatus.NEW: 1}
+        )
 
-        return application
+        application.vacancy = vacancy
+        application.candidate = candidate
+        return self.scoring_service.score_application(application)
 
     @transaction.atomic
     def update_status(
@@ -106,13 +119,26 @@ class ApplicationService:
 
         Returns:
             Application | None: Postulación actualizada.
+
+        Raises:
+            ValueError: Si el estado no es válido.
         """
-        application = self.application_repo.get_by_id(application_id)
+        if new_status not in CandidateStatus.values:
+            raise ValueError("Estado no válido.")
+
+        application = self.application_repo.get_by_id_for_update(application_id)
         if not application:
             return None
 
-        # Actualizar estado
-        self.application_repo.update_status(application, new_status)
+        # Actualizar estado y el embudo de la vacante
+        previous_status = application.status
+        if new_status != previous_status:
+            self.application_repo.update_status(application, new_status)
+            self.stats_repo.apply_deltas(
+                str(application.tenant_id),
+                application.vacancy_id,
+                {previous_status: -1, new_status: 1},
+            )
 
         # Agregar notas si existen
         if notes:
@@ -123,6 +149,82 @@ class ApplicationService:
 
         return application
 
+    @transaction.atomic
+    def delete_application(self, application: Application) -> None:
+        """Elimina una postulación y la descuenta del embudo."""
+        self.stats_repo.apply_deltas(
+            str(application.tenant_id),
+            application.vacancy_id,
+            {application.status: -1},
+        )
+        self.application_repo.delete(application)
+
+    def get_vacancy_board(
+        self,
+        vacancy_id: int,
+        limit: int,
+        status: str | None = None,
+        offset: int = 0,
+    ) -> list[dict]:
+        """
+        Tablero kanban de una vacante: primeras tarjetas por estado.
+
+        Args:
+            vacancy_id: ID de la vacante.
+            limit: Tarjetas por columna.
+            status: Si se indica, solo esa columna (para paginarla).
+            offset: Tarjetas a saltar por columna.
+
+        Returns:
+            list[dict]: Una columna por estado (en el orden del pipeline)
+                con ``status``, ``label``, ``total``, ``applications`` y
+                ``next_offset`` (None si no hay más).
+
+        Raises:
+            ValueError: Si el estado no es válido.
+        """
+        if status is not None and status not in CandidateStatus.values:
+            raise ValueError("Estado no válido.")
+
+        cards: dict[str, list[Application]] = {}
+        for application in self.application_repo.get_board(
+            vacancy_id, limit, status=status, offset=offset
+        ):
+            cards.setdefault(application.status, []).append(application)
+
+        statuses = [
+            (value, label)
+            for value, label in CandidateStatus.choices
+            if status is None or value == status
+        ]
+        # Una página vacía más allá del final no trae el total de la
+        # columna por ventana; se toma del embudo (VacancyPipelineStats).
+        fallback_totals = (
+            self.stats_repo.get_counts([vacancy_id])[vacancy_id]
+            if offset and any(value not in cards for value, _ in statuses)
+            else {}
+        )
+
+        columns = []
+        for value, label in statuses:
+            applications = cards.get(value, [])
+            total = (
+                applications[0].column_total
+                if applications
+                else fallback_totals.get(value, 0)
+            )
+            end = offset + len(applications)
+            columns.append(
+                {
+                    "status": value,
+                    "label": label,
+                    "total": total,
+                    "applications": applications,
+                    "next_offset": end if applications and end < total else None,
+                }
+            )
+        return columns
+
     def get_vacancy_applications(self, vacancy_id: int) -> list[Application]:
         """Obtiene postulaciones de una vacante."""
         return list(self.application_repo.get_by_vacancy(vacancy_id))
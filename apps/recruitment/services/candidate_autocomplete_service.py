@@ -0,0 +1,113 @@
+"""
+Servicio de aplicación para el autocompletado de candidatos.
+
+Este módulo elige, por tenant, entre un índice de prefijos en memoria
+(tenants pequeños) y la búsqueda trigram en base de datos.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import ClassVar
+
+from django.conf import settings
+
+from apps.recruitment.repositories import CandidateRepository
+
+from .candidate_prefix_index import CandidatePrefixIndex
+
+
+class CandidateAutocompleteService:
+    """
+    Servicio de aplicación para sugerencias de candidatos.
+
+    Los índices en memoria se comparten entre instancias del proceso,
+    expiran tras ``RECRUITMENT_AUTOCOMPLETE_LOCAL_INDEX_TTL`` segundos
+    y se invalidan al guardar o eliminar un candidato del tenant (o al
+    crearlo o actualizarlo por postulación o importación masiva).
+    """
+
+    # tenant_id -> (construido_en, índice o None si el tenant es grande)
+    _indexes: ClassVar[OrderedDict[str, tuple[float, CandidatePrefixIndex | None]]] = (
+        OrderedDict()
+    )
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self, candidate_repo: CandidateRepository | None = None):
+        self.candidate_repo = candidate_repo or CandidateRepository()
+
+    def suggest(
+        self, tenant_id: str, query: str, limit: int | None = None
+    ) -> list[dict]:
+        """
+        Sugiere candidatos por nombre o email.
+
+        Args:
+            tenant_id: ID del tenant.
+            query: Texto escrito por el usuario.
+            limit: Máximo de sugerencias (default y tope por settings).
+
+        Returns:
+            list[dict]: ``id``, ``first_name``, ``last_name``, ``email``
+                y ``score`` de cada sugerencia.
+
+        Raises:
+            ValueError: Si el query es más corto que el mínimo.
+        """
+        query = query.strip()
+        if len(query) < settings.RECRUITMENT_AUTOCOMPLETE_MIN_LENGTH:
+            raise ValueError(
+                "Ingrese al menos "
+                f"{settings.RECRUITMENT_AUTOCOMPLETE_MIN_LENGTH} caracteres."
+            )
+        limit = min(
+            limit or settings.RECRUITMENT_AUTOCOMPLETE_LIMIT,
+            settings.RECRUITMENT_AUTOCOMPLETE_MAX_LIMIT,
+        )
+
+        index = self._get_local_index(str(tenant_id))
+        if index is not None:
+            return index.search(query, limit)
+        return self.candidate_repo.autocomplete(tenant_id, query, limit)
+
+    @classmethod
+    def invalidate(cls, tenant_id: str) -> None:
+        """Descarta el índice en memoria de un tenant."""
+        with cls._lock:
+            cls._indexes.pop(str(tenant_id), None)
+
+    def _get_local_index(self, tenant_id: str) -> CandidatePrefixIndex | None:
+        """Obtiene (o construye) el índice en memoria del tenant."""
+        max_candidates = settings.RECRUITMENT_AUTOCOMPLETE_LOCAL_INDEX_MAX
+        if max_candidates <= 0:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._indexes.get(tenant_id)
+            if (
+                entry
+                and now - entry[0] < settings.RECRUITMENT_AUTOCOMPLETE_LOCAL_INDEX_TTL
+            ):
+                self._indexes.move_to_end(tenant_id)
+                return entry[1]
+
+        index = None
+        if self.candidate_repo.count_by_tenant(tenant_id, up_to=max_candidates + 1) <= (
+            max_candidates
+        ):
+            index = CandidatePrefixIndex(
+                self.candidate_repo.iter_values(
+                    tenant_id, ["id", "first_name", "last_name", "email"]
+                )
+            )
+
+        with self._lock:
+            self._indexes[tenant_id] = (now, index)
+            self._indexes.move_to_end(tenant_id)
+            while (
+                len(self._indexes)
+                > settings.RECRUITMENT_AUTOCOMPLETE_LOCAL_INDEX_TENANTS
+            ):
+                self._indexes.popitem(last=False)
+        return index
@@ -0,0 +1,103 @@
+"""
+Índice de prefijos en memoria para autocompletado de candidatos.
+
+Este módulo contiene una estructura inmutable que resuelve sugerencias
+por prefijo sin consultar la base de datos, pensada para tenants con
+pocos candidatos.
+"""
+
+import unicodedata
+from bisect import bisect_left
+from collections.abc import Iterable
+
+
+class CandidatePrefixIndex:
+    """
+    Índice ordenado de palabras (nombre, apellido y email) de un tenant.
+
+    Cada consulta es una búsqueda binaria por palabra; los candidatos
+    deben coincidir con todas las palabras escritas.
+    """
+
+    def __init__(self, rows: Iterable[tuple[int, str, str, str]]):
+        """
+        Construye el índice.
+
+        Args:
+            rows: Tuplas ``(id, first_name, last_name, email)``.
+        """
+        self._candidates: dict[int, dict] = {}
+        tokens: list[tuple[str, int]] = []
+        for candidate_id, first_name, last_name, email in rows:
+            self._candidates[candidate_id] = {
+                "id": candidate_id,
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": email,
+            }
+            words = _fold(f"{first_name} {last_name}").split()
+            words.append(_fold(email))
+            tokens.extend((word, candidate_id) for word in set(words))
+        tokens.sort()
+        self._tokens = tokens
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def search(self, query: str, limit: int) -> list[dict]:
+        """
+        Sugiere candidatos cuyas palabras empiezan con las del query.
+
+        Args:
+            query: Texto escrito por el usuario.
+            limit: Máximo de sugerencias.
+
+        Returns:
+            list[dict]: Mismo formato que ``CandidateRepository.autocomplete``.
+        """
+        words = _fold(query).split()
+        if not words:
+            return []
+
+        scores: dict[int, float] | None = None
+        for word in words:
+            matches = self._match_prefix(word)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {
+                    candidate_id: scores[candidate_id] + score
+                    for candidate_id, score in matches.items()
+                    if candidate_id in scores
+                }
+            if not scores:
+                return []
+
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (-item[1], self._candidates[item[0]]["last_name"]),
+        )
+        return [
+            {**self._candidates[candidate_id], "score": round(score / len(words), 4)}
+            for candidate_id, score in ranked[:limit]
+        ]
+
+    def _match_prefix(self, prefix: str) -> dict[int, float]:
+        """Mejor proporción prefijo/palabra por candidato."""
+        matches: dict[int, float] = {}
+        position = bisect_left(self._tokens, (prefix,))
+        while position < len(self._tokens):
+            token, candidate_id = self._tokens[position]
+            if not token.startswith(prefix):
+                break
+            score = len(prefix) / len(token)
+            if score > matches.get(candidate_id, 0.0):
+                matches[candidate_id] = score
+            position += 1
+        return matches
+
+
+def _fold(text: str) -> str:
+    """Minúsculas sin acentos, para que "gomez" encuentre "Gómez"."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
@@ -0,0 +1,123 @@
+"""
+Servicio de aplicación para el índice de habilidades de candidatos.
+
+Este módulo mantiene ``CandidateSkill`` sincronizado con
+``Candidate.skills`` y resuelve los filtros por habilidades.
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from itertools import islice
+
+from django.db import transaction
+from django.db.models import QuerySet
+
+from apps.recruitment.adapters.skill_normalizer import normalize_skills
+from apps.recruitment.models import Candidate
+from apps.recruitment.repositories import (
+    CandidateRepository,
+    CandidateSkillRepository,
+    SkillRepository,
+)
+
+SKILL_MATCH_MODES = ("all", "any")
+
+
+class CandidateSkillIndexService:
+    """
+    Servicio de aplicación para el índice normalizado de habilidades.
+
+    Las habilidades se normalizan como en ``extract_skills_from_profile``
+    (minúsculas) y se resuelven contra el diccionario ``Skill``, de modo
+    que los alias apuntan a la misma habilidad canónica.
+    """
+
+    def __init__(
+        self,
+        candidate_repo: CandidateRepository | None = None,
+        candidate_skill_repo: CandidateSkillRepository | None = None,
+        skill_repo: SkillRepository | None = None,
+    ):
+        self.candidate_repo = candidate_repo or CandidateRepository()
+        self.candidate_skill_repo = candidate_skill_repo or CandidateSkillRepository()
+        self.skill_repo = skill_repo or SkillRepository()
+
+    def sync_candidate(self, candidate: Candidate) -> None:
+        """Actualiza el índice de un candidato a partir de ``skills``."""
+        self.sync_rows([(candidate.pk, candidate.tenant_id, candidate.skills)])
+
+    @transaction.atomic
+    def sync_rows(self, rows: Iterable[tuple[int, str, list]]) -> int:
+        """
+        Actualiza el índice de un lote de candidatos.
+
+        Args:
+            rows: Tuplas ``(id, tenant_id, skills)``.
+
+        Returns:
+            int: Candidatos procesados.
+        """
+        normalized = {
+            candidate_id: (tenant_id, normalize_skills(skills or []))
+            for candidate_id, tenant_id, skills in rows
+        }
+        skill_ids = self.skill_repo.resolve(
+            sorted({name for _, names in normalized.values() for name in names}),
+            create=True,
+        )
+
+        by_tenant: dict[str, dict[int, set[int]]] = defaultdict(dict)
+        for candidate_id, (tenant_id, names) in normalized.items():
+            by_tenant[tenant_id][candidate_id] = {
+                skill_ids[name] for name in names if name in skill_ids
+            }
+        for tenant_id, skills_by_candidate in by_tenant.items():
+            self.candidate_skill_repo.replace(tenant_id, skills_by_candidate)
+        return len(normalized)
+
+    def backfill(self, tenant_id: str | None = None, chunk_size: int = 1000) -> int:
+        """
+        Reconstruye el índice de todos los candidatos (o de un tenant).
+
+        Cada lote se procesa en su propia transacción.
+
+        Returns:
+            int: Candidatos procesados.
+        """
+        rows = self.candidate_repo.iter_values(
+            tenant_id, ["id", "tenant_id", "skills"], chunk_size=chunk_size
+        )
+        total = 0
+        while chunk := list(islice(rows, chunk_size)):
+            total += self.sync_rows(chunk)
+        return total
+
+    def candidate_ids_with_skills(
+        self, tenant_id: str, skills: list[str], match: str = "all"
+    ) -> QuerySet | None:
+        """
+        Subconsulta de IDs de candidatos que tienen las habilidades.
+
+        Args:
+            tenant_id: ID del tenant.
+            skills: Habilidades tal como las escribió el usuario.
+            match: ``all`` (todas) o ``any`` (alguna).
+
+        Returns:
+            QuerySet | None: ``candidate_id`` para usar en ``__in``, o
+                None si ningún candidato puede coincidir.
+
+        Raises:
+            ValueError: Si ``match`` no es válido.
+        """
+        if match not in SKILL_MATCH_MODES:
+            raise ValueError("match debe ser 'all' o 'any'.")
+
+        names = normalize_skills(skills)
+        resolved = self.skill_repo.resolve(names)
+        if not resolved or (match == "all" and len(resolved) < len(names)):
+            return None
+
+        return self.candidate_skill_repo.candidate_ids_with_skills(
+            tenant_id, sorted(set(resolved.values())), match_all=match == "all"
+        )
@@ -0,0 +1,23 @@
+"""
+Respuesta pre-serializada del job board público.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class JobBoardPage:
+    """
+    Respuesta del job board lista para enviar (y cachear).
+
+    Attributes:
+        status: Código HTTP (200 o 404).
+        body: Cuerpo JSON ya renderizado.
+        etag: ETag fuerte (hash del cuerpo).
+        last_modified: Timestamp (epoch) de la última invalidación.
+    """
+
+    status: int
+    body: bytes
+    etag: str
+    last_modified: float
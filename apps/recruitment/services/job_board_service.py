@@ -0,0 +1,139 @@
+"""
+Servicio de aplicación para el job board público.
+
+Este módulo sirve el listado y el detalle de vacantes publicadas de un
+tenant (direccionado por slug) desde respuestas pre-serializadas en
+cache, de modo que la mayoría de las visitas no consultan la base de
+datos.
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.renderers import JSONRenderer
+
+from apps.recruitment.repositories import JobVacancyRepository
+from apps.recruitment.serializers import PublicJobVacancySerializer
+from apps.tenants.repositories import TenantRepository
+
+from .job_board_page import JobBoardPage
+
+NOT_FOUND_BODY = b'{"error":"No encontrado"}'
+
+
+class JobBoardService:
+    """
+    Servicio de aplicación para el job board.
+
+    Las entradas de cache se indexan por tenant y por una versión del
+    tenant (``time_ns`` de la última invalidación). Invalidar es
+    cambiar la versión: las entradas anteriores dejan de leerse y
+    expiran solas. La versión también es el ``Last-Modified``.
+    """
+
+    def __init__(
+        self,
+        vacancy_repo: JobVacancyRepository | None = None,
+        tenant_repo: TenantRepository | None = None,
+    ):
+        self.vacancy_repo = vacancy_repo or JobVacancyRepository()
+        self.tenant_repo = tenant_repo or TenantRepository()
+
+    def get_listing(self, tenant_slug: str) -> JobBoardPage:
+        """Vacantes publicadas del tenant."""
+        return self._get_page(tenant_slug, "list", self._build_listing)
+
+    def get_vacancy(self, tenant_slug: str, vacancy_id: int) -> JobBoardPage:
+        """Detalle de una vacante publicada del tenant."""
+        return self._get_page(
+            tenant_slug,
+            f"vacancy:{vacancy_id}",
+            lambda tenant_id, version: self._build_vacancy(
+                tenant_id, vacancy_id, version
+            ),
+        )
+
+    @classmethod
+    def invalidate(cls, tenant_id: str) -> None:
+        """Invalida todas las respuestas cacheadas de un tenant."""
+        key = cls._version_key(tenant_id)
+        version = max(time.time_ns(), (cache.get(key) or 0) + 1)
+        cache.set(key, version, timeout=None)
+
+    @classmethod
+    def forget_slug(cls, tenant_slug: str) -> None:
+        """Descarta la resolución cacheada de un slug."""
+        cache.delete(cls._slug_key(tenant_slug))
+
+    def _get_page(self, tenant_slug: str, name: str, build) -> JobBoardPage:
+        tenant_id = self._resolve_tenant(tenant_slug)
+        if not tenant_id:
+            return self._not_found(0)
+
+        version = self._get_version(tenant_id)
+        key = f"jobboard:{tenant_id}:{version}:{name}"
+        page = cache.get(key)
+        if page is None:
+            page = build(tenant_id, version)
+            cache.set(key, page, timeout=settings.RECRUITMENT_JOB_BOARD_CACHE_TTL)
+        return page
+
+    def _resolve_tenant(self, tenant_slug: str) -> str:
+        """ID del tenant activo con ese slug ("" si no existe)."""
+        key = self._slug_key(tenant_slug)
+        tenant_id = cache.get(key)
+        if tenant_id is None:
+            tenant = self.tenant_repo.get_by_slug(tenant_slug)
+            tenant_id = str(tenant.id) if tenant and tenant.is_active else ""
+            cache.set(key, tenant_id, timeout=settings.RECRUITMENT_JOB_BOARD_CACHE_TTL)
+        return tenant_id
+
+    def _get_version(self, tenant_id: str) -> int:
+        key = self._version_key(tenant_id)
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, time.time_ns(), timeout=None)
+            version = cache.get(key)
+        return version
+
+    def _build_listing(self, tenant_id: str, version: int) -> JobBoardPage:
+        vacancies = self.vacancy_repo.get_published_by_tenant(tenant_id).order_by(
+            "-created_at"
+        )
+        data = {"results": PublicJobVacancySerializer(vacancies, many=True).data}
+        return self._page(200, JSONRenderer().render(data), version)
+
+    def _build_vacancy(
+        self, tenant_id: str, vacancy_id: int, version: int
+    ) -> JobBoardPage:
+        vacancy = (
+            self.vacancy_repo.get_published_by_tenant(tenant_id)
+            .filter(id=vacancy_id)
+            .first()
+        )
+        if vacancy is None:
+            return self._not_found(version)
+        body = JSONRenderer().render(PublicJobVacancySerializer(vacancy).data)
+        return self._page(200, body, version)
+
+    def _not_found(self, version: int) -> JobBoardPage:
+        return self._page(404, NOT_FOUND_BODY, version)
+
+    @staticmethod
+    def _page(status: int, body: bytes, version: int) -> JobBoardPage:
+        return JobBoardPage(
+            status=status,
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+            last_modified=version / 1e9,
+        )
+
+    @staticmethod
+    def _version_key(tenant_id: str) -> str:
+        return f"jobboard:version:{tenant_id}"
+
+    @staticmethod
+    def _slug_key(tenant_slug: str) -> str:
+        return f"jobboard:slug:{tenant_slug}"
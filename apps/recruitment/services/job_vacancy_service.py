@@ -65,6 +65,30 @@ class JobVacancyService:
             **extra_fields,
         )
 
+    @transaction.atomic
+    def update_vacancy(self, vacancy: JobVacancy, **fields: Any) -> JobVacancy:
+        """
+        Actualiza una vacante.
+
+        Si cambian los requisitos incrementa ``score_version``, lo que
+        vuelve obsoletos los puntajes de sus postulaciones. La versión se
+        lee con la fila bloqueada: dos ediciones concurrentes incrementan
+        una tras otra y ninguna pisa el incremento de la otra (ni el de
+        ``bump_score_version``).
+
+        Args:
+            vacancy: Vacante a actualizar.
+            **fields: Campos a modificar.
+
+        Returns:
+            JobVacancy: Vacante actualizada.
+        """
+        current = self.repository.get_by_id_for_update(vacancy.pk)
+        vacancy.score_version = current.score_version
+        if "requirements" in fields and fields["requirements"] != current.requirements:
+            fields["score_version"] = current.score_version + 1
+        return self.repository.update(vacancy, **fields)
+
     @transaction.atomic
     def publish_vacancy(self, vacancy_id: int) -> JobVacancy | None:
         """
@@ -0,0 +1,119 @@
+"""
+Servicio de aplicación para exportaciones de reclutamiento.
+
+Este módulo contiene los casos de uso para exportar candidatos y
+postulaciones completos de un tenant (cumplimiento, auditorías) en
+streaming.
+"""
+
+from collections.abc import Iterator
+
+from django.conf import settings
+
+from apps.recruitment.adapters.export_stream import iter_export
+from apps.recruitment.repositories import ApplicationRepository, CandidateRepository
+
+# (columna exportada, lookup del ORM)
+APPLICATION_EXPORT_COLUMNS = [
+    ("application_id", "id"),
+    ("vacancy_id", "vacancy_id"),
+    ("vacancy_title", "vacancy__title"),
+    ("candidate_id", "candidate_id"),
+    ("first_name", "candidate__first_name"),
+    ("last_name", "candidate__last_name"),
+    ("email", "candidate__email"),
+    ("phone", "candidate__phone"),
+    ("linkedin_url", "candidate__linkedin_url"),
+    ("status", "status"),
+    ("source", "source"),
+    ("score", "score"),
+    ("applied_at", "applied_at"),
+    ("updated_at", "updated_at"),
+]
+
+CANDIDATE_EXPORT_COLUMNS = [
+    ("candidate_id", "id"),
+    ("first_name", "first_name"),
+    ("last_name", "last_name"),
+    ("email", "email"),
+    ("phone", "phone"),
+    ("linkedin_url", "linkedin_url"),
+    ("resume_url", "resume_url"),
+    ("skills", "skills"),
+    ("created_at", "created_at"),
+    ("updated_at", "updated_at"),
+]
+
+
+class RecruitmentExportService:
+    """
+    Servicio de aplicación para exportaciones masivas.
+
+    Proyecta solo las columnas necesarias con ``values_list`` (sin
+    instanciar modelos) y serializa fila a fila, de modo que la
+    memoria se mantiene plana aunque el tenant tenga millones de filas.
+    """
+
+    def __init__(
+        self,
+        application_repo: ApplicationRepository | None = None,
+        candidate_repo: CandidateRepository | None = None,
+    ):
+        self.application_repo = application_repo or ApplicationRepository()
+        self.candidate_repo = candidate_repo or CandidateRepository()
+
+    def export_applications(
+        self,
+        tenant_id: str,
+        file_format: str,
+        vacancy_id: int | None = None,
+        compress: bool = False,
+    ) -> Iterator[bytes]:
+        """
+        Exporta las postulaciones de un tenant (con datos del candidato).
+
+        Args:
+            tenant_id: ID del tenant.
+            file_format: ``csv`` o ``ndjson``.
+            vacancy_id: Limita la exportación a una vacante.
+            compress: Comprime el flujo con gzip.
+
+        Returns:
+            Iterator[bytes]: Fragmentos del archivo.
+
+        Raises:
+            ValueError: Si el formato no está soportado.
+        """
+        header, fields = zip(*APPLICATION_EXPORT_COLUMNS, strict=True)
+        rows = self.application_repo.iter_values(
+            tenant_id,
+            list(fields),
+            vacancy_id=vacancy_id,
+            chunk_size=settings.RECRUITMENT_EXPORT_CHUNK_SIZE,
+        )
+        return iter_export(list(header), rows, file_format, compress)
+
+    def export_candidates(
+        self, tenant_id: str, file_format: str, compress: bool = False
+    ) -> Iterator[bytes]:
+        """
+        Exporta los candidatos de un tenant.
+
+        Args:
+            tenant_id: ID del tenant.
+            file_format: ``csv`` o ``ndjson``.
+            compress: Comprime el flujo con gzip.
+
+        Returns:
+            Iterator[bytes]: Fragmentos del archivo.
+
+        Raises:
+            ValueError: Si el formato no está soportado.
+        """
+        header, fields = zip(*CANDIDATE_EXPORT_COLUMNS, strict=True)
+        rows = self.candidate_repo.iter_values(
+            tenant_id,
+            list(fields),
+            chunk_size=settings.RECRUITMENT_EXPORT_CHUNK_SIZE,
+        )
+        return iter_export(list(header), rows, file_format, compress)
@@ -0,0 +1,81 @@
+"""
+Servicio de aplicación para el embudo del pipeline por vacante.
+
+Este módulo lee y reconstruye ``VacancyPipelineStats``. Los
+incrementos los aplican los casos de uso que crean postulaciones o
+cambian su estado.
+"""
+
+from django.db import transaction
+
+from apps.recruitment.models import CandidateStatus, JobVacancy
+from apps.recruitment.repositories import (
+    JobVacancyRepository,
+    VacancyPipelineStatsRepository,
+)
+
+
+class VacancyPipelineStatsService:
+    """
+    Servicio de aplicación para el embudo de postulaciones.
+
+    Leer el embudo cuesta una consulta por página de vacantes,
+    independiente del número de postulaciones.
+    """
+
+    def __init__(
+        self,
+        stats_repo: VacancyPipelineStatsRepository | None = None,
+        vacancy_repo: JobVacancyRepository | None = None,
+    ):
+        self.stats_repo = stats_repo or VacancyPipelineStatsRepository()
+        self.vacancy_repo = vacancy_repo or JobVacancyRepository()
+
+    def get_funnels(self, vacancies: list[JobVacancy]) -> list[dict]:
+        """
+        Embudo de cada vacante, con todas las etapas en orden.
+
+        Returns:
+            list[dict]: ``vacancy``, ``total`` y ``stages`` (``status``,
+                ``label``, ``count``) por vacante.
+        """
+        counts = self.stats_repo.get_counts([vacancy.id for vacancy in vacancies])
+        return [
+            {
+                "vacancy": vacancy.id,
+                "title": vacancy.title,
+                "total": sum(counts[vacancy.id].values()),
+                "stages": [
+                    {
+                        "status": value,
+                        "label": label,
+                        "count": counts[vacancy.id].get(value, 0),
+                    }
+                    for value, label in CandidateStatus.choices
+                ],
+            }
+            for vacancy in vacancies
+        ]
+
+    def rebuild(self, vacancy_ids: list[int] | None = None) -> int:
+        """
+        Recalcula los contadores desde las postulaciones.
+
+        Cada vacante se reconstruye en su propia transacción.
+
+        Args:
+            vacancy_ids: Vacantes a reconstruir (default: todas).
+
+        Returns:
+            int: Vacantes reconstruidas.
+        """
+        vacancy_ids = vacancy_ids or self.vacancy_repo.get_ids()
+        rebuilt = 0
+        for vacancy_id in vacancy_ids:
+            vacancy = self.vacancy_repo.get_by_id(vacancy_id)
+            if not vacancy:
+                continue
+            with transaction.atomic():
+                self.stats_repo.rebuild(str(vacancy.tenant_id), vacancy.id)
+            rebuilt += 1
+        return rebuilt
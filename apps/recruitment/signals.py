@@ -0,0 +1,62 @@
+"""
+Señales de la app recruitment.
+
+Mantienen coherentes las estructuras en memoria derivadas de los
+candidatos (índice de autocompletado e índice de habilidades) y el
+cache del job board público.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.recruitment.models import Candidate, JobVacancy
+from apps.recruitment.services import (
+    CandidateAutocompleteService,
+    CandidateSkillIndexService,
+    JobBoardService,
+)
+from apps.tenants.models import Tenant
+
+
+@receiver(post_save, sender=Candidate)
+@receiver(post_delete, sender=Candidate)
+def invalidate_candidate_autocomplete(sender, instance: Candidate, **kwargs) -> None:
+    """Descarta el índice de autocompletado del tenant del candidato."""
+    CandidateAutocompleteService.invalidate(instance.tenant_id)
+
+
+@receiver(post_save, sender=Candidate)
+def sync_candidate_skill_index(
+    sender, instance: Candidate, update_fields=None, **kwargs
+) -> None:
+    """Sincroniza ``CandidateSkill`` cuando pueden haber cambiado las skills."""
+    if update_fields is not None and "skills" not in update_fields:
+        return
+    CandidateSkillIndexService().sync_candidate(instance)
+
+
+@receiver(post_save, sender=JobVacancy)
+@receiver(post_delete, sender=JobVacancy)
+def invalidate_job_board(sender, instance: JobVacancy, **kwargs) -> None:
+    """
+    Invalida el job board del tenant al crear, actualizar, publicar
+    (``publish()``), cerrar (``close()``) o eliminar una vacante.
+
+    Se ejecuta al confirmar la transacción para que ninguna lectura
+    concurrente vuelva a cachear el estado anterior.
+    """
+    tenant_id = str(instance.tenant_id)
+    transaction.on_commit(lambda: JobBoardService.invalidate(tenant_id))
+
+
+@receiver(post_save, sender=Tenant)
+def invalidate_tenant_job_board(sender, instance: Tenant, **kwargs) -> None:
+    """Refresca el slug y el job board al modificar (o desactivar) el tenant."""
+    tenant_id, slug = str(instance.id), instance.slug
+
+    def invalidate():
+        JobBoardService.forget_slug(slug)
+        JobBoardService.invalidate(tenant_id)
+
+    transaction.on_commit(invalidate)
@@ -0,0 +1,57 @@
+"""
+Tareas asíncronas (Celery) de la app recruitment.
+"""
+
+from celery import shared_task
+
+from apps.recruitment.services import (
+    ApplicationArchiveService,
+    ApplicationIntakeService,
+    ApplicationPartitionService,
+    ApplicationScoringService,
+)
+
+
+@shared_task(name="recruitment.process_application_intake")
+def process_application_intake(batch_size: int | None = None) -> dict[str, int]:
+    """
+    Drena la cola de postulaciones públicas en lotes.
+
+    Varias ejecuciones concurrentes se reparten la cola (SKIP LOCKED),
+    por lo que es seguro encolar esta tarea en cada recepción.
+    """
+    return ApplicationIntakeService().process_pending(batch_size)
+
+
+@shared_task(name="recruitment.recompute_vacancy_scores")
+def recompute_vacancy_scores(vacancy_id: int) -> int:
+    """
+    Recalcula los puntajes obsoletos de las postulaciones de una vacante.
+
+    Procesa por lotes de ``RECRUITMENT_SCORING_CHUNK_SIZE`` y solo toca
+    las filas cuyo ``score_version`` quedó atrás, por lo que repetir la
+    tarea es seguro.
+    """
+    return ApplicationScoringService().recompute_vacancy(vacancy_id)
+
+
+@shared_task(name="recruitment.archive_closed_vacancies")
+def archive_closed_vacancies(older_than_days: int | None = None) -> dict[str, int]:
+    """
+    Archiva las postulaciones de vacantes cerradas hace más de N días.
+
+    Pensada para ejecutarse periódicamente (Celery beat); cada lote se
+    mueve en su propia transacción, así que repetirla es seguro.
+    """
+    return ApplicationArchiveService().archive_closed_vacancies(older_than_days)
+
+
+@shared_task(name="recruitment.create_application_partitions")
+def create_application_partitions(months_ahead: int | None = None) -> list[str]:
+    """
+    Crea por adelantado las particiones mensuales de postulaciones.
+
+    Sin efecto si la tabla no está particionada; pensada para Celery
+    beat (mensual o más frecuente).
+    """
+    return ApplicationPartitionService().ensure_future_partitions(months_ahead)
@@ -0,0 +1,110 @@
+from datetime import timedelta
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+
+from apps.recruitment.models import (
+    Application,
+    ArchivedApplication,
+    CandidateStatus,
+    JobVacancy,
+)
+from apps.recruitment.repositories import VacancyPipelineStatsRepository
+from apps.recruitment.services import ApplicationArchiveService, ApplicationService
+from apps.tenants.models import Tenant
+
+
+@pytest.fixture
+def applications(vacancy):
+    service = ApplicationService()
+    created = [
+        service.apply_to_vacancy(
+            vacancy.id,
+            {"email": f"c{i}@x.com", "first_name": f"C{i}", "last_name": "X"},
+        )
+        for i in range(3)
+    ]
+    service.update_status(created[0].id, CandidateStatus.HIRED)
+    return created
+
+
+def _close(vacancy, days_ago):
+    vacancy.close()
+    JobVacancy.objects.filter(id=vacancy.id).update(
+        closed_at=timezone.now() - timedelta(days=days_ago)
+    )
+
+
+def _snapshot(model, ids):
+    return sorted(
+        model.objects.filter(id__in=ids).values_list(
+            "id", "candidate_id", "status", "score", "applied_at"
+        )
+    )
+
+
+def test_archive_and_restore_round_trip(api_client, vacancy, applications):
+    ids = [application.id for application in applications]
+    before = _snapshot(Application, ids)
+    counts = VacancyPipelineStatsRepository().get_counts([vacancy.id])
+    _close(vacancy, days_ago=400)
+
+    totals = ApplicationArchiveService().archive_closed_vacancies(365, chunk_size=2)
+
+    assert totals == {"vacancies": 1, "applications": 3}
+    assert not Application.objects.filter(vacancy=vacancy).exists()
+    assert _snapshot(ArchivedApplication, ids) == before
+    assert VacancyPipelineStatsRepository().get_counts([vacancy.id]) == counts
+
+    response = api_client.get(f"/api/recruitment/applications/{ids[0]}/")
+    assert response.status_code == 200
+    assert response["X-Archived"] == "true"
+    assert response.json()["status"] == CandidateStatus.HIRED
+
+    assert ApplicationArchiveService().restore_vacancy(vacancy.id, chunk_size=2) == 3
+    assert _snapshot(Application, ids) == before
+    assert not ArchivedApplication.objects.exists()
+
+
+def test_recent_or_open_vacancies_are_not_archived(tenant, vacancy, applications):
+    _close(vacancy, days_ago=10)
+    JobVacancy.objects.create(tenant=tenant, title="Abierta")
+
+    totals = ApplicationArchiveService().archive_closed_vacancies(365)
+
+    assert totals == {"vacancies": 0, "applications": 0}
+    assert Application.objects.filter(vacancy=vacancy).count() == 3
+
+
+def test_restore_keeps_archived_rows_that_would_duplicate(vacancy, applications):
+    _close(vacancy, days_ago=400)
+    ApplicationArchiveService().archive_closed_vacancies(365)
+    ApplicationService().apply_to_vacancy(
+        vacancy.id, {"email": "c1@x.com", "first_name": "C1", "last_name": "X"}
+    )
+
+    restored = ApplicationArchiveService().restore_vacancy(vacancy.id)
+
+    assert restored == 2
+    assert list(ArchivedApplication.objects.values_list("id", flat=True)) == [
+        applications[1].id
+    ]
+    assert Application.objects.filter(vacancy=vacancy).count() == 3
+
+
+def test_archived_application_of_another_tenant_is_not_found(
+    tenant_client, vacancy, applications
+):
+    _close(vacancy, days_ago=400)
+    ApplicationArchiveService().archive_closed_vacancies(365)
+    other = tenant_client(Tenant.objects.create(name="Globex", slug="globex"))
+
+    response = other.get(f"/api/recruitment/applications/{applications[0].id}/")
+
+    assert response.status_code == 404
+
+
+def test_archive_command_rejects_negative_days():
+    with pytest.raises(CommandError, match="negativo"):
+        call_command("archive_applications", "--days", "-1")
@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from apps.recruitment.models import ApplicationIdempotencyKey
+from apps.recruitment.services import ApplicationIdempotencyService
+
+
+def test_first_stored_response_wins(vacancy):
+    service = ApplicationIdempotencyService()
+    service.store_response(vacancy.id, "key-1", 201, {"id": 1})
+    service.store_response(vacancy.id, "key-1", 400, {"error": "ya postuló"})
+
+    assert service.get_stored_response(vacancy.id, "key-1") == (201, {"id": 1})
+    assert ApplicationIdempotencyKey.objects.count() == 1
+
+
+def test_expired_response_is_replaced(vacancy):
+    service = ApplicationIdempotencyService()
+    service.store_response(vacancy.id, "key-1", 201, {"id": 1})
+    ApplicationIdempotencyKey.objects.update(
+        created_at=ApplicationIdempotencyKey.objects.get().created_at
+        - service.ttl
+        - timedelta(seconds=1)
+    )
+    assert service.get_stored_response(vacancy.id, "key-1") is None
+
+    service.store_response(vacancy.id, "key-1", 201, {"id": 2})
+
+    assert service.get_stored_response(vacancy.id, "key-1") == (201, {"id": 2})
+    assert ApplicationIdempotencyKey.objects.count() == 1
@@ -0,0 +1,61 @@
+import pytest
+
+from apps.recruitment.models import Application, CandidateStatus
+from apps.recruitment.repositories import (
+    ApplicationRepository,
+    VacancyPipelineStatsRepository,
+)
+from apps.recruitment.services import ApplicationImportService, ApplicationService
+
+
+def _rows(*emails):
+    return [
+        (line, {"email": email, "first_name": "Ana", "last_name": "Pérez"})
+        for line, email in enumerate(emails, start=2)
+    ]
+
+
+def _new_count(vacancy):
+    counts = VacancyPipelineStatsRepository().get_counts([vacancy.id])[vacancy.id]
+    return counts.get(CandidateStatus.NEW, 0)
+
+
+def test_import_counts_created_applications(vacancy):
+    service = ApplicationImportService()
+
+    report = service.import_rows(vacancy.id, _rows("a@x.com", "b@x.com"))
+    assert (report.created, report.failed) == (2, 0)
+
+    report = service.import_rows(vacancy.id, _rows("b@x.com", "c@x.com"))
+    assert (report.created, report.failed) == (1, 1)
+    assert Application.objects.filter(vacancy=vacancy).count() == 3
+    assert _new_count(vacancy) == 3
+
+
+def test_import_skips_rows_inserted_concurrently(vacancy, monkeypatch):
+    ApplicationService().apply_to_vacancy(
+        vacancy.id, {"email": "a@x.com", "first_name": "Ana", "last_name": "Pérez"}
+    )
+    # Simula otro proceso que postuló entre la lectura y la inserción
+    monkeypatch.setattr(
+        ApplicationRepository, "get_applied_candidate_ids", lambda *args: set()
+    )
+
+    report = ApplicationImportService().import_rows(
+        vacancy.id, _rows("a@x.com", "b@x.com")
+    )
+
+    assert report.created == 1
+    assert report.errors == [
+        {"row": 2, "errors": "El candidato ya postuló a esta vacante."}
+    ]
+    assert Application.objects.filter(vacancy=vacancy).count() == 2
+    assert _new_count(vacancy) == 2
+
+
+def test_import_rejects_unknown_source(vacancy):
+    with pytest.raises(ValueError, match="Fuente"):
+        ApplicationImportService().import_rows(
+            vacancy.id, _rows("a@x.com"), source="fax"
+        )
+    assert not Application.objects.exists()
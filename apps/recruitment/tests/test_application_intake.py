@@ -0,0 +1,70 @@
+import pytest
+
+from apps.recruitment.models import Application, ApplicationIntake, IntakeStatus
+from apps.recruitment.services import ApplicationIntakeService, ApplicationService
+
+
+def _submit(service, vacancy_id, email):
+    return service.submit(
+        vacancy_id, {"email": email, "first_name": "Ana", "last_name": "Pérez"}
+    )
+
+
+def test_process_batch_isolates_rejections(vacancy):
+    service = ApplicationIntakeService()
+    ok = _submit(service, vacancy.id, "ana@example.com")
+    duplicate = _submit(service, vacancy.id, "ana@example.com")
+    missing = _submit(service, 999_999, "luis@example.com")
+
+    counts = service.process_batch()
+
+    assert counts == {"accepted": 1, "rejected": 2, "failed": 0}
+    ok.refresh_from_db()
+    assert ok.status == IntakeStatus.ACCEPTED
+    assert ok.application is not None
+    for intake in (duplicate, missing):
+        intake.refresh_from_db()
+        assert intake.status == IntakeStatus.REJECTED
+        assert intake.error
+
+
+def test_unexpected_error_fails_only_its_intake(vacancy, monkeypatch):
+    apply_to_vacancy = ApplicationService.apply_to_vacancy
+
+    def flaky_apply(self, vacancy_id, candidate_data, source="website"):
+        application = apply_to_vacancy(self, vacancy_id, candidate_data, source)
+        if candidate_data["email"] == "poison@example.com":
+            raise RuntimeError("boom")
+        return application
+
+    monkeypatch.setattr(ApplicationService, "apply_to_vacancy", flaky_apply)
+    service = ApplicationIntakeService()
+    poison = _submit(service, vacancy.id, "poison@example.com")
+    ok = _submit(service, vacancy.id, "ana@example.com")
+
+    assert service.process_pending() == {"accepted": 1, "rejected": 0, "failed": 1}
+
+    poison.refresh_from_db()
+    assert poison.status == IntakeStatus.FAILED
+    assert poison.error
+    assert poison.processed_at is not None
+    ok.refresh_from_db()
+    assert ok.status == IntakeStatus.ACCEPTED
+    # El savepoint revierte la postulación creada antes del error
+    assert list(Application.objects.values_list("candidate__email", flat=True)) == [
+        "ana@example.com"
+    ]
+    assert not ApplicationIntake.objects.filter(status=IntakeStatus.PENDING).exists()
+
+
+@pytest.mark.parametrize("batch_size", [1, 2])
+def test_process_pending_drains_queue(vacancy, batch_size):
+    service = ApplicationIntakeService()
+    for n in range(3):
+        _submit(service, vacancy.id, f"c{n}@example.com")
+
+    assert service.process_pending(batch_size) == {
+        "accepted": 3,
+        "rejected": 0,
+        "failed": 0,
+    }
@@ -0,0 +1,173 @@
+from datetime import timedelta
+
+import pytest
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+from apps.recruitment.models import (
+    Application,
+    ApplicationIntake,
+    Candidate,
+)
+from apps.recruitment.repositories import ApplicationRepository
+from apps.recruitment.repositories.application_partition_repository import (
+    KEY_TABLE,
+)
+from apps.recruitment.services import ApplicationPartitionService
+
+pytestmark = [
+    pytest.mark.postgresql,
+    pytest.mark.skipif(
+        connection.vendor != "postgresql",
+        reason="El particionado requiere PostgreSQL 13 o superior.",
+    ),
+]
+
+
+@pytest.fixture(autouse=True)
+def immediate_constraints(db):
+    """
+    Verifica las FKs al momento.
+
+    Cada paso corre en su propia transacción en producción; dentro de la
+    transacción del test, las verificaciones diferidas pendientes impiden
+    el ALTER TABLE de ``swap``.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+
+
+@pytest.fixture
+def candidates(tenant):
+    return [
+        Candidate.objects.create(
+            tenant=tenant,
+            first_name=f"Ana{i}",
+            last_name="Pérez",
+            email=f"ana{i}@example.com",
+        )
+        for i in range(6)
+    ]
+
+
+@pytest.fixture
+def partitioned(tenant, vacancy, candidates):
+    """Convierte la tabla con tres postulaciones de meses distintos."""
+    now = timezone.now()
+    for months, candidate in enumerate(candidates[:3]):
+        application = Application.objects.create(
+            tenant=tenant, vacancy=vacancy, candidate=candidate
+        )
+        Application.objects.filter(id=application.id).update(
+            applied_at=now - timedelta(days=31 * months)
+        )
+    service = ApplicationPartitionService()
+    service.run_step("prepare")
+    service.run_step("copy", chunk_size=2)
+    service.run_step("swap")
+    return service
+
+
+def test_copy_replay_swap_keeps_rows_and_references(tenant, vacancy, candidates):
+    now = timezone.now()
+    applications = []
+    for months, candidate in enumerate(candidates[:4]):
+        application = Application.objects.create(
+            tenant=tenant, vacancy=vacancy, candidate=candidate
+        )
+        Application.objects.filter(id=application.id).update(
+            applied_at=now - timedelta(days=31 * months)
+        )
+        applications.append(application)
+    intake = ApplicationIntake.objects.create(
+        vacancy_id=vacancy.id, payload={}, application=applications[3]
+    )
+    service = ApplicationPartitionService()
+
+    service.run_step("prepare")
+    service.run_step("copy", chunk_size=2)
+    # Cambios durante la copia: el swap los vuelve a copiar
+    Application.objects.filter(id=applications[0].id).update(score=90)
+    Application.objects.filter(id=applications[1].id).delete()
+    replacement = Application.objects.create(
+        tenant=tenant, vacancy=vacancy, candidate=candidates[1]
+    )
+    summary = service.run_step("swap")
+
+    assert service.is_partitioned()
+    assert summary == "Tabla particionada activa (4 filas)."
+    assert set(Application.objects.values_list("id", flat=True)) == {
+        applications[0].id,
+        applications[2].id,
+        applications[3].id,
+        replacement.id,
+    }
+    assert Application.objects.get(id=applications[0].id).score == 90
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT confrelid::regclass::text FROM pg_constraint "
+            "WHERE conrelid = to_regclass(%s) AND contype = 'f' "
+            "AND confrelid = to_regclass(%s)",
+            [ApplicationIntake._meta.db_table, KEY_TABLE],
+        )
+        assert cursor.fetchall() == [(KEY_TABLE,)]
+    assert ApplicationIntake.objects.get(id=intake.id).application == applications[3]
+    with pytest.raises(IntegrityError), transaction.atomic():
+        ApplicationIntake.objects.create(
+            vacancy_id=vacancy.id, payload={}, application_id=replacement.id + 1000
+        )
+
+
+def test_copy_skips_pair_reserved_by_deleted_row(tenant, vacancy, candidates):
+    first = Application.objects.create(
+        tenant=tenant, vacancy=vacancy, candidate=candidates[0]
+    )
+    other = Application.objects.create(
+        tenant=tenant, vacancy=vacancy, candidate=candidates[1]
+    )
+    service = ApplicationPartitionService()
+    service.run_step("prepare")
+    service.partition_repo.copy_chunk(0, other.id, 1)
+    first.delete()
+    again = Application.objects.create(
+        tenant=tenant, vacancy=vacancy, candidate=candidates[0]
+    )
+
+    service.run_step("copy")
+    service.run_step("swap")
+
+    assert set(Application.objects.values_list("id", flat=True)) == {
+        other.id,
+        again.id,
+    }
+
+
+def test_duplicate_insert_raises_integrity_error(partitioned, tenant, vacancy):
+    candidate = Application.objects.order_by("id").first().candidate
+
+    with pytest.raises(IntegrityError), transaction.atomic():
+        Application.objects.create(tenant=tenant, vacancy=vacancy, candidate=candidate)
+
+    assert Application.objects.filter(candidate=candidate).count() == 1
+
+
+def test_insert_if_absent_skips_duplicates(partitioned, tenant, vacancy, candidates):
+    repo = ApplicationRepository()
+
+    skipped = repo.create_if_absent(
+        tenant_id=tenant.id, vacancy_id=vacancy.id, candidate_id=candidates[0].id
+    )
+    created = repo.create_if_absent(
+        tenant_id=tenant.id, vacancy_id=vacancy.id, candidate_id=candidates[3].id
+    )
+    inserted = repo.bulk_create_if_absent(
+        [
+            Application(tenant=tenant, vacancy=vacancy, candidate=candidate)
+            for candidate in [candidates[1], candidates[4], candidates[4]]
+        ]
+    )
+
+    assert skipped is None
+    assert created.candidate_id == candidates[3].id
+    assert [a.candidate_id for a in inserted] == [candidates[4].id]
+    assert Application.objects.count() == 5
@@ -0,0 +1,58 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.db import connections
+
+from apps.recruitment.models import Application, Candidate, CandidateStatus
+from apps.recruitment.repositories import VacancyPipelineStatsRepository
+from apps.recruitment.services import ApplicationService
+
+CANDIDATE = {"email": "ana@example.com", "first_name": "Ana", "last_name": "Pérez"}
+
+
+def _counts(vacancy):
+    return VacancyPipelineStatsRepository().get_counts([vacancy.id])[vacancy.id]
+
+
+def test_second_apply_is_rejected_without_touching_stats(vacancy):
+    service = ApplicationService()
+    service.apply_to_vacancy(vacancy.id, dict(CANDIDATE))
+    counts = _counts(vacancy)
+    updated_at = Candidate.objects.get().updated_at
+
+    with pytest.raises(ValueError, match="ya postuló"):
+        service.apply_to_vacancy(vacancy.id, dict(CANDIDATE))
+
+    assert Application.objects.filter(vacancy=vacancy).count() == 1
+    assert Candidate.objects.get().updated_at == updated_at
+    assert _counts(vacancy) == counts == {CandidateStatus.NEW: 1}
+
+
+def test_apply_updates_existing_candidate(vacancy, tenant):
+    Candidate.objects.create(tenant=tenant, **{**CANDIDATE, "first_name": "Anita"})
+
+    ApplicationService().apply_to_vacancy(vacancy.id, dict(CANDIDATE))
+
+    candidate = Candidate.objects.get()
+    assert candidate.first_name == "Ana"
+    assert Application.objects.get().candidate_id == candidate.id
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_applies_create_one_application(vacancy):
+    def apply(_):
+        try:
+            ApplicationService().apply_to_vacancy(vacancy.id, dict(CANDIDATE))
+            return True
+        except ValueError:
+            return False
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(apply, range(8)))
+
+    assert results.count(True) == 1
+    assert Candidate.objects.count() == 1
+    assert Application.objects.filter(vacancy=vacancy).count() == 1
+    assert _counts(vacancy) == {CandidateStatus.NEW: 1}
@@ -0,0 +1,50 @@
+import pytest
+
+from apps.recruitment.services import (
+    ApplicationImportService,
+    ApplicationService,
+    CandidateAutocompleteService,
+)
+
+
+@pytest.fixture(autouse=True)
+def local_index(settings, tenant):
+    settings.RECRUITMENT_AUTOCOMPLETE_LOCAL_INDEX_MAX = 100
+    CandidateAutocompleteService.invalidate(tenant.id)
+    yield
+    CandidateAutocompleteService.invalidate(tenant.id)
+
+
+def _suggest(tenant, query):
+    return [
+        suggestion["email"]
+        for suggestion in CandidateAutocompleteService().suggest(tenant.id, query)
+    ]
+
+
+def test_apply_invalidates_local_index(
+    tenant, vacancy, django_capture_on_commit_callbacks
+):
+    assert _suggest(tenant, "zoe") == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ApplicationService().apply_to_vacancy(
+            vacancy.id,
+            {"email": "zoe@example.com", "first_name": "Zoe", "last_name": "Ruiz"},
+        )
+
+    assert _suggest(tenant, "zoe") == ["zoe@example.com"]
+
+
+def test_import_invalidates_local_index(
+    tenant, vacancy, django_capture_on_commit_callbacks
+):
+    assert _suggest(tenant, "zoe") == []
+
+    with django_capture_on_commit_callbacks(execute=True):
+        ApplicationImportService().import_rows(
+            vacancy.id,
+            [(2, {"email": "zoe@example.com", "first_name": "Zoe", "last_name": "R"})],
+        )
+
+    assert _suggest(tenant, "zoe") == ["zoe@example.com"]
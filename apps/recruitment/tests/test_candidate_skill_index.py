@@ -0,0 +1,92 @@
+import io
+
+from apps.recruitment.adapters.import_row_reader import iter_csv_rows
+from apps.recruitment.models import CandidateSkill
+from apps.recruitment.services import ApplicationImportService, ApplicationService
+
+
+def _emails(response):
+    assert response.status_code == 200, response.data
+    rows = response.data.get("results", response.data)
+    return sorted(row["email"] for row in rows)
+
+
+def test_apply_and_import_feed_skill_filter(vacancy, api_client):
+    ApplicationService().apply_to_vacancy(
+        vacancy.id,
+        {
+            "email": "ana@example.com",
+            "first_name": "Ana",
+            "last_name": "Pérez",
+            "skills": ["Python", "Django"],
+        },
+    )
+    assert CandidateSkill.objects.count() == 2
+
+    report = ApplicationImportService().import_rows(
+        vacancy.id,
+        [
+            (
+                2,
+                {
+                    "email": "luis@example.com",
+                    "first_name": "Luis",
+                    "last_name": "Gómez",
+                    "skills": ["python", "react"],
+                },
+            )
+        ],
+    )
+    assert report.created == 1
+
+    csv_file = io.BytesIO(
+        b'email,first_name,last_name,skills\neva@example.com,Eva,Ruiz,"Django, Go"\n'
+    )
+    report = ApplicationImportService().import_rows(vacancy.id, iter_csv_rows(csv_file))
+    assert (report.created, report.failed) == (1, 0)
+
+    url = "/api/recruitment/candidates/"
+    assert _emails(api_client.get(url, {"skills": "python"})) == [
+        "ana@example.com",
+        "luis@example.com",
+    ]
+    assert _emails(api_client.get(url, {"skills": "python,django"})) == [
+        "ana@example.com"
+    ]
+    assert _emails(api_client.get(url, {"skills": "django,go", "match": "any"})) == [
+        "ana@example.com",
+        "eva@example.com",
+    ]
+
+
+def test_reimport_updates_skill_index(vacancy, tenant):
+    ApplicationService().apply_to_vacancy(
+        vacancy.id,
+        {
+            "email": "ana@example.com",
+            "first_name": "Ana",
+            "last_name": "Pérez",
+            "skills": ["Python"],
+        },
+    )
+
+    ApplicationImportService().import_rows(
+        vacancy.id,
+        [
+            (
+                2,
+                {
+                    "email": "ana@example.com",
+                    "first_name": "Ana",
+                    "last_name": "Pérez",
+                    "skills": ["Go"],
+                },
+            )
+        ],
+    )
+
+    assert list(
+        CandidateSkill.objects.filter(tenant=tenant).values_list(
+            "skill__name", flat=True
+        )
+    ) == ["go"]
@@ -0,0 +1,93 @@
+from importlib import import_module
+
+import pytest
+from django.db import connection
+
+from apps.recruitment.models import Candidate, JobVacancy
+from apps.tenants.models import Tenant
+
+postgresql_only = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Búsqueda tsvector de PostgreSQL."
+)
+
+
+@pytest.fixture(autouse=True)
+def search_vectors(db):
+    """En PostgreSQL crea las columnas de ``0007`` (los tests no migran)."""
+    if connection.vendor == "postgresql":
+        migration = import_module("apps.recruitment.migrations.0007_search_vectors")
+        with connection.schema_editor() as schema_editor:
+            migration.add_search_vectors(None, schema_editor)
+
+
+@pytest.fixture
+def candidates(tenant):
+    other = Tenant.objects.create(name="Globex", slug="globex")
+    Candidate.objects.create(
+        tenant=other, first_name="Ana", last_name="Ajena", email="ana@globex.com"
+    )
+    return {
+        name: Candidate.objects.create(
+            tenant=tenant,
+            first_name=name,
+            last_name=last_name,
+            email=f"{name.lower()}@acme.com",
+            skills=skills,
+        )
+        for name, last_name, skills in [
+            ("Ana", "Pérez", ["Python", "Django"]),
+            ("Beto", "Gómez", ["Java"]),
+            ("Carla", "Ana", ["Python"]),
+        ]
+    }
+
+
+def _search(api_client, url, **params):
+    response = api_client.get(url, params)
+    assert response.status_code == 200
+    return [row["id"] for row in response.json()["results"]]
+
+
+def test_candidate_search_matches_every_term_in_tenant(api_client, candidates):
+    found = _search(api_client, "/api/recruitment/candidates/", search="ana python")
+
+    assert sorted(found) == sorted([candidates["Ana"].id, candidates["Carla"].id])
+
+
+def test_candidate_search_without_matches_is_empty(api_client, candidates):
+    assert _search(api_client, "/api/recruitment/candidates/", search="rust") == []
+    assert len(_search(api_client, "/api/recruitment/candidates/", search=" ")) == 3
+
+
+@postgresql_only
+def test_candidate_search_ranks_and_supports_websearch_syntax(
+    api_client, tenant, candidates
+):
+    # Coincidencia solo en skills (peso B): último aunque sea el más nuevo
+    zoe = Candidate.objects.create(
+        tenant=tenant, first_name="Zoe", last_name="Ruiz", skills=["Ana"]
+    )
+
+    ranked = _search(api_client, "/api/recruitment/candidates/", search="ana")
+    excluded = _search(
+        api_client, "/api/recruitment/candidates/", search="python -django"
+    )
+
+    assert set(ranked[:2]) == {candidates["Ana"].id, candidates["Carla"].id}
+    assert ranked[2:] == [zoe.id]
+    assert excluded == [candidates["Carla"].id]
+
+
+def test_vacancy_search_by_language(api_client, tenant):
+    vacancy = JobVacancy.objects.create(
+        tenant=tenant,
+        title="Desarrolladora backend",
+        description="Trabajarás con bases de datos",
+        requirements="Python",
+    )
+    JobVacancy.objects.create(tenant=tenant, title="Diseñadora UX")
+
+    assert _search(
+        api_client, "/api/recruitment/vacancies/", search="backend", lang="es"
+    ) == [vacancy.id]
+    assert _search(api_client, "/api/recruitment/vacancies/", search="kotlin") == []
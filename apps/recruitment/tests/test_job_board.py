@@ -0,0 +1,85 @@
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from apps.recruitment.models import JobVacancy
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def client():
+    return APIClient()
+
+
+@pytest.fixture
+def published(vacancy, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        vacancy.publish()
+    return vacancy
+
+
+def test_listing_serves_published_vacancies_from_cache(
+    client, tenant, published, django_assert_num_queries
+):
+    JobVacancy.objects.create(tenant=tenant, title="Borrador")
+
+    first = client.get("/api/recruitment/jobs/acme/")
+    with django_assert_num_queries(0):
+        second = client.get("/api/recruitment/jobs/acme/")
+
+    assert first.status_code == 200
+    assert [job["id"] for job in first.json()["results"]] == [published.id]
+    assert second.content == first.content
+    assert second["ETag"] == first["ETag"]
+
+
+def test_conditional_get_returns_not_modified(client, published):
+    page = client.get(f"/api/recruitment/jobs/acme/{published.id}/")
+
+    by_etag = client.get(
+        f"/api/recruitment/jobs/acme/{published.id}/",
+        HTTP_IF_NONE_MATCH=page["ETag"],
+    )
+    by_date = client.get(
+        f"/api/recruitment/jobs/acme/{published.id}/",
+        HTTP_IF_MODIFIED_SINCE=page["Last-Modified"],
+    )
+
+    assert page.json()["title"] == published.title
+    assert (by_etag.status_code, by_date.status_code) == (304, 304)
+    assert by_etag.content == b""
+
+
+def test_closing_a_vacancy_invalidates_the_board(
+    client, published, django_capture_on_commit_callbacks
+):
+    before = client.get("/api/recruitment/jobs/acme/")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        published.close()
+    after = client.get("/api/recruitment/jobs/acme/", HTTP_IF_NONE_MATCH=before["ETag"])
+
+    assert after.status_code == 200
+    assert after.json()["results"] == []
+    assert client.get(f"/api/recruitment/jobs/acme/{published.id}/").status_code == 404
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/recruitment/jobs/unknown/",
+        "/api/recruitment/jobs/acme/999999/",
+        "/api/recruitment/jobs/acme/abc/",
+    ],
+)
+def test_unknown_tenant_or_vacancy_is_not_found(client, published, url):
+    response = client.get(url)
+
+    assert response.status_code == 404
+    assert response.json() == {"error": "No encontrado"}
@@ -0,0 +1,34 @@
+from apps.recruitment.models import JobVacancy
+from apps.recruitment.repositories import JobVacancyRepository
+from apps.recruitment.services import JobVacancyService
+
+
+def test_requirement_edits_from_stale_instances_each_bump(vacancy):
+    first = JobVacancy.objects.get(pk=vacancy.pk)
+    second = JobVacancy.objects.get(pk=vacancy.pk)
+    service = JobVacancyService()
+
+    service.update_vacancy(first, requirements="Python, FastAPI")
+    service.update_vacancy(second, requirements="Python, Go")
+
+    vacancy.refresh_from_db()
+    assert vacancy.score_version == 3
+    assert vacancy.requirements == "Python, Go"
+
+
+def test_other_edits_keep_concurrent_bump(vacancy):
+    stale = JobVacancy.objects.get(pk=vacancy.pk)
+    JobVacancyRepository().bump_score_version([vacancy.pk])
+
+    JobVacancyService().update_vacancy(stale, title="Senior Python Dev")
+
+    vacancy.refresh_from_db()
+    assert vacancy.score_version == 2
+    assert vacancy.title == "Senior Python Dev"
+
+
+def test_same_requirements_do_not_bump(vacancy):
+    JobVacancyService().update_vacancy(vacancy, requirements=vacancy.requirements)
+
+    vacancy.refresh_from_db()
+    assert vacancy.score_version == 1
@@ -0,0 +1,78 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+
+from apps.recruitment.models import Application, Candidate, JobVacancy
+from apps.tenants.models import Tenant
+
+
+@pytest.fixture
+def applications(tenant, vacancy):
+    other = Tenant.objects.create(name="Globex", slug="globex")
+    foreign = Candidate.objects.create(
+        tenant=other, first_name="Otro", last_name="Tenant", email="otro@x.com"
+    )
+    Application.objects.create(
+        tenant=other,
+        vacancy=JobVacancy.objects.create(tenant=other, title="Ajena"),
+        candidate=foreign,
+    )
+    return [
+        Application.objects.create(
+            tenant=tenant,
+            vacancy=vacancy,
+            candidate=Candidate.objects.create(
+                tenant=tenant,
+                first_name=name,
+                last_name="Pérez",
+                email=f"{name.lower()}@x.com",
+                skills=["Python"],
+            ),
+        )
+        for name in ("Ana", "Beto")
+    ]
+
+
+def _body(response) -> bytes:
+    return b"".join(response.streaming_content)
+
+
+def test_export_candidates_csv_only_includes_tenant(api_client, applications):
+    response = api_client.get("/api/recruitment/candidates/export/")
+
+    assert response.status_code == 200
+    assert response["Content-Disposition"] == 'attachment; filename="candidates.csv"'
+    rows = list(csv.DictReader(io.StringIO(_body(response).decode())))
+    assert [row["email"] for row in rows] == ["ana@x.com", "beto@x.com"]
+    assert json.loads(rows[0]["skills"]) == ["Python"]
+
+
+def test_export_applications_ndjson_gzip_by_vacancy(api_client, applications, vacancy):
+    response = api_client.get(
+        "/api/recruitment/applications/export/",
+        {"output": "ndjson", "gzip": "1", "vacancy": vacancy.id},
+    )
+
+    assert response.status_code == 200
+    assert response["Content-Type"] == "application/gzip"
+    lines = gzip.decompress(_body(response)).decode().splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [r["application_id"] for r in records] == [a.id for a in applications]
+    assert records[0]["vacancy_title"] == vacancy.title
+
+
+@pytest.mark.parametrize(
+    ("url", "params"),
+    [
+        ("/api/recruitment/candidates/export/", {"output": "xlsx"}),
+        ("/api/recruitment/applications/export/", {"vacancy": "abc"}),
+    ],
+)
+def test_export_rejects_invalid_params(api_client, url, params):
+    response = api_client.get(url, params)
+
+    assert response.status_code == 400
+    assert "error" in response.json()
@@ -0,0 +1,90 @@
+import pytest
+
+from apps.recruitment.models import Application, CandidateStatus
+from apps.recruitment.services import ApplicationService
+from apps.tenants.models import Tenant
+
+
+@pytest.fixture
+def applications(vacancy):
+    """Tres postulaciones nuevas (puntajes 90, 70, 50) y una en screening."""
+    service = ApplicationService()
+    created = []
+    for index, score in enumerate([50, 90, 70, 80]):
+        application = service.apply_to_vacancy(
+            vacancy.id,
+            {"email": f"c{index}@x.com", "first_name": f"C{index}", "last_name": "X"},
+        )
+        Application.objects.filter(id=application.id).update(score=score)
+        created.append(application)
+    service.update_status(created[3].id, CandidateStatus.SCREENING)
+    return created
+
+
+def _board(api_client, vacancy, **params):
+    return api_client.get(f"/api/recruitment/vacancies/{vacancy.id}/board/", params)
+
+
+def test_board_returns_top_cards_per_column(api_client, vacancy, applications):
+    response = _board(api_client, vacancy, limit=2)
+
+    assert response.status_code == 200
+    columns = {column["status"]: column for column in response.json()["columns"]}
+    assert list(columns) == CandidateStatus.values
+    new = columns[CandidateStatus.NEW]
+    assert [card["id"] for card in new["applications"]] == [
+        applications[1].id,
+        applications[2].id,
+    ]
+    assert [card["position"] for card in new["applications"]] == [1, 2]
+    assert (new["total"], new["next_offset"]) == (3, 2)
+    screening = columns[CandidateStatus.SCREENING]
+    assert (screening["total"], screening["next_offset"]) == (1, None)
+    assert columns[CandidateStatus.HIRED]["applications"] == []
+
+
+def test_board_paginates_within_a_column(api_client, vacancy, applications):
+    page = _board(api_client, vacancy, status="new", limit=2, offset=2).json()
+    past_end = _board(api_client, vacancy, status="new", offset=10).json()
+
+    [column] = page["columns"]
+    assert [card["id"] for card in column["applications"]] == [applications[0].id]
+    assert (column["applications"][0]["position"], column["next_offset"]) == (3, None)
+    [column] = past_end["columns"]
+    assert (column["applications"], column["total"]) == ([], 3)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"limit": "0"},
+        {"limit": "abc"},
+        {"offset": "-1"},
+        {"status": "archived"},
+    ],
+)
+def test_board_rejects_invalid_params(api_client, vacancy, params):
+    response = _board(api_client, vacancy, **params)
+
+    assert response.status_code == 400
+    assert "error" in response.json()
+
+
+def test_funnel_counts_every_stage(api_client, vacancy, applications):
+    funnel = api_client.get(f"/api/recruitment/vacancies/{vacancy.id}/funnel/").json()
+    page = api_client.get("/api/recruitment/vacancies/funnels/").json()
+
+    counts = {stage["status"]: stage["count"] for stage in funnel["stages"]}
+    assert funnel["total"] == 4
+    assert (counts[CandidateStatus.NEW], counts[CandidateStatus.SCREENING]) == (3, 1)
+    assert counts[CandidateStatus.HIRED] == 0
+    assert page["count"] == 1
+    assert page["results"] == [funnel]
+
+
+def test_board_of_another_tenant_is_not_found(tenant_client, vacancy, applications):
+    other = tenant_client(Tenant.objects.create(name="Globex", slug="globex"))
+
+    response = other.get(f"/api/recruitment/vacancies/{vacancy.id}/board/")
+
+    assert response.status_code == 404
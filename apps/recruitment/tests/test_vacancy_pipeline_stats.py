@@ -0,0 +1,43 @@
+from unittest import mock
+
+from apps.recruitment.models import CandidateStatus, VacancyPipelineStats
+from apps.recruitment.repositories import VacancyPipelineStatsRepository
+from apps.recruitment.services import ApplicationService
+
+
+def _apply(vacancy, email):
+    return ApplicationService().apply_to_vacancy(
+        vacancy.id, {"email": email, "first_name": "Ana", "last_name": "Pérez"}
+    )
+
+
+def test_rebuild_replaces_drifted_counts(tenant, vacancy):
+    _apply(vacancy, "a@example.com")
+    _apply(vacancy, "b@example.com")
+    repository = VacancyPipelineStatsRepository()
+    repository.apply_deltas(
+        str(tenant.id), vacancy.id, {CandidateStatus.NEW: 5, CandidateStatus.HIRED: 1}
+    )
+
+    assert repository.rebuild(str(tenant.id), vacancy.id) == {CandidateStatus.NEW: 2}
+    assert repository.get_counts([vacancy.id])[vacancy.id] == {CandidateStatus.NEW: 2}
+
+
+def test_rebuild_tolerates_concurrent_first_row(tenant, vacancy):
+    _apply(vacancy, "a@example.com")
+    repository = VacancyPipelineStatsRepository()
+    VacancyPipelineStats.objects.all().delete()
+    bulk_create = VacancyPipelineStats.objects.bulk_create
+
+    def racing_bulk_create(objs, **kwargs):
+        # Otra postulación crea la fila del estado entre lectura y escritura
+        repository.apply_deltas(str(tenant.id), vacancy.id, {CandidateStatus.NEW: 1})
+        return bulk_create(objs, **kwargs)
+
+    with mock.patch.object(
+        VacancyPipelineStats.objects, "bulk_create", side_effect=racing_bulk_create
+    ):
+        counts = repository.rebuild(str(tenant.id), vacancy.id)
+
+    assert counts == {CandidateStatus.NEW: 1}
+    assert repository.get_counts([vacancy.id])[vacancy.id] == {CandidateStatus.NEW: 1}
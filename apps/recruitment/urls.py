@@ -5,12 +5,18 @@ from rest_framework.routers import DefaultRouter
 
 from apps.recruitment.views import (
     ApplicationViewSet,
+    CandidateViewSet,
+    JobBoardViewSet,
     JobVacancyViewSet,
 )
 
 router = DefaultRouter()
 router.register(r"vacancies", JobVacancyViewSet, basename="vacancy")
 router.register(r"applications", ApplicationViewSet, basename="application")
+router.register(r"candidates", CandidateViewSet, basename="candidate")
+router.register(
+    r"jobs/(?P<tenant_slug>[-a-zA-Z0-9_]+)", JobBoardViewSet, basename="job-board"
+)
 
 urlpatterns = [
     path("", include(router.urls)),
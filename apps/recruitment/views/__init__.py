@@ -1,9 +1,13 @@
 """Views de la app recruitment."""
 
 from .application_views import ApplicationViewSet
+from .candidate_views import CandidateViewSet
+from .job_board_views import JobBoardViewSet
 from .job_vacancy_views import JobVacancyViewSet
 
 __all__ = [
     "ApplicationViewSet",
+    "CandidateViewSet",
+    "JobBoardViewSet",
     "JobVacancyViewSet",
 ]
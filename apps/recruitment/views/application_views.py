@@ -4,7 +4,10 @@ ViewSet para Application.
 Este módulo contiene el ViewSet para gestión de postulaciones.
 """
 
-from rest_framework import status, viewsets
+from django.conf import settings
+from django.db import transaction
+from django.http import Http404
+from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
@@ -13,9 +16,21 @@ from rest_framework.response import Response
 from apps.recruitment.models import Application
 from apps.recruitment.serializers import (
     ApplicationCreateSerializer,
+    ApplicationIntakeSerializer,
     ApplicationSerializer,
 )
-from apps.recruitment.services import ApplicationService
+from apps.recruitment.services import (
+    ApplicationArchiveService,
+    ApplicationIdempotencyService,
+    ApplicationIntakeService,
+    ApplicationService,
+    RecruitmentExportService,
+)
+from apps.recruitment.tasks import process_application_intake
+
+from .applied_at_filter import AppliedAtFilter
+from .export_response import streaming_export_response
+from .skill_filter import SkillFilter
 
 
 class ApplicationViewSet(viewsets.ModelViewSet):
@@ -23,11 +38,22 @@ class ApplicationViewSet(viewsets.ModelViewSet):
 
     serializer_class = ApplicationSerializer
     permission_classes = [IsAuthenticated]
+    filter_backends = [
+        SkillFilter,
+        AppliedAtFilter,
+        filters.SearchFilter,
+        filters.OrderingFilter,
+    ]
+    skill_filter_field = "candidate_id"
     service = ApplicationService()
+    intake_service = ApplicationIntakeService()
+    idempotency_service = ApplicationIdempotencyService()
+    export_service = RecruitmentExportService()
+    archive_service = ApplicationArchiveService()
 
     def get_permissions(self):
         """Permite creación pública (postulación externa)."""
-        if self.action == "create":
+        if self.action in ["create", "intake_status"]:
             return [AllowAny()]
         return super().get_permissions()
 
@@ -42,8 +68,48 @@ class ApplicationViewSet(viewsets.ModelViewSet):
             return ApplicationCreateSerializer
         return ApplicationSerializer
 
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Detalle de una postulación, activa o archivada.
+
+        Las archivadas (solo lectura) se responden con el mismo formato y
+        el header ``X-Archived: true``.
+        """
+        try:
+            return super().retrieve(request, *args, **kwargs)
+        except Http404:
+            pk = str(kwargs.get(self.lookup_field, ""))
+            if not hasattr(request, "tenant_id") or not pk.isdigit():
+                raise
+            application = self.archive_service.get_archived_application(
+                request.tenant_id, int(pk)
+            )
+            if application is None:
+                raise
+            return Response(
+                ApplicationSerializer(application).data,
+                headers={"X-Archived": "true"},
+            )
+
+    @transaction.atomic
+    def perform_update(self, serializer):
+        """Los cambios de estado pasan por el servicio (embudo de la vacante)."""
+        new_status = serializer.validated_data.pop("status", None)
+        serializer.save()
+        if new_status is not None:
+            self.service.update_status(serializer.instance.id, new_status)
+            serializer.instance.refresh_from_db()
+
+    def perform_destroy(self, instance):
+        self.service.delete_application(instance)
+
     def create(self, request: Request) -> Response:
-        """Registra una nueva postulación (público)."""
+        """
+        Registra una nueva postulación (público).
+
+        Si la petición incluye el header ``Idempotency-Key``, los
+        reintentos con la misma key reciben la respuesta original.
+        """
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -51,6 +117,35 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         vacancy_id = data.pop("vacancy_id")
         source = data.pop("source", "website")
 
+        idempotency_key = request.headers.get("Idempotency-Key")
+        if idempotency_key:
+            if len(idempotency_key) > 255:
+                return Response(
+                    {"error": "Idempotency-Key demasiado largo (máx. 255)."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            stored = self.idempotency_service.get_stored_response(
+                vacancy_id, idempotency_key
+            )
+            if stored:
+                status_code, body = stored
+                return Response(
+                    body, status=status_code, headers={"Idempotent-Replayed": "true"}
+                )
+
+        if settings.RECRUITMENT_ASYNC_INTAKE:
+            response = self._enqueue(vacancy_id, data, source)
+        else:
+            response = self._apply(vacancy_id, data, source)
+
+        if idempotency_key:
+            self.idempotency_service.store_response(
+                vacancy_id, idempotency_key, response.status_code, response.data
+            )
+        return response
+
+    def _apply(self, vacancy_id: int, data: dict, source: str) -> Response:
+        """Registra la postulación de forma síncrona y responde 201."""
         try:
             application = self.service.apply_to_vacancy(
                 vacancy_id=vacancy_id, candidate_data=data, source=source
@@ -61,6 +156,52 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+    def _enqueue(self, vacancy_id: int, data: dict, source: str) -> Response:
+        """Encola la postulación y responde 202 con su tracking ID."""
+        intake = self.intake_service.submit(
+            vacancy_id=vacancy_id, candidate_data=data, source=source
+        )
+        transaction.on_commit(process_application_intake.delay)
+        return Response(
+            ApplicationIntakeSerializer(intake).data, status=status.HTTP_202_ACCEPTED
+        )
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"intake/(?P<tracking_id>[0-9a-f-]+)",
+    )
+    def intake_status(self, request, tracking_id=None):
+        """Consulta el resultado de una postulación encolada (público)."""
+        intake = self.intake_service.get_intake(tracking_id)
+        if not intake:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        return Response(ApplicationIntakeSerializer(intake).data)
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """
+        Exporta las postulaciones del tenant (CSV/NDJSON, gzip opcional).
+
+        Acepta ``?vacancy=<id>`` para limitar a una vacante.
+        """
+        vacancy_id = request.query_params.get("vacancy")
+        if vacancy_id is not None and not vacancy_id.isdigit():
+            return Response(
+                {"error": "vacancy debe ser un ID numérico"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return streaming_export_response(
+            request,
+            f"applications-{vacancy_id}" if vacancy_id else "applications",
+            lambda file_format, compress: self.export_service.export_applications(
+                request.tenant_id,
+                file_format,
+                vacancy_id=int(vacancy_id) if vacancy_id else None,
+                compress=compress,
+            ),
+        )
+
     @action(detail=True, methods=["post"])
     def update_status(self, request, pk=None):
         """Actualiza el estado de una postulación."""
@@ -72,9 +213,12 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 {"error": "Status requerido"}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        application = self.service.update_status(
-            application_id=pk, new_status=new_status, notes=notes
-        )
+        try:
+            application = self.service.update_status(
+                application_id=pk, new_status=new_status, notes=notes
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         if not application:
             return Response(status=status.HTTP_404_NOT_FOUND)
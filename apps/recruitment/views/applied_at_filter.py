@@ -0,0 +1,47 @@
+"""
+Filtro DRF por fecha de postulación.
+
+Este módulo resuelve ``?applied_after=<fecha>&applied_before=<fecha>``
+(ISO 8601, fecha o fecha y hora) sobre ``applied_at``.
+"""
+
+from datetime import datetime, time
+
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+
+class AppliedAtFilter(BaseFilterBackend):
+    """
+    Filtra por rango de ``applied_at`` (desde inclusive, hasta exclusive).
+
+    Con la tabla de postulaciones particionada por mes, acotar la fecha
+    (por ejemplo, "postulaciones recientes") limita la consulta a las
+    particiones del rango.
+    """
+
+    params = {"applied_after": "applied_at__gte", "applied_before": "applied_at__lt"}
+
+    def filter_queryset(self, request, queryset, view):
+        for param, lookup in self.params.items():
+            value = request.query_params.get(param)
+            if value:
+                queryset = queryset.filter(**{lookup: self._parse(param, value)})
+        return queryset
+
+    @staticmethod
+    def _parse(param: str, value: str) -> datetime:
+        try:
+            parsed = parse_datetime(value)
+            if parsed is None:
+                day = parse_date(value)
+                parsed = datetime.combine(day, time.min) if day else None
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValidationError({"error": f"{param} debe ser una fecha ISO 8601"})
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return parsed
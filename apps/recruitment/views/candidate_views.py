@@ -0,0 +1,85 @@
+"""
+ViewSet para Candidate.
+
+Este módulo contiene el ViewSet de consulta de candidatos.
+"""
+
+from rest_framework import filters, status, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from apps.recruitment.models import Candidate
+from apps.recruitment.serializers import CandidateSerializer
+from apps.recruitment.services import (
+    CandidateAutocompleteService,
+    RecruitmentExportService,
+)
+
+from .export_response import streaming_export_response
+from .full_text_search_filter import FullTextSearchFilter
+from .skill_filter import SkillFilter
+
+
+class CandidateViewSet(viewsets.ReadOnlyModelViewSet):
+    """ViewSet de solo lectura para candidatos del tenant."""
+
+    serializer_class = CandidateSerializer
+    permission_classes = [IsAuthenticated]
+    filter_backends = [SkillFilter, FullTextSearchFilter, filters.OrderingFilter]
+    search_fields = ["first_name", "last_name", "email", "skills"]
+    search_configs = ["simple"]
+    ordering_fields = ["created_at", "last_name"]
+    export_service = RecruitmentExportService()
+    autocomplete_service = CandidateAutocompleteService()
+
+    def get_queryset(self):
+        """Filtra candidatos por tenant."""
+        if not hasattr(self.request, "tenant_id"):
+            return Candidate.objects.none()
+        return Candidate.objects.filter(tenant_id=self.request.tenant_id)
+
+    @action(detail=False, methods=["get"])
+    def export(self, request):
+        """Exporta todos los candidatos del tenant (CSV/NDJSON, gzip)."""
+        return streaming_export_response(
+            request,
+            "candidates",
+            lambda file_format, compress: self.export_service.export_candidates(
+                request.tenant_id, file_format, compress=compress
+            ),
+        )
+
+    @action(detail=False, methods=["get"])
+    def autocomplete(self, request):
+        """Sugiere candidatos por nombre o email (``?q=``, ``?limit=``)."""
+        if not hasattr(request, "tenant_id"):
+            return Response(
+                {"error": "Tenant ID requerido"}, status=status.HTTP_403_FORBIDDEN
+            )
+        limit = request.query_params.get("limit")
+        if limit is not None and (not limit.isdigit() or int(limit) == 0):
+            return Response(
+                {"error": "limit debe ser un entero positivo."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            suggestions = self.autocomplete_service.suggest(
+                request.tenant_id,
+                request.query_params.get("q", ""),
+                int(limit or 0) or None,
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            [
+                {
+                    "id": item["id"],
+                    "full_name": f"{item['first_name']} {item['last_name']}",
+                    "email": item["email"],
+                    "score": item["score"],
+                }
+                for item in suggestions
+            ]
+        )
@@ -0,0 +1,61 @@
+"""
+Respuesta HTTP en streaming para exportaciones.
+
+Este módulo arma la ``StreamingHttpResponse`` común a los endpoints
+de exportación a partir de los parámetros ``output`` y ``gzip``.
+"""
+
+from collections.abc import Callable, Iterator
+
+from django.http import StreamingHttpResponse
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from apps.recruitment.adapters.export_stream import EXPORT_FORMATS
+
+
+def streaming_export_response(
+    request: Request,
+    basename: str,
+    export: Callable[[str, bool], Iterator[bytes]],
+) -> StreamingHttpResponse | Response:
+    """
+    Construye la respuesta de descarga de una exportación.
+
+    Query params:
+        output: ``csv`` (default) o ``ndjson``.
+        gzip: ``1``/``true`` para comprimir el flujo.
+
+    Args:
+        request: Request de DRF.
+        basename: Nombre base del archivo descargado.
+        export: Callable ``(formato, comprimir) -> fragmentos``.
+
+    Returns:
+        StreamingHttpResponse | Response: Descarga o error 400/403.
+    """
+    if not getattr(request, "tenant_id", None):
+        return Response(
+            {"error": "Tenant ID requerido"}, status=status.HTTP_403_FORBIDDEN
+        )
+
+    file_format = request.query_params.get("output", "csv")
+    if file_format not in EXPORT_FORMATS:
+        return Response(
+            {"error": f"Formato no soportado. Opciones: {', '.join(EXPORT_FORMATS)}"},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    compress = request.query_params.get("gzip", "").lower() in ("1", "true")
+
+    filename = f"{basename}.{file_format}"
+    content_type = EXPORT_FORMATS[file_format]
+    if compress:
+        filename += ".gz"
+        content_type = "application/gzip"
+
+    response = StreamingHttpResponse(
+        export(file_format, compress), content_type=content_type
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
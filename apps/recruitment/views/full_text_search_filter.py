@@ -0,0 +1,37 @@
+"""
+Filtro DRF de búsqueda de texto completo.
+
+Este módulo reemplaza el ``SearchFilter`` por defecto (``icontains``,
+scan secuencial) por búsqueda sobre las columnas tsvector indexadas.
+"""
+
+from django.conf import settings
+from rest_framework.filters import SearchFilter
+
+from apps.recruitment.repositories.full_text_search import full_text_search
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    Búsqueda de texto completo con ranking para ``?search=``.
+
+    La vista define:
+        search_fields: Campos para el fallback fuera de PostgreSQL.
+        search_configs: Configuraciones de PostgreSQL a usar por
+            defecto. ``?lang=es|en`` restringe a un idioma según
+            ``RECRUITMENT_SEARCH_LANGUAGES``.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        terms = request.query_params.get(self.search_param, "").strip()
+        if not terms:
+            return queryset
+
+        configs = list(getattr(view, "search_configs", ["simple"]))
+        language = request.query_params.get("lang")
+        if language in settings.RECRUITMENT_SEARCH_LANGUAGES and len(configs) > 1:
+            configs = [settings.RECRUITMENT_SEARCH_LANGUAGES[language]]
+
+        return full_text_search(
+            queryset, terms, configs, list(getattr(view, "search_fields", []))
+        )
@@ -0,0 +1,70 @@
+"""
+ViewSet público del job board.
+
+Este módulo expone las vacantes publicadas de un tenant, direccionado
+por su slug, para visitantes anónimos.
+"""
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import viewsets
+from rest_framework.permissions import AllowAny
+
+from apps.recruitment.services import JobBoardPage, JobBoardService
+
+
+class JobBoardViewSet(viewsets.ViewSet):
+    """
+    Listado y detalle públicos de vacantes publicadas.
+
+    Las respuestas salen pre-serializadas del cache y soportan GET
+    condicional (``If-None-Match`` / ``If-Modified-Since``).
+    """
+
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    service = JobBoardService()
+
+    def list(self, request, tenant_slug=None):
+        """Vacantes publicadas del tenant."""
+        return self._respond(request, self.service.get_listing(tenant_slug))
+
+    def retrieve(self, request, tenant_slug=None, pk=None):
+        """Detalle de una vacante publicada."""
+        if not str(pk).isdigit():
+            return self._respond(request, self.service.get_vacancy(tenant_slug, 0))
+        return self._respond(request, self.service.get_vacancy(tenant_slug, int(pk)))
+
+    def _respond(self, request, page: JobBoardPage) -> HttpResponse:
+        headers = {
+            "ETag": page.etag,
+            "Last-Modified": http_date(page.last_modified),
+            "Cache-Control": (
+                f"public, max-age={settings.RECRUITMENT_JOB_BOARD_MAX_AGE}"
+            ),
+        }
+        if page.status == 200 and self._not_modified(request, page):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(
+                page.body, status=page.status, content_type="application/json"
+            )
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+    @staticmethod
+    def _not_modified(request, page: JobBoardPage) -> bool:
+        """Evalúa las precondiciones del GET condicional (RFC 9110)."""
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return "*" in tags or page.etag in tags
+        if_modified_since = parse_http_date_safe(
+            request.headers.get("If-Modified-Since", "")
+        )
+        return (
+            if_modified_since is not None
+            and int(page.last_modified) <= if_modified_since
+        )
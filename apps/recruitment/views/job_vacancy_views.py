@@ -4,18 +4,36 @@ ViewSet para JobVacancy.
 Este módulo contiene el ViewSet para gestión de vacantes.
 """
 
-from rest_framework import status, viewsets
+from django.conf import settings
+from django.db import transaction
+from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.parsers import MultiPartParser
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from apps.recruitment.models import JobVacancy
+from apps.recruitment.adapters.import_row_reader import (
+    detect_import_format,
+    iter_import_rows,
+)
+from apps.recruitment.models import ApplicationSource, JobVacancy
 from apps.recruitment.serializers import (
+    ApplicationBoardSerializer,
+    ApplicationSerializer,
     JobVacancyCreateSerializer,
     JobVacancySerializer,
 )
-from apps.recruitment.services import JobVacancyService
+from apps.recruitment.services import (
+    ApplicationImportService,
+    ApplicationScoringService,
+    ApplicationService,
+    JobVacancyService,
+    VacancyPipelineStatsService,
+)
+from apps.recruitment.tasks import recompute_vacancy_scores
+
+from .full_text_search_filter import FullTextSearchFilter
 
 
 class JobVacancyViewSet(viewsets.ModelViewSet):
@@ -23,13 +41,21 @@ class JobVacancyViewSet(viewsets.ModelViewSet):
 
     serializer_class = JobVacancySerializer
     permission_classes = [IsAuthenticated]
+    filter_backends = [FullTextSearchFilter, filters.OrderingFilter]
+    search_fields = ["title", "description", "requirements"]
+    search_configs = ["spanish", "english"]
+    ordering_fields = ["created_at", "title"]
     service = JobVacancyService()
+    import_service = ApplicationImportService()
+    scoring_service = ApplicationScoringService()
+    stats_service = VacancyPipelineStatsService()
+    application_service = ApplicationService()
 
     def get_queryset(self):
         """Filtra vacantes por tenant del usuario."""
         if not hasattr(self.request, "tenant_id"):
             return JobVacancy.objects.none()
-        return self.service.get_tenant_vacancies(self.request.tenant_id)
+        return JobVacancy.objects.filter(tenant_id=self.request.tenant_id)
 
     def get_serializer_class(self):
         if self.action == "create":
@@ -52,6 +78,100 @@ class JobVacancyViewSet(viewsets.ModelViewSet):
         except ValueError as e:
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
+    def perform_update(self, serializer):
+        """Actualiza y, si cambiaron los requisitos, recalcula los puntajes."""
+        vacancy = serializer.instance
+        previous_version = vacancy.score_version
+        self.service.update_vacancy(vacancy, **serializer.validated_data)
+        if vacancy.score_version != previous_version:
+            transaction.on_commit(lambda: recompute_vacancy_scores.delay(vacancy.id))
+
+    @action(detail=True, methods=["get"])
+    def funnel(self, request, pk=None):
+        """Postulaciones por estado de la vacante (embudo del pipeline)."""
+        return Response(self.stats_service.get_funnels([self.get_object()])[0])
+
+    @action(detail=False, methods=["get"])
+    def funnels(self, request):
+        """
+        Embudo de una página de vacantes (mismos filtros que el listado).
+
+        Cuesta una consulta adicional por página, sin agrupar postulaciones.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        vacancies = list(page if page is not None else queryset)
+        data = self.stats_service.get_funnels(vacancies)
+        if page is not None:
+            return self.get_paginated_response(data)
+        return Response(data)
+
+    @action(detail=True, methods=["get"])
+    def board(self, request, pk=None):
+        """
+        Tablero kanban: primeras ``?limit=`` tarjetas de cada estado.
+
+        ``?status=<estado>&offset=<n>`` pagina dentro de una columna.
+        """
+        vacancy = self.get_object()
+        params = request.query_params
+        limit = params.get("limit", str(settings.RECRUITMENT_BOARD_COLUMN_LIMIT))
+        offset = params.get("offset", "0")
+        if not (limit.isdigit() and offset.isdigit()) or int(limit) == 0:
+            return Response(
+                {"error": "limit y offset deben ser enteros positivos."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            columns = self.application_service.get_vacancy_board(
+                vacancy.id,
+                min(int(limit), settings.RECRUITMENT_BOARD_MAX_COLUMN_LIMIT),
+                status=params.get("status"),
+                offset=int(offset),
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        for column in columns:
+            column["applications"] = ApplicationBoardSerializer(
+                column["applications"], many=True
+            ).data
+        return Response({"vacancy": vacancy.id, "columns": columns})
+
+    @action(detail=True, methods=["get"])
+    def top_applications(self, request, pk=None):
+        """
+        Mejores postulaciones de la vacante por puntaje (``?limit=``).
+
+        Los puntajes obsoletos se refrescan antes de leer; si quedan
+        más, se encola el recálculo y la respuesta lo indica.
+        """
+        vacancy = self.get_object()
+        try:
+            limit = min(
+                int(request.query_params.get("limit", 20)),
+                settings.RECRUITMENT_SCORING_TOP_MAX_LIMIT,
+            )
+        except ValueError:
+            return Response(
+                {"error": "limit debe ser un entero."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        applications, stale = self.scoring_service.top_applications(
+            vacancy, max(limit, 1)
+        )
+        if stale:
+            transaction.on_commit(lambda: recompute_vacancy_scores.delay(vacancy.id))
+        return Response(
+            {
+                "score_version": vacancy.score_version,
+                "stale": stale,
+                "results": ApplicationSerializer(applications, many=True).data,
+            }
+        )
+
     @action(detail=True, methods=["post"])
     def publish(self, request, pk=None):
         """Publica una vacante."""
@@ -67,3 +187,32 @@ class JobVacancyViewSet(viewsets.ModelViewSet):
         if not vacancy:
             return Response(status=status.HTTP_404_NOT_FOUND)
         return Response(JobVacancySerializer(vacancy).data)
+
+    @action(detail=True, methods=["post"], parser_classes=[MultiPartParser])
+    def import_applications(self, request, pk=None):
+        """
+        Importa postulaciones desde un archivo CSV o NDJSON.
+
+        El archivo (campo ``file``) se procesa en streaming y por lotes.
+        El formato se toma del campo ``format`` o de la extensión.
+        """
+        upload = request.FILES.get("file")
+        if not upload:
+            return Response(
+                {"error": "Archivo requerido"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        file_format = request.data.get("format") or detect_import_format(upload.name)
+        source = request.data.get("source", ApplicationSource.AGENCY)
+
+        try:
+            report = self.import_service.import_rows(
+                vacancy_id=pk,
+                rows=iter_import_rows(upload, file_format),
+                source=source,
+                tenant_id=request.tenant_id,
+            )
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(report.as_dict())
@@ -0,0 +1,43 @@
+"""
+Filtro DRF por habilidades de candidatos.
+
+Este módulo resuelve ``?skills=python,django&match=all|any`` contra el
+índice normalizado ``CandidateSkill``.
+"""
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from apps.recruitment.services import CandidateSkillIndexService
+
+
+class SkillFilter(BaseFilterBackend):
+    """
+    Filtra por habilidades usando el índice de candidatos.
+
+    La vista puede definir ``skill_filter_field``: campo del queryset
+    que contiene el ID del candidato (default ``pk``).
+    """
+
+    service = CandidateSkillIndexService()
+
+    def filter_queryset(self, request, queryset, view):
+        skills = [
+            skill
+            for skill in request.query_params.get("skills", "").split(",")
+            if skill
+        ]
+        if not skills or not hasattr(request, "tenant_id"):
+            return queryset
+
+        try:
+            candidate_ids = self.service.candidate_ids_with_skills(
+                request.tenant_id, skills, request.query_params.get("match", "all")
+            )
+        except ValueError as e:
+            raise ValidationError({"error": str(e)}) from e
+
+        if candidate_ids is None:
+            return queryset.none()
+        field = getattr(view, "skill_filter_field", "pk")
+        return queryset.filter(**{f"{field}__in": candidate_ids})
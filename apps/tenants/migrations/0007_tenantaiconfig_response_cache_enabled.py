@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 08:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0006_tenantmembership_permissions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tenantaiconfig',
+            name='response_cache_enabled',
+            field=models.BooleanField(default=True, help_text='Reutiliza respuestas idénticas del LLM (mismo prompt y modelo)', verbose_name='Cache de respuestas'),
+        ),
+    ]
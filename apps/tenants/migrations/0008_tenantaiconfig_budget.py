@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:23
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tenants', '0007_tenantaiconfig_response_cache_enabled'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tenantaiconfig',
+            name='budget_action',
+            field=models.CharField(choices=[('reject', 'Rechazar'), ('downgrade', 'Usar modelo de respaldo')], default='reject', max_length=20, verbose_name='Acción al exceder el presupuesto'),
+        ),
+        migrations.AddField(
+            model_name='tenantaiconfig',
+            name='budget_fallback_model',
+            field=models.CharField(blank=True, help_text='Modelo más económico a usar al exceder el presupuesto', max_length=100, verbose_name='Modelo de respaldo'),
+        ),
+        migrations.AddField(
+            model_name='tenantaiconfig',
+            name='monthly_budget_usd',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='Tope de gasto de IA por mes calendario (vacío: sin tope)', max_digits=12, null=True, validators=[django.core.validators.MinValueValidator(0)], verbose_name='Presupuesto mensual (USD)'),
+        ),
+    ]
@@ -1,11 +1,12 @@
 """Modelos de la app tenants."""
 
-from .choices import AIProvider, PlanType, TenantRole
+from .choices import AIBudgetAction, AIProvider, PlanType, TenantRole
 from .tenant_ai_config import TenantAIConfig
 from .tenant_membership import TenantMembership
 from .tenant_model import Tenant
 
 __all__ = [
+    "AIBudgetAction",
     "AIProvider",
     "PlanType",
     "Tenant",
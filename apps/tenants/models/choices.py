@@ -54,3 +54,16 @@ class AIProvider(models.TextChoices):
     CLAUDE = "claude", "Anthropic Claude"
     GEMINI = "gemini", "Google Gemini"
     LLAMA = "llama", "Meta Llama"
+
+
+class AIBudgetAction(models.TextChoices):
+    """
+    Define qué hacer cuando un tenant excede su presupuesto mensual de IA.
+
+    Attributes:
+        REJECT: Rechaza las llamadas al LLM hasta el mes siguiente.
+        DOWNGRADE: Sigue con el modelo de respaldo (más económico).
+    """
+
+    REJECT = "reject", "Rechazar"
+    DOWNGRADE = "downgrade", "Usar modelo de respaldo"
@@ -8,7 +8,7 @@ permitiendo BYOK (Bring Your Own Key) y selección de proveedor LLM.
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
-from .choices import AIProvider
+from .choices import AIBudgetAction, AIProvider
 from .tenant_model import Tenant
 
 
@@ -28,6 +28,13 @@ class TenantAIConfig(models.Model):
         temperature (float): Temperatura para generación de texto.
         max_tokens (int): Máximo de tokens por request.
         is_active (bool): Indica si la configuración está activa.
+        response_cache_enabled (bool): Si las respuestas del LLM se
+            reutilizan desde el cache de respuestas (opt-out por tenant).
+        monthly_budget_usd (Decimal | None): Tope de gasto de IA del mes
+            calendario en USD (None: sin tope).
+        budget_action (str): Qué hacer al exceder el tope.
+        budget_fallback_model (str): Modelo del mismo proveedor para
+            ``AIBudgetAction.DOWNGRADE``.
         created_at (datetime): Fecha de creación.
         updated_at (datetime): Fecha de última actualización.
 
@@ -84,6 +91,36 @@ class TenantAIConfig(models.Model):
         help_text="Indica si la configuración está activa",
     )
 
+    response_cache_enabled = models.BooleanField(
+        default=True,
+        verbose_name="Cache de respuestas",
+        help_text="Reutiliza respuestas idénticas del LLM (mismo prompt y modelo)",
+    )
+
+    monthly_budget_usd = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        validators=[MinValueValidator(0)],
+        verbose_name="Presupuesto mensual (USD)",
+        help_text="Tope de gasto de IA por mes calendario (vacío: sin tope)",
+    )
+
+    budget_action = models.CharField(
+        max_length=20,
+        choices=AIBudgetAction.choices,
+        default=AIBudgetAction.REJECT,
+        verbose_name="Acción al exceder el presupuesto",
+    )
+
+    budget_fallback_model = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name="Modelo de respaldo",
+        help_text="Modelo más económico a usar al exceder el presupuesto",
+    )
+
     created_at = models.DateTimeField(
         auto_now_add=True, verbose_name="Fecha de Creación"
     )
@@ -7,7 +7,7 @@ de los tenants (BYOK).
 
 from rest_framework import serializers
 
-from apps.tenants.models import TenantAIConfig
+from apps.tenants.models import AIBudgetAction, TenantAIConfig
 
 
 class TenantAIConfigSerializer(serializers.ModelSerializer):
@@ -35,6 +35,10 @@ class TenantAIConfigSerializer(serializers.ModelSerializer):
             "temperature",
             "max_tokens",
             "is_active",
+            "response_cache_enabled",
+            "monthly_budget_usd",
+            "budget_action",
+            "budget_fallback_model",
             "created_at",
             "updated_at",
         ]
@@ -74,6 +78,10 @@ class TenantAIConfigCreateSerializer(serializers.ModelSerializer):
             "model_name",
             "temperature",
             "max_tokens",
+            "response_cache_enabled",
+            "monthly_budget_usd",
+            "budget_action",
+            "budget_fallback_model",
         ]
 
     def validate_api_key(self, value: str) -> str:
@@ -130,3 +138,29 @@ class TenantAIConfigCreateSerializer(serializers.ModelSerializer):
                 "El máximo de tokens debe ser al menos 1."
             )
         return value
+
+    def validate(self, attrs: dict) -> dict:
+        """
+        Valida que la acción ``downgrade`` tenga modelo de respaldo.
+
+        Args:
+            attrs: Datos validados por campo.
+
+        Returns:
+            dict: Datos validados.
+
+        Raises:
+            ValidationError: Si falta el modelo de respaldo.
+        """
+        action = attrs.get(
+            "budget_action", getattr(self.instance, "budget_action", None)
+        )
+        fallback_model = attrs.get(
+            "budget_fallback_model",
+            getattr(self.instance, "budget_fallback_model", ""),
+        )
+        if action == AIBudgetAction.DOWNGRADE and not fallback_model:
+            raise serializers.ValidationError(
+                {"budget_fallback_model": "Requerido para usar el modelo de respaldo."}
+            )
+        return attrs
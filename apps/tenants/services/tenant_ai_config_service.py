@@ -5,9 +5,11 @@ Este módulo contiene los casos de uso relacionados con la
 configuración de IA de los tenants (BYOK).
 """
 
+from decimal import Decimal
+
 from django.db import transaction
 
-from apps.tenants.models import AIProvider, TenantAIConfig
+from apps.tenants.models import AIBudgetAction, AIProvider, TenantAIConfig
 from apps.tenants.repositories import TenantRepository
 
 
@@ -264,3 +266,91 @@ class TenantAIConfigService:
             return config
         except TenantAIConfig.DoesNotExist:
             return None
+
+    @transaction.atomic
+    def set_response_cache(
+        self, tenant_id: str, enabled: bool
+    ) -> TenantAIConfig | None:
+        """
+        Activa o desactiva (opt-out) el cache de respuestas del LLM.
+
+        Al desactivarlo también se descartan las respuestas ya
+        cacheadas del tenant (señal ``post_save`` de ai_core).
+
+        Args:
+            tenant_id: ID del tenant.
+            enabled: Si se reutilizan respuestas idénticas.
+
+        Returns:
+            TenantAIConfig | None: Configuración actualizada o None
+                si no existe.
+        """
+        tenant = self.tenant_repository.get_by_id(tenant_id)
+        if not tenant:
+            return None
+
+        try:
+            config = tenant.ai_config
+        except TenantAIConfig.DoesNotExist:
+            return None
+
+        config.response_cache_enabled = enabled
+        config.save(update_fields=["response_cache_enabled", "updated_at"])
+        return config
+
+    @transaction.atomic
+    def set_budget(
+        self,
+        tenant_id: str,
+        monthly_budget_usd: Decimal | None,
+        action: AIBudgetAction = AIBudgetAction.REJECT,
+        fallback_model: str = "",
+    ) -> TenantAIConfig | None:
+        """
+        Configura el tope de gasto mensual de IA del tenant.
+
+        El gasto acumulado no cambia: el nuevo tope aplica desde la
+        próxima llamada al LLM.
+
+        Args:
+            tenant_id: ID del tenant.
+            monthly_budget_usd: Tope en USD por mes calendario (None:
+                sin tope).
+            action: Qué hacer al excederlo.
+            fallback_model: Modelo del mismo proveedor para
+                ``AIBudgetAction.DOWNGRADE``.
+
+        Returns:
+            TenantAIConfig | None: Configuración actualizada o None
+                si no existe.
+
+        Raises:
+            ValueError: Si el tope es negativo o falta el modelo de
+                respaldo.
+        """
+        if monthly_budget_usd is not None and monthly_budget_usd < 0:
+            raise ValueError("El presupuesto mensual no puede ser negativo")
+        if action == AIBudgetAction.DOWNGRADE and not fallback_model:
+            raise ValueError("Falta el modelo de respaldo para el presupuesto")
+
+        tenant = self.tenant_repository.get_by_id(tenant_id)
+        if not tenant:
+            return None
+
+        try:
+            config = tenant.ai_config
+        except TenantAIConfig.DoesNotExist:
+            return None
+
+        config.monthly_budget_usd = monthly_budget_usd
+        config.budget_action = action
+        config.budget_fallback_model = fallback_model
+        config.save(
+            update_fields=[
+                "monthly_budget_usd",
+                "budget_action",
+                "budget_fallback_model",
+                "updated_at",
+            ]
+        )
+        return config
@@ -0,0 +1,16 @@
+"""
+Aplicación Celery del proyecto.
+
+Carga la configuración ``CELERY_*`` desde los settings de Django y
+descubre los módulos ``tasks.py`` de cada app.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings.dev")
+
+app = Celery("core")
+app.config_from_object("django.conf:settings", namespace="CELERY")
+app.autodiscover_tasks()
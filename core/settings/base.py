@@ -162,8 +162,146 @@ CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_TASK_TRACK_STARTED = True
 CELERY_TASK_TIME_LIMIT = 30 * 60  # 30 minutos
+# Con acks_late, cada worker reserva solo la tarea que está ejecutando
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+
+# Cache: Redis si se define REDIS_CACHE_URL; si no, memoria local del proceso
+REDIS_CACHE_URL = os.environ.get("REDIS_CACHE_URL")
+CACHES = {
+    "default": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_CACHE_URL,
+        }
+        if REDIS_CACHE_URL
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    )
+}
+
+# Recruitment: recepción asíncrona de postulaciones públicas (202 Accepted)
+RECRUITMENT_ASYNC_INTAKE = os.environ.get("RECRUITMENT_ASYNC_INTAKE", "0") == "1"
+RECRUITMENT_INTAKE_BATCH_SIZE = int(
+    os.environ.get("RECRUITMENT_INTAKE_BATCH_SIZE", "200")
+)
+# Filas por lote en la importación masiva de postulaciones (CSV/NDJSON)
+RECRUITMENT_IMPORT_CHUNK_SIZE = int(
+    os.environ.get("RECRUITMENT_IMPORT_CHUNK_SIZE", "500")
+)
+# Filas leídas por viaje al cursor del servidor en exportaciones en streaming
+RECRUITMENT_EXPORT_CHUNK_SIZE = int(
+    os.environ.get("RECRUITMENT_EXPORT_CHUNK_SIZE", "2000")
+)
+# Idiomas de búsqueda de texto completo (?lang=) -> configuración de PostgreSQL
+RECRUITMENT_SEARCH_LANGUAGES = {"es": "spanish", "en": "english"}
+# Autocompletado de candidatos (trigram en PostgreSQL)
+RECRUITMENT_AUTOCOMPLETE_MIN_LENGTH = 2
+RECRUITMENT_AUTOCOMPLETE_LIMIT = 10
+RECRUITMENT_AUTOCOMPLETE_MAX_LIMIT = 50
+# Tenants con hasta N candidatos usan un índice de prefijos en memoria (0 = nunca)
+RECRUITMENT_AUTOCOMPLETE_LOCAL_INDEX_MAX = int(
+    os.environ.get("RECRUITMENT_AUTOCOMPLETE_LOCAL_INDEX_MAX", "0")
+)
+RECRUITMENT_AUTOCOMPLETE_LOCAL_INDEX_TTL = 60
+RECRUITMENT_AUTOCOMPLETE_LOCAL_INDEX_TENANTS = 256
+# Scoring persistido de postulaciones
+RECRUITMENT_SCORING_CHUNK_SIZE = int(
+    os.environ.get("RECRUITMENT_SCORING_CHUNK_SIZE", "1000")
+)
+# Filas obsoletas que se recalculan en línea al leer el ranking de una vacante
+RECRUITMENT_SCORING_LAZY_REFRESH_LIMIT = 500
+RECRUITMENT_SCORING_TOP_MAX_LIMIT = 100
+# Tarjetas por columna del tablero kanban (default y máximo)
+RECRUITMENT_BOARD_COLUMN_LIMIT = 10
+RECRUITMENT_BOARD_MAX_COLUMN_LIMIT = 100
+# Job board público: vida de las respuestas en cache y max-age para clientes/CDN
+RECRUITMENT_JOB_BOARD_CACHE_TTL = 300
+RECRUITMENT_JOB_BOARD_MAX_AGE = 60
+# Archivo de postulaciones de vacantes cerradas hace más de N días
+RECRUITMENT_ARCHIVE_AFTER_DAYS = int(
+    os.environ.get("RECRUITMENT_ARCHIVE_AFTER_DAYS", "365")
+)
+RECRUITMENT_ARCHIVE_CHUNK_SIZE = 1000
+# Particionado mensual de postulaciones (PostgreSQL): meses creados por adelantado
+RECRUITMENT_PARTITION_MONTHS_AHEAD = 3
+RECRUITMENT_PARTITION_COPY_CHUNK_SIZE = 10000
+# Tiempo durante el cual se reproduce la respuesta de un Idempotency-Key
+RECRUITMENT_IDEMPOTENCY_TTL_SECONDS = int(
+    os.environ.get("RECRUITMENT_IDEMPOTENCY_TTL_SECONDS", str(24 * 60 * 60))
+)
 
 # AI Provider Configuration (LangChain)
 OPENAI_API_KEY_GLOBAL = os.environ.get('OPENAI_API_KEY', '')
 CLAUDE_API_KEY_GLOBAL = os.environ.get('CLAUDE_API_KEY', '')
 GEMINI_API_KEY_GLOBAL = os.environ.get('GEMINI_API_KEY', '')
+
+# Pool de clientes de LLM reutilizables (por proceso)
+AI_LLM_POOL_MAX_CLIENTS = int(os.environ.get("AI_LLM_POOL_MAX_CLIENTS", "128"))
+AI_LLM_POOL_IDLE_SECONDS = 300
+
+# Cache de respuestas de LLM por tenant (match exacto de prompt y modelo)
+# Backends: memory (por proceso), database, redis (alias de CACHES) o none
+AI_LLM_CACHE_BACKEND = os.environ.get("AI_LLM_CACHE_BACKEND", "memory")
+AI_LLM_CACHE_TTL_SECONDS = int(
+    os.environ.get("AI_LLM_CACHE_TTL_SECONDS", str(24 * 60 * 60))
+)
+AI_LLM_CACHE_MAX_ENTRIES = 2048
+AI_LLM_CACHE_ALIAS = "default"
+
+# Motor asíncrono de workflows (límites de concurrencia por proceso)
+AI_WORKFLOW_MAX_CONCURRENCY = int(os.environ.get("AI_WORKFLOW_MAX_CONCURRENCY", "64"))
+AI_WORKFLOW_TENANT_CONCURRENCY = 8
+AI_WORKFLOW_API_KEY_CONCURRENCY = 16
+AI_WORKFLOW_PROVIDER_CONCURRENCY = {"openai": 48, "claude": 32, "gemini": 32}
+
+# Workflows en Celery: cola por plan del tenant (workers dedicados a ai_high)
+AI_WORKFLOW_PLAN_QUEUES = {"enterprise": "ai_high"}
+AI_WORKFLOW_DEFAULT_QUEUE = "ai_default"
+AI_WORKFLOW_MAX_RETRIES = int(os.environ.get("AI_WORKFLOW_MAX_RETRIES", "3"))
+AI_WORKFLOW_RETRY_BACKOFF_SECONDS = 30
+
+# Bitácora de nodos (AgentExecutionLog): escritura en lote desde un hilo
+AI_AGENT_LOG_ENABLED = os.environ.get("AI_AGENT_LOG_ENABLED", "1") == "1"
+AI_AGENT_LOG_BACKGROUND = True
+AI_AGENT_LOG_BATCH_SIZE = 200
+AI_AGENT_LOG_FLUSH_INTERVAL_MS = 500
+# Eventos en espera como máximo (los que excedan se descartan)
+AI_AGENT_LOG_MAX_QUEUE = 10000
+# input_data/output_data más grandes se comprimen o truncan
+AI_AGENT_LOG_MAX_PAYLOAD_BYTES = 16 * 1024
+
+# Cache de resultados de tools (ToolCachePolicy): contadores de hit/miss
+# publicados en este alias de CACHES (ver comando tool_cache_stats)
+AI_TOOL_CACHE_STATS_ALIAS = "default"
+AI_TOOL_CACHE_STATS_FLUSH_SECONDS = 10
+
+# Consumo de tokens y costo: rollup diario AIUsageDaily (vía el writer en lote)
+AI_USAGE_TRACKING_ENABLED = os.environ.get("AI_USAGE_TRACKING_ENABLED", "1") == "1"
+# Presupuesto mensual por tenant (TenantAIConfig.monthly_budget_usd): contador
+# de gasto en el cache AI_BUDGET_CACHE_ALIAS, resembrado desde AIUsageDaily
+AI_BUDGET_CACHE_ALIAS = "default"
+AI_BUDGET_COUNTER_TTL_SECONDS = 300
+# USD por millón de tokens (entrada, salida); el modelo se busca por prefijo
+AI_MODEL_PRICES = {
+    "openai": {
+        "gpt-4": (30, 60),
+        "gpt-4-turbo": (10, 30),
+        "gpt-4o": (2.5, 10),
+        "gpt-4o-mini": (0.15, 0.6),
+        "gpt-4.1": (2, 8),
+        "gpt-4.1-mini": (0.4, 1.6),
+        "gpt-3.5-turbo": (0.5, 1.5),
+    },
+    "claude": {
+        "claude-3-5-sonnet": (3, 15),
+        "claude-3-5-haiku": (0.8, 4),
+        "claude-3-opus": (15, 75),
+        "claude-3-haiku": (0.25, 1.25),
+        "claude-sonnet-4": (3, 15),
+        "claude-opus-4": (15, 75),
+    },
+    "gemini": {
+        "gemini-1.5-pro": (1.25, 5),
+        "gemini-1.5-flash": (0.075, 0.3),
+        "gemini-2.0-flash": (0.1, 0.4),
+    },
+}
@@ -2,10 +2,28 @@ from .base import *
 
 DEBUG = False
 
-# Usa una DB en memoria o una DB de test separada
+# Los tests no dependen de un .env: clave fija si no viene del entorno
+SECRET_KEY = SECRET_KEY or "test-secret-key-not-for-production-use"
+SIMPLE_JWT = {**SIMPLE_JWT, "SIGNING_KEY": SECRET_KEY}
+
+# DB de test en archivo (no en memoria) para que los tests con hilos
+# compartan la base; IMMEDIATE toma el lock de escritura al iniciar cada
+# transacción, así los escritores concurrentes esperan en vez de fallar.
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": ":memory:",
+        "TEST": {"NAME": BASE_DIR / "db.test.sqlite3"},
+        "OPTIONS": {"transaction_mode": "IMMEDIATE", "timeout": 20},
     }
 }
+
+# Celery sin broker externo: las tareas se ejecutan en línea
+CELERY_BROKER_URL = "memory://"
+CELERY_RESULT_BACKEND = "cache+memory://"
+CELERY_TASK_ALWAYS_EAGER = True
+CELERY_TASK_EAGER_PROPAGATES = True
+
+# La bitácora de agentes se escribe en línea: el hilo de fondo no ve la
+# transacción del test
+AI_AGENT_LOG_BACKGROUND = False
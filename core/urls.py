@@ -14,4 +14,5 @@ urlpatterns = [
     path("api/users/", include("apps.users.urls")),
     path("api/tenants/", include("apps.tenants.urls")),
     path("api/recruitment/", include("apps.recruitment.urls")),
+    path("api/ai/", include("apps.ai_core.urls")),
 ]